@@ -29,10 +29,103 @@ if not JWT_SECRET:
 
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv("ACCESS_TOKEN_EXPIRE_HOURS", "24"))
+# Authenticated admins are cached per process for AUTH_CACHE_SECONDS, so most API
+# calls skip the admin lookup. Account edits invalidate the entry in the process
+# that made them; other workers pick the change up when the entry expires.
+AUTH_CACHE_SECONDS = float(os.getenv("AUTH_CACHE_SECONDS", "30"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "1024"))
+
+# Password hashing: new hashes use PASSWORD_HASHER ("pbkdf2_sha256" or "scrypt")
+# with the parameters below; older hashes are upgraded when their owner logs in.
+# Login checks run on PASSWORD_HASH_WORKERS threads with at most
+# PASSWORD_HASH_MAX_PENDING queued (more get a 503). See script/bench_passwords.py.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2_sha256")
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "600000"))
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2**15)))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+
+# How long the newest session number per roster is cached (see
+# app/utils/current_session.py). Writes in this process invalidate it immediately.
+CURRENT_SESSION_CACHE_SECONDS = float(os.getenv("CURRENT_SESSION_CACHE_SECONDS", "300"))
+
+# How long the rendered /api/directory bundle is cached. Commits touching any
+# model in it invalidate it immediately in this process (0 = build every time).
+DIRECTORY_CACHE_SECONDS = float(os.getenv("DIRECTORY_CACHE_SECONDS", "300"))
+
+# How long each rendered /api/pages/{slug} response is cached. Static page edits
+# committed in this process invalidate it immediately (0 = query every time).
+PAGES_CACHE_SECONDS = float(os.getenv("PAGES_CACHE_SECONDS", "3600"))
+
+# /api/legislation/{id} responses are cached per id, and /api/legislation/facets
+# per filter set. Commits touching legislation or its actions invalidate them
+# immediately in this process.
+LEGISLATION_CACHE_SECONDS = float(os.getenv("LEGISLATION_CACHE_SECONDS", "300"))
+LEGISLATION_CACHE_SIZE = int(os.getenv("LEGISLATION_CACHE_SIZE", "512"))
+LEGISLATION_FACETS_CACHE_SIZE = int(os.getenv("LEGISLATION_FACETS_CACHE_SIZE", "256"))
+
+# /api/senators/{id}/profile responses (and their ETags) are cached per senator
+# and page. Commits touching senators, committees, leadership or legislation
+# invalidate them immediately in this process.
+SENATOR_PROFILE_CACHE_SECONDS = float(os.getenv("SENATOR_PROFILE_CACHE_SECONDS", "300"))
+SENATOR_PROFILE_CACHE_SIZE = int(os.getenv("SENATOR_PROFILE_CACHE_SIZE", "512"))
+
+# Recurring events are expanded in this timezone's wall-clock time, so a
+# weekly meeting keeps its local start time across daylight saving changes.
+CALENDAR_TIMEZONE = os.getenv("CALENDAR_TIMEZONE", "America/New_York")
+# /api/events results are cached per (window, event type). Commits touching
+# calendar events invalidate them immediately in this process.
+EVENTS_CACHE_SECONDS = float(os.getenv("EVENTS_CACHE_SECONDS", "300"))
+EVENTS_CACHE_SIZE = int(os.getenv("EVENTS_CACHE_SIZE", "256"))
+# How far ahead recurring events are expanded when no end_date is given.
+EVENTS_RECURRENCE_HORIZON_DAYS = int(os.getenv("EVENTS_RECURRENCE_HORIZON_DAYS", "365"))
 
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/app/uploads")
 UPLOAD_BASE_URL = os.getenv("UPLOAD_BASE_URL", "/api/uploads")
 MAX_UPLOAD_SIZE_BYTES = int(os.getenv("MAX_UPLOAD_SIZE_BYTES", str(5 * 1024 * 1024)))
+# Worker processes for upload image resizing (0 = use a thread instead) and the
+# most images that may be queued or in progress before uploads get a 503.
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+IMAGE_MAX_PENDING = int(os.getenv("IMAGE_MAX_PENDING", "16"))
+# Responsive widths generated for srcset, and the extra encodings for each
+# (AVIF is skipped automatically when the installed Pillow cannot write it).
+IMAGE_VARIANT_WIDTHS = [int(w) for w in _env_csv("IMAGE_VARIANT_WIDTHS", ["320", "640", "1280"])]
+IMAGE_VARIANT_FORMATS = [f.lower() for f in _env_csv("IMAGE_VARIANT_FORMATS", ["webp", "avif"])]
+# On-demand derivatives served by /api/uploads/{filename}?w=&fmt=: only these
+# widths may be requested, and rendered files are kept in an LRU disk cache.
+IMAGE_DERIVATIVE_WIDTHS = [
+    int(w)
+    for w in _env_csv(
+        "IMAGE_DERIVATIVE_WIDTHS", ["150", "320", "480", "640", "800", "1024", "1280"]
+    )
+]
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(UPLOAD_DIR, ".derivatives"))
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Worker processes for rendering those derivatives (0 = thread) and the most
+# renders that may be queued or in progress before ?w= requests get a 503.
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", "1"))
+IMAGE_DERIVATIVE_MAX_PENDING = int(os.getenv("IMAGE_DERIVATIVE_MAX_PENDING", "8"))
+
+# Upload storage backend: local (UPLOAD_DIR), s3 (any S3-compatible bucket; needs
+# boto3) or memory. With s3, /api/uploads redirects to S3_PUBLIC_BASE_URL if set,
+# otherwise to a presigned URL valid for S3_PRESIGN_SECONDS.
+UPLOAD_STORAGE = os.getenv("UPLOAD_STORAGE", "local").lower()
+S3_BUCKET = os.getenv("S3_BUCKET", "")
+S3_PREFIX = os.getenv("S3_PREFIX", "")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL", "")
+S3_REGION = os.getenv("S3_REGION", "")
+S3_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY_ID", "")
+S3_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY", "")
+S3_PUBLIC_BASE_URL = os.getenv("S3_PUBLIC_BASE_URL", "")
+S3_PRESIGN_SECONDS = int(os.getenv("S3_PRESIGN_SECONDS", "3600"))
+
+# Internal nginx location aliased to UPLOAD_DIR; when set, /api/uploads answers with
+# X-Accel-Redirect and the proxy sends the bytes. Empty = the app streams files itself.
+# Only set it behind such a proxy: the shipped deployment has none, and without it
+# clients get empty bodies (see app.utils.file_serving).
+UPLOAD_ACCEL_REDIRECT_PREFIX = os.getenv("UPLOAD_ACCEL_REDIRECT_PREFIX", "")
 
 ANALYTICS_INGEST_SECRET = os.getenv("ANALYTICS_INGEST_SECRET")
 
@@ -41,3 +134,20 @@ SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
 SMTP_USER = os.getenv("SMTP_USER")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 SMTP_FROM = os.getenv("SMTP_FROM", "speaker@unc.edu")
+
+# Outbox worker: started with the app unless disabled (tests, one-off scripts).
+# Failed sends retry with exponential backoff from EMAIL_RETRY_BASE_SECONDS and are
+# marked dead after EMAIL_MAX_ATTEMPTS. SMTP connections idle longer than
+# EMAIL_SMTP_IDLE_SECONDS are closed instead of reused.
+EMAIL_WORKER_ENABLED = _env_bool("EMAIL_WORKER_ENABLED", default=True)
+EMAIL_POLL_SECONDS = float(os.getenv("EMAIL_POLL_SECONDS", "5"))
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "20"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "6"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+EMAIL_SMTP_CONNECTIONS = int(os.getenv("EMAIL_SMTP_CONNECTIONS", "2"))
+EMAIL_SMTP_IDLE_SECONDS = float(os.getenv("EMAIL_SMTP_IDLE_SECONDS", "60"))
+
+# Contact-form digests: when > 0, messages to the same recipient are collected for
+# this many minutes (from the first one) and sent as a single email. 0 sends each
+# message on its own.
+CONTACT_DIGEST_WINDOW_MINUTES = float(os.getenv("CONTACT_DIGEST_WINDOW_MINUTES", "0"))
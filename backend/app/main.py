@@ -1,10 +1,14 @@
 """FastAPI application entry point"""
 
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.config import CORS_ORIGINS
+from app.config import CORS_ORIGINS, EMAIL_WORKER_ENABLED
 from app.routers import (
     analytics,
     auth,
@@ -12,6 +16,7 @@ from app.routers import (
     carousel,
     committees,
     contact,
+    directory,
     districts,
     events,
     finance,
@@ -40,13 +45,35 @@ from app.routers.admin import pages as admin_pages
 from app.routers.admin import senators as admin_senators
 from app.routers.admin import staff as admin_staff
 from app.routers.admin import upload as admin_upload
+from app.routers.admin.upload import image_pool
+from app.routers.uploads import derivative_pool
+from app.utils.outbox import outbox_worker
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Run the email outbox sender for as long as the app is up.
+
+    On exit, also stop the upload and derivative image worker processes.
+    """
+    if EMAIL_WORKER_ENABLED:
+        outbox_worker.start()
+    try:
+        yield
+    finally:
+        if EMAIL_WORKER_ENABLED:
+            outbox_worker.stop()
+        image_pool.shutdown()
+        derivative_pool.shutdown()
+
+
 app = FastAPI(
     title="Senate API",
     description="Backend API for Senate application",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -58,6 +85,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(_request: Request, _exc: StaleDataError):
+    """A versioned row was changed by another request between our read and write."""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "This record was changed by someone else; reload and retry"},
+    )
+
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(health.router)
@@ -67,6 +104,7 @@ app.include_router(leadership.router)
 app.include_router(committees.router)
 app.include_router(carousel.router)
 app.include_router(districts.router)
+app.include_router(directory.router)
 app.include_router(staff.router)
 app.include_router(finance.router)
 app.include_router(budget.router)
@@ -0,0 +1,325 @@
+"""Versioned schema migrations.
+
+Usage::
+
+    python -m script.migrate             # create missing tables, apply pending migrations
+    python -m script.migrate --status    # list applied and pending migrations
+
+``create_all()`` creates tables that do not exist yet but never changes one that
+does. Every change to an existing table is therefore a migration: a module in
+``app/migrations/versions`` named ``m<NNNN>_<slug>.py`` that defines::
+
+    TRANSACTIONAL = True        # optional; False for CREATE INDEX CONCURRENTLY etc.
+
+    def upgrade(op: Operations) -> None:
+        op.add_column("senator", Column("nickname", String(100), nullable=True))
+
+Applied versions are recorded in ``schema_migration``. Migrations run in
+version order, each at most once. A transactional migration runs in one
+transaction together with its bookkeeping row. A non-transactional one runs in
+autocommit mode so it can build indexes CONCURRENTLY and commit a backfill
+batch by batch. It is only recorded once it has finished, so it must be safe to
+re-run after a crash; the ``Operations`` helpers all are.
+
+Because a fresh database gets every table from ``create_all()`` in its current
+shape, operations check the live schema first and skip work that is already
+done. On PostgreSQL the run holds an advisory lock, so replicas starting at the
+same time apply each migration once.
+
+Migrations describe the schema as it was at the time and must not import the
+ORM models or other app code; copy any logic they need into the migration.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from types import ModuleType
+
+from sqlalchemy import Column, Engine, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+from app.migrations import versions as _versions_package
+
+MIGRATION_TABLE = "schema_migration"
+_MODULE_NAME = re.compile(r"^m(\d{4})_(\w+)$")
+_ADVISORY_LOCK_ID = 7_244_351
+
+
+class MigrationError(RuntimeError):
+    """A migration cannot be applied as written."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Operations], None]
+    transactional: bool = True
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> Migration:
+        match = _MODULE_NAME.match(module.__name__.rsplit(".", 1)[-1])
+        if match is None:
+            raise MigrationError(f"{module.__name__}: name must look like m0001_description")
+        return cls(
+            version=int(match.group(1)),
+            name=match.group(2),
+            upgrade=module.upgrade,
+            transactional=getattr(module, "TRANSACTIONAL", True),
+        )
+
+
+def discover() -> list[Migration]:
+    """All migrations in ``app/migrations/versions``, in version order."""
+    migrations = [
+        Migration.from_module(importlib.import_module(f"{_versions_package.__name__}.{info.name}"))
+        for info in pkgutil.iter_modules(_versions_package.__path__)
+    ]
+    migrations.sort(key=lambda migration: migration.version)
+    for previous, current in zip(migrations, migrations[1:]):
+        if previous.version == current.version:
+            raise MigrationError(
+                f"Duplicate migration version {current.version}: {previous.name}, {current.name}"
+            )
+    return migrations
+
+
+class Operations:
+    """Schema operations that inspect the live schema and skip work already done."""
+
+    def __init__(self, conn: Connection, *, transactional: bool, log: Callable[[str], None]):
+        self.conn = conn
+        self.transactional = transactional
+        self.dialect = conn.dialect.name
+        self.log = log
+
+    # --- inspection --------------------------------------------------------
+
+    def has_table(self, table: str) -> bool:
+        return inspect(self.conn).has_table(table)
+
+    def has_column(self, table: str, column: str) -> bool:
+        return any(col["name"] == column for col in inspect(self.conn).get_columns(table))
+
+    def column_type(self, table: str, column: str) -> str | None:
+        for col in inspect(self.conn).get_columns(table):
+            if col["name"] == column:
+                return str(col["type"].compile(dialect=self.conn.dialect))
+        return None
+
+    def has_index(self, table: str, name: str) -> bool:
+        return any(index["name"] == name for index in inspect(self.conn).get_indexes(table))
+
+    def index_is_valid(self, name: str) -> bool:
+        """False for a PostgreSQL index left INVALID by an interrupted CONCURRENTLY build."""
+        if self.dialect != "postgresql":
+            return True
+        valid = self.conn.execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+            {"name": name},
+        ).scalar()
+        return valid is not False
+
+    def has_check_constraint(self, table: str, name: str) -> bool:
+        return any(ck["name"] == name for ck in inspect(self.conn).get_check_constraints(table))
+
+    # --- operations --------------------------------------------------------
+
+    def execute(self, sql: str, **params) -> int:
+        return self.conn.execute(text(sql), params).rowcount
+
+    def add_column(self, table: str, column: Column) -> None:
+        """Add ``column`` unless the table is missing or already has it."""
+        if not self.has_table(table) or self.has_column(table, column.name):
+            return
+        if not column.nullable and column.default is None and column.server_default is None:
+            raise MigrationError(
+                f"{table}.{column.name}: a NOT NULL column needs a server_default "
+                "to be added to a table with rows"
+            )
+        ddl = CreateColumn(column).compile(dialect=self.conn.dialect)
+        self.conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {ddl}"))
+        self.log(f"  added column {table}.{column.name}")
+
+    def create_index(
+        self, name: str, table: str, columns: list[str], *, unique: bool = False
+    ) -> None:
+        """Create an index if it is missing.
+
+        In a non-transactional migration on PostgreSQL the index is built
+        CONCURRENTLY, so the table stays writable; a failed build leaves an
+        invalid index behind, which is dropped before the error propagates.
+        If the process died mid-build instead, the invalid index is found and
+        rebuilt on the next run.
+        """
+        if not self.has_table(table):
+            return
+        concurrently = self.dialect == "postgresql" and not self.transactional
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        option = " CONCURRENTLY" if concurrently else ""
+        if self.has_index(table, name):
+            if self.index_is_valid(name):
+                return
+            self.conn.execute(text(f"DROP INDEX{option} IF EXISTS {name}"))
+            self.log(f"  dropped invalid index {name} left by an interrupted build")
+        try:
+            self.conn.execute(
+                text(
+                    f"CREATE {kind}{option} IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+                )
+            )
+        except Exception:
+            if concurrently:
+                self.conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            raise
+        self.log(f"  created index {name} on {table}")
+
+    def add_check_constraint(self, name: str, table: str, condition: str) -> None:
+        """Add a CHECK constraint on PostgreSQL (SQLite cannot add one to an existing table).
+
+        It is added ``NOT VALID`` and then validated, so existing rows are
+        checked without blocking writes for the duration of the scan.
+        """
+        if (
+            self.dialect != "postgresql"
+            or not self.has_table(table)
+            or self.has_check_constraint(table, name)
+        ):
+            return
+        self.conn.execute(
+            text(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+        )
+        self.conn.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}"))
+        self.log(f"  added check constraint {name} on {table}")
+
+    def alter_column_type(
+        self, table: str, column: str, type_sql: str, *, using: str | None = None
+    ) -> None:
+        """Change a column's type on PostgreSQL (SQLite does not enforce column types).
+
+        This rewrites the table under an exclusive lock; ``lock_timeout`` makes
+        it give up instead of queueing every other query behind it when the
+        table is busy. Reserve it for small tables or use add column + backfill.
+        """
+        if self.dialect != "postgresql" or not self.has_table(table):
+            return
+        current = self.column_type(table, column)
+        if current is None or current.upper() == type_sql.upper():
+            return
+        using_sql = f" USING {using}" if using else ""
+        if self.transactional:
+            self.conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+        self.conn.execute(
+            text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_sql}{using_sql}")
+        )
+        self.log(f"  changed {table}.{column} from {current} to {type_sql}")
+
+    def drop_not_null(self, table: str, column: str) -> None:
+        """Make a column nullable on PostgreSQL (SQLite cannot alter an existing column)."""
+        if self.dialect != "postgresql" or not self.has_column(table, column):
+            return
+        if any(
+            col["name"] == column and col["nullable"]
+            for col in inspect(self.conn).get_columns(table)
+        ):
+            return
+        self.conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} DROP NOT NULL"))
+        self.log(f"  made {table}.{column} nullable")
+
+    def backfill(
+        self, table: str, set_sql: str, where_sql: str, *, batch_size: int = 1000, key: str = "id"
+    ) -> int:
+        """``UPDATE table SET set_sql WHERE where_sql`` in batches of ``batch_size`` rows.
+
+        ``where_sql`` must stop matching a row once it is updated. In a
+        non-transactional migration each batch commits on its own, so a large
+        backfill never holds row locks for long.
+        """
+        if not self.has_table(table):
+            return 0
+        total = 0
+        while True:
+            updated = self.execute(
+                f"UPDATE {table} SET {set_sql} WHERE {key} IN "
+                f"(SELECT {key} FROM {table} WHERE {where_sql} LIMIT :batch_size)",
+                batch_size=batch_size,
+            )
+            total += updated
+            if updated < batch_size:
+                break
+        if total:
+            self.log(f"  backfilled {total} rows in {table}")
+        return total
+
+
+def _ensure_migration_table(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {MIGRATION_TABLE} ("
+                "version INTEGER PRIMARY KEY, name VARCHAR(200) NOT NULL, "
+                "applied_at TIMESTAMP NOT NULL)"
+            )
+        )
+
+
+def applied_versions(engine: Engine) -> set[int]:
+    _ensure_migration_table(engine)
+    with engine.connect() as conn:
+        return set(conn.execute(text(f"SELECT version FROM {MIGRATION_TABLE}")).scalars())
+
+
+def pending(engine: Engine, migrations: list[Migration] | None = None) -> list[Migration]:
+    done = applied_versions(engine)
+    return [m for m in (migrations or discover()) if m.version not in done]
+
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(
+        text(
+            f"INSERT INTO {MIGRATION_TABLE} (version, name, applied_at) "
+            "VALUES (:version, :name, :applied_at)"
+        ),
+        {"version": migration.version, "name": migration.name, "applied_at": datetime.now()},
+    )
+
+
+def _apply(engine: Engine, migration: Migration, log: Callable[[str], None]) -> None:
+    log(f"Applying migration {migration.version:04d} {migration.name}")
+    if migration.transactional:
+        with engine.begin() as conn:
+            migration.upgrade(Operations(conn, transactional=True, log=log))
+            _record(conn, migration)
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        migration.upgrade(Operations(conn, transactional=False, log=log))
+    with engine.begin() as conn:
+        _record(conn, migration)
+
+
+def migrate(
+    engine: Engine,
+    migrations: list[Migration] | None = None,
+    log: Callable[[str], None] = print,
+) -> list[Migration]:
+    """Apply every pending migration in order; returns the ones applied."""
+    lock = None
+    if engine.dialect.name == "postgresql":
+        lock = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        lock.execute(text("SELECT pg_advisory_lock(:id)"), {"id": _ADVISORY_LOCK_ID})
+    try:
+        todo = pending(engine, migrations)
+        for migration in todo:
+            _apply(engine, migration, log)
+        return todo
+    finally:
+        if lock is not None:
+            lock.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": _ADVISORY_LOCK_ID})
+            lock.close()
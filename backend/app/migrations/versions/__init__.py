@@ -0,0 +1 @@
+"""Migration modules, named ``m<NNNN>_<slug>.py``; see ``app.migrations``."""
@@ -0,0 +1,17 @@
+"""Columns added to tables that existed before migrations were introduced.
+
+``version`` columns back the optimistic locking on leadership, legislation
+actions, committees and staff; ``admin.token_version`` lets a password change
+revoke outstanding tokens; ``leadership.display_order`` orders the roster.
+"""
+
+from sqlalchemy import Column, Integer
+
+
+def upgrade(op) -> None:
+    op.add_column(
+        "leadership", Column("display_order", Integer, nullable=False, server_default="0")
+    )
+    for table in ("leadership", "legislation_action", "committee", "staff"):
+        op.add_column(table, Column("version", Integer, nullable=False, server_default="1"))
+    op.add_column("admin", Column("token_version", Integer, nullable=False, server_default="0"))
@@ -0,0 +1,28 @@
+"""Composite indexes for the public list and detail queries.
+
+Built CONCURRENTLY on PostgreSQL, so the tables stay writable meanwhile.
+"""
+
+TRANSACTIONAL = False
+
+INDEXES = [
+    ("ix_legislation_session_introduced", "legislation", ["session_number", "date_introduced"]),
+    ("ix_legislation_date_introduced", "legislation", ["date_introduced"]),
+    (
+        "ix_legislation_action_legislation_order",
+        "legislation_action",
+        ["legislation_id", "display_order"],
+    ),
+    ("ix_senator_session_active_district", "senator", ["session_number", "is_active", "district"]),
+    ("ix_senator_district_active", "senator", ["district", "is_active"]),
+    ("ix_news_published_date", "news", ["is_published", "date_published"]),
+    ("ix_calendar_event_published_start", "calendar_event", ["is_published", "start_datetime"]),
+    ("ix_committee_membership_committee", "committee_membership", ["committee_id"]),
+    ("ix_leadership_session_order", "leadership", ["session_number", "display_order"]),
+    ("ix_budget_data_year_order", "budget_data", ["fiscal_year", "display_order"]),
+]
+
+
+def upgrade(op) -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
@@ -0,0 +1,9 @@
+"""Store ``senator.headshot_url`` as VARCHAR instead of space-padded CHAR.
+
+PostgreSQL drops the trailing padding when casting CHAR to VARCHAR, so
+existing URLs come out clean.
+"""
+
+
+def upgrade(op) -> None:
+    op.alter_column_type("senator", "headshot_url", "VARCHAR(500)")
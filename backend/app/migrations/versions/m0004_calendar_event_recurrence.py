@@ -0,0 +1,10 @@
+"""Recurrence rule columns on ``calendar_event``."""
+
+from sqlalchemy import Column, DateTime, String
+
+
+def upgrade(op) -> None:
+    op.add_column("calendar_event", Column("recurrence_rule", String(255), nullable=True))
+    op.add_column(
+        "calendar_event", Column("recurrence_end", DateTime(timezone=True), nullable=True)
+    )
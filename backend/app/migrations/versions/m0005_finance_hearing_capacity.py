@@ -0,0 +1,27 @@
+"""Seat capacity and booking counter on ``finance_hearing_date``.
+
+Existing dates get one seat each. The bookings table itself is new and is
+created from the models.
+"""
+
+from sqlalchemy import Column, Integer
+
+
+def upgrade(op) -> None:
+    op.add_column(
+        "finance_hearing_date", Column("capacity", Integer, nullable=False, server_default="1")
+    )
+    op.add_column(
+        "finance_hearing_date",
+        Column("booked_count", Integer, nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_finance_hearing_date_date_time",
+        "finance_hearing_date",
+        ["hearing_date", "hearing_time"],
+    )
+    op.add_check_constraint(
+        "ck_finance_hearing_date_booked_within_capacity",
+        "finance_hearing_date",
+        "booked_count >= 0 AND booked_count <= capacity",
+    )
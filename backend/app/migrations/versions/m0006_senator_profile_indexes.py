@@ -0,0 +1,16 @@
+"""Indexes for the senator profile: bills by sponsor and roles by senator.
+
+Built CONCURRENTLY on PostgreSQL, so the tables stay writable meanwhile.
+"""
+
+TRANSACTIONAL = False
+
+INDEXES = [
+    ("ix_legislation_sponsor_introduced", "legislation", ["sponsor_id", "date_introduced"]),
+    ("ix_leadership_senator", "leadership", ["senator_id"]),
+]
+
+
+def upgrade(op) -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
@@ -0,0 +1,113 @@
+"""Recompute ``recurrence_end`` for COUNT series.
+
+Ends used to be taken from the window-capped occurrence iterator, so a series
+with more than 1000 starts stored too early an end and dropped out of later
+date ranges. Rules beyond the new COUNT limit (10000) get no end, which keeps
+them visible.
+
+The rule stepping below is a frozen copy of ``app.utils.recurrence`` as of this
+migration (COUNT rules only), so replaying it later gives the same ends.
+"""
+
+import calendar
+import os
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import DateTime, Integer, String, column, select, table, update
+
+MAX_COUNT = 10000
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+calendar_event = table(
+    "calendar_event",
+    column("id", Integer),
+    column("start_datetime", DateTime(timezone=True)),
+    column("recurrence_rule", String),
+    column("recurrence_end", DateTime(timezone=True)),
+)
+
+
+def _parse(text: str) -> tuple[str, int, tuple[int, ...], int]:
+    """``(freq, interval, by_day, count)``; ValueError for anything unsupported."""
+    parts = dict(item.split("=", 1) for item in text.strip().upper().split(";"))
+    freq = parts.pop("FREQ")
+    interval = int(parts.pop("INTERVAL", "1"))
+    count = int(parts.pop("COUNT"))
+    by_day = (
+        tuple(sorted({WEEKDAYS.index(code) for code in parts.pop("BYDAY").split(",")}))
+        if "BYDAY" in parts
+        else ()
+    )
+    if (
+        parts
+        or freq not in ("DAILY", "WEEKLY", "MONTHLY")
+        or interval < 1
+        or not 1 <= count <= MAX_COUNT
+    ):
+        raise ValueError(text)
+    return freq, interval, by_day, count
+
+
+def _add_months(day: date, months: int) -> date | None:
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    if day.day > calendar.monthrange(year, month)[1]:
+        return None
+    return day.replace(year=year, month=month)
+
+
+def _last_local_start(
+    freq: str, interval: int, by_day: tuple[int, ...], count: int, first: datetime
+) -> datetime:
+    if freq == "DAILY":
+        return first + timedelta(days=interval * (count - 1))
+    seen = 0
+    if freq == "WEEKLY":
+        week = first.date() - timedelta(days=first.weekday())
+        while True:
+            for weekday in by_day or (first.weekday(),):
+                start = datetime.combine(week + timedelta(days=weekday), first.time())
+                if start >= first:
+                    seen += 1
+                    if seen == count:
+                        return start
+            week += timedelta(weeks=interval)
+    months = 0
+    while True:
+        day = _add_months(first.date(), months)
+        if day is not None:
+            seen += 1
+            if seen == count:
+                return datetime.combine(day, first.time())
+        months += interval
+
+
+def _series_end(text: str, start: datetime, zone: ZoneInfo) -> datetime | None:
+    try:
+        rule = _parse(text)
+    except (KeyError, ValueError):
+        return None
+    aware = start.tzinfo is not None
+    local = start.astimezone(zone).replace(tzinfo=None) if aware else start
+    last = _last_local_start(*rule, local)
+    return last.replace(tzinfo=zone) if aware else last
+
+
+def upgrade(op) -> None:
+    if not op.has_column("calendar_event", "recurrence_rule"):
+        return
+    zone = ZoneInfo(os.getenv("CALENDAR_TIMEZONE", "America/New_York"))
+    rows = op.conn.execute(
+        select(
+            calendar_event.c.id, calendar_event.c.start_datetime, calendar_event.c.recurrence_rule
+        ).where(calendar_event.c.recurrence_rule.like("%COUNT=%"))
+    ).all()
+    for event_id, start, text in rows:
+        op.conn.execute(
+            update(calendar_event)
+            .where(calendar_event.c.id == event_id)
+            .values(recurrence_end=_series_end(text, start, zone))
+        )
+    if rows:
+        op.log(f"  recomputed recurrence_end for {len(rows)} events")
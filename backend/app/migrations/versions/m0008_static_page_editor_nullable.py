@@ -0,0 +1,9 @@
+"""Allow ``static_page_content.last_edited_by`` to be NULL.
+
+Default pages are created at init even when no admin exists yet; they have no
+editor until someone edits them.
+"""
+
+
+def upgrade(op) -> None:
+    op.drop_not_null("static_page_content", "last_edited_by")
@@ -0,0 +1,55 @@
+"""Case-insensitive one-seat-per-organization rule for hearing bookings.
+
+``uq_finance_hearing_booking_org`` compared raw names, so "ACM" and "acm" could
+both book a hearing. Bookings get an ``organization_key`` (the name casefolded
+with whitespace collapsed) and the unique index moves to it. Existing bookings
+that already collide keep their seats: their keys get the row id appended.
+"""
+
+from sqlalchemy import Column, Integer, String, column, select, table, update
+
+TABLE = "finance_hearing_booking"
+
+booking = table(
+    TABLE,
+    column("id", Integer),
+    column("hearing_date_id", Integer),
+    column("organization_name", String),
+    column("organization_key", String),
+)
+
+
+def _organization_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def upgrade(op) -> None:
+    if not op.has_table(TABLE):
+        return
+    op.add_column(TABLE, Column("organization_key", String(255), nullable=False, server_default=""))
+
+    taken = set()
+    rows = op.conn.execute(
+        select(booking.c.id, booking.c.hearing_date_id, booking.c.organization_name).order_by(
+            booking.c.id
+        )
+    ).all()
+    for booking_id, hearing_date_id, name in rows:
+        key = _organization_key(name)
+        if (hearing_date_id, key) in taken:
+            key = f"{key}:{booking_id}"
+        taken.add((hearing_date_id, key))
+        op.conn.execute(
+            update(booking).where(booking.c.id == booking_id).values(organization_key=key)
+        )
+    if rows:
+        op.log(f"  set organization_key on {len(rows)} bookings")
+
+    op.create_index(
+        "uq_finance_hearing_booking_org_key",
+        TABLE,
+        ["hearing_date_id", "organization_key"],
+        unique=True,
+    )
+    if op.dialect == "postgresql":
+        op.execute(f"ALTER TABLE {TABLE} DROP CONSTRAINT IF EXISTS uq_finance_hearing_booking_org")
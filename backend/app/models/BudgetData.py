@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DECIMAL, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DECIMAL, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -25,3 +25,5 @@ class BudgetData(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
+
+    __table_args__ = (Index("ix_budget_data_year_order", "fiscal_year", "display_order"),)
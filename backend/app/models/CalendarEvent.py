@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -17,3 +17,12 @@ class CalendarEvent(Base):
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)
     is_published: Mapped[bool] = mapped_column(Boolean, nullable=False)
     created_by: Mapped[int] = mapped_column(ForeignKey("admin.id"), nullable=False)
+    # RRULE subset (see app/utils/recurrence.py); NULL for a one-off event.
+    recurrence_rule: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Latest start of any occurrence; NULL for one-off events and endless series.
+    recurrence_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Public calendar: published events in a date range, in start order.
+        Index("ix_calendar_event_published_start", "is_published", "start_datetime"),
+    )
@@ -0,0 +1,66 @@
+"""ContactDigest models — contact-form messages batched per recipient.
+
+With ``CONTACT_DIGEST_WINDOW_MINUTES`` set, the first message to a recipient
+opens a digest that closes that many minutes later; messages arriving in
+between are attached to it. When it closes the outbox worker turns it into a
+single email and marks it ``queued``. At most one digest per recipient is
+``open`` at a time.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class ContactDigest(Base):
+    __tablename__ = "contact_digest"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="open", server_default="open"
+    )
+    opened_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+    closes_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    outbox_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("email_outbox.id", ondelete="SET NULL"), nullable=True
+    )
+
+    messages: Mapped[list["ContactDigestMessage"]] = relationship(
+        back_populates="digest", order_by="ContactDigestMessage.id", cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_contact_digest_open_recipient",
+            "to_email",
+            unique=True,
+            postgresql_where=text("status = 'open'"),
+            sqlite_where=text("status = 'open'"),
+        ),
+        Index("ix_contact_digest_status_closes_at", "status", "closes_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ContactDigest id={self.id} to={self.to_email!r} status={self.status}>"
+
+
+class ContactDigestMessage(Base):
+    __tablename__ = "contact_digest_message"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    digest_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("contact_digest.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    sender_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    sender_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+
+    digest: Mapped[ContactDigest] = relationship(back_populates="messages")
@@ -0,0 +1,34 @@
+"""FinanceHearingBooking model — one student organization's seat at a hearing."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class FinanceHearingBooking(Base):
+    __tablename__ = "finance_hearing_booking"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    hearing_date_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("finance_hearing_date.id", ondelete="CASCADE"), nullable=False
+    )
+    organization_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # organization_name casefolded with whitespace collapsed, so "ACM" and
+    # "acm" are one organization (see app.utils.hearing_bookings.organization_key).
+    organization_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        # One seat per organization per hearing; also serves lookups by hearing.
+        Index(
+            "uq_finance_hearing_booking_org_key",
+            "hearing_date_id",
+            "organization_key",
+            unique=True,
+        ),
+    )
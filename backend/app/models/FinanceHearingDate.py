@@ -1,6 +1,6 @@
 from datetime import date, time
 
-from sqlalchemy import Boolean, Date, Integer, String, Text, Time
+from sqlalchemy import Boolean, CheckConstraint, Date, Index, Integer, String, Text, Time
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -15,4 +15,24 @@ class FinanceHearingDate(Base):
     hearing_time: Mapped[time] = mapped_column(Time, nullable=False)
     location: Mapped[str | None] = mapped_column(String(500), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Closed by an admin regardless of remaining capacity.
     is_full: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Organizations that can book this slot, and how many have. booked_count is
+    # only changed by the conditional UPDATE in app/utils/hearing_bookings.py.
+    capacity: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    booked_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "booked_count >= 0 AND booked_count <= capacity",
+            name="ck_finance_hearing_date_booked_within_capacity",
+        ),
+        # Public listing: dates in a window, in date/time order.
+        Index("ix_finance_hearing_date_date_time", "hearing_date", "hearing_time"),
+    )
+
+    @property
+    def seats_remaining(self) -> int:
+        return 0 if self.is_full else max(self.capacity - self.booked_count, 0)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -24,6 +24,10 @@ class Leadership(Base):
     headshot_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     session_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    display_order: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, server_default=func.now()
     )
@@ -31,5 +35,12 @@ class Leadership(Base):
         DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        Index("ix_leadership_session_order", "session_number", "display_order"),
+        # Senator profiles: roles held by a senator's rows.
+        Index("ix_leadership_senator", "senator_id"),
+    )
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
         return f"<Leadership id={self.id} title={self.title!r} name={self.first_name!r} {self.last_name!r}>"
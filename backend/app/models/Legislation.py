@@ -1,10 +1,14 @@
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
+if TYPE_CHECKING:
+    from .LegislationAction import LegislationAction
+
 legislation_status_values = ["Introduced", "In Committee", "Passed", "Failed"]
 
 
@@ -29,3 +33,18 @@ class Legislation(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
+
+    actions: Mapped[list["LegislationAction"]] = relationship(
+        back_populates="legislation",
+        order_by="LegislationAction.display_order",
+        cascade="all, delete-orphan",
+    )
+
+    __table_args__ = (
+        # Public list: one session, newest first.
+        Index("ix_legislation_session_introduced", "session_number", "date_introduced"),
+        # /recent: newest first across sessions.
+        Index("ix_legislation_date_introduced", "date_introduced"),
+        # Senator profiles: a sponsor's bills, newest first.
+        Index("ix_legislation_sponsor_introduced", "sponsor_id", "date_introduced"),
+    )
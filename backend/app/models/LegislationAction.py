@@ -1,10 +1,14 @@
 from datetime import date
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
+if TYPE_CHECKING:
+    from .Legislation import Legislation
+
 
 class LegislationAction(Base):
     __tablename__ = "legislation_action"
@@ -15,3 +19,11 @@ class LegislationAction(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     action_type: Mapped[str] = mapped_column(String(100), nullable=False)
     display_order: Mapped[int] = mapped_column(Integer, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+    legislation: Mapped["Legislation"] = relationship(back_populates="actions")
+
+    __table_args__ = (
+        Index("ix_legislation_action_legislation_order", "legislation_id", "display_order"),
+    )
+    __mapper_args__ = {"version_id_col": version}
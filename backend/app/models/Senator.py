@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import CHAR, Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -20,7 +20,7 @@ class Senator(Base):
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
-    headshot_url: Mapped[Optional[str]] = mapped_column(CHAR(500), nullable=True)
+    headshot_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     district: Mapped[int] = mapped_column(Integer, ForeignKey("district.id"), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     session_number: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -31,6 +31,13 @@ class Senator(Base):
         DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        # Public roster: current session, active, optionally one district.
+        Index("ix_senator_session_active_district", "session_number", "is_active", "district"),
+        # District lookups: active senators for a set of districts.
+        Index("ix_senator_district_active", "district", "is_active"),
+    )
+
     # Relationships (referenced by cms.py)
     committee_memberships: Mapped[list["CommitteeMembership"]] = relationship(
         "CommitteeMembership", back_populates="senator"
@@ -7,7 +7,10 @@ from .base import Base
 from .BudgetData import BudgetData
 from .CalendarEvent import CalendarEvent
 from .CarouselSlide import CarouselSlide
+from .ContactDigest import ContactDigest, ContactDigestMessage
 from .District import District, DistrictMapping
+from .EmailOutbox import EmailOutbox
+from .FinanceHearingBooking import FinanceHearingBooking
 from .FinanceHearingConfig import FinanceHearingConfig
 from .FinanceHearingDate import FinanceHearingDate
 from .Leadership import Leadership
@@ -31,6 +34,7 @@ __all__ = [
     "LegislationAction",
     "FinanceHearingConfig",
     "FinanceHearingDate",
+    "FinanceHearingBooking",
     "BudgetData",
     "CalendarEvent",
     "CarouselSlide",
@@ -40,4 +44,7 @@ __all__ = [
     "Sections",
     "AdminSections",
     "PageView",
+    "EmailOutbox",
+    "ContactDigest",
+    "ContactDigestMessage",
 ]
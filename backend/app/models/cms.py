@@ -9,7 +9,16 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -48,6 +57,11 @@ class News(Base):
     )
     is_published: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
+    __table_args__ = (
+        # Public list: published articles, newest first.
+        Index("ix_news_published_date", "is_published", "date_published"),
+    )
+
     # Relationships
     author: Mapped[Optional[Admin]] = relationship("Admin", back_populates="news_articles")
 
@@ -74,6 +88,10 @@ class Committee(Base):
     chair_name: Mapped[str] = mapped_column(String(200), nullable=False)
     chair_email: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Optimistic-concurrency counter; bumped on every UPDATE (see app.utils.bulk).
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
 
     # Relationships
     chair_senator: Mapped[Optional[Senator]] = relationship(
@@ -107,7 +125,9 @@ class CommitteeMembership(Base):
     role: Mapped[str] = mapped_column(String(255), nullable=False, default="Member")
 
     __table_args__ = (
+        # Also serves lookups by senator_id (its leading column).
         UniqueConstraint("senator_id", "committee_id", name="uq_committee_membership"),
+        Index("ix_committee_membership_committee", "committee_id"),
     )
 
     # Relationships
@@ -138,6 +158,9 @@ class Staff(Base):
     photo_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
 
     def __repr__(self) -> str:
         return f"<Staff id={self.id} name={self.first_name!r} {self.last_name!r} active={self.is_active}>"
@@ -157,13 +180,16 @@ class StaticPageContent(Base):
     page_slug: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
-    last_edited_by: Mapped[int] = mapped_column(Integer, ForeignKey("admin.id"), nullable=False)
+    # NULL for a default page created before any admin existed.
+    last_edited_by: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("admin.id"), nullable=True
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=func.now(), onupdate=func.now()
     )
 
     # Relationships
-    editor: Mapped[Admin] = relationship("Admin", back_populates="edited_pages")
+    editor: Mapped[Admin | None] = relationship("Admin", back_populates="edited_pages")
 
     def __repr__(self) -> str:
         return f"<StaticPageContent id={self.id} slug={self.page_slug!r}>"
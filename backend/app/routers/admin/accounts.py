@@ -11,10 +11,11 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import require_role
+from app.dependencies.auth import Principal, require_role
 from app.models.Admin import Admin
 from app.schemas.account import AccountDTO, CreateAccountDTO, UpdateAccountDTO
 from app.schemas.pagination import PaginatedResponse
+from app.utils.auth import invalidate_principal
 from app.utils.pagination import paginate
 from app.utils.passwords import hash_password
 
@@ -28,7 +29,7 @@ router = APIRouter(
 def list_admin_accounts(
     page: int = Query(default=1, ge=1, description="1-based page number"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Return a paginated list of all accounts. Admin role required."""
@@ -45,7 +46,7 @@ def list_admin_accounts(
 @router.post("", response_model=AccountDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_account(
     body: CreateAccountDTO,
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Create an admin or staff account. Admin role required."""
@@ -73,7 +74,7 @@ def create_admin_account(
 def update_admin_account(
     account_id: int,
     body: UpdateAccountDTO,
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Update account fields. Unset fields remain unchanged. Admin role required."""
@@ -85,6 +86,8 @@ def update_admin_account(
         if field == "password":
             if value is not None:
                 account.password_hash = hash_password(value)
+                # Sign out every session that used the old password.
+                account.token_version += 1
         else:
             setattr(account, field, value)
 
@@ -96,6 +99,7 @@ def update_admin_account(
             status_code=400,
             detail="Update would conflict with an existing account (duplicate email or Onyen)",
         )
+    invalidate_principal(account.id)
     db.refresh(account)
     return AccountDTO.model_validate(account)
 
@@ -107,7 +111,7 @@ def update_admin_account(
 )
 def delete_admin_account(
     account_id: int,
-    current_user: Admin = Depends(require_role("admin")),
+    current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Delete an account. Admin role required. Cannot delete your own account."""
@@ -120,4 +124,5 @@ def delete_admin_account(
 
     db.delete(account)
     db.commit()
+    invalidate_principal(account_id)
     return None
@@ -10,8 +10,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.PageView import PageView
 from app.schemas.analytics import (
     AnalyticsSummaryDTO,
@@ -28,7 +27,7 @@ TOP_N = 10
 @router.get("/summary", response_model=AnalyticsSummaryDTO)
 def get_analytics_summary(
     days: int = Query(default=7, ge=1, le=90, description="Number of trailing days to summarize"),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Aggregate pageview stats over the trailing `days` days."""
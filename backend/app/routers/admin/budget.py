@@ -4,29 +4,216 @@ GET    /api/admin/budget       — flat list; optional fiscal_year filter
 POST   /api/admin/budget       — create budget entry; updated_by set from JWT
 PUT    /api/admin/budget/{id}  — update budget entry fields
 DELETE /api/admin/budget/{id}  — delete budget entry
+POST   /api/admin/budget/import — bulk CSV/XLSX import in one transaction; supports dry_run
 """
 
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from itertools import groupby
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.BudgetData import BudgetData
-from app.schemas.budget import AdminBudgetDataDTO, CreateBudgetDataDTO, UpdateBudgetDataDTO
+from app.schemas.budget import (
+    AdminBudgetDataDTO,
+    BudgetImportResultDTO,
+    BudgetImportRowDTO,
+    CreateBudgetDataDTO,
+    UpdateBudgetDataDTO,
+)
+from app.utils.tabular import iter_upload_rows
 
 router = APIRouter(
     prefix="/api/admin/budget",
     tags=["admin", "budget"],
 )
 
+# Parent references in an import file are either a bare category name
+# ("Operations") or a full path from the root ("Operations > Salaries").
+PATH_SEPARATOR = ">"
+MAX_IMPORT_ROWS = 5000
+_CENTS = Decimal("0.01")
+
+
+@dataclass(eq=False)
+class _ImportRow:
+    line: int
+    fiscal_year: str
+    category: str
+    amount: Decimal
+    description: str | None
+    parent_ref: tuple[str, ...] | None
+    display_order: int
+    path: tuple[str, ...] | None = None
+
+
+def _path_key(path: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(part.casefold() for part in path)
+
+
+def _format_path(path: tuple[str, ...]) -> str:
+    return f" {PATH_SEPARATOR} ".join(path)
+
+
+def _parse_import_rows(file: UploadFile, default_fiscal_year: str | None) -> list[_ImportRow]:
+    """Stream the uploaded sheet into typed rows, collecting every row-level error."""
+    rows: list[_ImportRow] = []
+    errors: list[str] = []
+
+    for index, (line, raw) in enumerate(iter_upload_rows(file), start=1):
+        if index > MAX_IMPORT_ROWS:
+            raise HTTPException(
+                status_code=400, detail=f"Import is limited to {MAX_IMPORT_ROWS} rows"
+            )
+
+        fiscal_year = raw.get("fiscal_year") or default_fiscal_year
+        category = raw.get("category", "")
+        if not fiscal_year:
+            errors.append(f"Row {line}: fiscal_year is required")
+        if not category:
+            errors.append(f"Row {line}: category is required")
+        if PATH_SEPARATOR in category:
+            errors.append(f"Row {line}: category may not contain '{PATH_SEPARATOR}'")
+
+        amount_raw = raw.get("amount", "").replace(",", "").replace("$", "")
+        try:
+            amount = Decimal(amount_raw)
+            if not amount.is_finite():
+                raise InvalidOperation
+            amount = amount.quantize(_CENTS)
+        except InvalidOperation:
+            errors.append(f"Row {line}: amount must be a number")
+            amount = Decimal(0)
+        else:
+            if amount <= 0:
+                errors.append(f"Row {line}: amount must be positive")
+
+        order_raw = raw.get("display_order", "")
+        try:
+            display_order = int(order_raw) if order_raw else index
+        except ValueError:
+            errors.append(f"Row {line}: display_order must be an integer")
+            display_order = index
+
+        parent_raw = raw.get("parent") or raw.get("parent_category") or ""
+        parent_ref = tuple(p.strip() for p in parent_raw.split(PATH_SEPARATOR) if p.strip())
+
+        rows.append(
+            _ImportRow(
+                line=line,
+                fiscal_year=fiscal_year or "",
+                category=category,
+                amount=amount,
+                description=raw.get("description") or None,
+                parent_ref=parent_ref or None,
+                display_order=display_order,
+            )
+        )
+
+    if not rows and not errors:
+        errors.append("Import file contains no rows")
+    if errors:
+        raise HTTPException(status_code=400, detail=errors)
+    return rows
+
+
+def _existing_paths(existing: list[BudgetData]) -> dict[int, tuple[str, ...]]:
+    """Compute the root-to-leaf category path of every existing row."""
+    by_id = {row.id: row for row in existing}
+    paths: dict[int, tuple[str, ...]] = {}
+
+    def path_of(row_id: int, seen: frozenset[int]) -> tuple[str, ...]:
+        if row_id in paths:
+            return paths[row_id]
+        row = by_id[row_id]
+        parent_id = row.parent_category_id
+        if parent_id is None or parent_id not in by_id or parent_id in seen:
+            path: tuple[str, ...] = (row.category,)
+        else:
+            path = path_of(parent_id, seen | {row_id}) + (row.category,)
+        paths[row_id] = path
+        return path
+
+    for row_id in by_id:
+        path_of(row_id, frozenset())
+    return paths
+
+
+def _resolve_import_paths(
+    rows: list[_ImportRow],
+    existing_paths_by_name: dict[tuple[str, str], list[tuple[str, ...]]],
+) -> list[str]:
+    """Resolve each row's parent reference to a full path, detecting cycles in memory.
+
+    Bare names are matched first against other rows in the file, then against
+    existing rows of the same fiscal year. Returns a list of row errors.
+    """
+    file_rows_by_name: dict[tuple[str, str], list[_ImportRow]] = {}
+    for row in rows:
+        file_rows_by_name.setdefault((row.fiscal_year, row.category.casefold()), []).append(row)
+
+    errors: dict[int, str] = {}
+    stack: list[_ImportRow] = []
+
+    def resolve(row: _ImportRow) -> tuple[str, ...] | None:
+        if row.path is not None:
+            return row.path
+        if row.line in errors:
+            return None
+        if row in stack:
+            for member in stack[stack.index(row) :]:
+                errors[member.line] = f"Row {member.line}: parent reference forms a cycle"
+            return None
+        if row.parent_ref is None:
+            row.path = (row.category,)
+            return row.path
+        if len(row.parent_ref) > 1:
+            row.path = row.parent_ref + (row.category,)
+            return row.path
+
+        parent_name = row.parent_ref[0]
+        name_key = (row.fiscal_year, parent_name.casefold())
+        in_file = [r for r in file_rows_by_name.get(name_key, []) if r is not row]
+        in_db = existing_paths_by_name.get(name_key, [])
+
+        if len(in_file) == 1:
+            stack.append(row)
+            parent_path = resolve(in_file[0])
+            stack.pop()
+            if parent_path is None:
+                errors.setdefault(
+                    row.line, f"Row {row.line}: parent category '{parent_name}' has errors"
+                )
+                return None
+        elif not in_file and len(in_db) == 1:
+            parent_path = in_db[0]
+        elif not in_file and not in_db:
+            errors[row.line] = f"Row {row.line}: parent category '{parent_name}' not found"
+            return None
+        else:
+            errors[row.line] = (
+                f"Row {row.line}: parent category '{parent_name}' is ambiguous; "
+                f"use a full path such as 'Parent {PATH_SEPARATOR} Child'"
+            )
+            return None
+
+        row.path = parent_path + (row.category,)
+        return row.path
+
+    for row in rows:
+        resolve(row)
+    return [errors[line] for line in sorted(errors)]
+
 
 @router.get("", response_model=list[AdminBudgetDataDTO])
 def list_admin_budget(
     fiscal_year: Optional[str] = Query(default=None, description="Filter by fiscal year"),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return a flat list of all budget entries, optionally filtered by fiscal year."""
@@ -39,7 +226,7 @@ def list_admin_budget(
 @router.post("", response_model=AdminBudgetDataDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_budget(
     body: CreateBudgetDataDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a budget entry. updated_by is set from the authenticated user."""
@@ -63,7 +250,7 @@ def create_admin_budget(
 def update_admin_budget(
     budget_id: int,
     body: UpdateBudgetDataDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update budget entry fields. Unset fields remain unchanged."""
@@ -101,7 +288,7 @@ def update_admin_budget(
 )
 def delete_admin_budget(
     budget_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a budget entry. Blocked if it has child entries."""
@@ -119,3 +306,148 @@ def delete_admin_budget(
     db.delete(entry)
     db.commit()
     return None
+
+
+@router.post(
+    "/import",
+    response_model=BudgetImportResultDTO,
+    responses={400: {"description": "Import file failed validation"}},
+)
+def import_admin_budget(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False, description="Validate and diff without writing"),
+    fiscal_year: Optional[str] = Query(
+        default=None, description="Fiscal year applied to rows that omit one"
+    ),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Bulk-upsert budget lines from a CSV or XLSX sheet in a single transaction.
+
+    Expected columns: fiscal_year, category, amount, description, parent,
+    display_order. Rows are matched to existing entries by fiscal year and
+    category path; matches are updated in place and the rest are created.
+    Entries not present in the file are left untouched.
+    """
+    rows = _parse_import_rows(file, fiscal_year)
+    fiscal_years = {row.fiscal_year for row in rows}
+
+    existing = db.query(BudgetData).filter(BudgetData.fiscal_year.in_(fiscal_years)).all()
+    existing_paths = _existing_paths(existing)
+    existing_by_key: dict[tuple[str, tuple[str, ...]], BudgetData] = {}
+    existing_paths_by_name: dict[tuple[str, str], list[tuple[str, ...]]] = {}
+    for entry in existing:
+        path = existing_paths[entry.id]
+        existing_by_key[(entry.fiscal_year, _path_key(path))] = entry
+        existing_paths_by_name.setdefault(
+            (entry.fiscal_year, entry.category.casefold()), []
+        ).append(path)
+
+    errors = _resolve_import_paths(rows, existing_paths_by_name)
+    if errors:
+        raise HTTPException(status_code=400, detail=errors)
+
+    file_keys: dict[tuple[str, tuple[str, ...]], _ImportRow] = {}
+    for row in rows:
+        key = (row.fiscal_year, _path_key(row.path))
+        if key in file_keys:
+            errors.append(
+                f"Row {row.line}: duplicates row {file_keys[key].line} ({_format_path(row.path)})"
+            )
+        file_keys[key] = row
+    for row in rows:
+        parent_key = (row.fiscal_year, _path_key(row.path[:-1]))
+        if len(row.path) > 1 and parent_key not in file_keys and parent_key not in existing_by_key:
+            errors.append(f"Row {row.line}: parent path '{_format_path(row.path[:-1])}' not found")
+    if errors:
+        raise HTTPException(status_code=400, detail=errors)
+
+    report: list[BudgetImportRowDTO] = []
+    creates: list[_ImportRow] = []
+    updates: list[dict] = []
+    for row in rows:
+        entry = existing_by_key.get((row.fiscal_year, _path_key(row.path)))
+        if entry is None:
+            creates.append(row)
+            report.append(
+                BudgetImportRowDTO(
+                    line=row.line,
+                    action="create",
+                    id=None,
+                    fiscal_year=row.fiscal_year,
+                    category=row.category,
+                    path=_format_path(row.path),
+                    changed_fields=[],
+                )
+            )
+            continue
+
+        incoming = {
+            "category": row.category,
+            "amount": row.amount,
+            "description": row.description,
+            "display_order": row.display_order,
+        }
+        current = {
+            "category": entry.category,
+            "amount": Decimal(str(entry.amount)).quantize(_CENTS),
+            "description": entry.description,
+            "display_order": entry.display_order,
+        }
+        changed = [field for field, value in incoming.items() if current[field] != value]
+        if changed:
+            updates.append({"id": entry.id, **incoming, "updated_by": current_user.id})
+        report.append(
+            BudgetImportRowDTO(
+                line=row.line,
+                action="update" if changed else "unchanged",
+                id=entry.id,
+                fiscal_year=row.fiscal_year,
+                category=row.category,
+                path=_format_path(row.path),
+                changed_fields=changed,
+            )
+        )
+
+    if not dry_run and (creates or updates):
+        ids_by_key = {key: entry.id for key, entry in existing_by_key.items()}
+        report_by_line = {item.line: item for item in report}
+
+        # Parents must exist before their children reference them, so insert one
+        # depth level per statement; each level is a single batched INSERT.
+        creates.sort(key=lambda r: len(r.path))
+        for _depth, level in groupby(creates, key=lambda r: len(r.path)):
+            level = list(level)
+            params = [
+                {
+                    "fiscal_year": row.fiscal_year,
+                    "category": row.category,
+                    "amount": row.amount,
+                    "description": row.description,
+                    "display_order": row.display_order,
+                    "parent_category_id": ids_by_key.get(
+                        (row.fiscal_year, _path_key(row.path[:-1]))
+                    ),
+                    "updated_by": current_user.id,
+                }
+                for row in level
+            ]
+            new_ids = db.scalars(
+                insert(BudgetData).returning(BudgetData.id, sort_by_parameter_order=True),
+                params,
+            ).all()
+            for row, new_id in zip(level, new_ids):
+                ids_by_key[(row.fiscal_year, _path_key(row.path))] = new_id
+                report_by_line[row.line].id = new_id
+
+        if updates:
+            db.execute(update(BudgetData), updates)
+        db.commit()
+
+    return BudgetImportResultDTO(
+        dry_run=dry_run,
+        created=sum(1 for item in report if item.action == "create"),
+        updated=sum(1 for item in report if item.action == "update"),
+        unchanged=sum(1 for item in report if item.action == "unchanged"),
+        rows=report,
+    )
@@ -11,8 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.CarouselSlide import CarouselSlide
 from app.schemas.carousel import (
     CarouselSlideDTO,
@@ -29,7 +28,7 @@ router = APIRouter(
 
 @router.get("", response_model=list[CarouselSlideDTO])
 def list_admin_slides(
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List all carousel slides, including inactive ones, ordered by display_order."""
@@ -40,7 +39,7 @@ def list_admin_slides(
 @router.post("", response_model=CarouselSlideDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_slide(
     body: CreateCarouselSlideDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a carousel slide."""
@@ -58,7 +57,7 @@ def create_admin_slide(
 )
 def reorder_admin_slides(
     body: ReorderCarouselDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Batch-reorder carousel slides. Accepts an ordered list of slide IDs and
@@ -88,7 +87,7 @@ def reorder_admin_slides(
 def update_admin_slide(
     slide_id: int,
     body: UpdateCarouselSlideDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update carousel slide fields. Unset fields remain unchanged."""
@@ -111,7 +110,7 @@ def update_admin_slide(
 )
 def delete_admin_slide(
     slide_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a carousel slide."""
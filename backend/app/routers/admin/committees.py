@@ -3,16 +3,18 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models.cms import Committee, CommitteeMembership
 from app.models.Senator import Senator
+from app.schemas.bulk import BatchDTO
 from app.schemas.committee import CommitteeDTO
 from app.schemas.committee_admin import (
     AssignCommitteeMemberDTO,
+    CommitteeBulkItemDTO,
     CommitteeCreateDTO,
     CommitteeUpdateDTO,
 )
+from app.utils.bulk import StaleRowsError, bulk_update
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(
@@ -24,7 +26,7 @@ router = APIRouter(
 @router.get("", response_model=list[CommitteeDTO])
 def list_committees(
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     committees = (
         db.query(Committee)
@@ -70,6 +72,7 @@ def serialize_committee(committee: Committee) -> dict:
         "chair_email": committee.chair_email,
         "members": members,
         "is_active": committee.is_active,
+        "version": committee.version,
     }
 
 
@@ -77,7 +80,7 @@ def serialize_committee(committee: Committee) -> dict:
 def create_committee(
     data: CommitteeCreateDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     payload = data.model_dump()
     payload["description"] = sanitize_html(payload["description"])
@@ -90,12 +93,41 @@ def create_committee(
     return serialize_committee(new_committee)
 
 
+@router.patch(
+    "/bulk",
+    response_model=list[CommitteeDTO],
+    responses={409: {"description": "A committee was changed or deleted since it was read"}},
+)
+def bulk_update_committees(
+    body: BatchDTO[CommitteeBulkItemDTO],
+    db: Session = Depends(get_db),
+    _current_user: Principal = Depends(get_current_user),
+):
+    """Patch several committees at once (e.g. activate/deactivate a selection)."""
+    try:
+        ids = bulk_update(
+            db, Committee, [item.model_dump(exclude_none=True) for item in body.items]
+        )
+    except StaleRowsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    db.commit()
+
+    committees = (
+        db.query(Committee)
+        .options(selectinload(Committee.memberships).selectinload(CommitteeMembership.senator))
+        .filter(Committee.id.in_(ids))
+        .order_by(Committee.name)
+        .all()
+    )
+    return [serialize_committee(committee) for committee in committees]
+
+
 @router.put("/{committee_id}", response_model=CommitteeDTO)
 def update_committee(
     committee_id: int,
     data: CommitteeUpdateDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     committee = (
         db.query(Committee)
@@ -121,7 +153,7 @@ def update_committee(
 def delete_committee(
     committee_id: int,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
 ):
     committee = db.query(Committee).filter(Committee.id == committee_id).first()
     if not committee:
@@ -137,7 +169,7 @@ def add_committee_member(
     committee_id: int,
     data: AssignCommitteeMemberDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     committee = db.query(Committee).filter(Committee.id == committee_id).first()
     if not committee:
@@ -183,7 +215,7 @@ def remove_committee_member(
     committee_id: int,
     senator_id: int,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
 ):
     membership = (
         db.query(CommitteeMembership)
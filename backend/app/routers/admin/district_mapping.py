@@ -9,8 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.District import District, DistrictMapping
 from app.schemas.district import CreateDistrictMappingDTO, DistrictMappingDTO
 
@@ -23,7 +22,7 @@ router = APIRouter(
 @router.get("/{district_id}/mappings", response_model=list[DistrictMappingDTO])
 def list_district_mappings(
     district_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return all mappings for a district."""
@@ -44,7 +43,7 @@ def list_district_mappings(
 def create_district_mapping(
     district_id: int,
     body: CreateDistrictMappingDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a mapping for a district."""
@@ -70,7 +69,7 @@ def create_district_mapping(
 def delete_district_mapping(
     district_id: int,
     map_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a mapping from a district."""
@@ -11,8 +11,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.District import District
 from app.schemas.district import AdminDistrictDTO, CreateDistrictDTO, UpdateDistrictDTO
 from app.utils.sanitization import sanitize_html
@@ -25,7 +24,7 @@ router = APIRouter(
 
 @router.get("", response_model=list[AdminDistrictDTO])
 def list_admin_districts(
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return all districts."""
@@ -36,7 +35,7 @@ def list_admin_districts(
 @router.post("", response_model=AdminDistrictDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_district(
     body: CreateDistrictDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a district."""
@@ -63,7 +62,7 @@ def create_admin_district(
 def update_admin_district(
     district_id: int,
     body: UpdateDistrictDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update district fields. Unset fields remain unchanged."""
@@ -93,7 +92,7 @@ def update_admin_district(
 )
 def delete_admin_district(
     district_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a district. Blocked if senators are still assigned to it."""
@@ -10,14 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models.CalendarEvent import CalendarEvent
 from app.schemas.calendar_event import (
     AdminCalendarEventDTO,
     CreateAdminCalendarEventDTO,
     UpdateCalendarEventDTO,
 )
+from app.utils.recurrence import RecurrenceRule, series_end
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(
@@ -26,9 +26,18 @@ router = APIRouter(
 )
 
 
+def _sync_recurrence_end(event: CalendarEvent) -> None:
+    """Store where a recurring series ends so the public range query can skip it."""
+    event.recurrence_end = (
+        series_end(RecurrenceRule.parse(event.recurrence_rule), event.start_datetime)
+        if event.recurrence_rule
+        else None
+    )
+
+
 @router.get("", response_model=list[AdminCalendarEventDTO])
 def list_admin_events(
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List all calendar events, including unpublished ones."""
@@ -39,7 +48,7 @@ def list_admin_events(
 @router.post("", response_model=AdminCalendarEventDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_event(
     body: CreateAdminCalendarEventDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a calendar event. created_by is set from the authenticated user."""
@@ -48,6 +57,7 @@ def create_admin_event(
         payload["description"] = sanitize_html(payload["description"])
 
     event = CalendarEvent(**payload, created_by=current_user.id)
+    _sync_recurrence_end(event)
     db.add(event)
     db.commit()
     db.refresh(event)
@@ -62,7 +72,7 @@ def create_admin_event(
 def update_admin_event(
     event_id: int,
     body: UpdateCalendarEventDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update event fields. Unset fields remain unchanged."""
@@ -76,6 +86,7 @@ def update_admin_event(
 
     for field, value in update_data.items():
         setattr(event, field, value)
+    _sync_recurrence_end(event)
 
     db.commit()
     db.refresh(event)
@@ -89,7 +100,7 @@ def update_admin_event(
 )
 def delete_admin_event(
     event_id: int,
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Delete a calendar event. Requires admin role."""
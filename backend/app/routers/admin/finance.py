@@ -4,23 +4,28 @@ PUT    /api/admin/finance-hearings/config       — update singleton config; upd
 POST   /api/admin/finance-hearings/dates        — create hearing date
 PUT    /api/admin/finance-hearings/dates/{id}   — update hearing date fields
 DELETE /api/admin/finance-hearings/dates/{id}   — delete hearing date
+GET    /api/admin/finance-hearings/dates/{id}/bookings               — list bookings for a date
+DELETE /api/admin/finance-hearings/dates/{id}/bookings/{booking_id}  — cancel a booking
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
+from app.models.FinanceHearingBooking import FinanceHearingBooking
 from app.models.FinanceHearingConfig import FinanceHearingConfig
 from app.models.FinanceHearingDate import FinanceHearingDate
 from app.schemas.finance import (
     CreateFinanceHearingDateDTO,
+    FinanceHearingBookingDTO,
     FinanceHearingConfigDTO,
     FinanceHearingDateDTO,
     UpdateFinanceHearingConfigDTO,
     UpdateFinanceHearingDateDTO,
 )
+from app.utils.hearing_bookings import cancel_booking
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(
@@ -32,7 +37,7 @@ router = APIRouter(
 @router.put("/config", response_model=FinanceHearingConfigDTO)
 def update_finance_config(
     body: UpdateFinanceHearingConfigDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update (or create) the singleton finance hearing configuration."""
@@ -75,7 +80,7 @@ def update_finance_config(
 )
 def create_finance_date(
     body: CreateFinanceHearingDateDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a finance hearing date slot."""
@@ -98,10 +103,16 @@ def create_finance_date(
 def update_finance_date(
     date_id: int,
     body: UpdateFinanceHearingDateDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Update finance hearing date fields. Unset fields remain unchanged."""
+    """Update finance hearing date fields. Unset fields remain unchanged.
+
+    A new ``capacity`` is applied with a conditional ``UPDATE`` that only
+    matches while it still covers ``booked_count``, so a booking taken since
+    the row was read turns the change into a 409 rather than a check
+    constraint violation.
+    """
     date_entry = db.query(FinanceHearingDate).filter(FinanceHearingDate.id == date_id).first()
     if date_entry is None:
         raise HTTPException(status_code=404, detail="Hearing date not found")
@@ -109,6 +120,25 @@ def update_finance_date(
     update_data = body.model_dump(exclude_unset=True)
     if update_data.get("description") is not None:
         update_data["description"] = sanitize_html(update_data["description"])
+    capacity = update_data.pop("capacity", None)
+    if capacity is not None:
+        resized = db.execute(
+            update(FinanceHearingDate)
+            .where(FinanceHearingDate.id == date_id, FinanceHearingDate.booked_count <= capacity)
+            .values(capacity=capacity)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not resized:
+            db.rollback()
+            booked = db.scalar(
+                select(FinanceHearingDate.booked_count).where(FinanceHearingDate.id == date_id)
+            )
+            if booked is None:
+                raise HTTPException(status_code=404, detail="Hearing date not found")
+            raise HTTPException(
+                status_code=409,
+                detail=f"Capacity cannot be below the {booked} seats already booked",
+            )
 
     for field, value in update_data.items():
         setattr(date_entry, field, value)
@@ -125,7 +155,7 @@ def update_finance_date(
 )
 def delete_finance_date(
     date_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a finance hearing date slot."""
@@ -136,3 +166,52 @@ def delete_finance_date(
     db.delete(date_entry)
     db.commit()
     return None
+
+
+@router.get(
+    "/dates/{date_id}/bookings",
+    response_model=list[FinanceHearingBookingDTO],
+    responses={404: {"description": "Hearing date not found"}},
+)
+def list_finance_bookings(
+    date_id: int,
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """List the organizations booked into a hearing date, in booking order."""
+    if db.get(FinanceHearingDate, date_id) is None:
+        raise HTTPException(status_code=404, detail="Hearing date not found")
+    bookings = (
+        db.query(FinanceHearingBooking)
+        .filter(FinanceHearingBooking.hearing_date_id == date_id)
+        .order_by(FinanceHearingBooking.created_at, FinanceHearingBooking.id)
+        .all()
+    )
+    return [FinanceHearingBookingDTO.model_validate(b) for b in bookings]
+
+
+@router.delete(
+    "/dates/{date_id}/bookings/{booking_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={404: {"description": "Booking not found"}},
+)
+def delete_finance_booking(
+    date_id: int,
+    booking_id: int,
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Cancel a booking and free its seat."""
+    booking = (
+        db.query(FinanceHearingBooking)
+        .filter(
+            FinanceHearingBooking.id == booking_id,
+            FinanceHearingBooking.hearing_date_id == date_id,
+        )
+        .first()
+    )
+    if booking is None:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    cancel_booking(db, booking)
+    return None
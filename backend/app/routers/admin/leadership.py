@@ -1,9 +1,11 @@
 """Admin leadership CRUD routes.
 
-GET    /api/admin/leadership       — paginated list; optional session_number filter
-POST   /api/admin/leadership       — create leadership entry
-PUT    /api/admin/leadership/{id}  — update leadership entry
-DELETE /api/admin/leadership/{id}  — delete leadership entry (admin role required)
+GET    /api/admin/leadership          — paginated list; optional session_number filter
+POST   /api/admin/leadership          — create leadership entry
+PUT    /api/admin/leadership/reorder  — set display_order for many entries at once
+PATCH  /api/admin/leadership/bulk     — patch display_order / is_active for many entries
+PUT    /api/admin/leadership/{id}     — update leadership entry
+DELETE /api/admin/leadership/{id}     — delete leadership entry (admin role required)
 """
 
 from typing import Any
@@ -13,12 +15,18 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models.Leadership import Leadership
 from app.models.Senator import Senator
-from app.schemas.leadership import CreateLeadershipDTO, LeadershipDTO, UpdateLeadershipDTO
+from app.schemas.bulk import BatchDTO, ReorderItemDTO
+from app.schemas.leadership import (
+    BulkLeadershipItemDTO,
+    CreateLeadershipDTO,
+    LeadershipDTO,
+    UpdateLeadershipDTO,
+)
 from app.schemas.pagination import PaginatedResponse
+from app.utils.bulk import StaleRowsError, bulk_update
 from app.utils.pagination import paginate
 
 router = APIRouter(
@@ -27,7 +35,12 @@ router = APIRouter(
 )
 
 
-def _serialize_leadership(leader: Leadership) -> dict[str, Any]:
+def leadership_to_dict(leader: Leadership) -> dict[str, Any]:
+    """Convert a Leadership ORM row to a dict compatible with ``LeadershipDTO``.
+
+    Key remappings vs the model: ``headshot_url`` → ``photo_url`` and
+    ``is_active`` → ``is_current``.
+    """
     return {
         "id": leader.id,
         "senator_id": leader.senator_id,
@@ -38,32 +51,52 @@ def _serialize_leadership(leader: Leadership) -> dict[str, Any]:
         "photo_url": leader.headshot_url,
         "session_number": leader.session_number,
         "is_current": leader.is_active,
+        "display_order": leader.display_order,
+        "version": leader.version,
     }
 
 
+def _apply_batch(db: Session, rows: list[dict[str, Any]]) -> list[LeadershipDTO]:
+    try:
+        ids = bulk_update(db, Leadership, rows)
+    except StaleRowsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    db.commit()
+
+    leaders = (
+        db.query(Leadership)
+        .filter(Leadership.id.in_(ids))
+        .order_by(Leadership.display_order, Leadership.title)
+        .all()
+    )
+    return [LeadershipDTO.model_validate(leadership_to_dict(leader)) for leader in leaders]
+
+
 @router.get("", response_model=PaginatedResponse[LeadershipDTO])
 def list_admin_leadership(
     page: int = Query(default=1, ge=1, description="1-based page number"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     session_number: int | None = Query(default=None, description="Filter by session number"),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return paginated leadership entries for admin workflows."""
-    query = db.query(Leadership).order_by(Leadership.session_number.desc(), Leadership.title)
+    query = db.query(Leadership).order_by(
+        Leadership.session_number.desc(), Leadership.display_order, Leadership.title
+    )
 
     if session_number is not None:
         query = query.filter(Leadership.session_number == session_number)
 
     items, total = paginate(query, page=page, limit=limit)
-    validated = [LeadershipDTO.model_validate(_serialize_leadership(leader)) for leader in items]
+    validated = [LeadershipDTO.model_validate(leadership_to_dict(leader)) for leader in items]
     return PaginatedResponse(items=validated, total=total, page=page, limit=limit)
 
 
 @router.post("", response_model=LeadershipDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_leadership(
     body: CreateLeadershipDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a leadership entry."""
@@ -82,7 +115,35 @@ def create_admin_leadership(
             status_code=400, detail="Unable to create leadership due to invalid data"
         )
     db.refresh(leader)
-    return LeadershipDTO.model_validate(_serialize_leadership(leader))
+    return LeadershipDTO.model_validate(leadership_to_dict(leader))
+
+
+@router.put(
+    "/reorder",
+    response_model=list[LeadershipDTO],
+    responses={409: {"description": "An entry was changed or deleted since it was read"}},
+)
+def reorder_admin_leadership(
+    body: BatchDTO[ReorderItemDTO],
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Set display_order for the given leadership entries in a single statement."""
+    return _apply_batch(db, [item.model_dump(exclude_none=True) for item in body.items])
+
+
+@router.patch(
+    "/bulk",
+    response_model=list[LeadershipDTO],
+    responses={409: {"description": "An entry was changed or deleted since it was read"}},
+)
+def bulk_update_admin_leadership(
+    body: BatchDTO[BulkLeadershipItemDTO],
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Patch display_order / is_active for several leadership entries at once."""
+    return _apply_batch(db, [item.model_dump(exclude_none=True) for item in body.items])
 
 
 @router.put(
@@ -93,7 +154,7 @@ def create_admin_leadership(
 def update_admin_leadership(
     leadership_id: int,
     body: UpdateLeadershipDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update leadership fields. Unset fields remain unchanged."""
@@ -118,7 +179,7 @@ def update_admin_leadership(
             status_code=400, detail="Unable to update leadership due to invalid data"
         )
     db.refresh(leader)
-    return LeadershipDTO.model_validate(_serialize_leadership(leader))
+    return LeadershipDTO.model_validate(leadership_to_dict(leader))
 
 
 @router.delete(
@@ -128,7 +189,7 @@ def update_admin_leadership(
 )
 def delete_admin_leadership(
     leadership_id: int,
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Delete a leadership entry."""
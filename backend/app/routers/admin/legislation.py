@@ -3,9 +3,9 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models import Legislation, LegislationAction
-from app.models.Admin import Admin
+from app.schemas.bulk import BatchDTO, ReorderItemDTO
 from app.schemas.legislation import (
     CreateLegislationActionDTO,
     CreateLegislationDTO,
@@ -14,6 +14,7 @@ from app.schemas.legislation import (
     UpdateLegislationActionDTO,
     UpdateLegislationDTO,
 )
+from app.utils.bulk import StaleRowsError, bulk_update
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(
@@ -22,15 +23,6 @@ router = APIRouter(
 )
 
 
-def _load_actions(db: Session, legislation_id: int) -> list[LegislationAction]:
-    return (
-        db.query(LegislationAction)
-        .filter(LegislationAction.legislation_id == legislation_id)
-        .order_by(LegislationAction.display_order)
-        .all()
-    )
-
-
 def _sync_last_action(db: Session, legislation: Legislation) -> None:
     latest_action_date = (
         db.query(func.max(LegislationAction.action_date))
@@ -44,7 +36,7 @@ def _sync_last_action(db: Session, legislation: Legislation) -> None:
 def create_legislation(
     payload: CreateLegislationDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     payload = payload.model_dump()
     for field in ("summary", "full_text"):
@@ -59,8 +51,6 @@ def create_legislation(
     db.commit()
     db.refresh(legislation)
 
-    legislation.actions = []
-
     return legislation
 
 
@@ -69,7 +59,7 @@ def update_legislation(
     id: int,
     payload: UpdateLegislationDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     legislation = db.query(Legislation).filter(Legislation.id == id).first()
 
@@ -90,8 +80,6 @@ def update_legislation(
     db.commit()
     db.refresh(legislation)
 
-    legislation.actions = _load_actions(db, id)
-
     return legislation
 
 
@@ -99,18 +87,14 @@ def update_legislation(
 def delete_legislation(
     id: int,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
 ):
     legislation = db.query(Legislation).filter(Legislation.id == id).first()
 
     if not legislation:
         raise HTTPException(404, "Legislation not found")
 
-    db.query(LegislationAction).filter(LegislationAction.legislation_id == id).delete(
-        synchronize_session=False
-    )
-
-    db.delete(legislation)
+    db.delete(legislation)  # actions go with it (delete-orphan cascade)
     db.commit()
 
 
@@ -119,26 +103,25 @@ def add_action(
     id: int,
     payload: CreateLegislationActionDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     legislation = db.query(Legislation).filter(Legislation.id == id).first()
 
     if not legislation:
         raise HTTPException(404, "Legislation not found")
 
-    display_order = db.query(LegislationAction).filter(LegislationAction.legislation_id == id).all()
-
-    newDisplayOrder = -1
-    for action in display_order:
-        newDisplayOrder = max(newDisplayOrder, action.display_order)
-    newDisplayOrder += 1
+    next_display_order = (
+        db.query(func.coalesce(func.max(LegislationAction.display_order), -1) + 1)
+        .filter(LegislationAction.legislation_id == id)
+        .scalar()
+    )
 
     action = LegislationAction(
         legislation_id=id,
         action_date=payload.action_date,
         description=sanitize_html(payload.description),
         action_type=payload.action_type,
-        display_order=newDisplayOrder,
+        display_order=next_display_order,
     )
 
     db.add(action)
@@ -151,13 +134,48 @@ def add_action(
     return action
 
 
+@router.put(
+    "/{id}/actions/reorder",
+    response_model=list[LegislationActionDTO],
+    responses={409: {"description": "An action was changed or deleted since it was read"}},
+)
+def reorder_actions(
+    id: int,
+    body: BatchDTO[ReorderItemDTO],
+    db: Session = Depends(get_db),
+    _current_user: Principal = Depends(get_current_user),
+):
+    if db.query(Legislation.id).filter(Legislation.id == id).first() is None:
+        raise HTTPException(404, "Legislation not found")
+
+    ids = [item.id for item in body.items]
+    owned = (
+        db.query(func.count(LegislationAction.id))
+        .filter(LegislationAction.legislation_id == id, LegislationAction.id.in_(ids))
+        .scalar()
+    )
+    if owned != len(ids):
+        raise HTTPException(404, "Action not found")
+
+    try:
+        bulk_update(
+            db, LegislationAction, [item.model_dump(exclude_none=True) for item in body.items]
+        )
+    except StaleRowsError as exc:
+        raise HTTPException(409, str(exc)) from exc
+    db.commit()
+
+    legislation = db.get(Legislation, id)
+    return legislation.actions
+
+
 @router.put("/{id}/actions/{action_id}", response_model=LegislationActionDTO)
 def update_action(
     id: int,
     action_id: int,
     payload: UpdateLegislationActionDTO,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
 ):
     action = (
         db.query(LegislationAction)
@@ -197,7 +215,7 @@ def delete_action(
     id: int,
     action_id: int,
     db: Session = Depends(get_db),
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
 ):
     action = (
         db.query(LegislationAction)
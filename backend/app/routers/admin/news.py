@@ -15,8 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models.cms import News
 from app.schemas.news import AdminNewsDTO, CreateNewsDTO, UpdateNewsDTO
 from app.schemas.pagination import PaginatedResponse
@@ -50,7 +49,7 @@ def list_admin_news(
     page: int = Query(default=1, ge=1, description="1-based page number"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     is_published: Optional[bool] = Query(default=None, description="Filter by published state"),
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return a paginated list of all news articles (including drafts).
@@ -68,7 +67,7 @@ def list_admin_news(
 @router.post("", response_model=AdminNewsDTO, status_code=201)
 def create_news(
     body: CreateNewsDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new news article. author_id is set from the authenticated user."""
@@ -86,7 +85,7 @@ def create_news(
 def update_news(
     news_id: int,
     body: UpdateNewsDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update an existing news article."""
@@ -105,7 +104,7 @@ def update_news(
 @router.delete("/{news_id}", status_code=204)
 def delete_news(
     news_id: int,
-    current_user: Admin = Depends(require_role("admin")),
+    current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Delete a news article. Requires admin role (not staff)."""
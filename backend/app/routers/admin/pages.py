@@ -2,17 +2,18 @@
 
 GET /api/admin/pages        — list all static pages
 PUT /api/admin/pages/{slug} — update page content; last_edited_by set from JWT
+
+Missing default pages are created by ``script/init_db.py``. Committing an
+edit drops the cached public copy of the page (see ``app/routers/pages.py``).
 """
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.cms import StaticPageContent
 from app.schemas.static_page import StaticPageDTO, UpdateStaticPageDTO
-from app.static_pages import ensure_default_static_pages
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(
@@ -23,11 +24,10 @@ router = APIRouter(
 
 @router.get("", response_model=list[StaticPageDTO])
 def list_admin_pages(
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return all static pages."""
-    ensure_default_static_pages(db, editor=current_user, commit=True)
     pages = db.query(StaticPageContent).order_by(StaticPageContent.page_slug).all()
     return [StaticPageDTO.model_validate(p) for p in pages]
 
@@ -40,7 +40,7 @@ def list_admin_pages(
 def update_admin_page(
     slug: str,
     body: UpdateStaticPageDTO,
-    current_user: Admin = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update static page content. Pages are pre-seeded; only editing is allowed."""
@@ -4,23 +4,39 @@ GET    /api/admin/senators       — paginated list; optional is_active/session
 POST   /api/admin/senators       — create senator
 PUT    /api/admin/senators/{id}  — update senator fields
 DELETE /api/admin/senators/{id}  — delete senator (admin role required)
+POST   /api/admin/senators/roster         — bulk roster import (JSON) for a new session
+POST   /api/admin/senators/roster/upload  — bulk roster import (CSV/XLSX) for a new session
+POST   /api/admin/senators/sessions/clone — copy a session's seats and memberships forward
 """
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from pydantic import ValidationError
+from sqlalchemy import and_, exists, func, insert, literal, select, true, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user, require_role
+from app.dependencies.auth import Principal, get_current_user, require_role
 from app.models import District, Leadership
-from app.models.Admin import Admin
-from app.models.cms import CommitteeMembership
+from app.models.cms import Committee, CommitteeMembership
 from app.models.Senator import Senator
 from app.schemas.pagination import PaginatedResponse
-from app.schemas.senator import CreateSenatorDTO, SenatorDTO, UpdateSenatorDTO
+from app.schemas.senator import (
+    CloneSessionDTO,
+    CloneSessionResultDTO,
+    CreateSenatorDTO,
+    RosterCommitteeDTO,
+    RosterConflictDTO,
+    RosterEntryDTO,
+    RosterImportDTO,
+    RosterImportResultDTO,
+    SenatorDTO,
+    UpdateSenatorDTO,
+)
 from app.utils.pagination import paginate
+from app.utils.tabular import iter_upload_rows
 
 router = APIRouter(
     prefix="/api/admin/senators",
@@ -59,13 +75,172 @@ def _serialize_senator(senator: Senator) -> dict[str, Any]:
     }
 
 
+def _lookup_by_id_or_name(refs: set[str], rows: list[Any], name_attr: str) -> dict[str, int]:
+    """Map each raw reference (numeric id or case-insensitive name) to a row id."""
+    by_id = {str(row.id): row.id for row in rows}
+    by_name = {getattr(row, name_attr).casefold(): row.id for row in rows}
+    resolved: dict[str, int] = {}
+    for ref in refs:
+        row_id = by_id.get(ref.strip()) or by_name.get(ref.strip().casefold())
+        if row_id is not None:
+            resolved[ref] = row_id
+    return resolved
+
+
+def _id_or_name_filter(column_id, column_name, refs: set[str]):
+    ids = [int(ref) for ref in refs if ref.strip().isdigit()]
+    names = [ref.strip().casefold() for ref in refs]
+    return column_id.in_(ids) | func.lower(column_name).in_(names)
+
+
+def _import_roster(
+    db: Session,
+    session_number: int,
+    entries: list[tuple[int, RosterEntryDTO]],
+    conflicts: list[RosterConflictDTO],
+    deactivate_previous: bool,
+    dry_run: bool,
+) -> RosterImportResultDTO:
+    """Validate a roster against the DB in a fixed number of queries and insert it."""
+    district_refs = {entry.district for _, entry in entries}
+    committee_refs = {c.committee for _, entry in entries for c in entry.committees}
+
+    districts = (
+        db.query(District.id, District.district_name)
+        .filter(_id_or_name_filter(District.id, District.district_name, district_refs))
+        .all()
+        if district_refs
+        else []
+    )
+    district_ids = _lookup_by_id_or_name(district_refs, districts, "district_name")
+
+    committees = (
+        db.query(Committee.id, Committee.name)
+        .filter(_id_or_name_filter(Committee.id, Committee.name, committee_refs))
+        .all()
+        if committee_refs
+        else []
+    )
+    committee_ids = _lookup_by_id_or_name(committee_refs, committees, "name")
+
+    existing_emails = {
+        email.casefold()
+        for (email,) in db.query(Senator.email)
+        .filter(Senator.session_number == session_number)
+        .all()
+    }
+
+    senator_rows: list[dict[str, Any]] = []
+    pending_memberships: list[list[dict[str, Any]]] = []
+    seen_emails: dict[str, int] = {}
+    for line, entry in entries:
+        email_key = entry.email.casefold()
+        if email_key in existing_emails:
+            reason = f"Senator already exists in session {session_number}"
+        elif email_key in seen_emails:
+            reason = f"Duplicate of line {seen_emails[email_key]}"
+        elif entry.district not in district_ids:
+            reason = f"District '{entry.district}' not found"
+        else:
+            reason = None
+        if reason is not None:
+            conflicts.append(RosterConflictDTO(line=line, email=entry.email, reason=reason))
+            continue
+        seen_emails[email_key] = line
+
+        memberships: dict[int, dict[str, Any]] = {}
+        for assignment in entry.committees:
+            committee_id = committee_ids.get(assignment.committee)
+            if committee_id is None:
+                conflicts.append(
+                    RosterConflictDTO(
+                        line=line,
+                        email=entry.email,
+                        reason=f"Committee '{assignment.committee}' not found; membership skipped",
+                    )
+                )
+                continue
+            memberships[committee_id] = {"committee_id": committee_id, "role": assignment.role}
+
+        senator_rows.append(
+            {
+                "first_name": entry.first_name,
+                "last_name": entry.last_name,
+                "email": entry.email,
+                "headshot_url": entry.headshot_url,
+                "district": district_ids[entry.district],
+                "is_active": True,
+                "session_number": session_number,
+            }
+        )
+        pending_memberships.append(list(memberships.values()))
+
+    deactivate_filter = and_(Senator.session_number < session_number, Senator.is_active == true())
+    if dry_run:
+        deactivated = (
+            db.query(func.count(Senator.id)).filter(deactivate_filter).scalar()
+            if deactivate_previous and senator_rows
+            else 0
+        )
+    else:
+        deactivated = 0
+        if senator_rows:
+            senator_ids = db.scalars(
+                insert(Senator).returning(Senator.id, sort_by_parameter_order=True),
+                senator_rows,
+            ).all()
+            membership_rows = [
+                {"senator_id": senator_id, **membership}
+                for senator_id, memberships in zip(senator_ids, pending_memberships)
+                for membership in memberships
+            ]
+            if membership_rows:
+                db.execute(insert(CommitteeMembership), membership_rows)
+            if deactivate_previous:
+                deactivated = db.execute(
+                    update(Senator)
+                    .where(deactivate_filter)
+                    .values(is_active=False)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=400, detail="Unable to import roster due to invalid data"
+            )
+
+    return RosterImportResultDTO(
+        session_number=session_number,
+        dry_run=dry_run,
+        created=len(senator_rows),
+        memberships_created=sum(len(m) for m in pending_memberships),
+        deactivated=deactivated,
+        conflicts=conflicts,
+    )
+
+
+def _parse_roster_committees(raw: str) -> list[RosterCommitteeDTO]:
+    """Parse ``"Finance:Chair; Judiciary"`` into committee assignments."""
+    assignments = []
+    for part in raw.split(";"):
+        if not part.strip():
+            continue
+        committee, _, role = part.partition(":")
+        assignments.append(
+            RosterCommitteeDTO(committee=committee.strip(), role=role.strip() or "Member")
+        )
+    return assignments
+
+
 @router.get("", response_model=PaginatedResponse[SenatorDTO])
 def list_admin_senators(
     page: int = Query(default=1, ge=1, description="1-based page number"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     is_active: bool | None = Query(default=None, description="Filter by active state"),
     session: int | None = Query(default=None, description="Filter by session number"),
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return a paginated list of senators for admin workflows."""
@@ -87,7 +262,7 @@ def list_admin_senators(
 @router.post("", response_model=SenatorDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_senator(
     body: CreateSenatorDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a senator record."""
@@ -118,7 +293,7 @@ def create_admin_senator(
 def update_admin_senator(
     senator_id: int,
     body: UpdateSenatorDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update senator fields. Unset fields remain unchanged."""
@@ -158,7 +333,7 @@ def update_admin_senator(
 )
 def delete_admin_senator(
     senator_id: int,
-    _current_user: Admin = Depends(require_role("admin")),
+    _current_user: Principal = Depends(require_role("admin")),
     db: Session = Depends(get_db),
 ):
     """Delete a senator, blocking deletion when leadership references still exist."""
@@ -177,3 +352,167 @@ def delete_admin_senator(
     db.delete(senator)
     db.commit()
     return None
+
+
+@router.post(
+    "/roster",
+    response_model=RosterImportResultDTO,
+    responses={400: {"description": "Roster could not be imported"}},
+)
+def import_roster(
+    body: RosterImportDTO,
+    dry_run: bool = Query(default=False, description="Validate without writing"),
+    _current_user: Principal = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    """Create a session's senators and committee memberships in one transaction.
+
+    Rows that conflict with existing data are skipped and reported. When
+    ``deactivate_previous`` is set, senators from earlier sessions are marked
+    inactive in the same transaction.
+    """
+    entries = list(enumerate(body.senators, start=1))
+    return _import_roster(db, body.session_number, entries, [], body.deactivate_previous, dry_run)
+
+
+@router.post(
+    "/roster/upload",
+    response_model=RosterImportResultDTO,
+    responses={400: {"description": "Roster could not be imported"}},
+)
+def import_roster_file(
+    session_number: int = Query(..., description="Session the roster belongs to"),
+    deactivate_previous: bool = Query(
+        default=True, description="Mark senators from earlier sessions inactive"
+    ),
+    dry_run: bool = Query(default=False, description="Validate without writing"),
+    file: UploadFile = File(...),
+    _current_user: Principal = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    """CSV/XLSX variant of the roster import.
+
+    Expected columns: first_name, last_name, email, district, headshot_url,
+    committees. ``committees`` is a ``;``-separated list of ``name:role``
+    pairs, e.g. ``Finance Committee:Chair; Judiciary Committee``.
+    """
+    entries: list[tuple[int, RosterEntryDTO]] = []
+    conflicts: list[RosterConflictDTO] = []
+    for line, row in iter_upload_rows(file):
+        try:
+            entry = RosterEntryDTO(
+                first_name=row.get("first_name", ""),
+                last_name=row.get("last_name", ""),
+                email=row.get("email", ""),
+                district=row.get("district") or row.get("district_id", ""),
+                headshot_url=row.get("headshot_url") or None,
+                committees=_parse_roster_committees(row.get("committees", "")),
+            )
+        except ValidationError as exc:
+            fields = ", ".join(str(error["loc"][0]) for error in exc.errors())
+            conflicts.append(
+                RosterConflictDTO(line=line, email=row.get("email", ""), reason=f"Invalid {fields}")
+            )
+            continue
+        if not entry.first_name or not entry.last_name or not entry.district:
+            conflicts.append(
+                RosterConflictDTO(line=line, email=entry.email, reason="Missing required fields")
+            )
+            continue
+        entries.append((line, entry))
+
+    return _import_roster(db, session_number, entries, conflicts, deactivate_previous, dry_run)
+
+
+@router.post(
+    "/sessions/clone",
+    response_model=CloneSessionResultDTO,
+    responses={
+        400: {"description": "Invalid source/target sessions"},
+        404: {"description": "Source session has no active senators"},
+    },
+)
+def clone_session(
+    body: CloneSessionDTO,
+    _current_user: Principal = Depends(require_role("admin")),
+    db: Session = Depends(get_db),
+):
+    """Copy a session's active senator seats (district assignments) and their
+    committee memberships into a new session with set-based INSERT ... SELECT
+    statements, all in one transaction. Senators already present in the target
+    session (matched by email) are left as they are.
+    """
+    source, target = body.source_session, body.target_session
+    if source == target:
+        raise HTTPException(status_code=400, detail="Target session must differ from source")
+
+    source_active = and_(Senator.session_number == source, Senator.is_active == true())
+    if db.query(Senator.id).filter(source_active).first() is None:
+        raise HTTPException(status_code=404, detail="Source session has no active senators")
+
+    in_target = aliased(Senator)
+    senator_columns = ["first_name", "last_name", "email", "headshot_url", "district"]
+    senators_cloned = db.execute(
+        insert(Senator).from_select(
+            [*senator_columns, "is_active", "session_number"],
+            select(
+                *(getattr(Senator, column) for column in senator_columns),
+                true(),
+                literal(target),
+            ).where(
+                source_active,
+                ~exists().where(
+                    in_target.session_number == target,
+                    func.lower(in_target.email) == func.lower(Senator.email),
+                ),
+            ),
+        )
+    ).rowcount
+
+    old, new = aliased(Senator), aliased(Senator)
+    existing_membership = aliased(CommitteeMembership)
+    memberships_cloned = db.execute(
+        insert(CommitteeMembership).from_select(
+            ["senator_id", "committee_id", "role"],
+            select(new.id, CommitteeMembership.committee_id, CommitteeMembership.role)
+            .join(old, old.id == CommitteeMembership.senator_id)
+            .join(
+                new,
+                and_(
+                    func.lower(new.email) == func.lower(old.email),
+                    new.session_number == target,
+                ),
+            )
+            .where(
+                old.session_number == source,
+                old.is_active == true(),
+                ~exists().where(
+                    existing_membership.senator_id == new.id,
+                    existing_membership.committee_id == CommitteeMembership.committee_id,
+                ),
+            ),
+        )
+    ).rowcount
+
+    deactivated = 0
+    if body.deactivate_source:
+        deactivated = db.execute(
+            update(Senator)
+            .where(source_active)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unable to clone session due to invalid data")
+
+    return CloneSessionResultDTO(
+        source_session=source,
+        target_session=target,
+        senators_cloned=senators_cloned,
+        memberships_cloned=memberships_cloned,
+        deactivated=deactivated,
+    )
@@ -1,18 +1,27 @@
 """Admin staff CRUD routes.
 
-POST   /api/admin/staff       — create staff member
-PUT    /api/admin/staff/{id}  — update staff fields
-DELETE /api/admin/staff/{id}  — delete staff member
+POST   /api/admin/staff          — create staff member
+PUT    /api/admin/staff/reorder  — set display_order for many staff members at once
+PATCH  /api/admin/staff/bulk     — patch display_order / is_active for many staff members
+PUT    /api/admin/staff/{id}     — update staff fields
+DELETE /api/admin/staff/{id}     — delete staff member
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.Admin import Admin
+from app.dependencies.auth import Principal, get_current_user
 from app.models.cms import Staff
-from app.schemas.staff import AdminStaffDTO, CreateStaffDTO, StaffDTO, UpdateStaffDTO
+from app.schemas.bulk import BatchDTO, ReorderItemDTO
+from app.schemas.staff import (
+    AdminStaffDTO,
+    BulkStaffItemDTO,
+    CreateStaffDTO,
+    StaffDTO,
+    UpdateStaffDTO,
+)
+from app.utils.bulk import StaleRowsError, bulk_update
 
 router = APIRouter(
     prefix="/api/admin/staff",
@@ -20,9 +29,25 @@ router = APIRouter(
 )
 
 
+def _apply_batch(db: Session, rows: list[dict]) -> list[AdminStaffDTO]:
+    try:
+        ids = bulk_update(db, Staff, rows)
+    except StaleRowsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    db.commit()
+
+    staff = (
+        db.query(Staff)
+        .filter(Staff.id.in_(ids))
+        .order_by(Staff.display_order, Staff.last_name)
+        .all()
+    )
+    return [AdminStaffDTO.model_validate(s) for s in staff]
+
+
 @router.get("", response_model=list[AdminStaffDTO])
 def list_admin_staff(
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Return all staff members ordered by display_order."""
@@ -33,7 +58,7 @@ def list_admin_staff(
 @router.post("", response_model=StaffDTO, status_code=status.HTTP_201_CREATED)
 def create_admin_staff(
     body: CreateStaffDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a staff member."""
@@ -44,6 +69,34 @@ def create_admin_staff(
     return StaffDTO.model_validate(staff)
 
 
+@router.put(
+    "/reorder",
+    response_model=list[AdminStaffDTO],
+    responses={409: {"description": "A staff member was changed or deleted since it was read"}},
+)
+def reorder_admin_staff(
+    body: BatchDTO[ReorderItemDTO],
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Set display_order for the given staff members in a single statement."""
+    return _apply_batch(db, [item.model_dump(exclude_none=True) for item in body.items])
+
+
+@router.patch(
+    "/bulk",
+    response_model=list[AdminStaffDTO],
+    responses={409: {"description": "A staff member was changed or deleted since it was read"}},
+)
+def bulk_update_admin_staff(
+    body: BatchDTO[BulkStaffItemDTO],
+    _current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Patch display_order / is_active for several staff members at once."""
+    return _apply_batch(db, [item.model_dump(exclude_none=True) for item in body.items])
+
+
 @router.put(
     "/{staff_id}",
     response_model=StaffDTO,
@@ -52,7 +105,7 @@ def create_admin_staff(
 def update_admin_staff(
     staff_id: int,
     body: UpdateStaffDTO,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update staff fields. Unset fields remain unchanged."""
@@ -75,7 +128,7 @@ def update_admin_staff(
 )
 def delete_admin_staff(
     staff_id: int,
-    _current_user: Admin = Depends(get_current_user),
+    _current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete a staff member."""
@@ -1,109 +1,144 @@
 """Admin upload endpoints for image assets."""
 
-from io import BytesIO
-from pathlib import Path
-from uuid import uuid4
+import json
+from typing import Any
 
+import anyio
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from PIL import Image, ImageOps, UnidentifiedImageError
 
-from app.config import MAX_UPLOAD_SIZE_BYTES, UPLOAD_BASE_URL, UPLOAD_DIR
-from app.dependencies.auth import get_current_user
-from app.models import Admin
+from app.config import (
+    IMAGE_MAX_PENDING,
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    IMAGE_WORKERS,
+    MAX_UPLOAD_SIZE_BYTES,
+    UPLOAD_BASE_URL,
+)
+from app.dependencies.auth import Principal, get_current_user
+from app.utils.image_processing import (
+    EncodedImage,
+    ImagePool,
+    ImagePoolBusyError,
+    ImageRejectedError,
+    ProcessedImage,
+)
+from app.utils.storage import Storage, get_storage
+from app.utils.upload_storage import content_key, shard_path
+from app.utils.upload_stream import read_upload, save_upload
 
 router = APIRouter(prefix="/api/admin", tags=["admin-upload"])
 
-_ALLOWED_FORMATS = {
-    "JPEG": "jpg",
-    "PNG": "png",
-    "WEBP": "webp",
-}
+image_pool = ImagePool(
+    workers=IMAGE_WORKERS,
+    max_pending=IMAGE_MAX_PENDING,
+    variant_widths=tuple(IMAGE_VARIANT_WIDTHS),
+    variant_formats=tuple(IMAGE_VARIANT_FORMATS),
+)
 
+_IMAGE_TYPES = {"jpeg", "png", "webp"}
 
-def _validate_and_load_image(content: bytes) -> tuple[Image.Image, str]:
-    """Validate uploaded bytes as a supported image and return image + extension."""
-    if len(content) > MAX_UPLOAD_SIZE_BYTES:
-        raise HTTPException(status_code=413, detail="File too large. Max size is 5MB")
 
-    try:
-        image = Image.open(BytesIO(content))
-        image.load()
-    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as exc:
-        raise HTTPException(status_code=400, detail="Unsupported file type") from exc
-
-    fmt = (image.format or "").upper()
-    if fmt not in _ALLOWED_FORMATS:
-        raise HTTPException(status_code=400, detail="Unsupported file type")
-
-    return image, _ALLOWED_FORMATS[fmt]
-
-
-def _validate_pdf(content: bytes) -> None:
-    if len(content) > MAX_UPLOAD_SIZE_BYTES:
-        raise HTTPException(status_code=413, detail="File too large. Max size is 5MB")
-    if not content.startswith(b"%PDF-"):
-        raise HTTPException(status_code=400, detail="Unsupported file type")
+def _image_suffix(image: EncodedImage) -> str:
+    if image.role == "standard":
+        return f".{image.extension}"
+    if image.role == "thumbnail":
+        return f"_thumb.{image.extension}"
+    return f"_{image.width}w.{image.extension}"
 
 
-def _save_pdf(content: bytes) -> str:
-    uploads_dir = Path(UPLOAD_DIR)
-    uploads_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{uuid4().hex}.pdf"
-    (uploads_dir / filename).write_bytes(content)
-    return filename
-
-
-def _save_resized_images(image: Image.Image, extension: str) -> str:
-    """Save standard and thumbnail variants and return the main filename."""
-    uploads_dir = Path(UPLOAD_DIR)
-    uploads_dir.mkdir(parents=True, exist_ok=True)
-
-    base_name = uuid4().hex
-    main_filename = f"{base_name}.{extension}"
-    thumb_filename = f"{base_name}_thumb.{extension}"
+def _load_manifest(storage: Storage, key: str) -> dict[str, Any] | None:
+    try:
+        return json.loads(storage.read(shard_path(key, ".json")))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _save_image_variants(storage: Storage, key: str, processed: ProcessedImage) -> dict[str, Any]:
+    """Write every encoded output and return the upload manifest.
+
+    The manifest is saved next to the images last, so its presence means the
+    whole set was written; a re-upload of the same bytes just returns it.
+    """
+    entries = []
+    for image in processed.images:
+        relpath = shard_path(key, _image_suffix(image))
+        storage.write(relpath, image.data)
+        entries.append(
+            {
+                "url": f"{UPLOAD_BASE_URL}/{relpath}",
+                "role": image.role,
+                "format": image.extension,
+                "width": image.width,
+                "height": image.height,
+                "bytes": len(image.data),
+            }
+        )
+
+    standard, thumbnail = entries[0], entries[1]
+    manifest = {
+        "url": standard["url"],
+        "width": standard["width"],
+        "height": standard["height"],
+        "thumbnail": thumbnail,
+        "variants": [entry for entry in entries if entry["role"] == "variant"],
+    }
+    storage.write(shard_path(key, ".json"), json.dumps(manifest).encode(), "application/json")
+    return manifest
 
-    save_kwargs: dict[str, int | bool] = {}
-    if extension in {"jpg", "webp"}:
-        save_kwargs["quality"] = 90
-    if extension == "jpg":
-        save_kwargs["optimize"] = True
 
-    working = image.convert("RGB") if extension == "jpg" else image.copy()
+@router.post("/upload")
+async def upload_image(
+    file: UploadFile = File(...),
+    storage: Storage = Depends(get_storage),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Upload an image and return its URLs.
+
+    Files are named by the SHA-256 of the uploaded bytes, so uploading the
+    same image again returns the stored manifest without re-encoding.
+    ``url`` is the 800px standard image. ``variants`` lists every responsive
+    width/format with its dimensions and byte size, for building ``srcset``.
+    Decoding and resizing run in ``image_pool`` and the files are written from
+    a worker thread, so the event loop stays free for other requests.
+    """
+    _ = current_user
+    _, content = await read_upload(file, max_bytes=MAX_UPLOAD_SIZE_BYTES, allowed=_IMAGE_TYPES)
 
-    standard = working.copy()
-    if standard.width > 800:
-        ratio = 800 / standard.width
-        resized_height = round(standard.height * ratio)
-        standard = standard.resize((800, resized_height), Image.Resampling.LANCZOS)
-    standard.save(uploads_dir / main_filename, **save_kwargs)
+    key = content_key(content)
+    existing = await anyio.to_thread.run_sync(_load_manifest, storage, key)
+    if existing is not None:
+        return existing
 
-    thumb = ImageOps.fit(working.copy(), (150, 150), method=Image.Resampling.LANCZOS)
-    thumb.save(uploads_dir / thumb_filename, **save_kwargs)
+    try:
+        processed = await image_pool.process(content)
+    except ImageRejectedError as exc:
+        raise HTTPException(status_code=400, detail="Unsupported file type") from exc
+    except ImagePoolBusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
 
-    return main_filename
+    return await anyio.to_thread.run_sync(_save_image_variants, storage, key, processed)
 
 
-@router.post("/upload")
-async def upload_image(
-    file: UploadFile = File(...),
-    current_user: Admin = Depends(get_current_user),
-):
-    """Upload an image and return a relative URL to the resized standard image."""
+@router.get("/upload/stats")
+def upload_stats(current_user: Principal = Depends(get_current_user)):
+    """Return image-processing queue depth and throughput counters."""
     _ = current_user
-    content = await file.read()
-    image, extension = _validate_and_load_image(content)
-    filename = _save_resized_images(image, extension)
-    return {"url": f"{UPLOAD_BASE_URL}/{filename}"}
+    return image_pool.stats()
 
 
 @router.post("/upload/pdf")
 async def upload_pdf(
     file: UploadFile = File(...),
-    current_user: Admin = Depends(get_current_user),
+    storage: Storage = Depends(get_storage),
+    current_user: Principal = Depends(get_current_user),
 ):
-    """Upload a PDF and return a relative URL to the stored file."""
+    """Upload a PDF and return a relative URL to the stored file.
+
+    The body is streamed to a temp file and stored once complete;
+    uploading identical bytes again returns the existing URL.
+    """
     _ = current_user
-    content = await file.read()
-    _validate_pdf(content)
-    filename = _save_pdf(content)
-    return {"url": f"{UPLOAD_BASE_URL}/{filename}"}
+    relpath = await save_upload(
+        file, storage, "pdf", max_bytes=MAX_UPLOAD_SIZE_BYTES, allowed={"pdf"}
+    )
+    return {"url": f"{UPLOAD_BASE_URL}/{relpath}"}
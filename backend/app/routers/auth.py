@@ -1,15 +1,17 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import Session
 
+from app.config import PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_WORKERS
 from app.database import get_db
 from app.models import Admin
 from app.schemas.account import MAX_PASSWORD_LENGTH, validate_onyen
-from app.utils.auth import create_access_token, get_current_user, require_role
-from app.utils.passwords import verify_password
+from app.utils.auth import Principal, create_access_token, get_current_user, require_role
+from app.utils.passwords import HashingPool, HashingPoolBusyError
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -17,6 +19,8 @@ MAX_FAILED_LOGIN_ATTEMPTS = 5
 FAILED_LOGIN_WINDOW = timedelta(minutes=15)
 failed_login_attempts: Dict[Tuple[str, str], List[datetime]] = {}
 
+password_pool = HashingPool(workers=PASSWORD_HASH_WORKERS, max_pending=PASSWORD_HASH_MAX_PENDING)
+
 
 class LoginRequest(BaseModel):
     onyen: str
@@ -56,23 +60,63 @@ def clear_failed_logins(request: Request, onyen: str) -> None:
     failed_login_attempts.pop(_login_rate_limit_key(request, onyen), None)
 
 
+def _find_admin(db: Session, onyen: str) -> Admin | None:
+    return db.query(Admin).filter(Admin.onyen == onyen).first()
+
+
+def _token_claims(user: Admin) -> Dict[str, Any]:
+    return {"sub": str(user.id), "ver": user.token_version}
+
+
+def _store_rehashed_password(db: Session, user: Admin, password_hash: str) -> Dict[str, Any]:
+    """Save ``password_hash`` and return the token claims.
+
+    The commit expires ``user``, so the claims are read here, where reloading
+    it is a blocking query that is allowed, instead of on the event loop.
+    """
+    user.password_hash = password_hash
+    db.commit()
+    return _token_claims(user)
+
+
 @router.post("/login")
-def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)):
-    check_login_rate_limit(request, payload.onyen)
-    user = db.query(Admin).filter(Admin.onyen == payload.onyen).first()
+async def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)):
+    """Exchange an Onyen and password for an access token.
 
-    if not user or not verify_password(payload.password, user.password_hash):
+    The password check runs in ``password_pool`` so slow hashing never holds a
+    request thread; a hash made with outdated settings is replaced on success.
+    """
+    check_login_rate_limit(request, payload.onyen)
+    user = await run_in_threadpool(_find_admin, db, payload.onyen)
+
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = await password_pool.verify_and_update(
+                payload.password, user.password_hash
+            )
+        except HashingPoolBusyError as exc:
+            raise HTTPException(
+                status_code=503, detail=str(exc), headers={"Retry-After": "1"}
+            ) from exc
+
+    if not verified:
         record_failed_login(request, payload.onyen)
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    if new_hash:
+        claims = await run_in_threadpool(_store_rehashed_password, db, user, new_hash)
+    else:
+        claims = _token_claims(user)
+
     clear_failed_logins(request, payload.onyen)
-    token = create_access_token(data={"sub": str(user.id)})
+    token = create_access_token(data=claims)
 
     return {"access_token": token, "token_type": "bearer"}
 
 
 @router.get("/me")
-def get_me(current_user: Admin = Depends(get_current_user)):
+def get_me(current_user: Principal = Depends(get_current_user)):
     return {
         "id": current_user.id,
         "email": current_user.email,
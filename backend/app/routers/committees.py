@@ -1,14 +1,35 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, selectinload
 
 from app.database import get_db
-from app.models import Committee, CommitteeMembership
-from app.schemas.committee import CommitteeDTO
+from app.models import Committee, CommitteeMembership, Senator
+from app.routers.senators import senator_to_dict
+from app.schemas.committee import CommitteeDTO, CommitteeRosterDTO
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(prefix="/api/committees", tags=["committees"])
 
 
+def committee_entry_to_dict(committee: Committee) -> dict[str, Any]:
+    """A committee for a roster that lists each member senator once, by id.
+
+    Members carry only ``senator_id`` and ``role``; the caller serializes the
+    senators themselves (see ``senator_to_dict``). Reads ``committee.memberships``,
+    so load it eagerly.
+    """
+    return {
+        "id": committee.id,
+        "name": committee.name,
+        "description": sanitize_html(committee.description),
+        "chair_name": committee.chair_name,
+        "chair_email": committee.chair_email,
+        "is_active": committee.is_active,
+        "members": [{"senator_id": m.senator_id, "role": m.role} for m in committee.memberships],
+    }
+
+
 @router.get("/", response_model=list[CommitteeDTO])
 def get_committees(db: Session = Depends(get_db)):
     committees = (
@@ -59,6 +80,39 @@ def get_committees(db: Session = Depends(get_db)):
     return result
 
 
+@router.get("/roster", response_model=CommitteeRosterDTO)
+def get_committee_roster(db: Session = Depends(get_db)):
+    """Active committees plus every member's full set of committee assignments.
+
+    Each senator appears once in ``senators`` however many committees they sit
+    on. Their other memberships come from one extra set query over all the
+    involved senators rather than a request per senator.
+    """
+    committees = (
+        db.query(Committee)
+        .options(
+            selectinload(Committee.memberships)
+            .selectinload(CommitteeMembership.senator)
+            .selectinload(Senator.committee_memberships)
+            .selectinload(CommitteeMembership.committee)
+        )
+        .filter(Committee.is_active)
+        .order_by(Committee.name)
+        .all()
+    )
+
+    senators = {}
+    result = []
+    for committee in committees:
+        for membership in committee.memberships:
+            senator = membership.senator
+            if senator.id not in senators:
+                senators[senator.id] = senator_to_dict(senator)
+        result.append(committee_entry_to_dict(committee))
+
+    return {"committees": result, "senators": senators}
+
+
 @router.get("/{id}", response_model=CommitteeDTO)
 def get_committee(id: int, db: Session = Depends(get_db)):
     committee = (
@@ -1,15 +1,15 @@
-import smtplib
 from datetime import datetime, timedelta
-from email.message import EmailMessage
 from typing import Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
-from app.config import SMTP_FROM, SMTP_HOST, SMTP_PASSWORD, SMTP_PORT, SMTP_USER
+from app.config import CONTACT_DIGEST_WINDOW_MINUTES
 from app.database import get_db
 from app.models.Senator import Senator
 from app.schemas.contact import ContactRequest, ContactResponse
+from app.utils.contact_digest import add_to_digest, message_body, message_subject
+from app.utils.outbox import enqueue_email, outbox_worker
 
 router = APIRouter(prefix="/api/contact", tags=["contact"])
 
@@ -37,35 +37,6 @@ def check_rate_limit(request: Request):
     ip_logs[client_ip].append(now)
 
 
-def send_email(to_email: str, reply_to: str, subject: str, body: str):
-    # Graceful degradation if SMTP isn't configured for local dev
-    if not SMTP_HOST or not SMTP_USER or not SMTP_PASSWORD:
-        print("----------------------------------------")
-        print(f"MOCK EMAIL WOULD SEND TO: {to_email}")
-        print(f"REPLY-TO: {reply_to}")
-        print(f"SUBJECT: {subject}")
-        print(f"BODY:\n{body}")
-        print("----------------------------------------")
-        return
-
-    msg = EmailMessage()
-    msg.set_content(body)
-    msg["Subject"] = subject
-    msg["From"] = SMTP_FROM
-    msg["To"] = to_email
-    msg.add_header("reply-to", reply_to)
-
-    try:
-        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASSWORD)
-        server.send_message(msg)
-        server.quit()
-    except Exception as e:
-        # Log error but don't crash user submission
-        print(f"Failed to send email: {e}")
-
-
 @router.post("", response_model=ContactResponse)
 def submit_contact_form(payload: ContactRequest, request: Request, db: Session = Depends(get_db)):
     # 1. Enforce Rate Limit
@@ -79,10 +50,27 @@ def submit_contact_form(payload: ContactRequest, request: Request, db: Session =
             raise HTTPException(status_code=404, detail="Senator not found")
         target_email = senator.email
 
-    # 3. Dispatch Email
-    subject_line = f"New Message via Senate Portal from {payload.name}"
-    body_text = f"Name: {payload.name}\nEmail: {payload.email}\n\nMessage:\n{payload.message}"
-
-    send_email(to_email=target_email, reply_to=payload.email, subject=subject_line, body=body_text)
+    # 3. Digest mode: hold the message for the recipient's next digest email
+    if CONTACT_DIGEST_WINDOW_MINUTES > 0:
+        add_to_digest(
+            db,
+            to_email=target_email,
+            sender_name=payload.name,
+            sender_email=payload.email,
+            message=payload.message,
+        )
+        db.commit()
+        return ContactResponse(success=True)
+
+    # 4. Queue Email (sent by the outbox worker, see app/utils/outbox.py)
+    enqueue_email(
+        db,
+        to_email=target_email,
+        reply_to=payload.email,
+        subject=message_subject(payload.name),
+        body=message_body(payload.name, payload.email, payload.message),
+    )
+    db.commit()
+    outbox_worker.wake()
 
     return ContactResponse(success=True)
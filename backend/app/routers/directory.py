@@ -0,0 +1,127 @@
+"""Directory bundle public API route.
+
+GET /api/directory — senators, committees, districts, leadership, staff and
+                     carousel slides in one response
+
+The homepage and directory pages need all of these on first paint. Fetched
+separately, each endpoint resolves the current session again and serializes
+its own copy of every senator it mentions. The bundle loads each collection
+once, lists every senator once in a ``senators`` map that the other
+collections reference by id, and caches the rendered JSON until a commit
+touches one of the models involved (see ``app.utils.change_tracking``).
+"""
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import or_, select, true
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import DIRECTORY_CACHE_SECONDS
+from app.database import get_db
+from app.models import (
+    CarouselSlide,
+    Committee,
+    CommitteeMembership,
+    District,
+    Leadership,
+    Senator,
+    Staff,
+)
+from app.routers.admin.leadership import leadership_to_dict
+from app.routers.committees import committee_entry_to_dict
+from app.routers.senators import senator_to_dict
+from app.schemas.directory import DirectoryDTO
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
+from app.utils.current_session import current_session
+
+router = APIRouter(prefix="/api/directory", tags=["directory"])
+
+DIRECTORY_MODELS = (
+    CarouselSlide,
+    Committee,
+    CommitteeMembership,
+    District,
+    Leadership,
+    Senator,
+    Staff,
+)
+
+directory_cache = TTLCache(maxsize=1, ttl=DIRECTORY_CACHE_SECONDS, name="directory")
+on_commit(DIRECTORY_MODELS, lambda _changed: directory_cache.clear())
+
+
+def build_directory(db: Session) -> DirectoryDTO:
+    committees = (
+        db.query(Committee)
+        .options(selectinload(Committee.memberships))
+        .filter(Committee.is_active)
+        .order_by(Committee.name)
+        .all()
+    )
+
+    # Active senators of every session (the district pages list them all) plus
+    # anyone seated on an active committee. The committees loaded above are
+    # already in the identity map, so only inactive ones need fetching here.
+    member_ids = {m.senator_id for committee in committees for m in committee.memberships}
+    senators = (
+        db.query(Senator)
+        .options(
+            selectinload(Senator.committee_memberships).selectinload(CommitteeMembership.committee)
+        )
+        .filter(or_(Senator.is_active == true(), Senator.id.in_(member_ids)))
+        .order_by(Senator.id)
+        .all()
+    )
+
+    senator_session = current_session(db, "senators")
+    district_senators: dict[int, list[int]] = {}
+    for senator in senators:
+        if senator.is_active:
+            district_senators.setdefault(senator.district, []).append(senator.id)
+
+    leadership = (
+        db.query(Leadership)
+        .filter(Leadership.session_number == current_session(db, "leadership"))
+        .order_by(Leadership.display_order, Leadership.title)
+        .all()
+    )
+    staff = db.query(Staff).filter(Staff.is_active == true()).order_by(Staff.display_order).all()
+    slides = db.scalars(
+        select(CarouselSlide)
+        .where(CarouselSlide.is_active == true())
+        .order_by(CarouselSlide.display_order)
+    ).all()
+
+    return DirectoryDTO.model_validate(
+        {
+            "senators": {senator.id: senator_to_dict(senator) for senator in senators},
+            "current_senator_ids": [
+                senator.id
+                for senator in senators
+                if senator.is_active and senator.session_number == senator_session
+            ],
+            "committees": [committee_entry_to_dict(committee) for committee in committees],
+            "districts": [
+                {
+                    "id": district.id,
+                    "district_name": district.district_name,
+                    "description": district.description,
+                    "senator_ids": district_senators.get(district.id, []),
+                }
+                for district in db.query(District).order_by(District.id).all()
+            ],
+            "leadership": [leadership_to_dict(leader) for leader in leadership],
+            "staff": staff,
+            "carousel": slides,
+        }
+    )
+
+
+@router.get("", response_model=DirectoryDTO)
+def get_directory(db: Session = Depends(get_db)):
+    generation = directory_cache.generation
+    body = directory_cache.get("directory")
+    if body is None:
+        body = build_directory(db).model_dump_json().encode()
+        directory_cache.set("directory", body, generation=generation)
+    return Response(content=body, media_type="application/json")
@@ -1,21 +1,103 @@
 """Calendar events public API routes (TDD Section 4.5.2).
 
-GET /api/events — published events only; filterable by start_date, end_date, event_type
+GET /api/events          — published events only; filterable by start_date, end_date, event_type
+GET /api/events/feed.ics — published events as an iCalendar feed; filterable by event_type
+
+Recurring events are stored once with a recurrence rule. ``/api/events``
+expands them into one item per occurrence inside the requested window (up to
+``EVENTS_RECURRENCE_HORIZON_DAYS`` ahead when no ``end_date`` is given); every
+occurrence keeps the series' ``id``. The feed leaves expansion to the
+calendar client. Results are cached per (window, event type) and dropped
+whenever a calendar event change is committed.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import true
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_, or_, true
 from sqlalchemy.orm import Session
 
+from app.config import EVENTS_CACHE_SECONDS, EVENTS_CACHE_SIZE, EVENTS_RECURRENCE_HORIZON_DAYS
 from app.database import get_db
 from app.models.CalendarEvent import CalendarEvent
 from app.schemas.calendar_event import CalendarEventDTO
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
+from app.utils.ical import calendar_chunks
+from app.utils.recurrence import RecurrenceRule, occurrences
 
 router = APIRouter(prefix="/api/events", tags=["events"])
 
+events_cache = TTLCache(maxsize=EVENTS_CACHE_SIZE, ttl=EVENTS_CACHE_SECONDS, name="events")
+on_commit([CalendarEvent], lambda _changed: events_cache.clear())
+
+_event_list = TypeAdapter(list[CalendarEventDTO])
+
+
+def _expand(
+    event: CalendarEvent, window_start: datetime | None, window_end: datetime
+) -> list[CalendarEventDTO]:
+    series = CalendarEventDTO.model_validate(event)
+    duration = event.end_datetime - event.start_datetime
+    return [
+        series.model_copy(update={"start_datetime": start, "end_datetime": start + duration})
+        for start in occurrences(
+            RecurrenceRule.parse(event.recurrence_rule),
+            event.start_datetime,
+            window_start,
+            window_end,
+        )
+    ]
+
+
+def _events_in_window(
+    db: Session, start_date: date | None, end_date: date | None, event_type: str | None
+) -> list[CalendarEventDTO]:
+    window_start = datetime.combine(start_date, time.min) if start_date is not None else None
+    if end_date is not None:
+        window_end = datetime.combine(end_date + timedelta(days=1), time.min)
+    else:
+        window_end = None
+    expand_until = window_end or datetime.combine(
+        max(start_date or date.today(), date.today())
+        + timedelta(days=EVENTS_RECURRENCE_HORIZON_DAYS),
+        time.min,
+    )
+
+    one_off = [CalendarEvent.recurrence_rule.is_(None)]
+    recurring = [
+        CalendarEvent.recurrence_rule.is_not(None),
+        CalendarEvent.start_datetime < expand_until,
+    ]
+    if window_start is not None:
+        one_off.append(CalendarEvent.start_datetime >= start_date)
+        recurring.append(
+            or_(
+                CalendarEvent.recurrence_end.is_(None),
+                CalendarEvent.recurrence_end >= window_start,
+            )
+        )
+    if window_end is not None:
+        one_off.append(CalendarEvent.start_datetime < window_end)
+
+    query = db.query(CalendarEvent).filter(
+        CalendarEvent.is_published == true(), or_(and_(*one_off), and_(*recurring))
+    )
+    if event_type is not None:
+        query = query.filter(CalendarEvent.event_type == event_type)
+
+    events: list[CalendarEventDTO] = []
+    for event in query.order_by(CalendarEvent.start_datetime).all():
+        if event.recurrence_rule:
+            events.extend(_expand(event, window_start, expand_until))
+        else:
+            events.append(CalendarEventDTO.model_validate(event))
+    events.sort(key=lambda e: e.start_datetime)
+    return events
+
 
 @router.get("", response_model=list[CalendarEventDTO])
 def list_events(
@@ -28,14 +110,28 @@ def list_events(
     event_type: Optional[str] = Query(default=None, description="Filter by event type"),
     db: Session = Depends(get_db),
 ):
-    query = db.query(CalendarEvent).filter(CalendarEvent.is_published == true())
+    key = (start_date, end_date, event_type)
+    generation = events_cache.generation
+    body = events_cache.get(key)
+    if body is None:
+        body = _event_list.dump_json(_events_in_window(db, start_date, end_date, event_type))
+        events_cache.set(key, body, generation=generation)
+    return Response(content=body, media_type="application/json")
 
-    if start_date is not None:
-        query = query.filter(CalendarEvent.start_datetime >= start_date)
-    if end_date is not None:
-        query = query.filter(CalendarEvent.start_datetime < end_date + timedelta(days=1))
+
+@router.get("/feed.ics", response_class=StreamingResponse)
+def calendar_feed(
+    request: Request,
+    event_type: Optional[str] = Query(default=None, description="Filter by event type"),
+    db: Session = Depends(get_db),
+):
+    query = db.query(CalendarEvent).filter(CalendarEvent.is_published == true())
     if event_type is not None:
         query = query.filter(CalendarEvent.event_type == event_type)
-
     events = query.order_by(CalendarEvent.start_datetime).all()
-    return [CalendarEventDTO.model_validate(e) for e in events]
+
+    return StreamingResponse(
+        calendar_chunks(events, domain=request.url.hostname or "localhost"),
+        media_type="text/calendar; charset=utf-8",
+        headers={"Content-Disposition": 'inline; filename="senate-events.ics"'},
+    )
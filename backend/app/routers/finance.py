@@ -1,18 +1,55 @@
 """Finance hearings public API routes (TDD Section 4.5.2).
 
-GET /api/finance-hearings — FinanceHearingConfig with nested dates when active
+GET  /api/finance-hearings                      — FinanceHearingConfig with nested dates when active
+GET  /api/finance-hearings/dates                — paginated hearing dates in a date window
+POST /api/finance-hearings/dates/{id}/bookings  — reserve a seat for a student organization
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import true
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.FinanceHearingConfig import FinanceHearingConfig
 from app.models.FinanceHearingDate import FinanceHearingDate
-from app.schemas.finance import FinanceHearingConfigDTO, FinanceHearingDateDTO
+from app.schemas.finance import (
+    CreateFinanceHearingBookingDTO,
+    FinanceHearingBookingDTO,
+    FinanceHearingConfigDTO,
+    FinanceHearingDateDTO,
+)
+from app.schemas.pagination import PaginatedResponse
+from app.utils.hearing_bookings import DuplicateBookingError, SlotUnavailableError, book_slot
+from app.utils.pagination import paginate
 
 router = APIRouter(prefix="/api/finance-hearings", tags=["finance"])
 
+# Bookings are unauthenticated, so throttle them per IP (in-memory, per worker).
+BOOKING_RATE_LIMIT_MAX_REQUESTS = 10
+BOOKING_RATE_LIMIT_WINDOW = timedelta(hours=1)
+_booking_requests: Dict[str, List[datetime]] = {}
+
+
+def _check_booking_rate_limit(client_ip: str) -> None:
+    now = datetime.now()
+    cutoff = now - BOOKING_RATE_LIMIT_WINDOW
+    recent = [ts for ts in _booking_requests.get(client_ip, []) if ts > cutoff]
+    if len(recent) >= BOOKING_RATE_LIMIT_MAX_REQUESTS:
+        _booking_requests[client_ip] = recent
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many requests"
+        )
+    recent.append(now)
+    _booking_requests[client_ip] = recent
+
+
+def _hearings_open(db: Session) -> bool:
+    config = db.query(FinanceHearingConfig).first()
+    return config is not None and config.is_active
+
 
 @router.get("", response_model=FinanceHearingConfigDTO)
 def get_finance_hearings(db: Session = Depends(get_db)):
@@ -23,7 +60,10 @@ def get_finance_hearings(db: Session = Depends(get_db)):
     dates: list[FinanceHearingDateDTO] = []
     if config.is_active:
         dates = [
-            FinanceHearingDateDTO.model_validate(d) for d in db.query(FinanceHearingDate).all()
+            FinanceHearingDateDTO.model_validate(d)
+            for d in db.query(FinanceHearingDate).order_by(
+                FinanceHearingDate.hearing_date, FinanceHearingDate.hearing_time
+            )
         ]
 
     return FinanceHearingConfigDTO(
@@ -32,3 +72,77 @@ def get_finance_hearings(db: Session = Depends(get_db)):
         season_end=config.season_end,
         dates=dates,
     )
+
+
+@router.get("/dates", response_model=PaginatedResponse[FinanceHearingDateDTO])
+def list_finance_hearing_dates(
+    start_date: Optional[date] = Query(
+        default=None, description="Include hearings on or after this date (default: today)"
+    ),
+    end_date: Optional[date] = Query(
+        default=None, description="Include hearings on or before this date"
+    ),
+    available_only: bool = Query(default=False, description="Only slots with seats left"),
+    page: int = Query(default=1, ge=1, description="1-based page number"),
+    limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    db: Session = Depends(get_db),
+):
+    """Hearing dates in date/time order; empty while sign-ups are switched off."""
+    if not _hearings_open(db):
+        return PaginatedResponse(items=[], total=0, page=page, limit=limit)
+
+    query = db.query(FinanceHearingDate).filter(
+        FinanceHearingDate.hearing_date >= (start_date or date.today())
+    )
+    if end_date is not None:
+        query = query.filter(FinanceHearingDate.hearing_date <= end_date)
+    if available_only:
+        query = query.filter(
+            FinanceHearingDate.is_full != true(),
+            FinanceHearingDate.booked_count < FinanceHearingDate.capacity,
+        )
+    query = query.order_by(FinanceHearingDate.hearing_date, FinanceHearingDate.hearing_time)
+
+    items, total = paginate(query, page=page, limit=limit)
+    return PaginatedResponse(
+        items=[FinanceHearingDateDTO.model_validate(d) for d in items],
+        total=total,
+        page=page,
+        limit=limit,
+    )
+
+
+@router.post(
+    "/dates/{date_id}/bookings",
+    response_model=FinanceHearingBookingDTO,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        404: {"description": "Hearing date not found"},
+        409: {"description": "Slot unavailable, sign-ups closed, or already booked"},
+        429: {"description": "Too many booking attempts from this IP"},
+    },
+)
+def book_finance_hearing(
+    date_id: int,
+    body: CreateFinanceHearingBookingDTO,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """Reserve a seat at a hearing. Safe under concurrent requests: never overbooks."""
+    _check_booking_rate_limit(request.client.host if request.client else "unknown")
+    if db.get(FinanceHearingDate, date_id) is None:
+        raise HTTPException(status_code=404, detail="Hearing date not found")
+    if not _hearings_open(db):
+        raise HTTPException(status_code=409, detail="Finance hearing sign-ups are closed")
+
+    try:
+        booking = book_slot(
+            db,
+            date_id,
+            organization_name=body.organization_name,
+            contact_name=body.contact_name,
+            contact_email=body.contact_email,
+        )
+    except (SlotUnavailableError, DuplicateBookingError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from None
+    return FinanceHearingBookingDTO.model_validate(booking)
@@ -1,20 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Leadership
 from app.schemas.leadership import LeadershipDTO
+from app.utils.current_session import current_session
 
 router = APIRouter(prefix="/api/leadership", tags=["leadership"])
 
 
-def _current_session(db: Session) -> int:
-    """Return the highest session_number in the leadership table."""
-    result = db.query(func.max(Leadership.session_number)).scalar()
-    return result or 1
-
-
 @router.get("/", response_model=list[LeadershipDTO])
 def get_leadership(session_number: int | None = None, db: Session = Depends(get_db)):
     """Return leadership rows for the requested session.
@@ -24,10 +18,12 @@ def get_leadership(session_number: int | None = None, db: Session = Depends(get_
     session; active vs inactive status is surfaced through ``is_current`` on
     each item instead of being filtered out here.
     """
-    target_session = session_number if session_number is not None else _current_session(db)
+    target_session = (
+        session_number if session_number is not None else current_session(db, "leadership")
+    )
     query = db.query(Leadership).filter(Leadership.session_number == target_session)
 
-    leadership = query.order_by(Leadership.title).all()
+    leadership = query.order_by(Leadership.display_order, Leadership.title).all()
 
     # dynamically add is_current based on is_active
     for leader in leadership:
@@ -40,12 +36,14 @@ def get_leadership(session_number: int | None = None, db: Session = Depends(get_
 @router.get("/sessions/all", response_model=list[LeadershipDTO])
 def get_all_leadership_sessions(db: Session = Depends(get_db)):
     """Return all leadership records across all sessions, ordered by session
-    descending, then by title.
+    descending, then by display_order and title.
 
     This endpoint is designed for the previous-leadership page to load
     multi-session data reliably in a single API call.
     """
-    query = db.query(Leadership).order_by(Leadership.session_number.desc(), Leadership.title)
+    query = db.query(Leadership).order_by(
+        Leadership.session_number.desc(), Leadership.display_order, Leadership.title
+    )
 
     leadership = query.all()
 
@@ -2,31 +2,72 @@
 
 GET /api/legislation         — paginated list, filterable
 GET /api/legislation/recent  — most recent N items, optionally filtered by type
+GET /api/legislation/facets  — filter counts and time-in-stage stats for the list filters
 GET /api/legislation/{id}    — single item with ordered actions list
 
-NOTE: /recent MUST be registered before /{id} to avoid route conflict.
+NOTE: /recent and /facets MUST be registered before /{id} to avoid route conflict.
+
+Facet counts come from one grouped query (``GROUPING SETS`` on PostgreSQL, a
+``UNION ALL`` of the same groupings elsewhere). Each facet applies every
+filter except its own, so the counts show what choosing another value would
+return. Facets are cached per filter set and detail responses per id, as
+rendered JSON, until a legislation or action change is committed.
 """
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, case, func, null, or_, select, tuple_, union_all
+from sqlalchemy.orm import Session, selectinload
 
+from app.config import (
+    LEGISLATION_CACHE_SECONDS,
+    LEGISLATION_CACHE_SIZE,
+    LEGISLATION_FACETS_CACHE_SIZE,
+)
 from app.database import get_db
 from app.models.Legislation import Legislation
 from app.models.LegislationAction import LegislationAction
-from app.schemas.legislation import LegislationActionDTO, LegislationDetailDTO, LegislationListDTO
+from app.schemas.legislation import (
+    FacetCountDTO,
+    LegislationActionDTO,
+    LegislationDetailDTO,
+    LegislationFacetsDTO,
+    LegislationListDTO,
+    StageDurationDTO,
+)
 from app.schemas.pagination import PaginatedResponse
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
+from app.utils.current_session import current_session
 from app.utils.pagination import paginate
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(prefix="/api/legislation", tags=["legislation"])
 
+legislation_cache = TTLCache(
+    maxsize=LEGISLATION_CACHE_SIZE, ttl=LEGISLATION_CACHE_SECONDS, name="legislation"
+)
+facets_cache = TTLCache(
+    maxsize=LEGISLATION_FACETS_CACHE_SIZE, ttl=LEGISLATION_CACHE_SECONDS, name="legislation_facets"
+)
+
+
+def _clear_caches(_changed: set[type]) -> None:
+    legislation_cache.clear()
+    facets_cache.clear()
+
 
-def _current_session(db: Session) -> int:
-    result = db.query(func.max(Legislation.session_number)).scalar()
-    return result or 1
+on_commit([Legislation, LegislationAction], _clear_caches)
+
+# Facet name -> grouped column. All are NOT NULL, so in a grouped row the one
+# non-null column tells which grouping set the row belongs to.
+FACET_COLUMNS = {
+    "status": Legislation.status,
+    "type": Legislation.type,
+    "sponsor": Legislation.sponsor_name,
+    "session": Legislation.session_number,
+}
 
 
 def _legislation_base_dict(leg: Legislation) -> dict:
@@ -46,23 +87,136 @@ def _legislation_base_dict(leg: Legislation) -> dict:
     }
 
 
-def _legislation_detail_dict(leg: Legislation, db: Session) -> dict:
-    actions = (
-        db.query(LegislationAction)
-        .filter(LegislationAction.legislation_id == leg.id)
-        .order_by(LegislationAction.display_order)
-        .all()
-    )
+def _legislation_detail_dict(leg: Legislation) -> dict:
     data = _legislation_base_dict(leg)
     data["actions"] = [
-        LegislationActionDTO.model_validate(
-            {**a.__dict__, "description": sanitize_html(a.description)}
+        LegislationActionDTO.model_validate(a).model_copy(
+            update={"description": sanitize_html(a.description)}
         )
-        for a in actions
+        for a in leg.actions
     ]
     return data
 
 
+def _search_condition(search: str | None):
+    if not search:
+        return None
+    pattern = f"%{search}%"
+    return or_(
+        Legislation.title.ilike(pattern),
+        Legislation.bill_number.ilike(pattern),
+        Legislation.summary.ilike(pattern),
+        Legislation.full_text.ilike(pattern),
+    )
+
+
+def _facet_conditions(
+    status: str | None, type: str | None, sponsor: str | None, session: int
+) -> dict:
+    """The list filters keyed by the facet they restrict; unset filters are omitted."""
+    conditions = {"session": Legislation.session_number == session}
+    if status:
+        conditions["status"] = Legislation.status == status
+    if type:
+        conditions["type"] = Legislation.type == type
+    if sponsor:
+        conditions["sponsor"] = Legislation.sponsor_name.ilike(f"%{sponsor}%")
+    return conditions
+
+
+def _count_where(conditions: list):
+    return func.count(case((and_(*conditions), 1))) if conditions else func.count()
+
+
+def _facet_counts(db: Session, search, conditions: dict) -> tuple[int, dict[str, list]]:
+    counts = [
+        _count_where([c for name, c in conditions.items() if name != facet]).label(f"{facet}_count")
+        for facet in FACET_COLUMNS
+    ]
+    counts.append(_count_where(list(conditions.values())).label("total"))
+    columns = list(FACET_COLUMNS.values())
+    where = [] if search is None else [search]
+
+    if db.get_bind().dialect.name == "postgresql":
+        sets = [tuple_(column) for column in columns] + [tuple_()]
+        statement = select(*columns, *counts).where(*where).group_by(func.grouping_sets(*sets))
+    else:
+        statement = union_all(
+            *(
+                select(*(c if c is grouped else null().label(c.key) for c in columns), *counts)
+                .where(*where)
+                .group_by(*([grouped] if grouped is not None else []))
+                for grouped in [*columns, None]
+            )
+        )
+
+    total = 0
+    facets: dict[str, list] = {facet: [] for facet in FACET_COLUMNS}
+    for row in db.execute(statement).mappings():
+        facet = next(
+            (name for name, column in FACET_COLUMNS.items() if row[column.key] is not None),
+            None,
+        )
+        if facet is None:
+            total = row["total"]
+        elif count := row[f"{facet}_count"]:
+            facets[facet].append(FacetCountDTO(value=row[FACET_COLUMNS[facet].key], count=count))
+    for facet, items in facets.items():
+        if facet == "session":
+            items.sort(key=lambda item: item.value, reverse=True)
+        else:
+            items.sort(key=lambda item: (-item.count, item.value))
+    return total, facets
+
+
+def _time_in_stage(db: Session, search, conditions: dict) -> list[StageDurationDTO]:
+    """Days from each action to the next one on the same bill, grouped by action type."""
+    matching = select(Legislation.id).where(*conditions.values())
+    if search is not None:
+        matching = matching.where(search)
+    timeline = (
+        select(
+            LegislationAction.action_type,
+            LegislationAction.action_date,
+            func.lead(LegislationAction.action_date)
+            .over(
+                partition_by=LegislationAction.legislation_id,
+                order_by=(LegislationAction.display_order, LegislationAction.id),
+            )
+            .label("next_date"),
+        )
+        .where(LegislationAction.legislation_id.in_(matching))
+        .subquery()
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        days = timeline.c.next_date - timeline.c.action_date
+    else:
+        days = func.julianday(timeline.c.next_date) - func.julianday(timeline.c.action_date)
+
+    rows = db.execute(
+        select(
+            timeline.c.action_type,
+            func.count(),
+            func.avg(days),
+            func.min(days),
+            func.max(days),
+        )
+        .where(timeline.c.next_date.is_not(None))
+        .group_by(timeline.c.action_type)
+        .order_by(timeline.c.action_type)
+    )
+    return [
+        StageDurationDTO(
+            action_type=action_type,
+            count=count,
+            avg_days=round(float(avg_days), 1),
+            min_days=int(min_days),
+            max_days=int(max_days),
+        )
+        for action_type, count, avg_days, min_days, max_days in rows
+    ]
+
+
 # /recent BEFORE /{id}
 @router.get("/recent")
 def get_recent_legislation(
@@ -92,28 +246,13 @@ def list_legislation(
     db: Session = Depends(get_db),
 ):
     """Return a paginated, filterable list of legislation for a given session."""
-    target_session = session if session is not None else _current_session(db)
-    query = db.query(Legislation).filter(Legislation.session_number == target_session)
-
-    if search:
-        pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Legislation.title.ilike(pattern),
-                Legislation.bill_number.ilike(pattern),
-                Legislation.summary.ilike(pattern),
-                Legislation.full_text.ilike(pattern),
-            )
-        )
-
-    if status:
-        query = query.filter(Legislation.status == status)
-
-    if type:
-        query = query.filter(Legislation.type == type)
-
-    if sponsor:
-        query = query.filter(Legislation.sponsor_name.ilike(f"%{sponsor}%"))
+    target_session = session if session is not None else current_session(db, "legislation")
+    query = db.query(Legislation).filter(
+        *_facet_conditions(status, type, sponsor, target_session).values()
+    )
+    search_condition = _search_condition(search)
+    if search_condition is not None:
+        query = query.filter(search_condition)
 
     query = query.order_by(Legislation.date_introduced.desc())
     items, total = paginate(query, page=page, limit=limit)
@@ -121,10 +260,63 @@ def list_legislation(
     return PaginatedResponse(items=validated, total=total, page=page, limit=limit)
 
 
-@router.get("/{legislation_id}")
+@router.get("/facets", response_model=LegislationFacetsDTO)
+def get_legislation_facets(
+    search: Optional[str] = Query(
+        default=None, description="Keyword search across title, bill_number, summary, full_text"
+    ),
+    status: Optional[str] = Query(default=None, description="Filter by status"),
+    type: Optional[str] = Query(default=None, description="Filter by type"),
+    session: Optional[int] = Query(default=None, description="Session number; defaults to current"),
+    sponsor: Optional[str] = Query(default=None, description="Partial match on sponsor name"),
+    db: Session = Depends(get_db),
+):
+    """Counts per status, type, sponsor and session for the same filters as the list.
+
+    ``total`` matches the list's total. ``time_in_stage`` reports, for the
+    matching bills, how many days passed between an action of each type and
+    the bill's next action.
+    """
+    target_session = session if session is not None else current_session(db, "legislation")
+    key = (search, status, type, target_session, sponsor)
+    generation = facets_cache.generation
+    body = facets_cache.get(key)
+    if body is None:
+        conditions = _facet_conditions(status, type, sponsor, target_session)
+        search_condition = _search_condition(search)
+        total, facets = _facet_counts(db, search_condition, conditions)
+        body = (
+            LegislationFacetsDTO(
+                total=total,
+                **facets,
+                time_in_stage=_time_in_stage(db, search_condition, conditions),
+            )
+            .model_dump_json()
+            .encode()
+        )
+        facets_cache.set(key, body, generation=generation)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/{legislation_id}",
+    response_model=LegislationDetailDTO,
+    responses={404: {"description": "Legislation not found"}},
+)
 def get_legislation(legislation_id: int, db: Session = Depends(get_db)):
     """Return a single legislation item with its ordered actions list, or 404."""
-    leg = db.query(Legislation).filter(Legislation.id == legislation_id).first()
-    if leg is None:
-        raise HTTPException(status_code=404, detail="Legislation not found")
-    return LegislationDetailDTO.model_validate(_legislation_detail_dict(leg, db))
+    generation = legislation_cache.generation
+    body = legislation_cache.get(legislation_id)
+    if body is None:
+        leg = (
+            db.query(Legislation)
+            .options(selectinload(Legislation.actions))
+            .filter(Legislation.id == legislation_id)
+            .first()
+        )
+        if leg is None:
+            raise HTTPException(status_code=404, detail="Legislation not found")
+        dto = LegislationDetailDTO.model_validate(_legislation_detail_dict(leg))
+        body = dto.model_dump_json().encode()
+        legislation_cache.set(legislation_id, body, generation=generation)
+    return Response(content=body, media_type="application/json")
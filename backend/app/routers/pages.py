@@ -1,27 +1,42 @@
 """Static pages public API routes (TDD Section 4.5.2).
 
 GET /api/pages/{slug} — static page content by slug, 404 if not found
+
+Default pages are backfilled once by ``script/init_db.py``, not per request.
+The sanitized page is cached per slug as rendered JSON until a static page
+change is committed, so repeat requests never touch the database.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.config import PAGES_CACHE_SECONDS
 from app.database import get_db
 from app.models.cms import StaticPageContent
 from app.schemas.static_page import StaticPageDTO
-from app.static_pages import ensure_default_static_pages
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
 from app.utils.sanitization import sanitize_html
 
 router = APIRouter(prefix="/api/pages", tags=["pages"])
 
+page_cache = TTLCache(maxsize=256, ttl=PAGES_CACHE_SECONDS, name="pages")
+on_commit([StaticPageContent], lambda _changed: page_cache.clear())
+
 
-@router.get("/{slug}", response_model=StaticPageDTO)
+@router.get(
+    "/{slug}",
+    response_model=StaticPageDTO,
+    responses={404: {"description": "Page not found"}},
+)
 def get_page(slug: str, db: Session = Depends(get_db)):
-    page = db.query(StaticPageContent).filter(StaticPageContent.page_slug == slug).first()
-    if page is None:
-        ensure_default_static_pages(db, slugs=[slug], commit=True)
+    generation = page_cache.generation
+    body = page_cache.get(slug)
+    if body is None:
         page = db.query(StaticPageContent).filter(StaticPageContent.page_slug == slug).first()
-    if page is None:
-        raise HTTPException(status_code=404, detail="Page not found")
-    dto = StaticPageDTO.model_validate(page)
-    return dto.model_copy(update={"body": sanitize_html(dto.body)})
+        if page is None:
+            raise HTTPException(status_code=404, detail="Page not found")
+        dto = StaticPageDTO.model_validate(page)
+        body = dto.model_copy(update={"body": sanitize_html(dto.body)}).model_dump_json().encode()
+        page_cache.set(slug, body, generation=generation)
+    return Response(content=body, media_type="application/json")
@@ -1,21 +1,43 @@
 """Senators public API routes (TDD Section 4.5.2).
 
-GET /api/senators         — filterable roster (search, district_id, committee, session)
-GET /api/senators/{id}    — single senator with committee assignments
+GET /api/senators              — filterable roster (search, district_id, committee, session)
+GET /api/senators/{id}         — single senator with committee assignments
+GET /api/senators/{id}/profile — senator with committee history, leadership roles and
+                                 sponsored legislation (paginated) across sessions
+
+Profiles carry a content ETag and are cached per (senator, page) until a
+commit touches one of the models they show, so a revalidation with a
+matching ``If-None-Match`` is answered 304 without a query.
 
 Schemas (SenatorDTO, CommitteeAssignmentDTO) are provided by PR #37 (ticket #10).
 The try/except guard allows this module to be imported and tested before that PR merges.
 """
 
+import hashlib
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import func, or_, true
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.config import SENATOR_PROFILE_CACHE_SECONDS, SENATOR_PROFILE_CACHE_SIZE
 from app.database import get_db
-from app.models.cms import CommitteeMembership
+from app.models.cms import Committee, CommitteeMembership
+from app.models.Leadership import Leadership
+from app.models.Legislation import Legislation
 from app.models.Senator import Senator
+from app.schemas.pagination import PaginatedResponse
+from app.schemas.senator import (
+    CommitteeHistoryDTO,
+    LeadershipRoleDTO,
+    SenatorProfileDTO,
+    SponsoredLegislationDTO,
+)
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
+from app.utils.current_session import current_session
+from app.utils.file_serving import etag_matches
+from app.utils.pagination import paginate
 
 try:
     from app.schemas.senator import CommitteeAssignmentDTO as _CommitteeAssignmentDTO  # noqa: F401
@@ -27,8 +49,18 @@ except ImportError:  # pragma: no cover — removed once PR #37 merges
 
 router = APIRouter(prefix="/api/senators", tags=["senators"])
 
+profile_cache = TTLCache(
+    maxsize=SENATOR_PROFILE_CACHE_SIZE, ttl=SENATOR_PROFILE_CACHE_SECONDS, name="senator_profiles"
+)
+on_commit(
+    [Senator, CommitteeMembership, Committee, Leadership, Legislation],
+    lambda _changed: profile_cache.clear(),
+)
+
 
-def _senator_to_dict(senator: Senator) -> dict[str, Any]:
+def senator_to_dict(
+    senator: Senator, memberships: list[CommitteeMembership] | None = None
+) -> dict[str, Any]:
     """Convert a Senator ORM row to a dict compatible with PR #37's SenatorDTO.
 
     Key remappings vs the model:
@@ -38,14 +70,17 @@ def _senator_to_dict(senator: Senator) -> dict[str, Any]:
     Relies on ``_base_query``'s ``selectinload`` to have eagerly loaded
     ``committee_memberships`` (and each membership's ``committee``), so this
     reads only already-fetched data instead of issuing per-senator queries.
+    Callers that loaded the memberships themselves pass them as ``memberships``.
     """
+    if memberships is None:
+        memberships = senator.committee_memberships
     committees = [
         {
             "committee_id": m.committee_id,
             "committee_name": m.committee.name if m.committee else "",
             "role": m.role,
         }
-        for m in senator.committee_memberships
+        for m in memberships
     ]
     return {
         "id": senator.id,
@@ -67,12 +102,6 @@ def _base_query(db: Session):
     )
 
 
-def _current_session(db: Session) -> int:
-    """Return the highest session_number present in the senator table."""
-    result = db.query(func.max(Senator.session_number)).scalar()
-    return result or 1
-
-
 @router.get("")
 def list_senators(
     search: Optional[str] = Query(default=None, description="Partial name search (first or last)"),
@@ -87,7 +116,7 @@ def list_senators(
     ``search`` performs a case-insensitive partial match on first_name + last_name.
     ``committee`` filters senators who are members of that committee via CommitteeMembership.
     """
-    target_session = session if session is not None else _current_session(db)
+    target_session = session if session is not None else current_session(db, "senators")
 
     query = _base_query(db).filter(
         Senator.is_active == true(),
@@ -113,7 +142,7 @@ def list_senators(
         ).filter(CommitteeMembership.committee_id == committee)
 
     senators_orm = query.all()
-    dicts: list[Any] = [_senator_to_dict(s) for s in senators_orm]
+    dicts: list[Any] = [senator_to_dict(s) for s in senators_orm]
 
     if _SENATOR_DTO_AVAILABLE:
         from app.schemas.senator import SenatorDTO
@@ -129,9 +158,100 @@ def get_senator(senator_id: int, db: Session = Depends(get_db)):
     if senator is None:
         raise HTTPException(status_code=404, detail="Senator not found")
 
-    data = _senator_to_dict(senator)
+    data = senator_to_dict(senator)
     if _SENATOR_DTO_AVAILABLE:
         from app.schemas.senator import SenatorDTO
 
         return SenatorDTO.model_validate(data)
     return data
+
+
+def _build_profile(db: Session, senator: Senator, page: int, limit: int) -> SenatorProfileDTO:
+    """Five queries however long the record: linked rows, memberships, roles, bill count, page."""
+    rows = (
+        db.query(Senator)
+        .filter(func.lower(Senator.email) == senator.email.lower())
+        .order_by(Senator.session_number.desc())
+        .all()
+    )
+    session_of = {row.id: row.session_number for row in rows}
+    ids = list(session_of)
+
+    memberships = (
+        db.query(CommitteeMembership)
+        .options(joinedload(CommitteeMembership.committee))
+        .filter(CommitteeMembership.senator_id.in_(ids))
+        .all()
+    )
+    history = sorted(
+        (
+            CommitteeHistoryDTO(
+                committee_id=m.committee_id,
+                committee_name=m.committee.name if m.committee else "",
+                role=m.role,
+                session_number=session_of[m.senator_id],
+            )
+            for m in memberships
+        ),
+        key=lambda h: (-h.session_number, h.committee_name),
+    )
+
+    roles = (
+        db.query(Leadership)
+        .filter(Leadership.senator_id.in_(ids))
+        .order_by(Leadership.session_number.desc(), Leadership.display_order)
+        .all()
+    )
+
+    sponsored = (
+        db.query(Legislation)
+        .filter(Legislation.sponsor_id.in_(ids))
+        .order_by(Legislation.date_introduced.desc(), Legislation.id.desc())
+    )
+    bills, total = paginate(sponsored, page=page, limit=limit)
+
+    current = [m for m in memberships if m.senator_id == senator.id]
+    return SenatorProfileDTO(
+        senator=senator_to_dict(senator, current),
+        sessions=sorted(set(session_of.values()), reverse=True),
+        committee_history=history,
+        leadership_roles=[LeadershipRoleDTO.model_validate(r) for r in roles],
+        sponsored_legislation=PaginatedResponse(
+            items=[SponsoredLegislationDTO.model_validate(b) for b in bills],
+            total=total,
+            page=page,
+            limit=limit,
+        ),
+    )
+
+
+@router.get(
+    "/{senator_id}/profile",
+    response_model=SenatorProfileDTO,
+    responses={304: {"description": "Not modified"}, 404: {"description": "Senator not found"}},
+)
+def get_senator_profile(
+    senator_id: int,
+    request: Request,
+    page: int = Query(default=1, ge=1, description="1-based page of sponsored legislation"),
+    limit: int = Query(default=20, ge=1, le=100, description="Sponsored legislation per page"),
+    db: Session = Depends(get_db),
+):
+    """Return a senator's profile across sessions; answers ``If-None-Match`` with 304."""
+    key = (senator_id, page, limit)
+    generation = profile_cache.generation
+    cached = profile_cache.get(key)
+    if cached is None:
+        senator = db.get(Senator, senator_id)
+        if senator is None:
+            raise HTTPException(status_code=404, detail="Senator not found")
+        body = _build_profile(db, senator, page, limit).model_dump_json().encode()
+        cached = (f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', body)
+        profile_cache.set(key, cached, generation=generation)
+
+    etag, body = cached
+    headers = {"etag": etag, "cache-control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
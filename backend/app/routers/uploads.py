@@ -1,28 +1,151 @@
-"""Public file-serving endpoints for uploaded images."""
+"""Public file-serving endpoints for uploaded images.
+
+GET /api/uploads/{path}                — the stored file as uploaded
+GET /api/uploads/{path}?w=&fmt=        — an image resized to an allowed width and/or
+                                         re-encoded, rendered once and then cached
+
+Content-addressed paths are served with a one-year ``immutable`` Cache-Control;
+legacy flat names get a short max-age. Every response carries an ETag and
+Last-Modified, so revalidation is a 304, and PDFs support ``Range``. When the
+storage backend exposes direct URLs (S3), originals are a 307 redirect there
+instead; derivatives are always rendered into the local cache and served here.
+
+Derivatives are rendered in ``derivative_pool``, a small process pool separate
+from the upload one; when its queue is full a cache miss gets a 503 with
+``Retry-After``, just like an upload.
+"""
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+import anyio.from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import RedirectResponse
 
-from app.config import UPLOAD_DIR
+from app.config import (
+    IMAGE_CACHE_DIR,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_DERIVATIVE_MAX_PENDING,
+    IMAGE_DERIVATIVE_WIDTHS,
+    IMAGE_DERIVATIVE_WORKERS,
+    UPLOAD_ACCEL_REDIRECT_PREFIX,
+    UPLOAD_DIR,
+)
+from app.utils.derivatives import DerivativeCache
+from app.utils.file_serving import (
+    IMMUTABLE,
+    REVALIDATE,
+    regular_file_stat,
+    serve_bytes,
+    serve_file,
+)
+from app.utils.image_processing import (
+    EncodedImage,
+    ImagePool,
+    ImagePoolBusyError,
+    ImageRejectedError,
+    avif_supported,
+)
+from app.utils.storage import Storage, get_storage
+from app.utils.upload_storage import is_content_addressed, servable_key
 
 router = APIRouter(prefix="/api/uploads", tags=["uploads"])
 
+derivative_pool = ImagePool(
+    workers=IMAGE_DERIVATIVE_WORKERS, max_pending=IMAGE_DERIVATIVE_MAX_PENDING
+)
 
-@router.get("/{filename}")
-def get_uploaded_file(filename: str):
-    """Serve files from the configured upload directory."""
-    if Path(filename).name != filename:
-        raise HTTPException(status_code=404, detail="File not found")
 
-    filepath = (Path(UPLOAD_DIR) / filename).resolve()
-    uploads_root = Path(UPLOAD_DIR).resolve()
+def _render_in_pool(content: bytes, width: int | None, extension: str | None) -> EncodedImage:
+    # get_uploaded_file is sync, so this runs on a worker thread of the event loop.
+    return anyio.from_thread.run(derivative_pool.render, content, width, extension)
+
+
+derivative_cache = DerivativeCache(
+    Path(IMAGE_CACHE_DIR), IMAGE_CACHE_MAX_BYTES, render=_render_in_pool
+)
+
+_IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+_REDIRECT_CACHE = "private, max-age=300"
+_FORMAT_ALIASES = {"jpg": "jpg", "jpeg": "jpg", "png": "png", "webp": "webp", "avif": "avif"}
 
-    if uploads_root not in filepath.parents and filepath != uploads_root:
-        raise HTTPException(status_code=404, detail="File not found")
 
-    if not filepath.exists() or not filepath.is_file():
+def _derivative_format(fmt: str | None) -> str | None:
+    if fmt is None:
+        return None
+    extension = _FORMAT_ALIASES.get(fmt.lower())
+    if extension is None or (extension == "avif" and not avif_supported()):
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {fmt}")
+    return extension
+
+
+@router.get("/{path:path}")
+def get_uploaded_file(
+    request: Request,
+    path: str,
+    w: int | None = Query(default=None, description="Resize to this width (allow-listed)"),
+    fmt: str | None = Query(default=None, description="Re-encode as jpg, png, webp or avif"),
+    storage: Storage = Depends(get_storage),
+):
+    """Serve an uploaded file from the configured storage backend.
+
+    ``path`` is either a legacy flat filename or a sharded content-addressed
+    path such as ``3f/3fa9...e1.jpg``. When ``UPLOAD_ACCEL_REDIRECT_PREFIX`` is
+    set, local files are handed to the fronting proxy via ``X-Accel-Redirect``.
+    """
+    key = servable_key(path)
+    if key is None:
         raise HTTPException(status_code=404, detail="File not found")
+    cache_control = IMMUTABLE if is_content_addressed(key) else REVALIDATE
+    serve_options = {"accel_root": Path(UPLOAD_DIR), "accel_prefix": UPLOAD_ACCEL_REDIRECT_PREFIX}
+
+    if w is not None or fmt is not None:
+        if w is not None and w not in IMAGE_DERIVATIVE_WIDTHS:
+            allowed = ", ".join(str(width) for width in sorted(IMAGE_DERIVATIVE_WIDTHS))
+            raise HTTPException(status_code=400, detail=f"Width must be one of: {allowed}")
+        extension = _derivative_format(fmt)
+        if Path(key).suffix.lower() not in _IMAGE_SUFFIXES:
+            raise HTTPException(status_code=400, detail="Only images can be resized")
 
-    return FileResponse(filepath)
+        source = storage.stat(key)
+        if source is None:
+            raise HTTPException(status_code=404, detail="File not found")
+        try:
+            derivative = derivative_cache.get_or_render(storage, source, w, extension)
+        except ImageRejectedError as exc:
+            raise HTTPException(status_code=400, detail="Unsupported file type") from exc
+        except ImagePoolBusyError as exc:
+            raise HTTPException(
+                status_code=503, detail=str(exc), headers={"Retry-After": "1"}
+            ) from exc
+        except FileNotFoundError as exc:
+            raise HTTPException(status_code=404, detail="File not found") from exc
+        stat_result = regular_file_stat(derivative)
+        if stat_result is None:  # evicted between render and stat
+            raise HTTPException(status_code=503, detail="Derivative unavailable, retry")
+        return serve_file(
+            request, derivative, stat_result, cache_control=cache_control, **serve_options
+        )
+
+    local_path = storage.local_path(key)
+    if local_path is not None:
+        stat_result = regular_file_stat(local_path)
+        if stat_result is None:
+            raise HTTPException(status_code=404, detail="File not found")
+        return serve_file(
+            request, local_path, stat_result, cache_control=cache_control, **serve_options
+        )
+
+    obj = storage.stat(key)
+    if obj is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    url = storage.url(key)
+    if url is not None:
+        # Presigned URLs expire, so let clients cache the redirect only briefly.
+        return RedirectResponse(url, status_code=307, headers={"cache-control": _REDIRECT_CACHE})
+    try:
+        data = storage.read(key)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="File not found") from exc
+    return serve_bytes(
+        request, data, key=key, etag=obj.etag, mtime=obj.mtime, cache_control=cache_control
+    )
@@ -52,3 +52,21 @@ class UpdateBudgetDataDTO(BaseModel):
     description: str | None = None
     parent_category_id: int | None = None
     display_order: int | None = None
+
+
+class BudgetImportRowDTO(BaseModel):
+    line: int
+    action: str  # "create", "update" or "unchanged"
+    id: int | None
+    fiscal_year: str
+    category: str
+    path: str
+    changed_fields: list[str]
+
+
+class BudgetImportResultDTO(BaseModel):
+    dry_run: bool
+    created: int
+    updated: int
+    unchanged: int
+    rows: list[BudgetImportRowDTO]
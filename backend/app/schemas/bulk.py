@@ -0,0 +1,37 @@
+"""Bulk schemas — generic batch envelopes for admin reorder / bulk-patch endpoints."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field, model_validator
+
+T = TypeVar("T")
+
+MAX_BATCH_SIZE = 500
+
+
+class BatchItemDTO(BaseModel):
+    """Base for one row of a batch request.
+
+    ``version`` is the value the client last read; when given, the row is only
+    changed if nobody else has modified it since.
+    """
+
+    id: int
+    version: int | None = None
+
+
+class ReorderItemDTO(BatchItemDTO):
+    display_order: int
+
+
+class BatchDTO(BaseModel, Generic[T]):
+    """Batch request envelope. Each id may appear at most once."""
+
+    items: list[T] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+    @model_validator(mode="after")
+    def ids_must_be_unique(self) -> "BatchDTO[T]":
+        ids = [item.id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each id may appear only once per batch")
+        return self
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from app.utils.recurrence import normalize as normalize_recurrence
 
 
 class CalendarEventDTO(BaseModel):
@@ -13,6 +15,7 @@ class CalendarEventDTO(BaseModel):
     end_datetime: datetime
     location: str | None
     event_type: str
+    recurrence_rule: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -26,6 +29,7 @@ class AdminCalendarEventDTO(BaseModel):
     location: str | None
     event_type: str
     is_published: bool
+    recurrence_rule: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -53,6 +57,12 @@ class CreateAdminCalendarEventDTO(BaseModel):
     location: str | None = None
     event_type: str
     is_published: bool = False
+    recurrence_rule: str | None = None
+
+    @field_validator("recurrence_rule")
+    @classmethod
+    def recurrence_rule_must_be_supported(cls, v: str | None) -> str | None:
+        return normalize_recurrence(v)
 
     @model_validator(mode="after")
     def end_must_be_after_start(self) -> "CreateAdminCalendarEventDTO":
@@ -69,3 +79,9 @@ class UpdateCalendarEventDTO(BaseModel):
     location: str | None = None
     event_type: str | None = None
     is_published: bool | None = None
+    recurrence_rule: str | None = None
+
+    @field_validator("recurrence_rule")
+    @classmethod
+    def recurrence_rule_must_be_supported(cls, v: str | None) -> str | None:
+        return normalize_recurrence(v)
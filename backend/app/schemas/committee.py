@@ -13,10 +13,33 @@ class CommitteeDTO(BaseModel):
     chair_email: str
     members: list[SenatorDTO]
     is_active: bool
+    version: int = 1
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class CommitteeSeatDTO(BaseModel):
+    senator_id: int
+    role: str
+
+
+class RosterCommitteeEntryDTO(BaseModel):
+    id: int
+    name: str
+    description: str
+    chair_name: str
+    chair_email: str
+    is_active: bool
+    members: list[CommitteeSeatDTO]
+
+
+class CommitteeRosterDTO(BaseModel):
+    """Active committees with their members listed once in ``senators``, keyed by id."""
+
+    committees: list[RosterCommitteeEntryDTO]
+    senators: dict[int, SenatorDTO]
+
+
 class CreateCommitteeDTO(BaseModel):
     name: str
     description: str
@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel, EmailStr
 
+from app.schemas.bulk import BatchItemDTO
+
 
 class CommitteeCreateDTO(BaseModel):
     name: str
@@ -24,3 +26,7 @@ class CommitteeUpdateDTO(BaseModel):
 class AssignCommitteeMemberDTO(BaseModel):
     senator_id: int
     role: str = "Member"
+
+
+class CommitteeBulkItemDTO(BatchItemDTO):
+    is_active: Optional[bool] = None
@@ -0,0 +1,28 @@
+"""Directory bundle schema — the public roster collections in one response."""
+
+from pydantic import BaseModel
+
+from app.schemas.carousel import CarouselSlideDTO
+from app.schemas.committee import RosterCommitteeEntryDTO
+from app.schemas.leadership import LeadershipDTO
+from app.schemas.senator import SenatorDTO
+from app.schemas.staff import StaffDTO
+
+
+class DirectoryDistrictDTO(BaseModel):
+    id: int
+    district_name: str
+    description: str | None
+    senator_ids: list[int]
+
+
+class DirectoryDTO(BaseModel):
+    """Every senator referenced anywhere in the bundle appears once in ``senators``."""
+
+    senators: dict[int, SenatorDTO]
+    current_senator_ids: list[int]
+    committees: list[RosterCommitteeEntryDTO]
+    districts: list[DirectoryDistrictDTO]
+    leadership: list[LeadershipDTO]
+    staff: list[StaffDTO]
+    carousel: list[CarouselSlideDTO]
@@ -1,8 +1,8 @@
 """Finance hearing schemas — input and output DTOs."""
 
-from datetime import date, time
+from datetime import date, datetime, time
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class FinanceHearingDateDTO(BaseModel):
@@ -11,7 +11,10 @@ class FinanceHearingDateDTO(BaseModel):
     hearing_time: time
     location: str | None
     description: str | None
-    is_full: bool
+    is_full: bool  # closed by an admin; seats_remaining is 0 once booked out as well
+    capacity: int = 1
+    booked_count: int = 0
+    seats_remaining: int = 1
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -36,6 +39,7 @@ class CreateFinanceHearingDateDTO(BaseModel):
     hearing_time: time
     location: str | None
     description: str | None
+    capacity: int = Field(default=1, ge=1)
 
 
 class UpdateFinanceHearingDateDTO(BaseModel):
@@ -44,3 +48,27 @@ class UpdateFinanceHearingDateDTO(BaseModel):
     location: str | None = None
     description: str | None = None
     is_full: bool | None = None
+    capacity: int | None = Field(default=None, ge=1)
+
+
+class CreateFinanceHearingBookingDTO(BaseModel):
+    organization_name: str = Field(min_length=1, max_length=255)
+    contact_name: str = Field(min_length=1, max_length=255)
+    contact_email: EmailStr
+
+    @field_validator("organization_name", "contact_name", mode="before")
+    @classmethod
+    def strip_names(cls, v):
+        # Before the length check, so a name of only spaces is rejected.
+        return v.strip() if isinstance(v, str) else v
+
+
+class FinanceHearingBookingDTO(BaseModel):
+    id: int
+    hearing_date_id: int
+    organization_name: str
+    contact_name: str
+    contact_email: str
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
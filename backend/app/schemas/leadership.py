@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, ConfigDict, EmailStr
 
+from app.schemas.bulk import BatchItemDTO
+
 
 class LeadershipDTO(BaseModel):
     id: int
@@ -13,6 +15,8 @@ class LeadershipDTO(BaseModel):
     photo_url: str | None
     session_number: int
     is_current: bool
+    display_order: int = 0
+    version: int = 1
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -26,6 +30,7 @@ class CreateLeadershipDTO(BaseModel):
     headshot_url: str | None = None
     is_active: bool = True
     session_number: int
+    display_order: int = 0
 
 
 class UpdateLeadershipDTO(BaseModel):
@@ -37,3 +42,9 @@ class UpdateLeadershipDTO(BaseModel):
     headshot_url: str | None = None
     is_active: bool | None = None
     session_number: int | None = None
+    display_order: int | None = None
+
+
+class BulkLeadershipItemDTO(BatchItemDTO):
+    display_order: int | None = None
+    is_active: bool | None = None
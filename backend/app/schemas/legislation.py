@@ -10,6 +10,8 @@ class LegislationActionDTO(BaseModel):
     action_date: date
     description: str
     action_type: str
+    display_order: int = 0
+    version: int = 1
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -81,3 +83,27 @@ class UpdateLegislationActionDTO(BaseModel):
     action_date: date | None = None
     description: str | None = None
     action_type: str | None = None
+
+
+class FacetCountDTO(BaseModel):
+    value: str | int
+    count: int
+
+
+class StageDurationDTO(BaseModel):
+    """How long bills stayed at one kind of action before the next action."""
+
+    action_type: str
+    count: int
+    avg_days: float
+    min_days: int
+    max_days: int
+
+
+class LegislationFacetsDTO(BaseModel):
+    total: int
+    status: list[FacetCountDTO]
+    type: list[FacetCountDTO]
+    sponsor: list[FacetCountDTO]
+    session: list[FacetCountDTO]
+    time_in_stage: list[StageDurationDTO]
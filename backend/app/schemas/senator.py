@@ -1,7 +1,11 @@
 """Senator schemas — input and output DTOs."""
 
+from datetime import date
+
 from pydantic import BaseModel, ConfigDict, EmailStr
 
+from app.schemas.pagination import PaginatedResponse
+
 
 class CommitteeAssignmentDTO(BaseModel):
     committee_id: int
@@ -25,6 +29,46 @@ class SenatorDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CommitteeHistoryDTO(CommitteeAssignmentDTO):
+    session_number: int
+
+
+class LeadershipRoleDTO(BaseModel):
+    title: str
+    session_number: int
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SponsoredLegislationDTO(BaseModel):
+    id: int
+    title: str
+    short_title: str | None = None
+    bill_number: str
+    session_number: int
+    status: str
+    type: str
+    date_introduced: date
+    date_last_action: date
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SenatorProfileDTO(BaseModel):
+    """A senator plus their record across every session they served.
+
+    Sessions are linked by email, since each session's roster has its own
+    senator rows.
+    """
+
+    senator: SenatorDTO
+    sessions: list[int]
+    committee_history: list[CommitteeHistoryDTO]
+    leadership_roles: list[LeadershipRoleDTO]
+    sponsored_legislation: PaginatedResponse[SponsoredLegislationDTO]
+
+
 class CreateSenatorDTO(BaseModel):
     first_name: str
     last_name: str
@@ -42,3 +86,52 @@ class UpdateSenatorDTO(BaseModel):
     is_active: bool | None = None
     session_number: int | None = None
     headshot_url: str | None = None
+
+
+class RosterCommitteeDTO(BaseModel):
+    committee: str  # committee id or name
+    role: str = "Member"
+
+
+class RosterEntryDTO(BaseModel):
+    first_name: str
+    last_name: str
+    email: EmailStr
+    district: str  # district id or name
+    headshot_url: str | None = None
+    committees: list[RosterCommitteeDTO] = []
+
+
+class RosterImportDTO(BaseModel):
+    session_number: int
+    deactivate_previous: bool = True
+    senators: list[RosterEntryDTO]
+
+
+class RosterConflictDTO(BaseModel):
+    line: int
+    email: str
+    reason: str
+
+
+class RosterImportResultDTO(BaseModel):
+    session_number: int
+    dry_run: bool
+    created: int
+    memberships_created: int
+    deactivated: int
+    conflicts: list[RosterConflictDTO]
+
+
+class CloneSessionDTO(BaseModel):
+    source_session: int
+    target_session: int
+    deactivate_source: bool = True
+
+
+class CloneSessionResultDTO(BaseModel):
+    source_session: int
+    target_session: int
+    senators_cloned: int
+    memberships_cloned: int
+    deactivated: int
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, ConfigDict, EmailStr
 
+from app.schemas.bulk import BatchItemDTO
+
 
 class StaffDTO(BaseModel):
     id: int
@@ -23,6 +25,7 @@ class AdminStaffDTO(BaseModel):
     photo_url: str | None
     display_order: int
     is_active: bool
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -44,3 +47,8 @@ class UpdateStaffDTO(BaseModel):
     photo_url: str | None = None
     display_order: int | None = None
     is_active: bool | None = None
+
+
+class BulkStaffItemDTO(BatchItemDTO):
+    display_order: int | None = None
+    is_active: bool | None = None
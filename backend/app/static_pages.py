@@ -6,6 +6,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from textwrap import dedent
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.Admin import Admin
@@ -202,10 +203,9 @@ def ensure_default_static_pages(
 
     editor_id = editor.id if editor is not None else None
     if editor_id is None:
-        first_admin = db.query(Admin).order_by(Admin.id).first()
-        if first_admin is None:
-            return 0
-        editor_id = first_admin.id
+        # Attributed to the first admin when there is one; a deploy whose
+        # first admin is added later still gets its pages, with no editor.
+        editor_id = db.scalar(select(Admin.id).order_by(Admin.id).limit(1))
 
     db.add_all(
         StaticPageContent(
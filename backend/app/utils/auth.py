@@ -1,3 +1,15 @@
+"""JWT access tokens and the authentication dependencies.
+
+Access tokens carry the admin id (``sub``) and their ``token_version``
+(``ver``). Bumping ``Admin.token_version`` revokes every token issued before.
+
+``get_current_user`` returns a ``Principal`` — an immutable snapshot of the
+admin — served from a short-lived per-process cache, so most admin API calls
+skip the admin lookup. Code that changes or deletes an account must call
+``invalidate_principal(admin_id)`` after committing.
+"""
+
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 from fastapi import Depends, HTTPException, status
@@ -5,12 +17,46 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
-from app.config import ACCESS_TOKEN_EXPIRE_HOURS, JWT_ALGORITHM, JWT_SECRET
+from app.config import (
+    ACCESS_TOKEN_EXPIRE_HOURS,
+    AUTH_CACHE_SECONDS,
+    AUTH_CACHE_SIZE,
+    JWT_ALGORITHM,
+    JWT_SECRET,
+)
 from app.database import get_db
 from app.models import Admin  # from your core entities
+from app.utils.cache import TTLCache
 
 security = HTTPBearer()
 
+principal_cache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_SECONDS, name="principals")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated admin as seen by route handlers."""
+
+    id: int
+    email: str
+    onyen: str
+    first_name: str
+    last_name: str
+    role: str
+    token_version: int
+
+    @classmethod
+    def from_admin(cls, admin: Admin) -> "Principal":
+        return cls(
+            id=admin.id,
+            email=admin.email,
+            onyen=admin.onyen,
+            first_name=admin.first_name,
+            last_name=admin.last_name,
+            role=admin.role,
+            token_version=admin.token_version,
+        )
+
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
@@ -23,10 +69,26 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
+def invalidate_principal(admin_id: int) -> None:
+    principal_cache.invalidate(admin_id)
+
+
+def _load_principal(db: Session, admin_id: int, *, refresh: bool = False) -> Principal | None:
+    generation = principal_cache.generation
+    principal = None if refresh else principal_cache.get(admin_id)
+    if principal is None:
+        admin = db.query(Admin).filter(Admin.id == admin_id).first()
+        if admin is None:
+            return None
+        principal = Principal.from_admin(admin)
+        principal_cache.set(admin_id, principal, generation=generation)
+    return principal
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
-):
+) -> Principal:
     token = credentials.credentials
 
     try:
@@ -39,16 +101,28 @@ def get_current_user(
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    user = db.query(Admin).filter(Admin.id == user_id).first()
+    try:
+        admin_id = int(user_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    token_version = payload.get("ver", 0)
+
+    user = _load_principal(db, admin_id)
+    if user is not None and token_version > user.token_version:
+        # Issued after the cached snapshot (e.g. by another worker); re-check.
+        user = _load_principal(db, admin_id, refresh=True)
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
+    if token_version != user.token_version:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
     return user
 
 
 def require_role(required_role: str):
-    def role_checker(user: Admin = Depends(get_current_user)):
+    def role_checker(user: Principal = Depends(get_current_user)):
         if user.role != required_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,137 @@
+"""Set-based batch updates for admin list editing (reorder and bulk patch).
+
+Usage::
+
+    from app.utils.bulk import StaleRowsError, bulk_update
+
+    try:
+        bulk_update(db, Staff, [{"id": 4, "version": 2, "display_order": 1}, ...])
+    except StaleRowsError:
+        ...
+
+Each distinct set of changed fields becomes ONE ``UPDATE`` statement no matter
+how many rows it touches. On PostgreSQL that is ``UPDATE ... FROM (VALUES ...)``;
+SQLite cannot alias a VALUES list with column names, so it gets an equivalent
+``CASE id WHEN ...`` statement instead.
+
+Models passed in must have an integer ``version`` column (mapped as the
+mapper's ``version_id_col``). Rows that carry a ``version`` are only updated
+when it still matches the stored value, and every updated row's version is
+bumped, which gives callers optimistic concurrency control.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Integer, and_, case, column, or_, update, values
+from sqlalchemy.orm import Session
+
+_NO_VERSION = -1
+
+
+class StaleRowsError(Exception):
+    """Raised when some rows were modified or deleted since the client read them."""
+
+    def __init__(self, ids: list[int]):
+        self.ids = ids
+        super().__init__(
+            "Rows were changed by someone else or no longer exist; reload and retry "
+            f"(ids: {', '.join(str(i) for i in ids)})"
+        )
+
+
+def _postgres_statement(model: Any, fields: list[str], rows: list[dict[str, Any]]):
+    table = model.__table__
+    batch = values(
+        column("id", Integer),
+        column("expected_version", Integer),
+        *(column(field, table.c[field].type) for field in fields),
+        name="batch",
+    ).data(
+        [
+            (row["id"], row.get("version", _NO_VERSION), *(row[field] for field in fields))
+            for row in rows
+        ]
+    )
+    return (
+        update(model)
+        .where(
+            model.id == batch.c.id,
+            or_(batch.c.expected_version == _NO_VERSION, model.version == batch.c.expected_version),
+        )
+        .values({**{field: batch.c[field] for field in fields}, "version": model.version + 1})
+    )
+
+
+def _generic_statement(model: Any, fields: list[str], rows: list[dict[str, Any]]):
+    ids = [row["id"] for row in rows]
+    version_checks = [
+        and_(model.id == row["id"], model.version == row["version"])
+        if row.get("version", _NO_VERSION) != _NO_VERSION
+        else model.id == row["id"]
+        for row in rows
+    ]
+    return (
+        update(model)
+        .where(model.id.in_(ids), or_(*version_checks))
+        .values(
+            {
+                **{
+                    field: case({row["id"]: row[field] for row in rows}, value=model.id)
+                    for field in fields
+                },
+                "version": model.version + 1,
+            }
+        )
+    )
+
+
+def _stale_ids(db: Session, model: Any, rows: list[dict[str, Any]]) -> list[int]:
+    current = dict(
+        db.query(model.id, model.version).filter(model.id.in_([row["id"] for row in rows])).all()
+    )
+    return [
+        row["id"]
+        for row in rows
+        if row["id"] not in current
+        or row.get("version", _NO_VERSION) not in (_NO_VERSION, current[row["id"]])
+    ]
+
+
+def bulk_update(db: Session, model: Any, rows: list[dict[str, Any]]) -> list[int]:
+    """Apply per-row field changes with one UPDATE per distinct field set.
+
+    Each row is a dict with ``id``, an optional ``version`` (``None`` skips the
+    check for that row) and the fields to change. Does not commit. If any row
+    did not match, the transaction is rolled back and ``StaleRowsError`` is
+    raised listing the offending ids.
+    """
+    normalized: list[dict[str, Any]] = []
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        row = dict(row)
+        if row.get("version") is None:
+            row["version"] = _NO_VERSION
+        fields = tuple(sorted(k for k in row if k not in {"id", "version"}))
+        if not fields:
+            continue
+        normalized.append(row)
+        groups.setdefault(fields, []).append(row)
+
+    build = (
+        _postgres_statement if db.get_bind().dialect.name == "postgresql" else _generic_statement
+    )
+    matched = 0
+    for fields, group in groups.items():
+        statement = build(model, list(fields), group)
+        result = db.execute(statement.execution_options(synchronize_session=False))
+        matched += result.rowcount
+
+    if matched != len(normalized):
+        db.rollback()
+        raise StaleRowsError(_stale_ids(db, model, normalized))
+
+    # Identity-map copies of these rows are now out of date.
+    db.expire_all()
+    return [row["id"] for row in normalized]
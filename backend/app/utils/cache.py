@@ -0,0 +1,110 @@
+"""Bounded in-process TTL cache.
+
+Usage::
+
+    from app.utils.cache import TTLCache
+
+    principals = TTLCache(maxsize=1024, ttl=30, name="principals")
+    generation = principals.generation
+    value = principals.get(key)
+    if value is None:
+        value = load(key)
+        principals.set(key, value, generation=generation)
+    principals.invalidate(key)      # after the underlying row changes
+
+Entries expire ``ttl`` seconds after they were stored; when the cache is full
+the least recently used entry is evicted. Every cache is thread-safe (sync
+routes run in a thread pool) and registers itself so ``clear_all()`` can reset
+every cache at once, e.g. between tests.
+
+Every ``invalidate()`` or ``clear()`` bumps ``generation``. Passing the
+generation read before loading to ``set()`` drops the value if an invalidation
+happened meanwhile, so a load that raced a write cannot re-cache what that
+write replaced.
+
+The cache is per process: with several workers or replicas, an invalidation
+only reaches the process that made it and the others catch up within ``ttl``.
+Keep ``ttl`` short for anything a change must take effect on quickly.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_registry: weakref.WeakSet[TTLCache] = weakref.WeakSet()
+
+
+class TTLCache:
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        _registry.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, *, generation: int | None = None) -> None:
+        """Store ``value``; skipped if ``generation`` is given and is no longer current."""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<TTLCache {self.name or id(self)} size={len(self)}/{self.maxsize} ttl={self.ttl}>"
+
+
+def clear_all() -> None:
+    """Empty every ``TTLCache`` in the process."""
+    for cache in list(_registry):
+        cache.clear()
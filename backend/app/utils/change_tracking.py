@@ -0,0 +1,75 @@
+"""Run callbacks when a transaction that wrote to given models commits.
+
+Usage::
+
+    from app.utils.change_tracking import on_commit
+
+    on_commit([Senator, Committee], lambda changed: roster_cache.clear())
+
+Session events note every ORM flush and every ORM-enabled ``insert``/
+``update``/``delete`` that touches a tracked model. When that transaction
+commits, each callback registered for one of the touched models is called
+once with the set of touched model classes; a rollback discards the record.
+Caches of derived data use this so route code never has to remember to
+invalidate them.
+
+Writes issued as raw SQL, or made by another process, are not seen; caches
+relying on this still need a TTL.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+Callback = Callable[[set[type]], None]
+
+_PENDING_KEY = "change_tracking_models"
+_callbacks: dict[type, list[Callback]] = {}
+
+
+def on_commit(models: Iterable[type], callback: Callback) -> None:
+    """Call ``callback(changed)`` after each commit that wrote to one of ``models``."""
+    for model in models:
+        _callbacks.setdefault(model, []).append(callback)
+
+
+def _mark_changed(session: Session, models: Iterable[type]) -> None:
+    tracked = {model for model in models if model in _callbacks}
+    if tracked:
+        session.info.setdefault(_PENDING_KEY, set()).update(tracked)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_rows(session: Session, _flush_context) -> None:
+    _mark_changed(
+        session, {type(row) for row in chain(session.new, session.dirty, session.deleted)}
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_statements(state: ORMExecuteState) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper is not None:
+        _mark_changed(state.session, {state.bind_mapper.class_})
+
+
+@event.listens_for(Session, "after_commit")
+def _run_callbacks(session: Session) -> None:
+    changed = session.info.pop(_PENDING_KEY, None)
+    if not changed:
+        return
+    callbacks: list[Callback] = []
+    for model in changed:
+        for callback in _callbacks[model]:
+            if callback not in callbacks:
+                callbacks.append(callback)
+    for callback in callbacks:
+        callback(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
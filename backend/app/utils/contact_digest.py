@@ -0,0 +1,138 @@
+"""Per-recipient digests of contact-form messages.
+
+Usage::
+
+    from app.utils.contact_digest import add_to_digest
+
+    add_to_digest(db, to_email=senator.email, sender_name=..., sender_email=..., message=...)
+    db.commit()
+
+With ``CONTACT_DIGEST_WINDOW_MINUTES`` > 0 the contact form stores messages
+here instead of queueing one email each. The first message to a recipient opens
+a ``ContactDigest`` that closes ``window`` later; everything sent to that
+recipient until then is attached to it. ``flush_due_digests`` (run by the
+outbox worker on every pass) turns each closed digest into one outbox email and
+marks it ``queued`` in the same transaction, so a message is never dropped or
+mailed twice. All of this lives in the database, so it survives restarts and is
+shared by every API replica.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import CONTACT_DIGEST_WINDOW_MINUTES
+from app.models.ContactDigest import ContactDigest, ContactDigestMessage
+from app.utils.outbox import enqueue_email, outbox_worker
+
+
+def message_subject(sender_name: str) -> str:
+    return f"New Message via Senate Portal from {sender_name}"
+
+
+def message_body(sender_name: str, sender_email: str, message: str) -> str:
+    return f"Name: {sender_name}\nEmail: {sender_email}\n\nMessage:\n{message}"
+
+
+def _open_digest(db: Session, to_email: str) -> ContactDigest | None:
+    # Locks the row so a concurrent flush waits for this message (PostgreSQL);
+    # if the flush got there first, the digest is no longer open and we start a new one.
+    return db.scalar(
+        select(ContactDigest)
+        .where(ContactDigest.to_email == to_email, ContactDigest.status == "open")
+        .with_for_update()
+    )
+
+
+def add_to_digest(
+    db: Session,
+    *,
+    to_email: str,
+    sender_name: str,
+    sender_email: str,
+    message: str,
+    window: timedelta | None = None,
+    now: datetime | None = None,
+) -> ContactDigest:
+    """Attach a message to ``to_email``'s open digest, opening one if needed.
+
+    The caller commits.
+    """
+    if window is None:
+        window = timedelta(minutes=CONTACT_DIGEST_WINDOW_MINUTES)
+    now = now or datetime.now()
+
+    while (digest := _open_digest(db, to_email)) is None:
+        try:
+            with db.begin_nested():
+                digest = ContactDigest(to_email=to_email, opened_at=now, closes_at=now + window)
+                db.add(digest)
+            break
+        except IntegrityError:
+            # Another request opened this recipient's digest first; attach to it,
+            # or open one again if a flush has closed it in the meantime.
+            continue
+
+    digest.messages.append(
+        ContactDigestMessage(
+            sender_name=sender_name, sender_email=sender_email, message=message, created_at=now
+        )
+    )
+    return digest
+
+
+def _digest_email(digest: ContactDigest) -> tuple[str, str, str | None]:
+    """Subject, body and reply-to for a closed digest."""
+    messages = digest.messages
+    if len(messages) == 1:
+        [only] = messages
+        return (
+            message_subject(only.sender_name),
+            message_body(only.sender_name, only.sender_email, only.message),
+            only.sender_email,
+        )
+
+    count = len(messages)
+    parts = [
+        f"You received {count} messages via the Senate Portal between "
+        f"{digest.opened_at:%b %d, %Y %H:%M} and {digest.closes_at:%H:%M}."
+    ]
+    for number, item in enumerate(messages, start=1):
+        parts.append(
+            f"--- Message {number} of {count} ---\n"
+            f"Received: {item.created_at:%b %d, %Y %H:%M}\n"
+            f"{message_body(item.sender_name, item.sender_email, item.message)}"
+        )
+    senders = {item.sender_email for item in messages}
+    reply_to = senders.pop() if len(senders) == 1 else None
+    return f"{count} new messages via Senate Portal", "\n\n".join(parts), reply_to
+
+
+def flush_due_digests(db: Session, now: datetime | None = None) -> int:
+    """Queue one email for every digest whose window has closed; returns how many."""
+    now = now or datetime.now()
+    digests = db.scalars(
+        select(ContactDigest)
+        .where(ContactDigest.status == "open", ContactDigest.closes_at <= now)
+        .order_by(ContactDigest.closes_at, ContactDigest.id)
+        .options(selectinload(ContactDigest.messages))
+        .with_for_update(skip_locked=True)
+    ).all()
+    for digest in digests:
+        if digest.messages:
+            subject, body, reply_to = _digest_email(digest)
+            row = enqueue_email(
+                db, to_email=digest.to_email, subject=subject, body=body, reply_to=reply_to
+            )
+            db.flush()
+            digest.outbox_id = row.id
+        digest.status = "queued"
+    db.commit()
+    return len(digests)
+
+
+outbox_worker.register_producer(flush_due_digests)
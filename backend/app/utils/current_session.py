@@ -0,0 +1,63 @@
+"""The current senate session per roster, cached.
+
+Usage::
+
+    from app.utils.current_session import current_session
+
+    target = session if session is not None else current_session(db, "senators")
+
+The public senator, legislation and leadership lists default to the newest
+session present in their own table. That value changes about once a year, so
+it is read once and then served from a ``TTLCache`` instead of running
+``SELECT max(session_number)`` before every list query.
+
+Writes are picked up without route code having to remember to invalidate:
+``app.utils.change_tracking`` drops the cached value when a transaction that
+wrote to one of the three tables commits. Other worker processes catch up
+within ``CURRENT_SESSION_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import CURRENT_SESSION_CACHE_SECONDS
+from app.models import Leadership, Legislation, Senator
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import on_commit
+
+_MODELS = {
+    "senators": Senator,
+    "legislation": Legislation,
+    "leadership": Leadership,
+}
+_KINDS = {model: kind for kind, model in _MODELS.items()}
+
+session_cache = TTLCache(
+    maxsize=len(_MODELS), ttl=CURRENT_SESSION_CACHE_SECONDS, name="current_session"
+)
+
+
+def current_session(db: Session, kind: str) -> int:
+    """Highest ``session_number`` in the ``kind`` table (1 when it is empty)."""
+    generation = session_cache.generation
+    cached = session_cache.get(kind)
+    if cached is None:
+        model = _MODELS[kind]
+        cached = db.query(func.max(model.session_number)).scalar() or 1
+        session_cache.set(kind, cached, generation=generation)
+    return cached
+
+
+def invalidate_current_session(*kinds: str) -> None:
+    """Forget the cached value for ``kinds`` (all of them if none are given)."""
+    for kind in kinds or _MODELS:
+        session_cache.invalidate(kind)
+
+
+def _invalidate_changed(changed: set[type]) -> None:
+    invalidate_current_session(*(_KINDS[model] for model in changed if model in _KINDS))
+
+
+on_commit(_MODELS.values(), _invalidate_changed)
@@ -0,0 +1,166 @@
+"""Disk cache for on-demand image derivatives (other widths / formats).
+
+Usage::
+
+    from app.utils.derivatives import DerivativeCache
+
+    cache = DerivativeCache(Path("/app/uploads/.derivatives"), max_bytes=512 * 1024**2)
+    path = cache.get_or_render(storage, "3f/3fa9...e1.jpg", width=640, extension="webp")
+
+The cache always lives on local disk, whatever backend holds the sources (see
+``app.utils.storage``). Entries are content-addressed: the key is the SHA-256
+of the source's bytes plus the requested width and format, so identical sources share
+derivatives and a replaced source can never be served a stale one. Files are
+sharded as ``<root>/<key[:2]>/<key>.<ext>``.
+
+The cache is capped at ``max_bytes``; when a write pushes it over, the least
+recently used entries (by mtime, refreshed on every hit) are deleted. Renders
+are single-flight: concurrent requests for the same derivative wait on one
+render instead of each doing the work.
+
+``render`` does the actual resize and encode; it defaults to calling
+``render_variant`` inline. The upload route passes one that hands the work to a
+bounded ``ImagePool``, so renders never run on request threads and a flood of
+cache misses is turned away instead of queueing without limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from app.utils.image_processing import EncodedImage, render_variant
+from app.utils.storage import Storage, StoredObject
+
+_MAX_REMEMBERED_DIGESTS = 4096
+
+
+class DerivativeCache:
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int,
+        render: Callable[[bytes, int | None, str | None], EncodedImage] | None = None,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.render = render
+        self.renders = 0
+        self._state_lock = threading.Lock()
+        self._key_locks: dict[str, tuple[threading.Lock, int]] = {}
+        self._digests: dict[tuple[str, str], str] = {}
+        self._total_bytes: int | None = None
+
+    def get_or_render(
+        self, storage: Storage, source: StoredObject, width: int | None, extension: str | None
+    ) -> Path:
+        """Return the cached derivative path, rendering it first if needed.
+
+        ``source`` is the ``storage.stat()`` of the original. Raises
+        ``ImageRejectedError`` if it cannot be decoded or the format cannot be
+        written, and ``FileNotFoundError`` if it vanished in the meantime.
+        Whatever ``render`` raises (e.g. ``ImagePoolBusyError``) propagates.
+        """
+        content: bytes | None = None
+        ident = (source.key, source.etag)
+        digest = self._digests.get(ident)
+        if digest is None:
+            content = storage.read(source.key)
+            digest = hashlib.sha256(content).hexdigest()
+            if len(self._digests) >= _MAX_REMEMBERED_DIGESTS:
+                self._digests.clear()
+            self._digests[ident] = digest
+        key = hashlib.sha256(f"{digest}:{width or ''}:{extension or ''}".encode()).hexdigest()
+
+        lock = self._acquire_key_lock(key)
+        try:
+            existing = self._find(key)
+            if existing is not None:
+                os.utime(existing)
+                return existing
+
+            if content is None:
+                content = storage.read(source.key)
+            render = self.render or render_variant
+            rendered = render(content, width, extension)
+            self.renders += 1
+            path = self._path(key, rendered.extension)
+            self._write(path, rendered.data)
+        finally:
+            self._release_key_lock(key, lock)
+
+        self._evict(keep=path)
+        return path
+
+    def _path(self, key: str, extension: str) -> Path:
+        return self.root / key[:2] / f"{key}.{extension}"
+
+    def _find(self, key: str) -> Path | None:
+        shard = self.root / key[:2]
+        if not shard.is_dir():
+            return None
+        return next(shard.glob(f"{key}.*"), None)
+
+    def _acquire_key_lock(self, key: str) -> threading.Lock:
+        with self._state_lock:
+            lock, waiters = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (lock, waiters + 1)
+        lock.acquire()
+        return lock
+
+    def _release_key_lock(self, key: str, lock: threading.Lock) -> None:
+        lock.release()
+        with self._state_lock:
+            _, waiters = self._key_locks[key]
+            if waiters <= 1:
+                del self._key_locks[key]
+            else:
+                self._key_locks[key] = (lock, waiters - 1)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._state_lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.suffix == ".part":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        with self._state_lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+            self._total_bytes = total
@@ -0,0 +1,162 @@
+"""HTTP responses for files on disk: validators, cache headers, ranges and offload.
+
+Usage::
+
+    from app.utils.file_serving import IMMUTABLE, regular_file_stat, serve_file
+
+    stat_result = regular_file_stat(path)          # one stat() call, None if missing
+    return serve_file(request, path, stat_result, cache_control=IMMUTABLE)
+
+``serve_file`` answers conditional requests (``If-None-Match`` /
+``If-Modified-Since``) with 304 before opening the file. Otherwise the body is
+delivered, in order of preference, by:
+
+1. the fronting proxy, when ``accel_prefix`` is set — the response carries only
+   headers plus ``X-Accel-Redirect`` and nginx streams the file itself;
+2. the ASGI server, when it advertises the ``http.response.pathsend``
+   extension (e.g. Granian) — it can ``sendfile()`` the path;
+3. Starlette's ``FileResponse``, which also handles ``Range`` requests.
+
+The shipped deployment uses neither offload: the Dockerfile runs plain
+uvicorn, which does not advertise ``pathsend``, and the OpenShift route in
+``deploy/cloudapps`` goes straight to it with no nginx in front, so
+``UPLOAD_ACCEL_REDIRECT_PREFIX`` must stay empty there and every file is
+streamed by ``FileResponse`` (3). Options 1 and 2 only apply when the app is
+run behind such a proxy or server. For 1, nginx needs an ``internal``
+location aliased to ``UPLOAD_DIR``, or it would serve the empty body::
+
+    location /_uploads/ {
+        internal;
+        alias /app/uploads/;
+    }
+
+``serve_bytes`` does the same validator handling for content that is already
+in memory (e.g. from the in-memory storage backend).
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from pathlib import Path
+from urllib.parse import quote
+
+from fastapi import Request
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=3600"
+
+
+def regular_file_stat(path: Path) -> os.stat_result | None:
+    try:
+        stat_result = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong ETag from file identity (inode, mtime, size) — no hashing of the body."""
+    return f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value matches ``etag`` (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since
+
+
+def _validator_headers(etag: str, mtime: float, cache_control: str) -> dict[str, str]:
+    return {
+        "cache-control": cache_control,
+        "etag": etag,
+        "last-modified": formatdate(mtime, usegmt=True),
+    }
+
+
+class PathSendFileResponse(FileResponse):
+    """``FileResponse`` that lets the server send whole files via ``pathsend``.
+
+    Falls back to streaming under servers without the extension, including
+    the uvicorn the Dockerfile runs.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            "http.response.pathsend" not in scope.get("extensions", {})
+            or scope["method"].upper() == "HEAD"
+            or "range" in Headers(scope=scope)
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers}
+        )
+        await send({"type": "http.response.pathsend", "path": str(self.path)})
+        if self.background is not None:
+            await self.background()
+
+
+def serve_file(
+    request: Request,
+    path: Path,
+    stat_result: os.stat_result,
+    *,
+    cache_control: str,
+    accel_root: Path | None = None,
+    accel_prefix: str = "",
+) -> Response:
+    """Build the response for ``path``; ``stat_result`` must come from ``regular_file_stat``.
+
+    ``accel_prefix`` is the internal nginx location that maps to ``accel_root``,
+    e.g. ``location /_uploads/ { internal; alias /app/uploads/; }``. Files
+    outside ``accel_root`` are always served by the app.
+    """
+    etag = file_etag(stat_result)
+    headers = _validator_headers(etag, stat_result.st_mtime, cache_control)
+    if is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    if accel_prefix and accel_root is not None and path.is_relative_to(accel_root):
+        relpath = path.relative_to(accel_root).as_posix()
+        headers["x-accel-redirect"] = f"{accel_prefix.rstrip('/')}/{quote(relpath)}"
+        return Response(headers=headers, media_type=guess_type(path.name)[0])
+
+    return PathSendFileResponse(path, headers=headers, stat_result=stat_result)
+
+
+def serve_bytes(
+    request: Request,
+    data: bytes,
+    *,
+    key: str,
+    etag: str,
+    mtime: float,
+    cache_control: str,
+) -> Response:
+    headers = _validator_headers(etag, mtime, cache_control)
+    if is_not_modified(request, etag, mtime):
+        return Response(status_code=304, headers=headers)
+    return Response(data, headers=headers, media_type=guess_type(key)[0])
@@ -0,0 +1,126 @@
+"""Finance hearing slot reservations that cannot overbook.
+
+Usage::
+
+    from app.utils.hearing_bookings import SlotUnavailableError, book_slot
+
+    try:
+        booking = book_slot(db, hearing_date_id, organization_name=..., contact_name=...,
+                            contact_email=...)
+    except SlotUnavailableError:
+        ...   # full, closed or in the past
+
+A seat is taken with one conditional ``UPDATE``::
+
+    UPDATE finance_hearing_date SET booked_count = booked_count + 1
+     WHERE id = :id AND NOT is_full AND booked_count < capacity AND hearing_date >= :today
+
+PostgreSQL re-checks the ``WHERE`` clause against the latest row version when
+two such updates race, so the second one sees the incremented counter and
+matches nothing once the slot is full. No read-then-write window exists to
+overbook in, and nothing waits on an explicit lock longer than that single
+statement's transaction. The booking row is inserted in the same transaction:
+if the insert fails (the organization already holds a seat), the rollback
+returns the seat.
+
+Organizations are matched on ``organization_key``: the name casefolded with
+runs of whitespace collapsed, so "ACM" and " acm " hold the same seat.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import FinanceHearingBooking, FinanceHearingDate
+
+ORGANIZATION_UNIQUE_INDEX = "uq_finance_hearing_booking_org_key"
+
+
+class SlotUnavailableError(Exception):
+    """The hearing slot is full, closed by an admin, or already past."""
+
+
+class DuplicateBookingError(Exception):
+    """The organization already holds a seat at this hearing."""
+
+
+def organization_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def _is_duplicate_organization(exc: IntegrityError) -> bool:
+    """Whether ``exc`` came from the one-seat-per-organization index."""
+    diag = getattr(exc.orig, "diag", None)  # psycopg2
+    if diag is not None:
+        return diag.constraint_name == ORGANIZATION_UNIQUE_INDEX
+    # SQLite names the columns instead: "UNIQUE constraint failed: t.a, t.b".
+    # Databases created before m0009 also keep the old organization_name one.
+    message = str(exc.orig)
+    return (
+        message.startswith("UNIQUE")
+        and f"{FinanceHearingBooking.__tablename__}.organization_" in message
+    )
+
+
+def book_slot(
+    db: Session,
+    hearing_date_id: int,
+    *,
+    organization_name: str,
+    contact_name: str,
+    contact_email: str,
+    today: date | None = None,
+) -> FinanceHearingBooking:
+    """Reserve one seat and record the booking; commits on success."""
+    reserved = db.execute(
+        update(FinanceHearingDate)
+        .where(
+            FinanceHearingDate.id == hearing_date_id,
+            FinanceHearingDate.is_full.is_(False),
+            FinanceHearingDate.booked_count < FinanceHearingDate.capacity,
+            FinanceHearingDate.hearing_date >= (today or date.today()),
+        )
+        .values(booked_count=FinanceHearingDate.booked_count + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not reserved:
+        db.rollback()
+        raise SlotUnavailableError("This hearing slot is no longer available")
+
+    booking = FinanceHearingBooking(
+        hearing_date_id=hearing_date_id,
+        organization_name=organization_name,
+        organization_key=organization_key(organization_name),
+        contact_name=contact_name,
+        contact_email=contact_email,
+    )
+    db.add(booking)
+    try:
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        if not _is_duplicate_organization(exc):
+            raise
+        raise DuplicateBookingError(
+            "This organization already has a seat at this hearing"
+        ) from None
+    return booking
+
+
+def cancel_booking(db: Session, booking: FinanceHearingBooking) -> None:
+    """Delete ``booking`` and give its seat back; commits."""
+    db.execute(
+        update(FinanceHearingDate)
+        .where(
+            FinanceHearingDate.id == booking.hearing_date_id,
+            FinanceHearingDate.booked_count > 0,
+        )
+        .values(booked_count=FinanceHearingDate.booked_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+    db.delete(booking)
+    db.commit()
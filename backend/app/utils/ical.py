@@ -0,0 +1,240 @@
+"""Serialize calendar events as an iCalendar (RFC 5545) feed.
+
+Usage::
+
+    from app.utils.ical import calendar_chunks
+
+    return StreamingResponse(calendar_chunks(events, domain="senate.unc.edu"),
+                             media_type="text/calendar; charset=utf-8")
+
+Recurring events are written once with their ``RRULE`` and calendar clients
+expand them. Their start is given in ``CALENDAR_TIMEZONE`` so the series keeps
+its local time across daylight saving changes; one-off events use UTC.
+Timezone-naive datetimes are written as floating local times.
+
+RFC 5545 requires a ``VTIMEZONE`` for every ``TZID`` used, and clients such as
+Outlook do not know IANA names, so the feed carries one built from the zone's
+current-year transitions (``timezone_lines``). Transitions that fall on the
+n-th or last weekday of a month become a yearly ``RRULE``; anything else is
+listed explicitly for the next decade.
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from app.config import CALENDAR_TIMEZONE
+from app.models.CalendarEvent import CalendarEvent
+
+PRODUCT_ID = "-//UNC Undergraduate Senate//Calendar//EN"
+_zone = ZoneInfo(CALENDAR_TIMEZONE)
+_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_EXPLICIT_YEARS = 10
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Split a content line into 75-octet pieces joined by CRLF + space."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    pieces = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1  # never split inside a UTF-8 sequence
+        pieces.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(pieces) + "\r\n"
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _datetime_property(name: str, value: datetime, *, local: bool) -> str:
+    if value.tzinfo is None:
+        return f"{name}:{value.strftime('%Y%m%dT%H%M%S')}"
+    if local:
+        return (
+            f"{name};TZID={CALENDAR_TIMEZONE}:{value.astimezone(_zone).strftime('%Y%m%dT%H%M%S')}"
+        )
+    return f"{name}:{_utc(value)}"
+
+
+def _offset(value: timedelta) -> str:
+    minutes = int(value.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def _transitions(zone: tzinfo, year: int) -> list[tuple[datetime, timedelta, timedelta, bool, str]]:
+    """``(local_start, offset_from, offset_to, is_dst, name)`` for each change in ``year``.
+
+    ``local_start`` is the wall-clock time of the change in the old offset, as
+    ``DTSTART`` inside a ``VTIMEZONE`` expects.
+    """
+
+    def offset_at(moment: datetime) -> timedelta:
+        return moment.astimezone(zone).utcoffset()
+
+    found = []
+    day = datetime(year, 1, 1, tzinfo=timezone.utc)
+    while day.year == year:
+        following = day + timedelta(days=1)
+        if offset_at(day) != offset_at(following):
+            low, high = day, following
+            while high - low > timedelta(minutes=1):  # changes happen on whole minutes
+                middle = low + (high - low) / 2
+                low, high = (middle, high) if offset_at(middle) == offset_at(low) else (low, middle)
+            after = high.astimezone(zone)
+            before_offset = offset_at(low)
+            found.append(
+                (
+                    (high + before_offset).replace(tzinfo=None, second=0, microsecond=0),
+                    before_offset,
+                    after.utcoffset(),
+                    bool(after.dst()),
+                    after.tzname() or "",
+                )
+            )
+        day = following
+    return found
+
+
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> date | None:
+    days = [
+        day
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+        if date(year, month, day).weekday() == weekday
+    ]
+    try:
+        return date(year, month, days[nth - 1 if nth > 0 else nth])
+    except IndexError:
+        return None
+
+
+def _yearly_rule(local: datetime, later: list[datetime]) -> int | None:
+    """The ``BYDAY`` ordinal (1-4 or -1) that also matches ``later`` transitions."""
+    first = (local.day - 1) // 7 + 1
+    for nth in (first, -1):
+        if all(
+            _nth_weekday(moment.year, local.month, local.weekday(), nth) == moment.date()
+            for moment in later
+        ):
+            return nth
+    return None
+
+
+def timezone_lines(zone_name: str, year: int | None = None) -> tuple[str, ...]:
+    """A ``VTIMEZONE`` component for ``zone_name``, from its rules in ``year``."""
+    return _timezone_lines(zone_name, year or datetime.now(timezone.utc).year)
+
+
+@lru_cache(maxsize=8)
+def _timezone_lines(zone_name: str, year: int) -> tuple[str, ...]:
+    zone = ZoneInfo(zone_name)
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{zone_name}"]
+    changes = _transitions(zone, year)
+    if not changes:
+        moment = datetime(year, 1, 1, tzinfo=zone)
+        offset = _offset(moment.utcoffset())
+        return (
+            *lines,
+            "BEGIN:STANDARD",
+            "DTSTART:19700101T000000",
+            f"TZOFFSETFROM:{offset}",
+            f"TZOFFSETTO:{offset}",
+            f"TZNAME:{moment.tzname()}",
+            "END:STANDARD",
+            "END:VTIMEZONE",
+        )
+
+    following = [_transitions(zone, year + n) for n in range(1, _EXPLICIT_YEARS + 1)]
+    for index, (local, offset_from, offset_to, is_dst, name) in enumerate(changes):
+        later = [
+            years[index][0]
+            for years in following
+            if len(years) == len(changes)
+            and years[index][1:] == (offset_from, offset_to, is_dst, name)
+        ]
+        kind = "DAYLIGHT" if is_dst else "STANDARD"
+        nth = _yearly_rule(local, later) if len(later) == _EXPLICIT_YEARS else None
+        if nth is not None:
+            start = datetime.combine(
+                _nth_weekday(1970, local.month, local.weekday(), nth), local.time()
+            )
+            rule = [
+                f"RRULE:FREQ=YEARLY;BYMONTH={local.month};BYDAY={nth}{_WEEKDAYS[local.weekday()]}"
+            ]
+        else:
+            start = local
+            rule = [f"RDATE:{moment.strftime('%Y%m%dT%H%M%S')}" for moment in later]
+        lines += [
+            f"BEGIN:{kind}",
+            f"DTSTART:{start.strftime('%Y%m%dT%H%M%S')}",
+            *rule,
+            f"TZOFFSETFROM:{_offset(offset_from)}",
+            f"TZOFFSETTO:{_offset(offset_to)}",
+            f"TZNAME:{name}",
+            f"END:{kind}",
+        ]
+    return (*lines, "END:VTIMEZONE")
+
+
+def event_lines(event: CalendarEvent, *, domain: str, stamp: datetime) -> list[str]:
+    recurring = bool(event.recurrence_rule)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.id}@{domain}",
+        f"DTSTAMP:{_utc(stamp)}",
+        _datetime_property("DTSTART", event.start_datetime, local=recurring),
+        _datetime_property("DTEND", event.end_datetime, local=recurring),
+        f"SUMMARY:{escape_text(event.title)}",
+        f"CATEGORIES:{escape_text(event.event_type)}",
+    ]
+    if recurring:
+        lines.append(f"RRULE:{event.recurrence_rule}")
+    if event.location:
+        lines.append(f"LOCATION:{escape_text(event.location)}")
+    if event.description:
+        lines.append(f"DESCRIPTION:{escape_text(event.description)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def calendar_chunks(
+    events: Iterable[CalendarEvent], *, domain: str, name: str = "Undergraduate Senate"
+) -> Iterator[str]:
+    """The feed as one chunk per event, so it can be streamed as it is built."""
+    stamp = datetime.now(timezone.utc)
+    yield "".join(
+        fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{escape_text(name)}",
+            f"X-WR-TIMEZONE:{CALENDAR_TIMEZONE}",
+            *timezone_lines(CALENDAR_TIMEZONE),
+        )
+    )
+    for event in events:
+        yield "".join(fold(line) for line in event_lines(event, domain=domain, stamp=stamp))
+    yield fold("END:VCALENDAR")
@@ -0,0 +1,330 @@
+"""Image decode/resize/encode for admin uploads, kept off the event loop.
+
+Usage::
+
+    from app.utils.image_processing import ImagePool
+
+    pool = ImagePool(workers=2, max_pending=16)
+    processed = await pool.process(content)   # ProcessedImage
+    variant = await pool.render(content, 640, "webp")   # EncodedImage
+    pool.stats()                              # queue depth and counters
+
+Pillow work is CPU-bound and holds the GIL for most of a resize, so running it
+inline in an ``async def`` route stalls every other request on that worker.
+``ImagePool`` hands it to a ``ProcessPoolExecutor`` and awaits the result, so
+the event loop keeps serving while images are processed. At most
+``max_pending`` images may be queued or running at once; further uploads are
+rejected with ``ImagePoolBusyError`` rather than piling up in memory. If a
+worker process dies (OOM kill, crash in a codec) the executor is replaced and
+the image is retried once.
+
+``process_image`` runs in the worker process, so this module must stay cheap to
+import and must not pull in ``app.config`` or the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+
+import anyio
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+ALLOWED_FORMATS = {
+    "JPEG": "jpg",
+    "PNG": "png",
+    "WEBP": "webp",
+}
+STANDARD_WIDTH = 800
+THUMBNAIL_SIZE = (150, 150)
+DEFAULT_VARIANT_WIDTHS = (320, 640, 1280)
+DEFAULT_VARIANT_FORMATS = ("webp", "avif")
+
+_PILLOW_FORMATS = {"jpg": "JPEG", "png": "PNG", "webp": "WEBP", "avif": "AVIF"}
+_ENCODER_OPTIONS: dict[str, dict[str, Any]] = {
+    "jpg": {"quality": 85, "optimize": True, "progressive": True},
+    "png": {},
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 6},
+}
+
+
+class ImageRejectedError(ValueError):
+    """The uploaded bytes are not a supported, safely decodable image."""
+
+
+class ImagePoolBusyError(RuntimeError):
+    """Too many images are already queued for processing."""
+
+
+def avif_supported() -> bool:
+    """True when the installed Pillow (or a plugin) can write AVIF."""
+    Image.init()
+    return "AVIF" in Image.SAVE
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """One encoded output file.
+
+    ``role`` is ``"standard"`` (the 800px image the upload URL points at),
+    ``"thumbnail"`` or ``"variant"`` (a responsive width for ``srcset``).
+    """
+
+    role: str
+    extension: str
+    width: int
+    height: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class ProcessedImage:
+    extension: str
+    images: list[EncodedImage]
+
+    @property
+    def standard(self) -> EncodedImage:
+        return next(image for image in self.images if image.role == "standard")
+
+    @property
+    def thumbnail(self) -> EncodedImage:
+        return next(image for image in self.images if image.role == "thumbnail")
+
+
+def process_image(
+    content: bytes,
+    max_image_pixels: int | None,
+    variant_widths: tuple[int, ...] = DEFAULT_VARIANT_WIDTHS,
+    variant_formats: tuple[str, ...] = DEFAULT_VARIANT_FORMATS,
+) -> ProcessedImage:
+    """Decode, resize and re-encode one upload. Runs inside a worker process.
+
+    ``max_image_pixels`` is passed explicitly because worker processes do not
+    see changes the parent made to ``Image.MAX_IMAGE_PIXELS``. Every output is
+    rotated per its EXIF orientation and written without EXIF/XMP/comments;
+    only the ICC colour profile is kept. Widths larger than the source are
+    clamped to it (images are never upscaled), and formats the installed
+    Pillow cannot write (typically AVIF) are skipped.
+    """
+    Image.MAX_IMAGE_PIXELS = max_image_pixels
+    working, extension, icc_profile = _decode(content)
+
+    formats = [extension]
+    for fmt in variant_formats:
+        if fmt in formats or fmt not in _PILLOW_FORMATS:
+            continue
+        if fmt == "avif" and not avif_supported():
+            continue
+        formats.append(fmt)
+
+    outputs = [
+        _encode("standard", _fit_width(working, STANDARD_WIDTH), extension, icc_profile, 90),
+        _encode(
+            "thumbnail",
+            ImageOps.fit(working, THUMBNAIL_SIZE, method=Image.Resampling.LANCZOS),
+            extension,
+            icc_profile,
+            90,
+        ),
+    ]
+    for width in sorted({min(w, working.width) for w in variant_widths if w > 0}):
+        resized = _fit_width(working, width)
+        outputs.extend(_encode("variant", resized, fmt, icc_profile) for fmt in formats)
+
+    return ProcessedImage(extension=extension, images=outputs)
+
+
+def render_variant(content: bytes, width: int | None, extension: str | None = None) -> EncodedImage:
+    """Render one derivative of an already-stored image.
+
+    ``width`` and ``extension`` default to the source's own. Used to serve
+    sizes and formats that were not generated at upload time; see
+    ``app.utils.derivatives``.
+    """
+    working, source_extension, icc_profile = _decode(content)
+    extension = extension or source_extension
+    if extension not in _PILLOW_FORMATS or (extension == "avif" and not avif_supported()):
+        raise ImageRejectedError(f"Unsupported output format: {extension}")
+    resized = _fit_width(working, width) if width else working
+    return _encode("variant", resized, extension, icc_profile)
+
+
+def _render_variant_in_worker(
+    content: bytes, max_image_pixels: int | None, width: int | None, extension: str | None
+) -> EncodedImage:
+    Image.MAX_IMAGE_PIXELS = max_image_pixels
+    return render_variant(content, width, extension)
+
+
+def _decode(content: bytes) -> tuple[Image.Image, str, bytes | None]:
+    """Open, validate and orient an image; returns (image, extension, icc_profile)."""
+    try:
+        image = Image.open(BytesIO(content))
+        image.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as exc:
+        raise ImageRejectedError("Unsupported file type") from exc
+
+    extension = ALLOWED_FORMATS.get((image.format or "").upper())
+    if extension is None:
+        raise ImageRejectedError("Unsupported file type")
+
+    icc_profile = image.info.get("icc_profile")
+    working = ImageOps.exif_transpose(image)
+    if extension == "jpg":
+        working = working.convert("RGB")
+    working.info = {}
+    return working, extension, icc_profile
+
+
+def _fit_width(image: Image.Image, width: int) -> Image.Image:
+    if image.width <= width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _encode(
+    role: str,
+    image: Image.Image,
+    extension: str,
+    icc_profile: bytes | None,
+    quality: int | None = None,
+) -> EncodedImage:
+    options = dict(_ENCODER_OPTIONS[extension])
+    if quality is not None and "quality" in options:
+        options["quality"] = quality
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    if extension == "jpg" and image.mode not in {"RGB", "L"}:
+        image = image.convert("RGB")
+
+    buf = BytesIO()
+    image.save(buf, format=_PILLOW_FORMATS[extension], **options)
+    return EncodedImage(
+        role=role,
+        extension=extension,
+        width=image.width,
+        height=image.height,
+        data=buf.getvalue(),
+    )
+
+
+class ImagePool:
+    """Bounded process pool for ``process_image`` with queue-depth counters.
+
+    ``workers=0`` processes images on a worker thread instead of a separate
+    process; useful where ``multiprocessing`` is unavailable, but Pillow will
+    then compete with request handling for the GIL.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        variant_widths: tuple[int, ...] = DEFAULT_VARIANT_WIDTHS,
+        variant_formats: tuple[str, ...] = DEFAULT_VARIANT_FORMATS,
+    ):
+        self.workers = workers
+        self.max_pending = max(max_pending, 1)
+        self.variant_widths = tuple(variant_widths)
+        self.variant_formats = tuple(variant_formats)
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._restarts = 0
+        self._busy_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # "spawn" avoids forking a process that already runs the event loop
+            # and database connection pool threads.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def process(self, content: bytes) -> ProcessedImage:
+        args = (content, Image.MAX_IMAGE_PIXELS, self.variant_widths, self.variant_formats)
+        return await self._run(process_image, args)
+
+    async def render(
+        self, content: bytes, width: int | None, extension: str | None
+    ) -> EncodedImage:
+        """``render_variant`` in the pool; see ``app.utils.derivatives``."""
+        return await self._run(
+            _render_variant_in_worker, (content, Image.MAX_IMAGE_PIXELS, width, extension)
+        )
+
+    async def _run(self, fn: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+        if self._in_flight >= self.max_pending:
+            self._rejected += 1
+            raise ImagePoolBusyError("Image processing is busy; retry shortly")
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        started = time.perf_counter()
+        try:
+            if self.workers > 0:
+                try:
+                    result = await self._submit(fn, args)
+                except BrokenProcessPool:
+                    # The broken executor has been replaced; give the image one more try.
+                    result = await self._submit(fn, args)
+            else:
+                result = await anyio.to_thread.run_sync(fn, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self._busy_seconds += time.perf_counter() - started
+
+        self._completed += 1
+        return result
+
+    async def _submit(self, fn: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+        executor = self._get_executor()
+        try:
+            return await asyncio.wrap_future(executor.submit(fn, *args))
+        except BrokenProcessPool:
+            # A dead worker breaks the whole executor for good.
+            self._discard_executor(executor)
+            raise
+
+    def _discard_executor(self, executor: Executor) -> None:
+        if self._executor is executor:
+            self._executor = None
+            self._restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        running = min(self._in_flight, max(self.workers, 1))
+        finished = self._completed + self._failed
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "queued": self._in_flight - running,
+            "peak_in_flight": self._peak_in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "restarts": self._restarts,
+            "avg_latency_ms": round(self._busy_seconds * 1000 / finished, 1) if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,169 @@
+"""Pooled SMTP delivery.
+
+Usage::
+
+    from app.utils.mailer import SMTPPool, build_message
+
+    pool = SMTPPool(size=2)
+    pool.send(build_message(to_email="a@unc.edu", subject="Hi", body="..."))
+    pool.close()
+
+Opening an SMTP session costs a TCP connect, a STARTTLS handshake and an AUTH
+round trip, so connections are kept open and reused between messages, up to
+``size`` at once. A connection idle for longer than ``idle_seconds`` is closed
+instead of reused (servers drop idle clients), and one the server has already
+dropped is replaced and the send retried once.
+
+When SMTP is not configured (local dev), ``send`` prints the message instead.
+"""
+
+from __future__ import annotations
+
+import smtplib
+import threading
+import time
+from collections.abc import Callable
+from email.message import EmailMessage
+
+from app.config import (
+    EMAIL_SMTP_CONNECTIONS,
+    EMAIL_SMTP_IDLE_SECONDS,
+    SMTP_FROM,
+    SMTP_HOST,
+    SMTP_PASSWORD,
+    SMTP_PORT,
+    SMTP_USER,
+)
+
+SMTP_TIMEOUT_SECONDS = 30
+
+
+def build_message(
+    *, to_email: str, subject: str, body: str, reply_to: str | None = None
+) -> EmailMessage:
+    msg = EmailMessage()
+    msg.set_content(body)
+    msg["Subject"] = subject
+    msg["From"] = SMTP_FROM
+    msg["To"] = to_email
+    if reply_to:
+        msg.add_header("reply-to", reply_to)
+    return msg
+
+
+def is_permanent_failure(exc: Exception) -> bool:
+    """True if retrying ``exc`` cannot succeed (e.g. the recipient was rejected).
+
+    Authentication failures are 5xx too, but they are a server-side
+    configuration problem rather than a problem with the message, so they are
+    retried.
+    """
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(exc, smtplib.SMTPAuthenticationError):
+        return False
+    return isinstance(exc, smtplib.SMTPResponseException) and 500 <= exc.smtp_code < 600
+
+
+def _quit(conn: smtplib.SMTP) -> None:
+    try:
+        conn.quit()
+    except Exception:
+        conn.close()
+
+
+def _open_smtp() -> smtplib.SMTP:
+    conn = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+    try:
+        conn.starttls()
+        conn.login(SMTP_USER, SMTP_PASSWORD)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+class SMTPPool:
+    """Up to ``size`` authenticated SMTP connections, reused across sends.
+
+    ``connect`` opens a ready-to-use connection; it defaults to STARTTLS +
+    login against the configured ``SMTP_*`` server.
+    """
+
+    def __init__(
+        self,
+        size: int = EMAIL_SMTP_CONNECTIONS,
+        idle_seconds: float = EMAIL_SMTP_IDLE_SECONDS,
+        connect: Callable[[], smtplib.SMTP] | None = None,
+    ):
+        self.size = max(size, 1)
+        self.idle_seconds = idle_seconds
+        self.connections_opened = 0
+        self._connect = connect
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+    @property
+    def configured(self) -> bool:
+        return self._connect is not None or bool(SMTP_HOST and SMTP_USER and SMTP_PASSWORD)
+
+    def _open(self) -> smtplib.SMTP:
+        conn = (self._connect or _open_smtp)()
+        with self._lock:
+            self.connections_opened += 1
+        return conn
+
+    def _checkout(self) -> smtplib.SMTP:
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if now - last_used <= self.idle_seconds:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for old in stale:
+            _quit(old)
+        return conn if conn is not None else self._open()
+
+    def _checkin(self, conn: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    def send(self, message: EmailMessage) -> None:
+        """Deliver ``message``; raises the ``smtplib``/``OSError`` failure if it cannot."""
+        if not self.configured:
+            print("----------------------------------------")
+            print(f"MOCK EMAIL WOULD SEND TO: {message['To']}")
+            print(f"REPLY-TO: {message['Reply-To']}")
+            print(f"SUBJECT: {message['Subject']}")
+            print(f"BODY:\n{message.get_content()}")
+            print("----------------------------------------")
+            return
+
+        with self._slots:
+            conn = self._checkout()
+            try:
+                try:
+                    conn.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    conn.close()
+                    conn = self._open()
+                    conn.send_message(message)
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                # The server answered, so the session is still usable.
+                self._checkin(conn)
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            self._checkin(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            _quit(conn)
@@ -0,0 +1,215 @@
+"""Persistent email outbox: queue mail inside a request, deliver it in the background.
+
+Usage::
+
+    from app.utils.outbox import enqueue_email, outbox_worker
+
+    enqueue_email(db, to_email=senator.email, subject=..., body=..., reply_to=...)
+    db.commit()
+    outbox_worker.wake()        # deliver now rather than at the next poll
+
+The request only inserts an ``EmailOutbox`` row, so a slow or unreachable SMTP
+server never holds up a response and no message is lost if the process dies.
+``outbox_worker`` (started from the app lifespan unless
+``EMAIL_WORKER_ENABLED=false``) claims due rows, sends them over a shared
+``SMTPPool`` and records the outcome:
+
+- delivered: ``status="sent"``;
+- transient failure: retried after ``EMAIL_RETRY_BASE_SECONDS * 2**(attempts-1)``
+  (capped at an hour);
+- permanent failure (recipient rejected) or ``EMAIL_MAX_ATTEMPTS`` reached:
+  ``status="dead"``, kept with ``last_error`` for inspection.
+
+Claims use ``SELECT ... FOR UPDATE SKIP LOCKED`` on PostgreSQL, so several API
+replicas can each run a worker against the same table.
+
+Producers registered with ``outbox_worker.register_producer(fn)`` run at the
+start of every pass as ``fn(db, now)`` and may enqueue (and commit) mail that
+only becomes due over time, e.g. contact digests (``app/utils/contact_digest.py``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import (
+    EMAIL_BATCH_SIZE,
+    EMAIL_MAX_ATTEMPTS,
+    EMAIL_POLL_SECONDS,
+    EMAIL_RETRY_BASE_SECONDS,
+)
+from app.database import SessionLocal
+from app.models.EmailOutbox import EmailOutbox
+from app.utils.mailer import SMTPPool, build_message, is_permanent_failure
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY_SECONDS = 60 * 60
+CLAIM_LEASE_SECONDS = 5 * 60
+
+Producer = Callable[[Session, datetime], object]
+
+
+def enqueue_email(
+    db: Session, *, to_email: str, subject: str, body: str, reply_to: str | None = None
+) -> EmailOutbox:
+    """Add a message to the outbox. The caller commits."""
+    row = EmailOutbox(to_email=to_email, reply_to=reply_to, subject=subject, body=body)
+    db.add(row)
+    return row
+
+
+def retry_delay(attempts: int, base: float = EMAIL_RETRY_BASE_SECONDS) -> timedelta:
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), MAX_RETRY_DELAY_SECONDS))
+
+
+@dataclass
+class _Claimed:
+    id: int
+    attempts: int
+    message: EmailMessage
+    error: Exception | None = None
+
+
+class OutboxWorker:
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        pool: SMTPPool | None = None,
+        *,
+        batch_size: int = EMAIL_BATCH_SIZE,
+        max_attempts: int = EMAIL_MAX_ATTEMPTS,
+        retry_base: float = EMAIL_RETRY_BASE_SECONDS,
+        poll_seconds: float = EMAIL_POLL_SECONDS,
+        producers: Iterable[Producer] = (),
+    ):
+        self.session_factory = session_factory
+        self.pool = pool or SMTPPool()
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.poll_seconds = poll_seconds
+        self.producers = list(producers)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register_producer(self, producer: Producer) -> None:
+        if producer not in self.producers:
+            self.producers.append(producer)
+
+    def _produce(self, db: Session, now: datetime) -> None:
+        for producer in self.producers:
+            try:
+                producer(db, now)
+            except Exception:
+                db.rollback()
+                logger.exception("Outbox producer %r failed", producer)
+
+    def _claim(self, db: Session, now: datetime) -> list[_Claimed]:
+        rows = db.scalars(
+            select(EmailOutbox)
+            .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        claimed = []
+        for row in rows:
+            row.attempts += 1
+            row.next_attempt_at = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+            message = build_message(
+                to_email=row.to_email, subject=row.subject, body=row.body, reply_to=row.reply_to
+            )
+            claimed.append(_Claimed(row.id, row.attempts, message))
+        db.commit()
+        return claimed
+
+    def _deliver(self, item: _Claimed) -> _Claimed:
+        try:
+            self.pool.send(item.message)
+        except Exception as exc:
+            item.error = exc
+        return item
+
+    def _record(self, db: Session, results: list[_Claimed], now: datetime) -> None:
+        rows = {
+            row.id: row
+            for row in db.scalars(
+                select(EmailOutbox).where(EmailOutbox.id.in_([item.id for item in results]))
+            )
+        }
+        for item in results:
+            row = rows.get(item.id)
+            if row is None:  # deleted while we were sending
+                continue
+            if item.error is None:
+                row.status = "sent"
+                row.sent_at = now
+                row.last_error = None
+                continue
+            row.last_error = f"{type(item.error).__name__}: {item.error}"[:1000]
+            if is_permanent_failure(item.error) or item.attempts >= self.max_attempts:
+                row.status = "dead"
+                logger.error("Email %s dead-lettered: %s", item.id, row.last_error)
+            else:
+                row.next_attempt_at = now + retry_delay(item.attempts, self.retry_base)
+        db.commit()
+
+    def run_once(self) -> int:
+        """Run the producers, then claim and send one batch of due messages.
+
+        Returns how many messages were claimed.
+        """
+        db = self.session_factory()
+        try:
+            self._produce(db, datetime.now())
+            claimed = self._claim(db, datetime.now())
+            if not claimed:
+                return 0
+            with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+                results = list(executor.map(self._deliver, claimed))
+            self._record(db, results, datetime.now())
+            return len(claimed)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                while self.run_once() >= self.batch_size and not self._stop.is_set():
+                    pass
+            except Exception:
+                logger.exception("Email outbox pass failed")
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.pool.close()
+
+
+outbox_worker = OutboxWorker()
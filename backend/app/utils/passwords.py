@@ -1,15 +1,45 @@
-"""Password hashing helpers for local admin authentication."""
+"""Password hashing helpers for local admin authentication.
+
+Usage::
+
+    from app.utils.passwords import hash_password, verify_and_update
+
+    stored = hash_password("correct horse battery staple")
+    ok, new_hash = verify_and_update(password, stored)
+    if ok and new_hash:
+        admin.password_hash = new_hash   # parameters changed since it was stored
+
+Hashes are stored as ``<algorithm>$<parameters...>$<salt>$<digest>`` and
+verified by the hasher registered for that algorithm, so hashes made under
+older settings keep working. New hashes use ``PASSWORD_HASHER`` (PBKDF2-SHA256
+or scrypt). ``verify_and_update`` returns a fresh hash when a stored one was
+made with another algorithm or other parameters, so stored hashes follow the
+configuration as admins log in.
+
+Hashing is deliberately slow. Request handlers should run it through a
+``HashingPool`` (a small, bounded thread pool) rather than on the event loop
+or the shared request threads.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import binascii
 import hashlib
 import hmac
 import secrets
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import (
+    PASSWORD_HASHER,
+    PASSWORD_PBKDF2_ITERATIONS,
+    PASSWORD_SCRYPT_N,
+    PASSWORD_SCRYPT_P,
+    PASSWORD_SCRYPT_R,
+)
 
-ALGORITHM = "pbkdf2_sha256"
-ITERATIONS = 600_000
 SALT_BYTES = 16
 HASH_BYTES = 32
 
@@ -23,37 +53,186 @@ def _b64decode(encoded: str) -> bytes:
     return base64.urlsafe_b64decode(f"{encoded}{padding}")
 
 
+class Hasher(ABC):
+    """One password hashing algorithm with its current parameters."""
+
+    algorithm: str
+
+    @abstractmethod
+    def hash(self, password: str) -> str: ...
+
+    @abstractmethod
+    def verify(self, password: str, encoded: str) -> bool: ...
+
+    @abstractmethod
+    def needs_update(self, encoded: str) -> bool:
+        """True if ``encoded`` (made by this algorithm) used other parameters."""
+
+
+class PBKDF2Hasher(Hasher):
+    algorithm = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def _digest(self, password: str, salt: bytes, iterations: int, length: int) -> bytes:
+        return hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), salt, iterations, dklen=length
+        )
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(SALT_BYTES)
+        digest = self._digest(password, salt, self.iterations, HASH_BYTES)
+        return f"{self.algorithm}${self.iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            algorithm, iterations_raw, salt_raw, digest_raw = encoded.split("$", 3)
+            if algorithm != self.algorithm:
+                return False
+            iterations = int(iterations_raw)
+            salt = _b64decode(salt_raw)
+            expected_digest = _b64decode(digest_raw)
+        except (binascii.Error, ValueError, TypeError):
+            return False
+
+        actual_digest = self._digest(password, salt, iterations, len(expected_digest))
+        return hmac.compare_digest(actual_digest, expected_digest)
+
+    def needs_update(self, encoded: str) -> bool:
+        return encoded.split("$")[1:2] != [str(self.iterations)]
+
+
+class ScryptHasher(Hasher):
+    """Memory-hard scrypt; each hash needs about ``128 * n * r`` bytes of RAM."""
+
+    algorithm = "scrypt"
+
+    def __init__(self, n: int = 2**15, r: int = 8, p: int = 1):
+        self.n = n
+        self.r = r
+        self.p = p
+
+    @staticmethod
+    def _digest(password: str, salt: bytes, n: int, r: int, p: int, length: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r + 1024 * 1024,
+            dklen=length,
+        )
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(SALT_BYTES)
+        digest = self._digest(password, salt, self.n, self.r, self.p, HASH_BYTES)
+        return (
+            f"{self.algorithm}${self.n}${self.r}${self.p}${_b64encode(salt)}${_b64encode(digest)}"
+        )
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            algorithm, n_raw, r_raw, p_raw, salt_raw, digest_raw = encoded.split("$", 5)
+            if algorithm != self.algorithm:
+                return False
+            n, r, p = int(n_raw), int(r_raw), int(p_raw)
+            salt = _b64decode(salt_raw)
+            expected_digest = _b64decode(digest_raw)
+            actual_digest = self._digest(password, salt, n, r, p, len(expected_digest))
+        except (binascii.Error, ValueError, TypeError):
+            return False
+        return hmac.compare_digest(actual_digest, expected_digest)
+
+    def needs_update(self, encoded: str) -> bool:
+        return encoded.split("$")[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+
+HASHERS: dict[str, Hasher] = {}
+
+
+def register_hasher(hasher: Hasher) -> None:
+    HASHERS[hasher.algorithm] = hasher
+
+
+register_hasher(PBKDF2Hasher(PASSWORD_PBKDF2_ITERATIONS))
+register_hasher(ScryptHasher(PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P))
+if PASSWORD_HASHER not in HASHERS:
+    raise RuntimeError(f"PASSWORD_HASHER must be one of: {', '.join(sorted(HASHERS))}")
+
+
+def get_hasher(algorithm: str | None = None) -> Hasher:
+    """The registered hasher for ``algorithm`` (default: ``PASSWORD_HASHER``)."""
+    return HASHERS[algorithm or PASSWORD_HASHER]
+
+
 def hash_password(password: str) -> str:
-    """Return a salted PBKDF2-SHA256 password hash."""
-    salt = secrets.token_bytes(SALT_BYTES)
-    digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        ITERATIONS,
-        dklen=HASH_BYTES,
-    )
-    return f"{ALGORITHM}${ITERATIONS}${_b64encode(salt)}${_b64encode(digest)}"
+    """Return a salted hash of ``password`` using the configured hasher."""
+    return get_hasher().hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Check a plaintext password against a stored password hash."""
-    try:
-        algorithm, iterations_raw, salt_raw, digest_raw = password_hash.split("$", 3)
-        if algorithm != ALGORITHM:
-            return False
+    hasher = HASHERS.get(password_hash.split("$", 1)[0])
+    return hasher is not None and hasher.verify(password, password_hash)
+
 
-        iterations = int(iterations_raw)
-        salt = _b64decode(salt_raw)
-        expected_digest = _b64decode(digest_raw)
-    except (binascii.Error, ValueError, TypeError):
-        return False
-
-    actual_digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations,
-        dklen=len(expected_digest),
+def needs_rehash(password_hash: str) -> bool:
+    """True if ``password_hash`` was not made with the current hasher and parameters."""
+    current = get_hasher()
+    return not password_hash.startswith(f"{current.algorithm}$") or current.needs_update(
+        password_hash
     )
-    return hmac.compare_digest(actual_digest, expected_digest)
+
+
+def verify_and_update(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify ``password``; also return a replacement hash if the stored one is outdated."""
+    if not verify_password(password, password_hash):
+        return False, None
+    if needs_rehash(password_hash):
+        return True, hash_password(password)
+    return True, None
+
+
+class HashingPoolBusyError(RuntimeError):
+    """Too many password checks are already queued."""
+
+
+class HashingPool:
+    """Bounded thread pool for password hashing.
+
+    ``hashlib`` releases the GIL while it hashes, so a few dedicated threads
+    are enough. At most ``max_pending`` checks may be queued or running; more
+    are rejected with ``HashingPoolBusyError`` so a burst of logins cannot tie
+    up memory or the threads that serve other routes.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(workers, 1)
+        self.max_pending = max(max_pending, 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def verify_and_update(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        if self._in_flight >= self.max_pending:
+            raise HashingPoolBusyError("Too many sign-in attempts in progress; retry shortly")
+        self._in_flight += 1
+        try:
+            return await asyncio.wrap_future(
+                self._get_executor().submit(verify_and_update, password, password_hash)
+            )
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
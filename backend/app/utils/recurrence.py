@@ -0,0 +1,215 @@
+"""Recurring calendar events: a small subset of iCalendar RRULE.
+
+Usage::
+
+    from app.utils.recurrence import RecurrenceRule, occurrences
+
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20261215")
+    for start in occurrences(rule, event.start_datetime, window_start, window_end):
+        ...
+
+Supported parts: ``FREQ`` (DAILY, WEEKLY or MONTHLY), ``INTERVAL``, ``BYDAY``
+(weekly rules only, plain weekday codes), and at most one of ``COUNT`` (up to
+``MAX_COUNT``) or ``UNTIL``. Anything else is rejected with ``ValueError`` rather than silently
+ignored, so a rule always means the same thing here and in the ``.ics`` feed.
+
+Occurrences keep the wall-clock time of the first one: a timezone-aware start
+is stepped in ``CALENDAR_TIMEZONE``, so a 7 pm meeting stays at 7 pm across
+daylight saving changes. Naive starts are stepped as they are.
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import islice
+from zoneinfo import ZoneInfo
+
+from app.config import CALENDAR_TIMEZONE
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Upper bound on occurrences produced for one series in one window.
+MAX_OCCURRENCES = 1000
+# Largest COUNT accepted; series_end() walks the whole series to find its end.
+MAX_COUNT = 10000
+
+_zone = ZoneInfo(CALENDAR_TIMEZONE)
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    by_day: tuple[int, ...] = ()
+    count: int | None = None
+    until: datetime | date | None = None
+
+    @classmethod
+    def parse(cls, text: str) -> RecurrenceRule:
+        parts: dict[str, str] = {}
+        for item in text.strip().upper().removeprefix("RRULE:").split(";"):
+            name, sep, value = item.partition("=")
+            if not sep or not value:
+                raise ValueError(f"Malformed recurrence rule part: {item!r}")
+            parts[name.strip()] = value.strip()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+        try:
+            interval = int(parts.pop("INTERVAL", "1"))
+            count = int(parts["COUNT"]) if "COUNT" in parts else None
+        except ValueError:
+            raise ValueError("INTERVAL and COUNT must be integers") from None
+        parts.pop("COUNT", None)
+        if interval < 1 or (count is not None and count < 1):
+            raise ValueError("INTERVAL and COUNT must be positive")
+        if count is not None and count > MAX_COUNT:
+            raise ValueError(f"COUNT must be at most {MAX_COUNT}")
+
+        by_day: tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+            codes = parts.pop("BYDAY").split(",")
+            if any(code not in WEEKDAYS for code in codes):
+                raise ValueError(f"BYDAY days must be among {','.join(WEEKDAYS)}")
+            by_day = tuple(sorted({WEEKDAYS.index(code) for code in codes}))
+
+        until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+        if count is not None and until is not None:
+            raise ValueError("Use COUNT or UNTIL, not both")
+        if parts:
+            raise ValueError(f"Unsupported recurrence rule parts: {', '.join(sorted(parts))}")
+        return cls(freq=freq, interval=interval, by_day=by_day, count=count, until=until)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.by_day:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.by_day))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if isinstance(self.until, datetime):
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%SZ')}")
+        elif self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%d')}")
+        return ";".join(parts)
+
+
+def _parse_until(value: str) -> datetime | date:
+    try:
+        if "T" in value:
+            return datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S").replace(
+                tzinfo=timezone.utc
+            )
+        return datetime.strptime(value, "%Y%m%d").date()
+    except ValueError:
+        raise ValueError("UNTIL must look like 20261215 or 20261215T235959Z") from None
+
+
+def normalize(text: str | None) -> str | None:
+    """Validate a rule and return its canonical text (``None``/blank stays ``None``)."""
+    if text is None or not text.strip():
+        return None
+    return str(RecurrenceRule.parse(text))
+
+
+def _add_months(day: date, months: int) -> date | None:
+    """``day`` moved by ``months``, or None when that month has no such day."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    if day.day > calendar.monthrange(year, month)[1]:
+        return None
+    return day.replace(year=year, month=month)
+
+
+def _local_starts(rule: RecurrenceRule, first: datetime) -> Iterator[datetime]:
+    """Naive wall-clock occurrence starts, from ``first`` on, without end checks."""
+    clock = first.time()
+    if rule.freq == "DAILY":
+        step = timedelta(days=rule.interval)
+        current = first
+        while True:
+            yield current
+            current += step
+    elif rule.freq == "WEEKLY":
+        days = rule.by_day or (first.weekday(),)
+        week = first.date() - timedelta(days=first.weekday())
+        while True:
+            for weekday in days:
+                start = datetime.combine(week + timedelta(days=weekday), clock)
+                if start >= first:
+                    yield start
+            week += timedelta(weeks=rule.interval)
+    else:
+        months = 0
+        while True:
+            day = _add_months(first.date(), months)
+            if day is not None:
+                yield datetime.combine(day, clock)
+            months += rule.interval
+
+
+def _to_local(value: datetime) -> datetime:
+    return value.astimezone(_zone).replace(tzinfo=None) if value.tzinfo else value
+
+
+def _from_local(value: datetime, aware: bool) -> datetime:
+    return value.replace(tzinfo=_zone) if aware else value
+
+
+def _until_local(rule: RecurrenceRule) -> datetime | None:
+    if rule.until is None:
+        return None
+    if isinstance(rule.until, datetime):
+        return _to_local(rule.until)
+    return datetime.combine(rule.until, time.max)
+
+
+def occurrences(
+    rule: RecurrenceRule,
+    dtstart: datetime,
+    window_start: datetime | None = None,
+    window_end: datetime | None = None,
+) -> Iterator[datetime]:
+    """Occurrence starts with ``window_start <= start < window_end`` (both optional).
+
+    At most ``MAX_OCCURRENCES`` are produced, which also ends an open-ended
+    rule queried without ``window_end``.
+    """
+    aware = dtstart.tzinfo is not None
+    local_start = _to_local(dtstart)
+    local_from = _to_local(window_start) if window_start is not None else None
+    local_to = _to_local(window_end) if window_end is not None else None
+    until = _until_local(rule)
+
+    yielded = 0
+    for index, local in enumerate(_local_starts(rule, local_start)):
+        if yielded >= MAX_OCCURRENCES or (rule.count is not None and index >= rule.count):
+            return
+        if (until is not None and local > until) or (local_to is not None and local >= local_to):
+            return
+        if local_from is None or local >= local_from:
+            yielded += 1
+            yield _from_local(local, aware)
+
+
+def series_end(rule: RecurrenceRule, dtstart: datetime) -> datetime | None:
+    """Latest start any occurrence can have, or None for a series with no end.
+
+    Stored alongside the event so a date-range query can skip finished series.
+    """
+    if rule.until is not None:
+        return _from_local(_until_local(rule), dtstart.tzinfo is not None)
+    if rule.count is None:
+        return None
+    # Not occurrences(): its MAX_OCCURRENCES cap would cut long series short.
+    (last,) = deque(islice(_local_starts(rule, _to_local(dtstart)), rule.count), maxlen=1)
+    return _from_local(last, dtstart.tzinfo is not None)
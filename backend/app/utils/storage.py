@@ -0,0 +1,354 @@
+"""Where uploaded files live: local disk, an S3-compatible bucket, or memory.
+
+Usage::
+
+    from app.utils.storage import get_storage
+
+    storage = get_storage()
+    storage.write("3f/3fa9...e1.jpg", data, "image/jpeg")
+    obj = storage.stat("3f/3fa9...e1.jpg")    # StoredObject, or None if missing
+    url = storage.url("3f/3fa9...e1.jpg")     # direct/presigned URL, or None
+
+The backend is chosen by ``UPLOAD_STORAGE``:
+
+- ``local`` (default): files under ``UPLOAD_DIR``, served by the API or by
+  nginx via ``X-Accel-Redirect``.
+- ``s3``: objects in ``S3_BUCKET`` on AWS or any S3-compatible service (MinIO,
+  R2, ...); requires ``boto3``. ``/api/uploads`` redirects to
+  ``S3_PUBLIC_BASE_URL`` or a presigned URL, so API replicas share uploads
+  and never stream file bytes themselves.
+- ``memory``: a process-local dict, for tests and throwaway dev servers.
+
+Keys are the ``/``-separated relative paths produced by
+``app.utils.upload_storage``. Every method blocks, so call them from a worker
+thread in async code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Any
+
+from app.config import (
+    S3_ACCESS_KEY_ID,
+    S3_BUCKET,
+    S3_ENDPOINT_URL,
+    S3_PREFIX,
+    S3_PRESIGN_SECONDS,
+    S3_PUBLIC_BASE_URL,
+    S3_REGION,
+    S3_SECRET_ACCESS_KEY,
+    UPLOAD_DIR,
+    UPLOAD_STORAGE,
+)
+from app.utils.file_serving import IMMUTABLE, REVALIDATE, file_etag
+from app.utils.upload_storage import is_content_addressed, write_atomic
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    key: str
+    size: int
+    mtime: float
+    etag: str
+
+
+class Storage(ABC):
+    #: Directory ``save_upload`` spools request bodies into before ``write_file``.
+    #: Local storage uses its own root so the final move is a rename; ``None``
+    #: means the system temp directory.
+    staging_dir: Path | None = None
+
+    @abstractmethod
+    def stat(self, key: str) -> StoredObject | None: ...
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """Return the object's bytes; raises ``FileNotFoundError`` if missing."""
+
+    @abstractmethod
+    def write(self, key: str, data: bytes, content_type: str | None = None) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def iter_objects(self) -> Iterator[StoredObject]:
+        """Every stored object, skipping hidden (``.``-prefixed) paths."""
+
+    def write_file(self, key: str, source: Path, content_type: str | None = None) -> None:
+        """Store the file at ``source`` under ``key``. ``source`` is consumed."""
+        self.write(key, source.read_bytes(), content_type)
+        source.unlink()
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    def local_path(self, key: str) -> Path | None:
+        """Filesystem path for ``key`` if this backend keeps files on local disk."""
+        return None
+
+    def url(self, key: str) -> str | None:
+        """URL clients can fetch ``key`` from directly, bypassing the API."""
+        return None
+
+
+def _content_type(key: str, content_type: str | None) -> str:
+    return content_type or guess_type(key)[0] or "application/octet-stream"
+
+
+def _is_hidden(key: str) -> bool:
+    return any(part.startswith(".") for part in key.split("/"))
+
+
+class LocalStorage(Storage):
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.staging_dir = self.root
+
+    def local_path(self, key: str) -> Path:
+        return self.root / key
+
+    def stat(self, key: str) -> StoredObject | None:
+        try:
+            stat_result = os.stat(self.root / key)
+        except (OSError, ValueError):
+            return None
+        return StoredObject(key, stat_result.st_size, stat_result.st_mtime, file_etag(stat_result))
+
+    def read(self, key: str) -> bytes:
+        return (self.root / key).read_bytes()
+
+    def write(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        write_atomic(self.root, key, data)
+
+    def write_file(self, key: str, source: Path, content_type: str | None = None) -> None:
+        destination = self.root / key
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(source, destination)
+            return
+        except OSError:
+            pass  # different filesystem; copy into place instead
+        fd, tmp_name = tempfile.mkstemp(dir=destination.parent, prefix=".upload-", suffix=".part")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            os.replace(tmp_name, destination)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        source.unlink()
+
+    def delete(self, key: str) -> None:
+        (self.root / key).unlink(missing_ok=True)
+
+    def iter_objects(self) -> Iterator[StoredObject]:
+        if not self.root.is_dir():
+            return
+        for path in self.root.rglob("*"):
+            key = path.relative_to(self.root).as_posix()
+            if _is_hidden(key) or not path.is_file():
+                continue
+            obj = self.stat(key)
+            if obj is not None:
+                yield obj
+
+
+class MemoryStorage(Storage):
+    def __init__(self) -> None:
+        self._objects: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def stat(self, key: str) -> StoredObject | None:
+        with self._lock:
+            entry = self._objects.get(key)
+        if entry is None:
+            return None
+        data, mtime = entry
+        return StoredObject(key, len(data), mtime, f'"{hashlib.sha256(data).hexdigest()[:32]}"')
+
+    def read(self, key: str) -> bytes:
+        with self._lock:
+            entry = self._objects.get(key)
+        if entry is None:
+            raise FileNotFoundError(key)
+        return entry[0]
+
+    def write(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        with self._lock:
+            self._objects[key] = (bytes(data), time.time())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._objects.pop(key, None)
+
+    def iter_objects(self) -> Iterator[StoredObject]:
+        with self._lock:
+            keys = [key for key in self._objects if not _is_hidden(key)]
+        for key in keys:
+            obj = self.stat(key)
+            if obj is not None:
+                yield obj
+
+
+class S3Storage(Storage):
+    """Objects in an S3-compatible bucket.
+
+    ``client`` defaults to a boto3 S3 client built from the other arguments;
+    pass one explicitly to point at a stand-in. Objects are written with a
+    ``Cache-Control`` matching what ``/api/uploads`` would have sent, so a CDN
+    or browser fetching them directly caches them the same way.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "",
+        client: Any = None,
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        public_base_url: str = "",
+        presign_seconds: int = 3600,
+    ):
+        if not bucket:
+            raise RuntimeError("S3_BUCKET is required when UPLOAD_STORAGE=s3")
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.public_base_url = public_base_url.rstrip("/")
+        self.presign_seconds = presign_seconds
+        self._client = client
+        self._client_kwargs = {
+            "endpoint_url": endpoint_url or None,
+            "region_name": region or None,
+            "aws_access_key_id": access_key_id or None,
+            "aws_secret_access_key": secret_access_key or None,
+        }
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            try:
+                import boto3
+            except ImportError as exc:  # pragma: no cover - depends on the install
+                raise RuntimeError("UPLOAD_STORAGE=s3 requires boto3 (pip install boto3)") from exc
+            self._client = boto3.client("s3", **self._client_kwargs)
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return self.prefix + key
+
+    def _put_args(self, key: str, content_type: str | None) -> dict[str, str]:
+        return {
+            "ContentType": _content_type(key, content_type),
+            "CacheControl": IMMUTABLE if is_content_addressed(key) else REVALIDATE,
+        }
+
+    @staticmethod
+    def _is_missing(exc: Exception) -> bool:
+        error = getattr(exc, "response", {}).get("Error", {})
+        return str(error.get("Code")) in {"404", "NoSuchKey", "NotFound"}
+
+    def stat(self, key: str) -> StoredObject | None:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as exc:
+            if self._is_missing(exc):
+                return None
+            raise
+        return StoredObject(
+            key, head["ContentLength"], head["LastModified"].timestamp(), head["ETag"]
+        )
+
+    def read(self, key: str) -> bytes:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as exc:
+            if self._is_missing(exc):
+                raise FileNotFoundError(key) from exc
+            raise
+        return response["Body"].read()
+
+    def write(self, key: str, data: bytes, content_type: str | None = None) -> None:
+        self.client.put_object(
+            Bucket=self.bucket, Key=self._key(key), Body=data, **self._put_args(key, content_type)
+        )
+
+    def write_file(self, key: str, source: Path, content_type: str | None = None) -> None:
+        # upload_file streams from disk and switches to multipart for large files.
+        self.client.upload_file(
+            str(source),
+            self.bucket,
+            self._key(key),
+            ExtraArgs=self._put_args(key, content_type),
+        )
+        source.unlink()
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+    def iter_objects(self) -> Iterator[StoredObject]:
+        kwargs = {"Bucket": self.bucket, "Prefix": self.prefix}
+        while True:
+            page = self.client.list_objects_v2(**kwargs)
+            for item in page.get("Contents", []):
+                key = item["Key"].removeprefix(self.prefix)
+                if not _is_hidden(key):
+                    yield StoredObject(
+                        key, item["Size"], item["LastModified"].timestamp(), item["ETag"]
+                    )
+            if not page.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    def url(self, key: str) -> str:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{self._key(key)}"
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._key(key)},
+            ExpiresIn=self.presign_seconds,
+        )
+
+
+def build_storage(kind: str = UPLOAD_STORAGE) -> Storage:
+    if kind == "local":
+        return LocalStorage(Path(UPLOAD_DIR))
+    if kind == "memory":
+        return MemoryStorage()
+    if kind == "s3":
+        return S3Storage(
+            S3_BUCKET,
+            prefix=S3_PREFIX,
+            endpoint_url=S3_ENDPOINT_URL,
+            region=S3_REGION,
+            access_key_id=S3_ACCESS_KEY_ID,
+            secret_access_key=S3_SECRET_ACCESS_KEY,
+            public_base_url=S3_PUBLIC_BASE_URL,
+            presign_seconds=S3_PRESIGN_SECONDS,
+        )
+    raise RuntimeError(f"Unknown UPLOAD_STORAGE: {kind!r} (expected local, s3 or memory)")
+
+
+_storage: Storage | None = None
+
+
+def get_storage() -> Storage:
+    """FastAPI dependency returning the process-wide upload storage."""
+    global _storage
+    if _storage is None:
+        _storage = build_storage()
+    return _storage
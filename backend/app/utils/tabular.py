@@ -0,0 +1,100 @@
+"""Streaming row readers for spreadsheet uploads (CSV and XLSX).
+
+Usage::
+
+    from app.utils.tabular import iter_upload_rows
+
+    for line, row in iter_upload_rows(file):
+        ...
+
+Rows are yielded one at a time straight from the uploaded file handle, so an
+import never needs the whole body in memory as a single ``bytes`` object.
+Header names are normalized to ``snake_case`` and every cell is returned as a
+stripped string (empty cells become ``""``).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import re
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+from fastapi import HTTPException, UploadFile
+
+_XLSX_MAGIC = b"PK\x03\x04"
+
+
+def normalize_header(value: Any) -> str:
+    """Turn a spreadsheet header such as ``"Parent Category"`` into ``parent_category``."""
+    text = "" if value is None else str(value)
+    return re.sub(r"[^a-z0-9]+", "_", text.strip().lower()).strip("_")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[tuple[int, dict[str, str]]]:
+    """Yield ``(line_number, row)`` pairs from a UTF-8 CSV stream."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = [normalize_header(h) for h in header]
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield reader.line_num, {k: _cell(v) for k, v in zip(keys, row) if k}
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail="CSV file must be UTF-8 encoded") from exc
+    finally:
+        # Leave the underlying upload stream open; FastAPI closes it.
+        text.detach()
+
+
+def iter_xlsx_rows(stream: BinaryIO) -> Iterator[tuple[int, dict[str, str]]]:
+    """Yield ``(line_number, row)`` pairs from the first sheet of an XLSX workbook."""
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+    except Exception as exc:  # openpyxl raises a mix of zipfile/KeyError/ValueError
+        raise HTTPException(status_code=400, detail="Unsupported file type") from exc
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        keys = [normalize_header(h) for h in header]
+        for line, row in enumerate(rows, start=2):
+            cells = [_cell(v) for v in row]
+            if not any(cells):
+                continue
+            yield line, {k: v for k, v in zip(keys, cells) if k}
+    finally:
+        workbook.close()
+
+
+def iter_upload_rows(file: UploadFile) -> Iterator[tuple[int, dict[str, str]]]:
+    """Dispatch to the CSV or XLSX reader based on the file's leading bytes."""
+    stream = file.file
+    stream.seek(0)
+    magic = stream.read(len(_XLSX_MAGIC))
+    stream.seek(0)
+
+    if magic == _XLSX_MAGIC:
+        return iter_xlsx_rows(stream)
+
+    filename = (file.filename or "").lower()
+    if filename.endswith((".xlsx", ".xls")):
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    return iter_csv_rows(stream)
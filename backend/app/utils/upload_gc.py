@@ -0,0 +1,92 @@
+"""Find (and optionally delete) uploaded files nothing in the database points at.
+
+Usage::
+
+    from app.utils.upload_gc import collect_garbage
+
+    report = collect_garbage(db, get_storage(), UPLOAD_BASE_URL, delete=False)
+
+A file is kept if its upload group (see ``app.utils.upload_storage``) is
+mentioned anywhere the site can link to it:
+
+- any ``headshot_url``, ``image_url``, ``photo_url`` or ``full_text_pdf_url``
+  column, and
+- any ``Text`` column (news bodies, static pages, ...), since rich-text editors
+  embed upload URLs inline.
+
+Keeping by group means a referenced standard image also keeps its thumbnail,
+responsive variants and manifest. Files younger than ``min_age`` are never
+touched, so an image uploaded but not yet saved on a record survives. Hidden
+paths (temp files, the derivative cache) are ignored. Works with any storage
+backend (see ``app.utils.storage``).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import Text, select
+from sqlalchemy.orm import Session
+
+from app.models.base import Base
+from app.utils.storage import Storage
+from app.utils.upload_storage import upload_group
+
+REFERENCE_COLUMNS = ("headshot_url", "image_url", "photo_url", "full_text_pdf_url")
+DEFAULT_MIN_AGE_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class GcReport:
+    scanned: int = 0
+    referenced_groups: int = 0
+    orphans: list[str] = field(default_factory=list)
+    orphan_bytes: int = 0
+    deleted: bool = False
+
+
+def _url_pattern(base_url: str) -> re.Pattern[str]:
+    return re.compile(re.escape(base_url.rstrip("/")) + r"/([^\s\"'?#<>()]+)")
+
+
+def referenced_groups(db: Session, base_url: str) -> set[str]:
+    """Upload groups referenced by URL columns or embedded in rich text."""
+    pattern = _url_pattern(base_url)
+    groups: set[str] = set()
+
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.name not in REFERENCE_COLUMNS and not isinstance(column.type, Text):
+                continue
+            for value in db.scalars(select(column).where(column.is_not(None)).distinct()):
+                # Tolerate stray whitespace around stored URLs.
+                for relpath in pattern.findall(str(value).strip()):
+                    groups.add(upload_group(relpath))
+    return groups
+
+
+def collect_garbage(
+    db: Session,
+    storage: Storage,
+    base_url: str,
+    *,
+    delete: bool = False,
+    min_age: float = DEFAULT_MIN_AGE_SECONDS,
+    now: float | None = None,
+) -> GcReport:
+    """Report unreferenced uploads older than ``min_age``; remove them if ``delete``."""
+    groups = referenced_groups(db, base_url)
+    cutoff = (time.time() if now is None else now) - min_age
+    report = GcReport(referenced_groups=len(groups), deleted=delete)
+
+    for obj in storage.iter_objects():
+        report.scanned += 1
+        if upload_group(obj.key) in groups or obj.mtime > cutoff:
+            continue
+        report.orphans.append(obj.key)
+        report.orphan_bytes += obj.size
+        if delete:
+            storage.delete(obj.key)
+    return report
@@ -0,0 +1,79 @@
+"""Content-addressed naming for uploaded files.
+
+Usage::
+
+    from app.utils.upload_storage import content_key, shard_path
+
+    key = content_key(data)                        # SHA-256 hex of the upload
+    relpath = shard_path(key, ".jpg")              # "3f/3fa9...e1.jpg"
+    storage.write(relpath, data)                   # see app.utils.storage
+
+Uploads are named by the SHA-256 of the bytes the admin sent, sharded into
+256 subdirectories by the first two hex digits, so a re-upload of the same
+file maps to the same name and can be answered without storing another copy.
+Files derived from one upload share its key as a prefix
+(``<key>_thumb.jpg``, ``<key>_640w.webp``, ``<key>.json``); ``upload_group``
+recovers that key, which is what the garbage collector reasons about.
+
+Names beginning with ``.`` are reserved for internal use (temp files, the
+derivative cache) and are never served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path, PurePosixPath
+
+_CONTENT_ADDRESSED = re.compile(r"([0-9a-f]{2})/\1[0-9a-f]{62}[._]")
+
+
+def content_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def shard_path(key: str, suffix: str) -> str:
+    """Relative, ``/``-separated path for ``key`` plus ``suffix`` (e.g. ``"_thumb.jpg"``)."""
+    return f"{key[:2]}/{key}{suffix}"
+
+
+def upload_group(relpath: str) -> str:
+    """The upload a stored file belongs to: its name up to the first ``_`` or ``.``."""
+    name = PurePosixPath(relpath).name
+    return name.split(".", 1)[0].split("_", 1)[0]
+
+
+def write_atomic(root: Path, relpath: str, data: bytes) -> Path:
+    """Write ``data`` to ``root / relpath`` via a temp file and rename."""
+    destination = root / relpath
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=destination.parent, prefix=".upload-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def is_content_addressed(relpath: str) -> bool:
+    """True for sharded ``ab/<sha256>...`` names, whose bytes never change."""
+    return _CONTENT_ADDRESSED.match(relpath) is not None
+
+
+def servable_key(relpath: str) -> str | None:
+    """Normalise a request path to a storage key, or ``None`` if it may not be served.
+
+    Purely lexical: rejects absolute paths and any hidden (``.``-prefixed)
+    segment, which covers ``..``.
+    """
+    path = PurePosixPath(relpath)
+    if path.is_absolute() or not path.parts:
+        return None
+    if any(part.startswith(".") or "\\" in part for part in path.parts):
+        return None
+    return path.as_posix()
@@ -0,0 +1,126 @@
+"""Chunked reads of uploaded files with early size and type checks.
+
+Usage::
+
+    from app.utils.upload_stream import read_upload, save_upload
+
+    kind, content = await read_upload(file, max_bytes=limit, allowed={"jpeg", "png"})
+    relpath = await save_upload(file, storage, "pdf", max_bytes=limit, allowed={"pdf"})
+
+Both helpers look at the first chunk to identify the file from its magic bytes
+and stop reading as soon as the size limit is passed, so an oversized or
+mislabelled upload never gets fully read into memory. ``save_upload`` streams
+to a temporary file in the storage backend's staging directory and then hands
+it to the backend under its content-addressed key (see
+``app.utils.upload_storage``), so readers never see a partially written file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import anyio
+from fastapi import HTTPException, UploadFile
+
+from app.utils.storage import Storage
+from app.utils.upload_storage import shard_path
+
+CHUNK_SIZE = 64 * 1024
+
+_SIGNATURES: tuple[tuple[str, bytes], ...] = (
+    ("jpeg", b"\xff\xd8\xff"),
+    ("png", b"\x89PNG\r\n\x1a\n"),
+    ("pdf", b"%PDF-"),
+)
+
+
+def sniff_type(head: bytes) -> str | None:
+    """Identify a file from its leading bytes; ``None`` if not a known type."""
+    for kind, signature in _SIGNATURES:
+        if head.startswith(signature):
+            return kind
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _reserve_temp_file(dest_dir: Path | None) -> str:
+    if dest_dir is not None:
+        dest_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest_dir, prefix=".upload-", suffix=".part")
+    os.close(fd)
+    return tmp_name
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"File too large. Max size is {max_bytes // (1024 * 1024)}MB"
+    )
+
+
+async def _first_chunk(file: UploadFile, max_bytes: int, allowed: set[str]) -> tuple[str, bytes]:
+    # The multipart parser records the part size, so a declared-too-large
+    # upload is rejected before any of it is read.
+    if file.size is not None and file.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    await file.seek(0)
+    head = await file.read(CHUNK_SIZE)
+    kind = sniff_type(head)
+    if kind not in allowed:
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    if len(head) > max_bytes:
+        raise _too_large(max_bytes)
+    return kind, head
+
+
+async def read_upload(file: UploadFile, *, max_bytes: int, allowed: set[str]) -> tuple[str, bytes]:
+    """Read an upload into memory in chunks, capped at ``max_bytes``."""
+    kind, head = await _first_chunk(file, max_bytes, allowed)
+    chunks = [head]
+    total = len(head)
+    while chunk := await file.read(CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise _too_large(max_bytes)
+        chunks.append(chunk)
+    return kind, b"".join(chunks)
+
+
+async def save_upload(
+    file: UploadFile, storage: Storage, extension: str, *, max_bytes: int, allowed: set[str]
+) -> str:
+    """Stream an upload into ``storage`` under its content-addressed key.
+
+    The body goes to a temp file while its SHA-256 is computed, then is stored
+    as ``shard_path(sha, "." + extension)``. If that key already exists the
+    temp file is discarded. Returns the key.
+    """
+    _, head = await _first_chunk(file, max_bytes, allowed)
+
+    tmp_name = await anyio.to_thread.run_sync(_reserve_temp_file, storage.staging_dir)
+    tmp_path = anyio.Path(tmp_name)
+    try:
+        hasher = hashlib.sha256(head)
+        total = len(head)
+        async with await anyio.open_file(tmp_name, "wb") as out:
+            await out.write(head)
+            while chunk := await file.read(CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise _too_large(max_bytes)
+                hasher.update(chunk)
+                await out.write(chunk)
+
+        relpath = shard_path(hasher.hexdigest(), f".{extension}")
+        if await anyio.to_thread.run_sync(storage.exists, relpath):
+            await tmp_path.unlink()
+        else:
+            await anyio.to_thread.run_sync(storage.write_file, relpath, Path(tmp_name))
+    except BaseException:
+        await tmp_path.unlink(missing_ok=True)
+        raise
+    return relpath
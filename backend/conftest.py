@@ -11,8 +11,18 @@ import pytest
 from fastapi.testclient import TestClient
 
 os.environ.setdefault("JWT_SECRET", "test-only-jwt-secret")
+os.environ.setdefault("EMAIL_WORKER_ENABLED", "false")
 
 from app.main import app
+from app.utils.cache import clear_all as clear_all_caches
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Start every test with empty in-process caches (ids are reused across test DBs)."""
+    clear_all_caches()
+    yield
+    clear_all_caches()
 
 
 @pytest.fixture()
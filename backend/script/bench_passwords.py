@@ -0,0 +1,70 @@
+"""Measure how long one password hash takes per hasher configuration.
+
+Usage:
+    python -m script.bench_passwords
+    python -m script.bench_passwords --rounds 10 --pbkdf2 600000 1200000 --scrypt 32768:8:1
+    python -m script.bench_passwords --threads 4      # throughput with parallel logins
+
+Run it on the production host class when choosing PASSWORD_HASHER and its
+parameters: a login should spend roughly 100-500 ms hashing. The configuration
+currently set in the environment is marked with "*".
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.passwords import Hasher, PBKDF2Hasher, ScryptHasher, get_hasher
+
+DEFAULT_PBKDF2 = [310_000, 600_000, 1_200_000]
+DEFAULT_SCRYPT = ["16384:8:1", "32768:8:1", "65536:8:1"]
+PASSWORD = "Benchmark-Password-123!"
+
+
+def _scrypt(spec: str) -> ScryptHasher:
+    n, r, p = (int(part) for part in spec.split(":"))
+    return ScryptHasher(n, r, p)
+
+
+def _label(hasher: Hasher) -> str:
+    if isinstance(hasher, ScryptHasher):
+        memory_mb = 128 * hasher.n * hasher.r / 1024**2
+        return f"scrypt n={hasher.n} r={hasher.r} p={hasher.p} (~{memory_mb:.0f} MiB)"
+    return f"pbkdf2_sha256 iterations={hasher.iterations}"
+
+
+def _time_hash(hasher: Hasher) -> float:
+    started = time.perf_counter()
+    hasher.hash(PASSWORD)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Hashes per configuration")
+    parser.add_argument("--pbkdf2", type=int, nargs="*", default=DEFAULT_PBKDF2)
+    parser.add_argument("--scrypt", nargs="*", default=DEFAULT_SCRYPT, help="n:r:p")
+    parser.add_argument("--threads", type=int, default=1, help="Hash on this many threads at once")
+    args = parser.parse_args()
+
+    hashers: list[Hasher] = [PBKDF2Hasher(i) for i in args.pbkdf2]
+    hashers += [_scrypt(spec) for spec in args.scrypt]
+    current = _label(get_hasher())
+
+    print(f"{'configuration':<48} {'median ms':>10} {'max ms':>9} {'hashes/s':>9}")
+    for hasher in hashers:
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            started = time.perf_counter()
+            timings = list(executor.map(_time_hash, [hasher] * args.rounds))
+            elapsed = time.perf_counter() - started
+        label = _label(hasher)
+        marker = "*" if label == current else " "
+        print(
+            f"{marker}{label:<47} {statistics.median(timings) * 1000:>10.1f}"
+            f" {max(timings) * 1000:>9.1f} {args.rounds / elapsed:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Remove uploaded files that are no longer referenced by any record.
+
+Usage:
+    python -m script.gc_uploads             # dry run: list what would be removed
+    python -m script.gc_uploads --delete    # actually remove the files
+    python -m script.gc_uploads --delete --min-age-hours 72
+
+Uploads are content-addressed, so the same file may back several records;
+a file is only an orphan when no headshot_url / image_url / photo_url /
+full_text_pdf_url column and no rich-text body mentions it. See
+app/utils/upload_gc.py for the exact rules.
+"""
+
+import argparse
+
+from app.config import UPLOAD_BASE_URL
+from app.database import SessionLocal
+from app.models import Admin  # noqa: F401 - importing app.models registers all tables
+from app.utils.storage import build_storage
+from app.utils.upload_gc import DEFAULT_MIN_AGE_SECONDS, collect_garbage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delete", action="store_true", help="Delete orphans (default: dry run)")
+    parser.add_argument(
+        "--min-age-hours",
+        type=float,
+        default=DEFAULT_MIN_AGE_SECONDS / 3600,
+        help="Never touch files newer than this",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = collect_garbage(
+            db,
+            build_storage(),
+            UPLOAD_BASE_URL,
+            delete=args.delete,
+            min_age=args.min_age_hours * 3600,
+        )
+    finally:
+        db.close()
+
+    for key in report.orphans:
+        print(f"{'Deleted' if report.deleted else 'Orphan'}: {key}")
+    print(
+        f"Scanned {report.scanned} files, {report.referenced_groups} referenced uploads, "
+        f"{len(report.orphans)} orphans ({report.orphan_bytes / 1024 / 1024:.1f} MiB)"
+        + ("" if report.deleted else " — dry run, pass --delete to remove")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,12 @@ Usage:
     python -m script.init_db
 
 This script is intended for first deploys and safe redeploys. It creates any
-missing tables and can optionally bootstrap the first admin account from
-environment variables. It never drops tables and never clears application data.
+missing tables, can optionally bootstrap the first admin account from
+environment variables, and creates missing default static pages (credited to
+the first admin, or to no one if there is none yet). It never drops tables and
+never clears application data.
+Changes to tables that already exist are schema migrations; run
+``python -m script.migrate`` first.
 """
 
 from __future__ import annotations
@@ -13,9 +17,8 @@ from __future__ import annotations
 import os
 import sys
 
-from sqlalchemy import inspect, or_, text
+from sqlalchemy import or_
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.schema import CreateColumn
 
 from app.database import (
     Base,
@@ -33,40 +36,6 @@ def create_missing_tables() -> None:
     print("Missing tables created")
 
 
-def sync_missing_columns() -> None:
-    """Add columns present on the ORM models but missing from deployed tables.
-
-    create_all() only creates tables that don't exist yet; it never alters a
-    table that's already there. When a column is added to a model whose table
-    was already deployed, the deployed table silently falls out of sync and
-    any insert/update touching that column fails at the database level. This
-    brings existing tables' columns back in line with the models.
-    """
-    inspector = inspect(engine)
-    existing_tables = set(inspector.get_table_names())
-
-    with engine.begin() as conn:
-        for table in Base.metadata.sorted_tables:
-            if table.name not in existing_tables:
-                continue  # just created by create_missing_tables()
-
-            existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
-            for column in table.columns:
-                if column.name in existing_columns:
-                    continue
-
-                if not column.nullable and column.default is None and column.server_default is None:
-                    print(
-                        f"Skipping {table.name}.{column.name}: NOT NULL with no default, "
-                        "cannot be added automatically to a table with existing rows"
-                    )
-                    continue
-
-                column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
-                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}"))
-                print(f"Added missing column {table.name}.{column.name}")
-
-
 def bootstrap_initial_admin() -> None:
     email = os.getenv("INITIAL_ADMIN_EMAIL")
     onyen = os.getenv("INITIAL_ADMIN_ONYEN")
@@ -104,7 +73,6 @@ def bootstrap_initial_admin() -> None:
         existing = db.query(Admin).filter(or_(Admin.email == email, Admin.onyen == onyen)).first()
         if existing:
             print(f"Initial admin {onyen} already exists")
-            ensure_default_static_pages(db, editor=existing, commit=True)
             return
 
         admin = Admin(
@@ -116,8 +84,6 @@ def bootstrap_initial_admin() -> None:
             role=role,
         )
         db.add(admin)
-        db.flush()
-        ensure_default_static_pages(db, editor=admin, commit=False)
         db.commit()
         print(f"Initial admin {onyen} created")
     except IntegrityError as exc:
@@ -128,9 +94,19 @@ def bootstrap_initial_admin() -> None:
         db.close()
 
 
+def backfill_static_pages() -> None:
+    """Create default static pages that are missing; edited pages are left alone."""
+    db = SessionLocal()
+    try:
+        created = ensure_default_static_pages(db, commit=True)
+        print(f"Default static pages created: {created}")
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     print("Initializing deployed database")
     create_missing_tables()
-    sync_missing_columns()
     bootstrap_initial_admin()
+    backfill_static_pages()
     print("Database initialization complete")
@@ -0,0 +1,129 @@
+"""Measure public-request latency while admin image uploads are in progress.
+
+Runs a public GET endpoint in a steady loop twice: once on its own (baseline)
+and once while a batch of large headshot uploads is being processed. If image
+processing is properly kept off the event loop, the p99 of the two phases
+should be close; if it blocks the loop, the "during uploads" p99 jumps to
+roughly the time it takes to resize an image.
+
+Usage:
+    python -m script.load_test_uploads --token <admin JWT>
+    python -m script.load_test_uploads --base-url http://localhost:8000 \\
+        --token <admin JWT> --uploads 40 --concurrency 8 --path /api/senators
+
+The upload-stats endpoint is sampled at the end to report peak queue depth.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from io import BytesIO
+
+import httpx
+from PIL import Image
+
+
+def _make_headshot(width: int, height: int) -> bytes:
+    image = Image.effect_noise((width, height), 10).convert("RGB")
+    buf = BytesIO()
+    image.save(buf, format="JPEG", quality=80)
+    return buf.getvalue()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _poll_public(client: httpx.AsyncClient, path: str, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def _upload_batch(
+    client: httpx.AsyncClient, token: str, payload: bytes, uploads: int, concurrency: int
+) -> dict[int, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: dict[int, int] = {}
+
+    async def _one(i: int) -> None:
+        async with semaphore:
+            response = await client.post(
+                "/api/admin/upload",
+                files={"file": (f"headshot-{i}.jpg", payload, "image/jpeg")},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(_one(i) for i in range(uploads)))
+    return statuses
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    return (
+        f"{label:<16} n={len(samples):<5} p50={statistics.median(samples):7.1f}ms "
+        f"p99={_percentile(samples, 99):7.1f}ms max={max(samples):7.1f}ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    payload = _make_headshot(args.width, args.height)
+    print(f"Upload payload: {len(payload) / 1024:.0f} KiB ({args.width}x{args.height} JPEG)")
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+        stop = asyncio.Event()
+        poller = asyncio.create_task(_poll_public(client, args.path, stop))
+        await asyncio.sleep(args.baseline_seconds)
+        stop.set()
+        baseline = await poller
+
+        stop = asyncio.Event()
+        poller = asyncio.create_task(_poll_public(client, args.path, stop))
+        started = time.perf_counter()
+        statuses = await _upload_batch(client, args.token, payload, args.uploads, args.concurrency)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        during = await poller
+
+        stats = await client.get(
+            "/api/admin/upload/stats", headers={"Authorization": f"Bearer {args.token}"}
+        )
+
+    print(_summary("baseline", baseline))
+    print(_summary("during uploads", during))
+    print(f"Uploads: {args.uploads} in {elapsed:.1f}s, status codes {statuses}")
+    if stats.status_code == 200:
+        print(f"Pool stats: {stats.json()}")
+
+    ratio = _percentile(during, 99) / max(_percentile(baseline, 99), 1.0)
+    print(f"p99 ratio (during / baseline): {ratio:.2f}")
+    return 0 if ratio <= args.max_ratio else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True, help="Admin bearer token")
+    parser.add_argument("--path", default="/health", help="Public endpoint to poll")
+    parser.add_argument("--uploads", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--width", type=int, default=3000)
+    parser.add_argument("--height", type=int, default=4000)
+    parser.add_argument("--baseline-seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--max-ratio", type=float, default=3.0, help="Exit non-zero if p99 grows beyond this"
+    )
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Bring a deployed database's schema up to date.
+
+Usage:
+    python -m script.migrate            # create missing tables, apply pending migrations
+    python -m script.migrate --status   # list migrations without applying anything
+
+Runs before the app starts (see the Dockerfile). New tables are created from the
+models; changes to existing tables come from ``app/migrations/versions``. See
+``app.migrations`` for how to write one.
+"""
+
+import argparse
+
+from app.database import Base, engine
+from app.migrations import applied_versions, discover, migrate
+from app.models import Admin  # noqa: F401 - importing app.models registers all tables
+
+
+def print_status() -> None:
+    applied = applied_versions(engine)
+    for migration in discover():
+        state = "applied" if migration.version in applied else "pending"
+        print(f"{migration.version:04d} {migration.name:<40} {state}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--status", action="store_true", help="Only list migration status")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+        return
+
+    Base.metadata.create_all(bind=engine)
+    applied = migrate(engine)
+    print(f"Schema up to date ({len(applied)} migration(s) applied)")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,7 @@ class TestAdminModel:
             "onyen",
             "password_hash",
             "role",
+            "token_version",
             "created_at",
             "updated_at",
         }
@@ -167,6 +168,8 @@ class TestLeadershipModel:
             "headshot_url",
             "is_active",
             "session_number",
+            "display_order",
+            "version",
             "created_at",
             "updated_at",
         }
@@ -238,6 +238,7 @@ class TestLegislationActionModel:
             "description",
             "action_type",
             "display_order",
+            "version",
         }
         assert expected == set(cols.keys())
 
@@ -354,6 +355,8 @@ class TestCalendarEventModel:
             "event_type",
             "is_published",
             "created_by",
+            "recurrence_rule",
+            "recurrence_end",
         }
         assert expected == set(cols.keys())
 
@@ -642,6 +645,8 @@ class TestFinanceHearingDateModel:
             "location",
             "description",
             "is_full",
+            "capacity",
+            "booked_count",
         }
         assert expected == set(cols.keys())
 
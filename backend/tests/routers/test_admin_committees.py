@@ -146,3 +146,24 @@ def test_staff_cannot_remove_committee_member(staff_client, seeded_committees):
         f"/api/admin/committees/{m1.committee_id}/members/{m1.senator_id}"
     )
     assert response.status_code == 403
+
+
+def test_bulk_update_committees(admin_client, seeded_committees):
+    committee = seeded_committees["committees"][0]
+    listed = {c["id"]: c for c in admin_client.get("/api/admin/committees").json()}
+    version = listed[committee.id]["version"]
+
+    response = admin_client.patch(
+        "/api/admin/committees/bulk",
+        json={"items": [{"id": committee.id, "is_active": False, "version": version}]},
+    )
+    assert response.status_code == 200
+    (data,) = response.json()
+    assert data["is_active"] is False
+    assert data["version"] == version + 1
+
+    stale = admin_client.patch(
+        "/api/admin/committees/bulk",
+        json={"items": [{"id": committee.id, "is_active": True, "version": version}]},
+    )
+    assert stale.status_code == 409
@@ -178,3 +178,40 @@ def test_unauthenticated_delete_rejected(client, seeded_leadership):
     leader = seeded_leadership["records"][0]
     response = client.delete(f"/api/admin/leadership/{leader.id}")
     assert response.status_code in {401, 403}
+
+
+def test_reorder_admin_leadership_changes_public_order(admin_client, seeded_leadership):
+    current = [r for r in seeded_leadership["records"] if r.session_number == 2025]
+    items = [
+        {"id": leader.id, "display_order": position, "version": leader.version}
+        for position, leader in enumerate(reversed(current))
+    ]
+    response = admin_client.put("/api/admin/leadership/reorder", json={"items": items})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [item["id"] for item in items]
+    assert all(item["version"] == 2 for item in response.json())
+
+    public = admin_client.get("/api/leadership/?session_number=2025").json()
+    assert [item["id"] for item in public] == [item["id"] for item in items]
+
+
+def test_reorder_admin_leadership_stale_version_conflict(admin_client, seeded_leadership):
+    leader = seeded_leadership["records"][0]
+    admin_client.put(f"/api/admin/leadership/{leader.id}", json={"title": "Renamed"})
+
+    response = admin_client.put(
+        "/api/admin/leadership/reorder",
+        json={"items": [{"id": leader.id, "display_order": 3, "version": 1}]},
+    )
+    assert response.status_code == 409
+
+
+def test_bulk_update_admin_leadership(admin_client, seeded_leadership):
+    ids = [leader.id for leader in seeded_leadership["records"]]
+    response = admin_client.patch(
+        "/api/admin/leadership/bulk",
+        json={"items": [{"id": leader_id, "is_active": False} for leader_id in ids]},
+    )
+    assert response.status_code == 200
+    assert {item["id"] for item in response.json()} == set(ids)
+    assert all(item["is_current"] is False for item in response.json())
@@ -2,7 +2,7 @@ import pytest
 
 from app.dependencies.auth import get_current_user
 from app.main import app
-from app.models import Admin, Leadership, Senator
+from app.models import Admin, CommitteeMembership, District, Leadership, Senator
 
 
 @pytest.fixture
@@ -194,3 +194,185 @@ def test_unauthenticated_delete_rejected(client, seeded_committees):
     senator = seeded_committees["senators"][0]
     response = client.delete(f"/api/admin/senators/{senator.id}")
     assert response.status_code in {401, 403}
+
+
+def _senators_in_session(test_db, session_number: int) -> list[Senator]:
+    test_db.expire_all()
+    return test_db.query(Senator).filter(Senator.session_number == session_number).all()
+
+
+def test_import_roster_creates_senators_and_memberships(admin_client, test_db, seeded_committees):
+    district = seeded_committees["senators"][0].district
+    committee = seeded_committees["committees"][0]
+    response = admin_client.post(
+        "/api/admin/senators/roster",
+        json={
+            "session_number": 3001,
+            "senators": [
+                {
+                    "first_name": "Roster",
+                    "last_name": "One",
+                    "email": "roster.one@example.com",
+                    "district": str(district),
+                    "committees": [{"committee": str(committee.id), "role": "Chair"}],
+                },
+                {
+                    "first_name": "Roster",
+                    "last_name": "Two",
+                    "email": "roster.two@example.com",
+                    "district": str(district),
+                },
+            ],
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert body["memberships_created"] == 1
+    assert body["conflicts"] == []
+    assert body["deactivated"] >= 2
+
+    created = _senators_in_session(test_db, 3001)
+    assert {s.email for s in created} == {"roster.one@example.com", "roster.two@example.com"}
+    assert all(s.is_active for s in created)
+    assert not any(
+        s.is_active for s in test_db.query(Senator).filter(Senator.session_number < 3001)
+    )
+
+    chair = next(s for s in created if s.last_name == "One")
+    membership = (
+        test_db.query(CommitteeMembership).filter(CommitteeMembership.senator_id == chair.id).one()
+    )
+    assert membership.committee_id == committee.id
+    assert membership.role == "Chair"
+
+
+def test_import_roster_reports_conflicts(admin_client, test_db, seeded_committees):
+    district = seeded_committees["senators"][0].district
+    base = {"first_name": "Conflict", "last_name": "Case", "district": str(district)}
+    response = admin_client.post(
+        "/api/admin/senators/roster",
+        json={
+            "session_number": 3002,
+            "deactivate_previous": False,
+            "senators": [
+                {**base, "email": "dup@example.com"},
+                {**base, "email": "DUP@example.com"},
+                {**base, "email": "nodistrict@example.com", "district": "Nowhere"},
+                {**base, "email": "nocommittee@example.com", "committees": [{"committee": "Nope"}]},
+            ],
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert body["deactivated"] == 0
+    reasons = {(c["line"], c["reason"]) for c in body["conflicts"]}
+    assert (2, "Duplicate of line 1") in reasons
+    assert (3, "District 'Nowhere' not found") in reasons
+    assert (4, "Committee 'Nope' not found; membership skipped") in reasons
+
+    again = admin_client.post(
+        "/api/admin/senators/roster",
+        json={"session_number": 3002, "senators": [{**base, "email": "dup@example.com"}]},
+    ).json()
+    assert again["created"] == 0
+    assert again["conflicts"][0]["reason"] == "Senator already exists in session 3002"
+
+
+def test_import_roster_dry_run_does_not_write(admin_client, test_db, seeded_committees):
+    district = seeded_committees["senators"][0].district
+    response = admin_client.post(
+        "/api/admin/senators/roster?dry_run=true",
+        json={
+            "session_number": 3003,
+            "senators": [
+                {
+                    "first_name": "Dry",
+                    "last_name": "Run",
+                    "email": "dry.run@example.com",
+                    "district": str(district),
+                }
+            ],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert _senators_in_session(test_db, 3003) == []
+
+
+def test_import_roster_csv_upload(admin_client, test_db, seeded_committees):
+    district = test_db.get(District, seeded_committees["senators"][0].district)
+    committee = seeded_committees["committees"][0]
+    content = (
+        "First Name,Last Name,Email,District,Committees\n"
+        f"Csv,One,csv.one@example.com,{district.id},{committee.id}:Vice Chair\n"
+        "Csv,Two,not-an-email,1,\n"
+    ).encode()
+    response = admin_client.post(
+        "/api/admin/senators/roster/upload?session_number=3004&deactivate_previous=false",
+        files={"file": ("roster.csv", content, "text/csv")},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 1
+    assert body["memberships_created"] == 1
+    assert body["conflicts"] == [{"line": 3, "email": "not-an-email", "reason": "Invalid email"}]
+
+
+def test_staff_cannot_import_roster(staff_client):
+    response = staff_client.post(
+        "/api/admin/senators/roster", json={"session_number": 3005, "senators": []}
+    )
+    assert response.status_code == 403
+
+
+def test_clone_session_copies_seats_and_memberships(admin_client, test_db, seeded_committees):
+    district = seeded_committees["senators"][0].district
+    committee = seeded_committees["committees"][0]
+    admin_client.post(
+        "/api/admin/senators/roster",
+        json={
+            "session_number": 3010,
+            "senators": [
+                {
+                    "first_name": "Clone",
+                    "last_name": "Source",
+                    "email": "clone.source@example.com",
+                    "district": str(district),
+                    "committees": [{"committee": str(committee.id), "role": "Member"}],
+                }
+            ],
+        },
+    )
+
+    response = admin_client.post(
+        "/api/admin/senators/sessions/clone",
+        json={"source_session": 3010, "target_session": 3011},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["senators_cloned"] == 1
+    assert body["memberships_cloned"] == 1
+    assert body["deactivated"] == 1
+
+    (cloned,) = _senators_in_session(test_db, 3011)
+    assert cloned.email == "clone.source@example.com"
+    assert cloned.district == district
+    assert cloned.is_active is True
+    assert [m.committee_id for m in cloned.committee_memberships] == [committee.id]
+    assert not any(s.is_active for s in _senators_in_session(test_db, 3010))
+
+    repeat = admin_client.post(
+        "/api/admin/senators/sessions/clone",
+        json={"source_session": 3010, "target_session": 3011},
+    )
+    assert repeat.status_code == 404
+
+
+def test_clone_session_rejects_same_session(admin_client):
+    response = admin_client.post(
+        "/api/admin/senators/sessions/clone",
+        json={"source_session": 3010, "target_session": 3010},
+    )
+    assert response.status_code == 400
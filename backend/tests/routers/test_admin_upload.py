@@ -1,3 +1,4 @@
+import hashlib
 from io import BytesIO
 
 import pytest
@@ -6,6 +7,7 @@ from PIL import Image
 from app.dependencies.auth import get_current_user
 from app.main import app
 from app.models import Admin
+from app.utils.storage import LocalStorage, get_storage
 
 
 @pytest.fixture
@@ -20,6 +22,14 @@ def admin_client(client, test_db, seeded_admins):
     app.dependency_overrides.pop(get_current_user, None)
 
 
+@pytest.fixture(autouse=True)
+def storage(tmp_path):
+    local = LocalStorage(tmp_path)
+    app.dependency_overrides[get_storage] = lambda: local
+    yield local
+    app.dependency_overrides.pop(get_storage, None)
+
+
 def _make_png_bytes(width: int = 1000, height: int = 600) -> bytes:
     image = Image.new("RGB", (width, height), color="red")
     buf = BytesIO()
@@ -28,12 +38,9 @@ def _make_png_bytes(width: int = 1000, height: int = 600) -> bytes:
 
 
 def test_valid_upload(admin_client, tmp_path, monkeypatch):
-    from app.routers import uploads as uploads_router
     from app.routers.admin import upload as upload_router
 
-    monkeypatch.setattr(upload_router, "UPLOAD_DIR", str(tmp_path))
     monkeypatch.setattr(upload_router, "UPLOAD_BASE_URL", "/api/uploads")
-    monkeypatch.setattr(uploads_router, "UPLOAD_DIR", str(tmp_path))
 
     payload = _make_png_bytes()
     response = admin_client.post(
@@ -46,7 +53,7 @@ def test_valid_upload(admin_client, tmp_path, monkeypatch):
     assert "url" in body
     assert body["url"].startswith("/api/uploads/")
 
-    filename = body["url"].split("/")[-1]
+    filename = body["url"].removeprefix("/api/uploads/")
     thumb_filename = f"{filename.rsplit('.', 1)[0]}_thumb.{filename.rsplit('.', 1)[1]}"
     assert (tmp_path / filename).exists()
     assert (tmp_path / thumb_filename).exists()
@@ -61,11 +68,7 @@ def test_valid_upload(admin_client, tmp_path, monkeypatch):
     assert get_response.status_code == 200
 
 
-def test_invalid_file_type(admin_client, tmp_path, monkeypatch):
-    from app.routers.admin import upload as upload_router
-
-    monkeypatch.setattr(upload_router, "UPLOAD_DIR", str(tmp_path))
-
+def test_invalid_file_type(admin_client):
     response = admin_client.post(
         "/api/admin/upload",
         files={"file": ("notes.txt", b"this-is-not-an-image", "text/plain")},
@@ -75,12 +78,9 @@ def test_invalid_file_type(admin_client, tmp_path, monkeypatch):
     assert response.json()["detail"] == "Unsupported file type"
 
 
-def test_decompression_bomb_rejected_cleanly(admin_client, tmp_path, monkeypatch):
+def test_decompression_bomb_rejected_cleanly(admin_client, monkeypatch):
     from PIL import Image as PILImage
 
-    from app.routers.admin import upload as upload_router
-
-    monkeypatch.setattr(upload_router, "UPLOAD_DIR", str(tmp_path))
     monkeypatch.setattr(PILImage, "MAX_IMAGE_PIXELS", 1000)
 
     payload = _make_png_bytes(width=200, height=200)
@@ -93,11 +93,7 @@ def test_decompression_bomb_rejected_cleanly(admin_client, tmp_path, monkeypatch
     assert response.json()["detail"] == "Unsupported file type"
 
 
-def test_oversized_file(admin_client, tmp_path, monkeypatch):
-    from app.routers.admin import upload as upload_router
-
-    monkeypatch.setattr(upload_router, "UPLOAD_DIR", str(tmp_path))
-
+def test_oversized_file(admin_client):
     oversized = b"x" * (5 * 1024 * 1024 + 1)
     response = admin_client.post(
         "/api/admin/upload",
@@ -125,11 +121,7 @@ def test_unauthenticated_pdf_upload_rejected(client):
     assert response.status_code in {401, 403}
 
 
-def test_standard_resize_only_limits_width(admin_client, tmp_path, monkeypatch):
-    from app.routers.admin import upload as upload_router
-
-    monkeypatch.setattr(upload_router, "UPLOAD_DIR", str(tmp_path))
-
+def test_standard_resize_only_limits_width(admin_client, tmp_path):
     # Width is already under 800, so the standard image should keep original dimensions.
     payload = _make_png_bytes(width=600, height=2000)
     response = admin_client.post(
@@ -138,7 +130,279 @@ def test_standard_resize_only_limits_width(admin_client, tmp_path, monkeypatch):
     )
 
     assert response.status_code == 200
-    filename = response.json()["url"].split("/")[-1]
+    filename = response.json()["url"].removeprefix("/api/uploads/")
 
     with Image.open(tmp_path / filename) as uploaded:
         assert uploaded.size == (600, 2000)
+
+
+def _make_jpeg_bytes(width: int, height: int) -> bytes:
+    image = Image.new("RGB", (width, height), color="blue")
+    buf = BytesIO()
+    image.save(buf, format="JPEG", quality=85)
+    return buf.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_bulk_uploads(admin_client, monkeypatch):
+    # Processing is held open until the other requests have been answered, so
+    # this only passes if image work runs off the event loop. Wall-clock
+    # latency under load is measured by script/load_test_uploads.py instead.
+    import asyncio
+    import threading
+
+    import httpx
+
+    from app.routers.admin import upload as upload_router
+    from app.utils import image_processing
+    from app.utils.image_processing import ImagePool
+
+    release = threading.Event()
+    real_process_image = image_processing.process_image
+
+    def blocked_process_image(*args):
+        release.wait(timeout=10)
+        return real_process_image(*args)
+
+    pool = ImagePool(workers=0, max_pending=16)
+    monkeypatch.setattr(upload_router, "image_pool", pool)
+    monkeypatch.setattr(image_processing, "process_image", blocked_process_image)
+
+    async def all_uploads_in_pool():
+        while pool.stats()["in_flight"] < 6:
+            await asyncio.sleep(0.01)
+
+    payload = _make_jpeg_bytes(400, 300)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            uploads = asyncio.gather(
+                *(
+                    client.post(
+                        "/api/admin/upload",
+                        files={"file": (f"headshot{i}.jpg", payload, "image/jpeg")},
+                    )
+                    for i in range(6)
+                )
+            )
+            await asyncio.wait_for(all_uploads_in_pool(), timeout=5)
+
+            health = [await client.get("/health") for _ in range(5)]
+            assert not uploads.done()
+            assert pool.stats()["completed"] == 0
+
+            release.set()
+            responses = await uploads
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert all(r.status_code == 200 for r in health)
+    assert all(r.status_code == 200 for r in responses)
+    assert pool.stats()["completed"] == 6
+    assert pool.stats()["peak_in_flight"] == 6
+
+
+@pytest.mark.asyncio
+async def test_image_pool_rejects_when_queue_is_full():
+    import asyncio
+
+    from app.utils.image_processing import ImagePool, ImagePoolBusyError
+
+    pool = ImagePool(workers=0, max_pending=1)
+    payload = _make_png_bytes(width=1200, height=900)
+    results = await asyncio.gather(
+        pool.process(payload), pool.process(payload), return_exceptions=True
+    )
+
+    assert results[0].extension == "png"
+    assert isinstance(results[1], ImagePoolBusyError)
+    assert pool.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_image_pool_replaces_a_broken_executor():
+    import asyncio
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    from app.utils.image_processing import ImagePool
+
+    pool = ImagePool(workers=1, max_pending=4)
+    try:
+        # A worker that dies mid-task leaves the executor permanently broken.
+        crashed = pool._get_executor().submit(os._exit, 1)
+        with pytest.raises(BrokenProcessPool):
+            await asyncio.wrap_future(crashed)
+
+        result = await pool.process(_make_png_bytes(width=400, height=300))
+    finally:
+        pool.shutdown()
+
+    assert result.extension == "png"
+    assert pool.stats()["restarts"] == 1
+    assert pool.stats()["failed"] == 0
+
+
+def test_upload_stats(admin_client):
+    response = admin_client.get("/api/admin/upload/stats")
+    assert response.status_code == 200
+    assert {"workers", "in_flight", "queued", "rejected"} <= set(response.json())
+
+
+def test_pdf_upload_streams_to_final_path(admin_client, tmp_path):
+    payload = b"%PDF-1.4\n" + b"0" * 200_000
+    response = admin_client.post(
+        "/api/admin/upload/pdf",
+        files={"file": ("minutes.pdf", payload, "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    filename = response.json()["url"].removeprefix("/api/uploads/")
+    assert (tmp_path / filename).read_bytes() == payload
+    assert [str(p.relative_to(tmp_path)) for p in tmp_path.rglob("*") if p.is_file()] == [filename]
+
+
+def test_pdf_upload_rejects_wrong_magic_bytes(admin_client, tmp_path):
+    response = admin_client.post(
+        "/api/admin/upload/pdf",
+        files={"file": ("fake.pdf", _make_png_bytes(), "application/pdf")},
+    )
+
+    assert response.status_code == 400
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_oversized_pdf_rejected(admin_client, tmp_path):
+    oversized = b"%PDF-1.4\n" + b"0" * (5 * 1024 * 1024)
+    response = admin_client.post(
+        "/api/admin/upload/pdf",
+        files={"file": ("big.pdf", oversized, "application/pdf")},
+    )
+
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_streaming_save_aborts_at_limit_without_declared_size(tmp_path):
+    from fastapi import HTTPException, UploadFile
+
+    from app.utils.upload_stream import CHUNK_SIZE, save_upload
+
+    body = BytesIO(b"%PDF-1.4\n" + b"0" * (CHUNK_SIZE * 4))
+    upload = UploadFile(file=body, filename="big.pdf")
+    assert upload.size is None
+
+    with pytest.raises(HTTPException) as excinfo:
+        await save_upload(
+            upload, LocalStorage(tmp_path), "pdf", max_bytes=CHUNK_SIZE * 2, allowed={"pdf"}
+        )
+
+    assert excinfo.value.status_code == 413
+    assert body.tell() <= CHUNK_SIZE * 3
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sniff_type():
+    from app.utils.upload_stream import sniff_type
+
+    assert sniff_type(_make_png_bytes(10, 10)) == "png"
+    assert sniff_type(_make_jpeg_bytes(10, 10)) == "jpeg"
+    assert sniff_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "webp"
+    assert sniff_type(b"%PDF-1.7") == "pdf"
+    assert sniff_type(b"GIF89a") is None
+
+
+def test_upload_returns_variant_manifest(admin_client, tmp_path):
+    from app.utils.image_processing import avif_supported
+
+    response = admin_client.post(
+        "/api/admin/upload",
+        files={"file": ("headshot.jpg", _make_jpeg_bytes(1000, 600), "image/jpeg")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["width"], body["height"]) == (800, 480)
+    assert body["thumbnail"]["width"] == 150
+
+    formats = {"jpg", "webp"} | ({"avif"} if avif_supported() else set())
+    variants = body["variants"]
+    assert {(v["width"], v["format"]) for v in variants} == {
+        (width, fmt) for width in (320, 640, 1000) for fmt in formats
+    }
+    for variant in variants:
+        path = tmp_path / variant["url"].removeprefix("/api/uploads/")
+        assert path.stat().st_size == variant["bytes"]
+        with Image.open(path) as img:
+            assert img.size == (variant["width"], variant["height"])
+
+    jpeg_640 = next(v for v in variants if v["format"] == "jpg" and v["width"] == 640)
+    with Image.open(tmp_path / jpeg_640["url"].removeprefix("/api/uploads/")) as img:
+        assert img.info.get("progressive") or img.info.get("progression")
+
+
+def test_upload_applies_exif_orientation_and_strips_metadata(admin_client, tmp_path):
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90° clockwise on display
+    exif[0x010F] = "Test Camera"
+    buf = BytesIO()
+    Image.new("RGB", (400, 200), color="green").save(
+        buf, format="JPEG", exif=exif, comment=b"secret"
+    )
+
+    response = admin_client.post(
+        "/api/admin/upload",
+        files={"file": ("rotated.jpg", buf.getvalue(), "image/jpeg")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["width"], body["height"]) == (200, 400)
+    for entry in [body, *body["variants"]]:
+        with Image.open(tmp_path / entry["url"].removeprefix("/api/uploads/")) as img:
+            assert not img.getexif()
+            assert "comment" not in img.info
+
+
+def test_duplicate_image_upload_reuses_stored_files(admin_client, tmp_path, monkeypatch):
+    from app.routers.admin import upload as upload_router
+
+    processed = []
+    real_process = upload_router.image_pool.process
+
+    async def counting_process(content):
+        processed.append(len(content))
+        return await real_process(content)
+
+    monkeypatch.setattr(upload_router.image_pool, "process", counting_process)
+
+    payload = _make_png_bytes()
+    first = admin_client.post(
+        "/api/admin/upload", files={"file": ("a.png", payload, "image/png")}
+    ).json()
+    files_after_first = sorted(tmp_path.rglob("*"))
+    second = admin_client.post(
+        "/api/admin/upload", files={"file": ("b.png", payload, "image/png")}
+    ).json()
+
+    assert second == first
+    assert len(processed) == 1
+    assert sorted(tmp_path.rglob("*")) == files_after_first
+
+    key = hashlib.sha256(payload).hexdigest()
+    assert first["url"] == f"/api/uploads/{key[:2]}/{key}.png"
+
+
+def test_duplicate_pdf_upload_returns_same_url(admin_client, tmp_path):
+    payload = b"%PDF-1.4\nsame bytes"
+    urls = {
+        admin_client.post(
+            "/api/admin/upload/pdf", files={"file": (name, payload, "application/pdf")}
+        ).json()["url"]
+        for name in ("one.pdf", "two.pdf")
+    }
+
+    assert len(urls) == 1
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
@@ -1,7 +1,9 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from jose import jwt
+from sqlalchemy import event
 
 import app.routers.auth as auth_router
 from app.config import ACCESS_TOKEN_EXPIRE_HOURS, JWT_ALGORITHM, JWT_SECRET
@@ -114,3 +116,142 @@ def test_failed_login_rate_limited(client, seeded_admins):
 
     response = client.post("/api/auth/login", json=payload)
     assert response.status_code == 429
+
+
+def _login(client, onyen, password="TestPassword123!"):
+    response = client.post("/api/auth/login", json={"onyen": onyen, "password": password})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def temp_account(client, seeded_admins):
+    """A staff account created (and cleaned up) through the admin accounts API."""
+    admin = _login(client, "user123456789")
+    response = client.post(
+        "/api/admin/accounts",
+        headers=admin,
+        json={
+            "email": "temp@test.com",
+            "onyen": "tempuser",
+            "password": "TempPassword123!",
+            "first_name": "Temp",
+            "last_name": "User",
+            "role": "staff",
+        },
+    )
+    assert response.status_code == 201
+    account_id = response.json()["id"]
+    yield account_id, admin
+    client.delete(f"/api/admin/accounts/{account_id}", headers=admin)
+
+
+def test_token_carries_token_version(client, seeded_admins):
+    headers = _login(client, "user123456789")
+    token = headers["Authorization"].split()[1]
+    assert jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])["ver"] == 0
+
+
+def test_authenticated_admin_is_cached_between_requests(client, seeded_admins, test_db):
+    headers = _login(client, "user123456789")
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = test_db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for _ in range(3):
+            assert client.get("/api/auth/me", headers=headers).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert sum("FROM admin" in statement for statement in statements) == 1
+
+
+def test_role_change_applies_to_cached_admin(client, temp_account):
+    account_id, admin = temp_account
+    headers = _login(client, "tempuser", "TempPassword123!")
+    assert client.get("/api/auth/admin-only", headers=headers).status_code == 403
+
+    response = client.put(
+        f"/api/admin/accounts/{account_id}", headers=admin, json={"role": "admin"}
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/auth/admin-only", headers=headers).status_code == 200
+
+
+def test_password_change_revokes_existing_tokens(client, temp_account):
+    account_id, admin = temp_account
+    old = _login(client, "tempuser", "TempPassword123!")
+    assert client.get("/api/auth/me", headers=old).status_code == 200
+
+    response = client.put(
+        f"/api/admin/accounts/{account_id}", headers=admin, json={"password": "NewPassword123!"}
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/auth/me", headers=old)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+    new = _login(client, "tempuser", "NewPassword123!")
+    assert client.get("/api/auth/me", headers=new).status_code == 200
+
+
+def test_deleted_account_is_rejected_immediately(client, temp_account):
+    account_id, admin = temp_account
+    headers = _login(client, "tempuser", "TempPassword123!")
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+    assert client.delete(f"/api/admin/accounts/{account_id}", headers=admin).status_code == 204
+
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+
+def test_login_upgrades_outdated_password_hash(client, test_db):
+    from app.models import Admin
+    from app.utils.passwords import PBKDF2Hasher, needs_rehash, verify_password
+
+    account = Admin(
+        email="legacy@test.com",
+        first_name="Legacy",
+        last_name="Hash",
+        onyen="legacyuser",
+        password_hash=PBKDF2Hasher(iterations=1_000).hash("TestPassword123!"),
+        role="staff",
+    )
+    test_db.add(account)
+    test_db.commit()
+    on_event_loop = []
+
+    def record(conn, cursor, statement, *args):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        on_event_loop.append(statement)
+
+    engine = test_db.get_bind()
+    try:
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            headers = _login(client, "legacyuser")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # The rehash commit expires the account; reloading it for the token
+        # claims must not block the event loop.
+        assert on_event_loop == []
+        token = headers["Authorization"].split()[1]
+        claims = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        assert claims["sub"] == str(account.id)
+        assert claims["ver"] == account.token_version
+
+        test_db.refresh(account)
+        assert not needs_rehash(account.password_hash)
+        assert verify_password("TestPassword123!", account.password_hash)
+    finally:
+        test_db.delete(account)
+        test_db.commit()
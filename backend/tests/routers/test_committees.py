@@ -1,5 +1,9 @@
 """Committee router tests."""
 
+from sqlalchemy import event
+
+from app.models import CommitteeMembership
+
 
 # --- Tests ---
 def test_get_committee_by_id(client, seeded_committees):
@@ -31,3 +35,50 @@ def test_get_all_active_committees(client, seeded_committees):
     names = [c["name"] for c in data]
     assert "Finance Committee" in names
     assert "Education Committee" not in names
+
+
+def test_committee_roster_lists_each_senator_once_with_all_assignments(
+    client, test_db, seeded_committees
+):
+    finance, education = seeded_committees["committees"]
+    john, jane = seeded_committees["senators"]
+    test_db.add(CommitteeMembership(senator_id=john.id, committee_id=education.id, role="Member"))
+    test_db.commit()
+
+    response = client.get("/api/committees/roster")
+    assert response.status_code == 200
+
+    data = response.json()
+    entry = next(c for c in data["committees"] if c["id"] == finance.id)
+    assert entry["members"] == [
+        {"senator_id": john.id, "role": "Chair"},
+        {"senator_id": jane.id, "role": "Member"},
+    ]
+    assert education.id not in {c["id"] for c in data["committees"]}
+
+    senator = data["senators"][str(john.id)]
+    assert senator["first_name"] == "John"
+    assert {(c["committee_name"], c["role"]) for c in senator["committees"]} == {
+        ("Finance Committee", "Chair"),
+        ("Education Committee", "Member"),
+    }
+
+
+def test_committee_roster_query_count_does_not_grow_with_members(
+    client, test_db, seeded_committees
+):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = test_db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/committees/roster")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    # committees, memberships, senators, the senators' memberships, their committees
+    assert len(statements) <= 5
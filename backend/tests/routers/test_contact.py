@@ -11,8 +11,8 @@ client = TestClient(app)
 
 
 @pytest.fixture
-def mock_send_email():
-    with patch("app.routers.contact.send_email") as mock_func:
+def mock_enqueue_email():
+    with patch("app.routers.contact.enqueue_email") as mock_func:
         yield mock_func
 
 
@@ -24,7 +24,7 @@ def mock_db_session():
     app.dependency_overrides.clear()
 
 
-def test_contact_speaker_success(mock_send_email, mock_db_session):
+def test_contact_speaker_success(mock_enqueue_email, mock_db_session):
     payload = {
         "name": "Jane Tarheel",
         "email": "jane@unc.edu",
@@ -34,12 +34,12 @@ def test_contact_speaker_success(mock_send_email, mock_db_session):
     assert response.status_code == 200
     assert response.json()["success"] is True
 
-    mock_send_email.assert_called_once()
-    args = mock_send_email.call_args.kwargs
+    mock_enqueue_email.assert_called_once()
+    args = mock_enqueue_email.call_args.kwargs
     assert args["to_email"] == "speaker@unc.edu"
 
 
-def test_contact_specific_senator(mock_send_email, mock_db_session):
+def test_contact_specific_senator(mock_enqueue_email, mock_db_session):
     # Setup test DB senator output
     senator = Senator(
         id=99,
@@ -61,12 +61,12 @@ def test_contact_specific_senator(mock_send_email, mock_db_session):
     response = client.post("/api/contact", json=payload)
     assert response.status_code == 200
 
-    mock_send_email.assert_called_once()
-    args = mock_send_email.call_args.kwargs
+    mock_enqueue_email.assert_called_once()
+    args = mock_enqueue_email.call_args.kwargs
     assert args["to_email"] == "jonny.senator@unc.edu"
 
 
-def test_contact_with_zero_senator_id_returns_404(mock_send_email, mock_db_session):
+def test_contact_with_zero_senator_id_returns_404(mock_enqueue_email, mock_db_session):
     mock_db_session.query.return_value.filter.return_value.first.return_value = None
 
     payload = {
@@ -79,10 +79,10 @@ def test_contact_with_zero_senator_id_returns_404(mock_send_email, mock_db_sessi
     response = client.post("/api/contact", json=payload)
     assert response.status_code == 404
     assert response.json()["detail"] == "Senator not found"
-    mock_send_email.assert_not_called()
+    mock_enqueue_email.assert_not_called()
 
 
-def test_rate_limiting():
+def test_rate_limiting(mock_enqueue_email, mock_db_session):
     from app.routers.contact import ip_logs
 
     ip_logs.clear()
@@ -96,3 +96,39 @@ def test_rate_limiting():
     res = client.post("/api/contact", json=payload)
     assert res.status_code == 429
     assert "Rate limit exceeded" in res.json()["detail"]
+
+
+def test_contact_is_queued_in_outbox(integration_client, db_session):
+    from app.models import EmailOutbox
+    from app.routers.contact import ip_logs
+
+    ip_logs.clear()
+    payload = {"name": "Jane Tarheel", "email": "jane@unc.edu", "message": "Queued, not sent"}
+
+    response = integration_client.post("/api/contact", json=payload)
+
+    assert response.status_code == 200
+    row = db_session.query(EmailOutbox).one()
+    assert row.to_email == "speaker@unc.edu"
+    assert row.reply_to == "jane@unc.edu"
+    assert row.status == "pending"
+    assert "Queued, not sent" in row.body
+
+
+def test_contact_digest_mode_batches_per_recipient(integration_client, db_session, monkeypatch):
+    from app.models import ContactDigest, EmailOutbox
+    from app.routers.contact import ip_logs
+
+    monkeypatch.setattr("app.routers.contact.CONTACT_DIGEST_WINDOW_MINUTES", 30)
+    monkeypatch.setattr("app.utils.contact_digest.CONTACT_DIGEST_WINDOW_MINUTES", 30)
+    ip_logs.clear()
+
+    for name in ("Jane", "John"):
+        payload = {"name": name, "email": f"{name.lower()}@unc.edu", "message": f"From {name}"}
+        assert integration_client.post("/api/contact", json=payload).status_code == 200
+
+    assert db_session.query(EmailOutbox).count() == 0
+    digest = db_session.query(ContactDigest).one()
+    assert digest.to_email == "speaker@unc.edu"
+    assert digest.status == "open"
+    assert [m.sender_name for m in digest.messages] == ["Jane", "John"]
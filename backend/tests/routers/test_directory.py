@@ -0,0 +1,83 @@
+"""Directory bundle router tests."""
+
+from sqlalchemy import event
+
+from app.models import CarouselSlide, Staff
+
+
+def _count_queries(test_db, client, path):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = test_db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    return response.json(), statements
+
+
+def test_directory_bundles_collections_with_shared_senators(
+    client, test_db, seeded_committees, seeded_leadership
+):
+    john, jane = seeded_committees["senators"]
+    finance, education = seeded_committees["committees"]
+    test_db.add_all(
+        [
+            Staff(
+                first_name="Sam",
+                last_name="Lee",
+                title="Advisor",
+                email="sam@example.com",
+                display_order=1,
+            ),
+            CarouselSlide(image_url="/a.jpg", display_order=1, is_active=True),
+            CarouselSlide(image_url="/hidden.jpg", display_order=2, is_active=False),
+        ]
+    )
+    test_db.commit()
+
+    response = client.get("/api/directory")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert {str(john.id), str(jane.id)} <= set(data["senators"])
+    assert data["senators"][str(john.id)]["committees"][0]["role"] == "Chair"
+    # Only the newest session's active senators are on the default roster.
+    assert jane.id in data["current_senator_ids"]
+    assert john.id not in data["current_senator_ids"]
+
+    committee = next(c for c in data["committees"] if c["id"] == finance.id)
+    assert {m["senator_id"] for m in committee["members"]} == {john.id, jane.id}
+    assert education.id not in {c["id"] for c in data["committees"]}
+
+    district_ids = {d["id"]: d["senator_ids"] for d in data["districts"]}
+    assert john.id in district_ids[john.district]
+    assert jane.id in district_ids[jane.district]
+
+    assert [leader["title"] for leader in data["leadership"]] == [
+        "Parliamentarian",
+        "Speaker",
+        "Whip",
+    ]
+    assert "Sam" in {s["first_name"] for s in data["staff"]}
+    assert "/hidden.jpg" not in {s["image_url"] for s in data["carousel"]}
+
+
+def test_directory_is_cached_until_a_commit_touches_its_models(client, test_db, seeded_committees):
+    _count_queries(test_db, client, "/api/directory")
+
+    _, statements = _count_queries(test_db, client, "/api/directory")
+    assert statements == []
+
+    john = seeded_committees["senators"][0]
+    john.first_name = "Johnny"
+    test_db.commit()
+
+    data, statements = _count_queries(test_db, client, "/api/directory")
+    assert statements
+    assert data["senators"][str(john.id)]["first_name"] == "Johnny"
@@ -1,5 +1,7 @@
 import logging
 
+from app.models import LegislationAction
+
 logging.basicConfig(level=logging.DEBUG)
 
 # -----------------------------
@@ -69,7 +71,7 @@ def test_add_legislation_action(client, seeded_admins):
     act_data = act_res.json()
 
     assert act_data["description"] == "First reading"
-    # assert act_data["display_order"] == 0   <----- incompatible DTO
+    assert act_data["display_order"] == 0
 
 
 def test_update_legislation(client, seeded_admins):
@@ -194,7 +196,7 @@ def test_delete_legislation_action(client, seeded_admins):
     assert detail_res.json()["date_last_action"] == "2026-04-08"
 
 
-def test_delete_legislation_and_cascade_actions(client, seeded_admins):
+def test_delete_legislation_and_cascade_actions(client, test_db, seeded_admins):
     login = client.post(
         "/api/auth/login", json={"onyen": "user123456789", "password": "TestPassword123!"}
     )
@@ -209,7 +211,8 @@ def test_delete_legislation_and_cascade_actions(client, seeded_admins):
     # Add multiple actions
     for i in range(3):
         action_payload = {
-            "action_date": f"2026-04-{8 + i}",
+            "legislation_id": leg_id,
+            "action_date": f"2026-04-{8 + i:02d}",
             "description": f"Action {i}",
             "action_type": "reading",
         }
@@ -219,8 +222,64 @@ def test_delete_legislation_and_cascade_actions(client, seeded_admins):
             headers={"Authorization": f"Bearer {token}"},
         )
 
+    assert len(client.get(f"/api/legislation/{leg_id}").json()["actions"]) == 3
+
     # Delete legislation
     del_res = client.delete(
         f"/api/admin/legislation/{leg_id}", headers={"Authorization": f"Bearer {token}"}
     )
     assert del_res.status_code == 204
+    assert client.get(f"/api/legislation/{leg_id}").status_code == 404
+    remaining = (
+        test_db.query(LegislationAction).filter(LegislationAction.legislation_id == leg_id).count()
+    )
+    assert remaining == 0
+
+
+def test_reorder_legislation_actions(client, seeded_admins):
+    login = client.post(
+        "/api/auth/login", json={"onyen": "user123456789", "password": "TestPassword123!"}
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    leg_id = client.post(
+        "/api/admin/legislation", json=create_leg_payload(), headers=headers
+    ).json()["id"]
+
+    actions = [
+        client.post(
+            f"/api/admin/legislation/{leg_id}/actions",
+            json={
+                **create_action_payload(),
+                "legislation_id": leg_id,
+                "description": f"Action {i}",
+            },
+            headers=headers,
+        ).json()
+        for i in range(3)
+    ]
+    assert [a["display_order"] for a in actions] == [0, 1, 2]
+
+    items = [
+        {"id": a["id"], "display_order": position, "version": a["version"]}
+        for position, a in enumerate(reversed(actions))
+    ]
+    res = client.put(
+        f"/api/admin/legislation/{leg_id}/actions/reorder", json={"items": items}, headers=headers
+    )
+    assert res.status_code == 200
+    assert [a["description"] for a in res.json()] == ["Action 2", "Action 1", "Action 0"]
+
+    stale = client.put(
+        f"/api/admin/legislation/{leg_id}/actions/reorder", json={"items": items}, headers=headers
+    )
+    assert stale.status_code == 409
+
+    other_leg = client.post(
+        "/api/admin/legislation", json=create_leg_payload(), headers=headers
+    ).json()["id"]
+    foreign = client.put(
+        f"/api/admin/legislation/{other_leg}/actions/reorder",
+        json={"items": [{"id": actions[0]["id"], "display_order": 0}]},
+        headers=headers,
+    )
+    assert foreign.status_code == 404
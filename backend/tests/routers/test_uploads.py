@@ -0,0 +1,327 @@
+import threading
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.main import app
+from app.routers import uploads as uploads_router
+from app.utils.derivatives import DerivativeCache
+from app.utils.image_processing import ImagePool
+from app.utils.storage import LocalStorage, MemoryStorage, get_storage
+
+
+@pytest.fixture
+def derivative_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads_router, "derivative_pool", ImagePool(workers=0, max_pending=4))
+    cache = DerivativeCache(
+        tmp_path / "derivatives",
+        max_bytes=50 * 1024 * 1024,
+        render=uploads_router._render_in_pool,
+    )
+    monkeypatch.setattr(uploads_router, "derivative_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch, derivative_cache):
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    storage = LocalStorage(uploads)
+    monkeypatch.setattr(uploads_router, "UPLOAD_DIR", str(uploads))
+    app.dependency_overrides[get_storage] = lambda: storage
+    yield uploads
+    app.dependency_overrides.pop(get_storage, None)
+
+
+def _write_jpeg(path, width: int = 1200, height: int = 800) -> None:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), color="purple").save(buf, format="JPEG")
+    path.write_bytes(buf.getvalue())
+
+
+def test_original_served_without_query(client, upload_dir):
+    _write_jpeg(upload_dir / "photo.jpg")
+    response = client.get("/api/uploads/photo.jpg")
+    assert response.status_code == 200
+    assert response.content == (upload_dir / "photo.jpg").read_bytes()
+
+
+def test_resize_and_reencode(client, upload_dir):
+    _write_jpeg(upload_dir / "photo.jpg")
+    response = client.get("/api/uploads/photo.jpg?w=320&fmt=webp")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    with Image.open(BytesIO(response.content)) as img:
+        assert img.format == "WEBP"
+        assert img.size == (320, 213)
+
+
+def test_derivative_rendered_once_then_cached(client, upload_dir):
+    _write_jpeg(upload_dir / "photo.jpg")
+    cache = uploads_router.derivative_cache
+
+    first = client.get("/api/uploads/photo.jpg?w=640")
+    second = client.get("/api/uploads/photo.jpg?w=640")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert cache.renders == 1
+    assert uploads_router.derivative_pool.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_derivative_render_returns_503_when_pool_is_busy(upload_dir, monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from app.utils import image_processing
+
+    _write_jpeg(upload_dir / "photo.jpg")
+    release = threading.Event()
+    real_render = image_processing.render_variant
+
+    def blocked_render(*args):
+        release.wait(timeout=10)
+        return real_render(*args)
+
+    pool = ImagePool(workers=0, max_pending=1)
+    monkeypatch.setattr(uploads_router, "derivative_pool", pool)
+    monkeypatch.setattr(image_processing, "render_variant", blocked_render)
+
+    async def render_in_pool():
+        while pool.stats()["in_flight"] < 1:
+            await asyncio.sleep(0.01)
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.ensure_future(client.get("/api/uploads/photo.jpg?w=640"))
+            await asyncio.wait_for(render_in_pool(), timeout=5)
+
+            busy = await client.get("/api/uploads/photo.jpg?w=320")
+
+            release.set()
+            done = await first
+    finally:
+        release.set()
+
+    assert busy.status_code == 503
+    assert busy.headers["retry-after"] == "1"
+    assert done.status_code == 200
+    assert pool.stats()["rejected"] == 1
+
+
+def test_identical_sources_share_derivatives(client, upload_dir):
+    _write_jpeg(upload_dir / "a.jpg")
+    (upload_dir / "b.jpg").write_bytes((upload_dir / "a.jpg").read_bytes())
+
+    client.get("/api/uploads/a.jpg?w=320")
+    client.get("/api/uploads/b.jpg?w=320")
+    assert uploads_router.derivative_cache.renders == 1
+
+
+@pytest.mark.parametrize(
+    "query, detail",
+    [
+        ("w=333", "Width must be one of"),
+        ("fmt=gif", "Unsupported format"),
+    ],
+)
+def test_rejects_values_outside_allow_list(client, upload_dir, query, detail):
+    _write_jpeg(upload_dir / "photo.jpg")
+    response = client.get(f"/api/uploads/photo.jpg?{query}")
+    assert response.status_code == 400
+    assert detail in response.json()["detail"]
+
+
+def test_pdf_cannot_be_resized(client, upload_dir):
+    (upload_dir / "doc.pdf").write_bytes(b"%PDF-1.4\n")
+    response = client.get("/api/uploads/doc.pdf?w=320")
+    assert response.status_code == 400
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    storage = LocalStorage(tmp_path)
+    _write_jpeg(tmp_path / "photo.jpg")
+    source = storage.stat("photo.jpg")
+    cache = DerivativeCache(tmp_path / "cache", max_bytes=1)
+
+    first = cache.get_or_render(storage, source, 320, None)
+    second = cache.get_or_render(storage, source, 640, None)
+
+    assert second.exists()
+    assert not first.exists()
+
+
+def test_concurrent_requests_render_once(tmp_path, monkeypatch):
+    import app.utils.derivatives as derivatives
+
+    storage = LocalStorage(tmp_path)
+    _write_jpeg(tmp_path / "photo.jpg")
+    source = storage.stat("photo.jpg")
+    cache = DerivativeCache(tmp_path / "cache", max_bytes=50 * 1024 * 1024)
+
+    started = threading.Barrier(8)
+    real_render = derivatives.render_variant
+
+    def slow_render(*args):
+        threading.Event().wait(0.05)
+        return real_render(*args)
+
+    monkeypatch.setattr(derivatives, "render_variant", slow_render)
+
+    results = []
+
+    def worker():
+        started.wait()
+        results.append(cache.get_or_render(storage, source, 480, "webp"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.renders == 1
+    assert len(set(results)) == 1
+
+
+def test_sharded_path_served(client, upload_dir):
+    (upload_dir / "ab").mkdir()
+    _write_jpeg(upload_dir / "ab" / "abcdef.jpg")
+    assert client.get("/api/uploads/ab/abcdef.jpg").status_code == 200
+    assert client.get("/api/uploads/ab/abcdef.jpg?w=320").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "path", ["../secret.txt", "ab/../../secret.txt", ".derivatives/x.jpg", "ab/.upload-1.part"]
+)
+def test_hidden_and_traversal_paths_not_served(client, upload_dir, path):
+    (upload_dir.parent / "secret.txt").write_text("nope")
+    (upload_dir / ".derivatives").mkdir()
+    _write_jpeg(upload_dir / ".derivatives" / "x.jpg")
+    (upload_dir / "ab").mkdir()
+    (upload_dir / "ab" / ".upload-1.part").write_bytes(b"partial")
+
+    assert client.get(f"/api/uploads/{path}").status_code == 404
+
+
+SHARDED = "ab/ab" + "0" * 62 + ".jpg"
+
+
+def test_content_addressed_files_are_immutable(client, upload_dir):
+    (upload_dir / "ab").mkdir()
+    _write_jpeg(upload_dir / SHARDED)
+    _write_jpeg(upload_dir / "legacy.jpg")
+
+    sharded = client.get(f"/api/uploads/{SHARDED}")
+    derivative = client.get(f"/api/uploads/{SHARDED}?w=320")
+    legacy = client.get("/api/uploads/legacy.jpg")
+
+    assert "immutable" in sharded.headers["cache-control"]
+    assert "immutable" in derivative.headers["cache-control"]
+    assert "immutable" not in legacy.headers["cache-control"]
+    assert all(r.headers["etag"] for r in (sharded, derivative, legacy))
+
+
+def test_conditional_requests_return_304(client, upload_dir):
+    _write_jpeg(upload_dir / "photo.jpg")
+    first = client.get("/api/uploads/photo.jpg")
+
+    by_etag = client.get("/api/uploads/photo.jpg", headers={"If-None-Match": first.headers["etag"]})
+    by_date = client.get(
+        "/api/uploads/photo.jpg", headers={"If-Modified-Since": first.headers["last-modified"]}
+    )
+    stale = client.get("/api/uploads/photo.jpg", headers={"If-None-Match": '"other"'})
+
+    assert by_etag.status_code == by_date.status_code == 304
+    assert by_etag.content == b""
+    assert stale.status_code == 200
+
+
+def test_range_request_returns_partial_pdf(client, upload_dir):
+    body = b"%PDF-1.4\n" + bytes(range(256)) * 100
+    (upload_dir / "doc.pdf").write_bytes(body)
+
+    response = client.get("/api/uploads/doc.pdf", headers={"Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.content == body[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(body)}"
+
+
+def test_accel_redirect_hands_off_to_proxy(client, upload_dir, monkeypatch):
+    monkeypatch.setattr(uploads_router, "UPLOAD_ACCEL_REDIRECT_PREFIX", "/_uploads/")
+    (upload_dir / "doc.pdf").write_bytes(b"%PDF-1.4\n")
+
+    response = client.get("/api/uploads/doc.pdf")
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/_uploads/doc.pdf"
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_pathsend_used_when_server_supports_it(tmp_path):
+    from app.utils.file_serving import PathSendFileResponse
+
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [],
+        "extensions": {"http.response.pathsend": {}},
+    }
+    await PathSendFileResponse(path, stat_result=path.stat())(scope, None, send)
+
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(path)}
+
+
+@pytest.fixture
+def memory_storage(derivative_cache):
+    storage = MemoryStorage()
+    app.dependency_overrides[get_storage] = lambda: storage
+    yield storage
+    app.dependency_overrides.pop(get_storage, None)
+
+
+def test_memory_backend_serves_bytes_and_derivatives(client, memory_storage):
+    buf = BytesIO()
+    Image.new("RGB", (1200, 800), color="purple").save(buf, format="JPEG")
+    memory_storage.write(SHARDED, buf.getvalue())
+
+    original = client.get(f"/api/uploads/{SHARDED}")
+    revalidated = client.get(
+        f"/api/uploads/{SHARDED}", headers={"If-None-Match": original.headers["etag"]}
+    )
+    resized = client.get(f"/api/uploads/{SHARDED}?w=320")
+
+    assert original.status_code == 200
+    assert original.content == buf.getvalue()
+    assert original.headers["content-type"] == "image/jpeg"
+    assert revalidated.status_code == 304
+    with Image.open(BytesIO(resized.content)) as img:
+        assert img.width == 320
+
+
+def test_memory_backend_missing_file_is_404(client, memory_storage):
+    assert client.get("/api/uploads/nope.jpg").status_code == 404
+
+
+def test_storage_with_direct_urls_redirects(client, memory_storage, monkeypatch):
+    memory_storage.write("doc.pdf", b"%PDF-1.4\n")
+    monkeypatch.setattr(memory_storage, "url", lambda key: f"https://cdn.example.com/{key}")
+
+    response = client.get("/api/uploads/doc.pdf", follow_redirects=False)
+
+    assert response.status_code == 307
+    assert response.headers["location"] == "https://cdn.example.com/doc.pdf"
@@ -293,3 +293,125 @@ class TestDeleteAdminBudget:
 
     def test_returns_404_for_missing(self, write_admin_client):
         assert write_admin_client.delete("/api/admin/budget/999999").status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# POST /api/admin/budget/import
+# ---------------------------------------------------------------------------
+
+
+def _csv(*lines: str) -> bytes:
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _import(client, content: bytes, filename: str = "budget.csv", **params):
+    return client.post(
+        "/api/admin/budget/import",
+        params=params,
+        files={"file": (filename, content, "text/csv")},
+    )
+
+
+class TestImportAdminBudget:
+    _HEADER = "fiscal_year,category,amount,description,parent,display_order"
+
+    def test_creates_nested_rows_in_one_import(self, write_admin_client):
+        content = _csv(
+            self._HEADER,
+            "FY2027,Programs,5000,,,1",
+            "FY2027,Outreach,2000,,Programs,2",
+            "FY2027,Flyers,500,,Programs > Outreach,3",
+        )
+        resp = _import(write_admin_client, content)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["created"] == 3
+        assert body["dry_run"] is False
+
+        rows = write_admin_client.get("/api/admin/budget?fiscal_year=FY2027").json()
+        by_category = {r["category"]: r for r in rows}
+        assert by_category["Outreach"]["parent_category_id"] == by_category["Programs"]["id"]
+        assert by_category["Flyers"]["parent_category_id"] == by_category["Outreach"]["id"]
+
+    def test_updates_existing_rows_by_path(self, write_admin_client):
+        content = _csv(
+            self._HEADER,
+            "FY2026,Operations,100000,,,1",
+            "FY2026,Salaries,75000,,Operations,2",
+        )
+        body = _import(write_admin_client, content).json()
+        assert body["updated"] == 1
+        assert body["unchanged"] == 1
+        salaries = next(r for r in body["rows"] if r["category"] == "Salaries")
+        assert salaries["changed_fields"] == ["amount"]
+
+        rows = write_admin_client.get("/api/admin/budget?fiscal_year=FY2026").json()
+        assert next(r for r in rows if r["category"] == "Salaries")["amount"] == 75000
+
+    def test_dry_run_does_not_write(self, write_admin_client):
+        before = write_admin_client.get("/api/admin/budget").json()
+        content = _csv(self._HEADER, "FY2027,Programs,5000,,,1")
+        body = _import(write_admin_client, content, dry_run="true").json()
+        assert body["dry_run"] is True
+        assert body["created"] == 1
+        assert write_admin_client.get("/api/admin/budget").json() == before
+
+    def test_cycle_rejected(self, write_admin_client):
+        content = _csv(
+            self._HEADER,
+            "FY2027,Alpha,100,,Beta,1",
+            "FY2027,Beta,100,,Alpha,2",
+        )
+        resp = _import(write_admin_client, content)
+        assert resp.status_code == 400
+        assert any("cycle" in error for error in resp.json()["detail"])
+
+    def test_row_errors_reported_without_writing(self, write_admin_client):
+        before = write_admin_client.get("/api/admin/budget").json()
+        content = _csv(
+            self._HEADER,
+            "FY2027,Programs,5000,,,1",
+            "FY2027,Broken,-5,,,2",
+            "FY2027,Unpriced,abc,,,3",
+        )
+        resp = _import(write_admin_client, content)
+        assert resp.status_code == 400
+        detail = resp.json()["detail"]
+        assert any(error.startswith("Row 3:") for error in detail)
+        assert any(error.startswith("Row 4:") for error in detail)
+        assert write_admin_client.get("/api/admin/budget").json() == before
+
+    @pytest.mark.parametrize("amount", ["NaN", "sNaN", "Infinity", "-inf"])
+    def test_non_finite_amount_rejected(self, write_admin_client, amount):
+        content = _csv(self._HEADER, f"FY2027,Programs,{amount},,,1")
+        resp = _import(write_admin_client, content)
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == ["Row 2: amount must be a number"]
+
+    def test_unknown_parent_rejected(self, write_admin_client):
+        content = _csv(self._HEADER, "FY2027,Orphan,10,,Missing,1")
+        resp = _import(write_admin_client, content)
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == ["Row 2: parent category 'Missing' not found"]
+
+    def test_fiscal_year_query_param_fills_missing_column(self, write_admin_client):
+        content = _csv("category,amount", "Programs,5000")
+        body = _import(write_admin_client, content, fiscal_year="FY2030").json()
+        assert body["rows"][0]["fiscal_year"] == "FY2030"
+
+    def test_xlsx_import(self, write_admin_client):
+        from io import BytesIO
+
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Fiscal Year", "Category", "Amount", "Parent"])
+        sheet.append(["FY2027", "Programs", 5000, None])
+        sheet.append(["FY2027", "Outreach", 2000.5, "Programs"])
+        buf = BytesIO()
+        workbook.save(buf)
+
+        resp = _import(write_admin_client, buf.getvalue(), filename="budget.xlsx")
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 2
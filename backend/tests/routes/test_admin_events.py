@@ -286,3 +286,57 @@ class TestDeleteAdminEvent:
         finally:
             if saved:
                 app.dependency_overrides[get_current_user] = saved
+
+
+# ---------------------------------------------------------------------------
+# Recurring events and the public /api/events cache
+# ---------------------------------------------------------------------------
+
+
+class TestRecurringEvents:
+    _WEEKLY = {
+        **_CREATE_PAYLOAD,
+        "title": "Full Senate",
+        "start_datetime": "2026-09-01T19:00:00",
+        "end_datetime": "2026-09-01T21:00:00",
+        "is_published": True,
+        "recurrence_rule": "freq=weekly;until=20261201",
+    }
+
+    def test_rule_is_normalized(self, write_admin_client):
+        resp = write_admin_client.post("/api/admin/events", json=self._WEEKLY)
+        assert resp.status_code == 201
+        assert resp.json()["recurrence_rule"] == "FREQ=WEEKLY;UNTIL=20261201"
+
+    def test_unsupported_rule_returns_422(self, write_admin_client):
+        bad = {**self._WEEKLY, "recurrence_rule": "FREQ=HOURLY"}
+        assert write_admin_client.post("/api/admin/events", json=bad).status_code == 422
+
+    def test_public_list_expands_occurrences_in_window(self, write_admin_client):
+        event_id = write_admin_client.post("/api/admin/events", json=self._WEEKLY).json()["id"]
+
+        data = write_admin_client.get(
+            "/api/events?start_date=2026-10-01&end_date=2026-10-31"
+        ).json()
+
+        starts = [e["start_datetime"] for e in data if e["id"] == event_id]
+        assert starts == [f"2026-10-{day:02d}T19:00:00" for day in (6, 13, 20, 27)]
+        assert {e["end_datetime"][11:] for e in data if e["id"] == event_id} == {"21:00:00"}
+
+    def test_finished_series_is_not_listed(self, write_admin_client):
+        write_admin_client.post("/api/admin/events", json=self._WEEKLY)
+        data = write_admin_client.get("/api/events?start_date=2027-01-01").json()
+        assert data == []
+
+    def test_admin_changes_invalidate_cached_lists(self, write_admin_client):
+        event_id = write_admin_client.post("/api/admin/events", json=self._WEEKLY).json()["id"]
+        url = "/api/events?start_date=2026-09-01&end_date=2026-09-30"
+        assert len(write_admin_client.get(url).json()) == 5
+
+        write_admin_client.put(
+            f"/api/admin/events/{event_id}", json={"recurrence_rule": "FREQ=WEEKLY;COUNT=2"}
+        )
+        assert len(write_admin_client.get(url).json()) == 2
+
+        write_admin_client.delete(f"/api/admin/events/{event_id}")
+        assert write_admin_client.get(url).json() == []
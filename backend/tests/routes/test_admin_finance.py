@@ -1,6 +1,6 @@
 """Integration tests for admin finance hearing CRUD routes (ticket #71)."""
 
-from datetime import date, time
+from datetime import date, time, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
@@ -271,3 +271,190 @@ class TestDeleteFinanceDate:
         finally:
             if saved:
                 app.dependency_overrides[get_current_user] = saved
+
+
+# ---------------------------------------------------------------------------
+# Slot bookings
+# ---------------------------------------------------------------------------
+
+
+class TestFinanceBookings:
+    @pytest.fixture(autouse=True)
+    def _reset_booking_rate_limit(self):
+        from app.routers import finance as finance_router
+
+        finance_router._booking_requests.clear()
+        yield
+        finance_router._booking_requests.clear()
+
+    def _create_date(self, client, **overrides) -> int:
+        payload = {
+            "hearing_date": (date.today() + timedelta(days=30)).isoformat(),
+            "hearing_time": "10:00:00",
+            "location": "Union",
+            "description": None,
+            "capacity": 2,
+            **overrides,
+        }
+        return client.post("/api/admin/finance-hearings/dates", json=payload).json()["id"]
+
+    def _book(self, client, date_id, org="Chess Club"):
+        return client.post(
+            f"/api/finance-hearings/dates/{date_id}/bookings",
+            json={
+                "organization_name": org,
+                "contact_name": "Pat Treasurer",
+                "contact_email": "pat@unc.edu",
+            },
+        )
+
+    def _date(self, client, date_id):
+        dates = client.get("/api/finance-hearings").json()["dates"]
+        return next(d for d in dates if d["id"] == date_id)
+
+    def test_booking_takes_a_seat(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+
+        resp = self._book(write_admin_client, date_id)
+
+        assert resp.status_code == 201
+        assert resp.json()["organization_name"] == "Chess Club"
+        slot = self._date(write_admin_client, date_id)
+        assert (slot["booked_count"], slot["seats_remaining"]) == (1, 1)
+
+    def test_full_slot_rejects_more_bookings(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+        assert self._book(write_admin_client, date_id, "A").status_code == 201
+        assert self._book(write_admin_client, date_id, "B").status_code == 201
+
+        resp = self._book(write_admin_client, date_id, "C")
+
+        assert resp.status_code == 409
+        assert self._date(write_admin_client, date_id)["booked_count"] == 2
+
+    def test_duplicate_organization_does_not_use_a_seat(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+        self._book(write_admin_client, date_id)
+
+        assert self._book(write_admin_client, date_id).status_code == 409
+        assert self._date(write_admin_client, date_id)["booked_count"] == 1
+
+    def test_organization_names_differing_only_by_case_share_a_seat(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+        self._book(write_admin_client, date_id, "Chess Club")
+
+        resp = self._book(write_admin_client, date_id, "CHESS  club")
+
+        assert resp.status_code == 409
+        assert self._date(write_admin_client, date_id)["booked_count"] == 1
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(
+        self, write_admin_client, write_engine
+    ):
+        from sqlalchemy.exc import IntegrityError
+
+        from app.utils.hearing_bookings import book_slot
+
+        date_id = self._create_date(write_admin_client)
+
+        with (
+            sessionmaker(bind=write_engine)() as db,
+            pytest.raises(IntegrityError, match="contact_name"),
+        ):
+            book_slot(
+                db,
+                date_id,
+                organization_name="Chess Club",
+                contact_name=None,
+                contact_email="pat@unc.edu",
+            )
+        assert self._date(write_admin_client, date_id)["booked_count"] == 0
+
+    def test_closed_and_past_slots_cannot_be_booked(self, write_admin_client):
+        past_id = self._create_date(write_admin_client, hearing_date="2020-01-01")
+        closed_id = self._create_date(write_admin_client)
+        write_admin_client.put(
+            f"/api/admin/finance-hearings/dates/{closed_id}", json={"is_full": True}
+        )
+
+        assert self._book(write_admin_client, past_id).status_code == 409
+        assert self._book(write_admin_client, closed_id).status_code == 409
+        assert self._book(write_admin_client, 999999).status_code == 404
+
+    def test_bookings_closed_while_config_inactive(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+        write_admin_client.put(
+            "/api/admin/finance-hearings/config",
+            json={"is_active": False, "season_start": None, "season_end": None},
+        )
+
+        assert self._book(write_admin_client, date_id).status_code == 409
+
+    def test_admin_lists_and_cancels_bookings(self, write_admin_client):
+        date_id = self._create_date(write_admin_client, capacity=1)
+        self._book(write_admin_client, date_id)
+
+        url = f"/api/admin/finance-hearings/dates/{date_id}/bookings"
+        bookings = write_admin_client.get(url).json()
+        assert [b["organization_name"] for b in bookings] == ["Chess Club"]
+
+        assert write_admin_client.delete(f"{url}/{bookings[0]['id']}").status_code == 204
+        assert write_admin_client.get(url).json() == []
+        assert self._book(write_admin_client, date_id, "Debate Team").status_code == 201
+
+    def test_blank_organization_name_rejected(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+
+        assert self._book(write_admin_client, date_id, "   ").status_code == 422
+        assert (
+            self._book(write_admin_client, date_id, "  Chess Club ").json()["organization_name"]
+            == "Chess Club"
+        )
+
+    def test_bookings_are_rate_limited_per_ip(self, write_admin_client):
+        from app.routers.finance import BOOKING_RATE_LIMIT_MAX_REQUESTS
+
+        date_id = self._create_date(write_admin_client, capacity=1)
+        for _ in range(BOOKING_RATE_LIMIT_MAX_REQUESTS):
+            assert self._book(write_admin_client, date_id).status_code != 429
+
+        assert self._book(write_admin_client, date_id).status_code == 429
+
+    def test_capacity_cannot_drop_below_bookings(self, write_admin_client):
+        date_id = self._create_date(write_admin_client)
+        self._book(write_admin_client, date_id, "A")
+        self._book(write_admin_client, date_id, "B")
+
+        resp = write_admin_client.put(
+            f"/api/admin/finance-hearings/dates/{date_id}", json={"capacity": 1}
+        )
+        assert resp.status_code == 409
+
+    def test_capacity_change_racing_a_booking_is_a_conflict(self, write_admin_client):
+        from sqlalchemy import text
+        from sqlalchemy.orm import Session
+
+        date_id = self._create_date(write_admin_client)
+        self._book(write_admin_client, date_id, "A")
+
+        raced = []
+
+        def book_after_read(session, instance):
+            # Another seat is taken right after the route has read the slot.
+            if isinstance(instance, FinanceHearingDate) and not raced:
+                raced.append(instance.id)
+                session.connection().execute(
+                    text("UPDATE finance_hearing_date SET booked_count = 2 WHERE id = :id"),
+                    {"id": date_id},
+                )
+
+        event.listen(Session, "loaded_as_persistent", book_after_read)
+        try:
+            resp = write_admin_client.put(
+                f"/api/admin/finance-hearings/dates/{date_id}", json={"capacity": 1}
+            )
+        finally:
+            event.remove(Session, "loaded_as_persistent", book_after_read)
+
+        assert raced == [date_id]
+        assert resp.status_code == 409
@@ -13,7 +13,6 @@ from app.main import app
 from app.models import Admin
 from app.models.base import Base
 from app.models.cms import StaticPageContent
-from app.static_pages import STATIC_PAGE_DEFAULTS
 from app.utils.passwords import hash_password
 
 _SQLITE_URL = "sqlite:///:memory:"
@@ -155,7 +154,12 @@ class TestListAdminPages:
     def test_returns_list_of_pages(self, admin_read_client):
         data = admin_read_client.get("/api/admin/pages").json()
         assert isinstance(data, list)
-        assert len(data) >= len(STATIC_PAGE_DEFAULTS)
+        assert len(data) == 2
+
+    def test_listing_does_not_backfill_defaults(self, admin_read_client, read_engine):
+        admin_read_client.get("/api/admin/pages")
+        with sessionmaker(bind=read_engine)() as db:
+            assert db.query(StaticPageContent).count() == 2
 
     def test_response_shape(self, admin_read_client):
         item = admin_read_client.get("/api/admin/pages").json()[0]
@@ -218,6 +222,15 @@ class TestUpdateAdminPage:
             == 422
         )
 
+    def test_public_page_serves_update(self, write_admin_client):
+        write_admin_client.get("/api/pages/powers-of-senate")
+        write_admin_client.put(
+            "/api/admin/pages/powers-of-senate", json={"title": "New", "body": "<p>New</p>"}
+        )
+
+        data = write_admin_client.get("/api/pages/powers-of-senate").json()
+        assert (data["title"], data["body"]) == ("New", "<p>New</p>")
+
     def test_unauthenticated_rejected(self):
         saved = app.dependency_overrides.pop(get_current_user, None)
         try:
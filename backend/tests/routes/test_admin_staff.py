@@ -239,3 +239,102 @@ class TestDeleteAdminStaff:
         finally:
             if saved:
                 app.dependency_overrides[get_current_user] = saved
+
+
+# ---------------------------------------------------------------------------
+# PUT /api/admin/staff/reorder, PATCH /api/admin/staff/bulk
+# ---------------------------------------------------------------------------
+
+
+class TestBatchAdminStaff:
+    def _create_staff(self, client, email: str) -> dict:
+        return client.post("/api/admin/staff", json={**_CREATE_PAYLOAD, "email": email}).json()
+
+    def _listed(self, client) -> dict[int, dict]:
+        return {s["id"]: s for s in client.get("/api/admin/staff").json()}
+
+    def test_reorder_sets_display_order_and_bumps_version(self, write_admin_client):
+        a = self._create_staff(write_admin_client, "a@unc.edu")["id"]
+        b = self._create_staff(write_admin_client, "b@unc.edu")["id"]
+        resp = write_admin_client.put(
+            "/api/admin/staff/reorder",
+            json={
+                "items": [
+                    {"id": a, "display_order": 20, "version": 1},
+                    {"id": b, "display_order": 10, "version": 1},
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        assert [s["id"] for s in resp.json()] == [b, a]
+        listed = self._listed(write_admin_client)
+        assert listed[a]["display_order"] == 20
+        assert listed[a]["version"] == 2
+
+    def test_stale_version_returns_409_and_changes_nothing(self, write_admin_client):
+        a = self._create_staff(write_admin_client, "a@unc.edu")["id"]
+        b = self._create_staff(write_admin_client, "b@unc.edu")["id"]
+        write_admin_client.put(f"/api/admin/staff/{b}", json={"title": "Bumped"})
+
+        resp = write_admin_client.put(
+            "/api/admin/staff/reorder",
+            json={
+                "items": [
+                    {"id": a, "display_order": 7, "version": 1},
+                    {"id": b, "display_order": 8, "version": 1},
+                ]
+            },
+        )
+        assert resp.status_code == 409
+        assert str(b) in resp.json()["detail"]
+        assert self._listed(write_admin_client)[a]["display_order"] == 5
+
+    def test_missing_id_returns_409(self, write_admin_client):
+        resp = write_admin_client.put(
+            "/api/admin/staff/reorder", json={"items": [{"id": 999999, "display_order": 1}]}
+        )
+        assert resp.status_code == 409
+
+    def test_bulk_patch_mixed_fields(self, write_admin_client):
+        a = self._create_staff(write_admin_client, "a@unc.edu")["id"]
+        b = self._create_staff(write_admin_client, "b@unc.edu")["id"]
+        resp = write_admin_client.patch(
+            "/api/admin/staff/bulk",
+            json={"items": [{"id": a, "is_active": False}, {"id": b, "display_order": 0}]},
+        )
+        assert resp.status_code == 200
+        listed = self._listed(write_admin_client)
+        assert listed[a]["is_active"] is False
+        assert listed[a]["display_order"] == 5
+        assert listed[b]["display_order"] == 0
+        assert listed[b]["is_active"] is True
+
+    def test_duplicate_ids_return_422(self, write_admin_client):
+        resp = write_admin_client.put(
+            "/api/admin/staff/reorder",
+            json={"items": [{"id": 1, "display_order": 1}, {"id": 1, "display_order": 2}]},
+        )
+        assert resp.status_code == 422
+
+    def test_empty_batch_returns_422(self, write_admin_client):
+        assert (
+            write_admin_client.patch("/api/admin/staff/bulk", json={"items": []}).status_code == 422
+        )
+
+    def test_postgres_uses_single_update_from_values(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.utils.bulk import _postgres_statement
+
+        statement = _postgres_statement(
+            Staff,
+            ["display_order"],
+            [
+                {"id": 1, "version": 3, "display_order": 2},
+                {"id": 2, "version": -1, "display_order": 1},
+            ],
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.count("UPDATE staff") == 1
+        assert "FROM (VALUES" in sql
+        assert "version=(staff.version +" in sql
@@ -92,3 +92,23 @@ class TestListEvents:
     def test_date_range_no_results(self, client):
         data = client.get("/api/events?start_date=2026-06-01&end_date=2026-06-30").json()
         assert data == []
+
+
+class TestCalendarFeed:
+    def test_feed_is_icalendar(self, client):
+        response = client.get("/api/events/feed.ics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert response.text.startswith("BEGIN:VCALENDAR\r\n")
+        assert response.text.endswith("END:VCALENDAR\r\n")
+
+    def test_feed_lists_published_events_only(self, client):
+        body = client.get("/api/events/feed.ics").text
+        assert body.count("BEGIN:VEVENT") == 2
+        assert "SUMMARY:General Body Meeting" in body
+        assert "Draft Event" not in body
+
+    def test_feed_filter_by_event_type(self, client):
+        body = client.get("/api/events/feed.ics?event_type=hearing").text
+        assert body.count("BEGIN:VEVENT") == 1
+        assert "SUMMARY:Finance Hearing" in body
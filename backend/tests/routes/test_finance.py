@@ -1,5 +1,7 @@
 """Integration tests for GET /api/finance-hearings (TDD Section 4.5.2)."""
 
+import pytest
+
 from app.models.FinanceHearingConfig import FinanceHearingConfig
 
 
@@ -53,3 +55,36 @@ class TestGetFinanceHearings:
         data = client.get("/api/finance-hearings").json()
         assert data["is_active"] is False
         assert data["dates"] == []
+
+
+class TestListFinanceHearingDates:
+    @pytest.fixture(autouse=True)
+    def _active_config(self, db_session):
+        db_session.query(FinanceHearingConfig).first().is_active = True
+        db_session.commit()
+
+    def test_window_is_ordered_and_paginated(self, client):
+        data = client.get("/api/finance-hearings/dates?start_date=2026-01-01&limit=1").json()
+        assert data["total"] == 2
+        assert [d["hearing_date"] for d in data["items"]] == ["2026-02-01"]
+
+        page_two = client.get(
+            "/api/finance-hearings/dates?start_date=2026-01-01&limit=1&page=2"
+        ).json()
+        assert [d["hearing_date"] for d in page_two["items"]] == ["2026-02-02"]
+
+    def test_end_date_limits_the_window(self, client):
+        data = client.get(
+            "/api/finance-hearings/dates?start_date=2026-01-01&end_date=2026-02-01"
+        ).json()
+        assert data["total"] == 1
+
+    def test_defaults_to_upcoming_dates(self, client):
+        assert client.get("/api/finance-hearings/dates").json()["total"] == 0
+
+    def test_available_only_skips_full_dates(self, client):
+        data = client.get(
+            "/api/finance-hearings/dates?start_date=2026-01-01&available_only=true"
+        ).json()
+        assert [d["hearing_date"] for d in data["items"]] == ["2026-02-01"]
+        assert data["items"][0]["seats_remaining"] == 1
@@ -1,5 +1,9 @@
 """Integration tests for GET /api/pages/:slug (TDD Section 4.5.2)."""
 
+from sqlalchemy import event
+
+from app.models.cms import StaticPageContent
+
 
 class TestGetPage:
     def test_returns_200_for_existing_slug(self, client):
@@ -19,10 +23,9 @@ class TestGetPage:
         data = client.get("/api/pages/powers-of-senate").json()
         assert len(data["body"]) > 0
 
-    def test_missing_default_page_is_backfilled(self, client):
-        data = client.get("/api/pages/staffer-application").json()
-        assert data["page_slug"] == "staffer-application"
-        assert data["title"] == "Applying to be a Senate Staffer"
+    def test_missing_default_page_is_not_created_on_request(self, client):
+        """Defaults are backfilled by script/init_db.py, never by a public GET."""
+        assert client.get("/api/pages/staffer-application").status_code == 404
 
     def test_404_for_nonexistent_slug(self, client):
         assert client.get("/api/pages/this-page-does-not-exist").status_code == 404
@@ -30,3 +33,33 @@ class TestGetPage:
     def test_404_response_has_detail(self, client):
         data = client.get("/api/pages/this-page-does-not-exist").json()
         assert "detail" in data
+
+
+class TestPageCache:
+    def test_repeat_request_does_not_query(self, client, seeded_engine):
+        client.get("/api/pages/powers-of-senate")
+        statements = []
+
+        def record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(seeded_engine, "before_cursor_execute", record)
+        try:
+            resp = client.get("/api/pages/powers-of-senate")
+        finally:
+            event.remove(seeded_engine, "before_cursor_execute", record)
+
+        assert resp.json()["page_slug"] == "powers-of-senate"
+        assert statements == []
+
+    def test_committed_edit_replaces_cached_page(self, client, db_session):
+        client.get("/api/pages/powers-of-senate")
+        page = (
+            db_session.query(StaticPageContent)
+            .filter(StaticPageContent.page_slug == "powers-of-senate")
+            .one()
+        )
+        page.body = "<p>Revised</p><script></script>"
+        db_session.commit()
+
+        assert client.get("/api/pages/powers-of-senate").json()["body"] == "<p>Revised</p>"
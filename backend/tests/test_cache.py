@@ -0,0 +1,69 @@
+"""Tests for the in-process TTL cache."""
+
+from app.utils.cache import TTLCache, clear_all
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = TTLCache(maxsize=10, ttl=30, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 29.9
+    assert cache.get("a") == 1
+    clock.now = 30
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_and_clear_all():
+    first = TTLCache(maxsize=10, ttl=30)
+    second = TTLCache(maxsize=10, ttl=30)
+    first.set("a", 1)
+    first.set("b", 2)
+    second.set("a", 1)
+
+    first.invalidate("a")
+    assert first.get("a") is None
+    assert first.get("b") == 2
+
+    clear_all()
+    assert len(first) == len(second) == 0
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_set_after_invalidation_is_dropped():
+    cache = TTLCache(maxsize=10, ttl=30)
+    generation = cache.generation
+
+    cache.clear()  # a write committed while the value was being built
+    cache.set("a", "stale", generation=generation)
+    assert cache.get("a") is None
+
+    cache.set("a", "fresh", generation=cache.generation)
+    assert cache.get("a") == "fresh"
@@ -0,0 +1,139 @@
+"""Tests for per-recipient contact-form digests."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models import ContactDigest, EmailOutbox
+from app.utils import contact_digest
+from app.utils.contact_digest import add_to_digest, flush_due_digests
+from app.utils.mailer import SMTPPool
+from app.utils.outbox import OutboxWorker
+
+WINDOW = timedelta(minutes=30)
+
+
+def _submit(db, name, to_email="senator@unc.edu", now=None):
+    add_to_digest(
+        db,
+        to_email=to_email,
+        sender_name=name,
+        sender_email=f"{name.lower()}@unc.edu",
+        message=f"Message from {name}",
+        window=WINDOW,
+        now=now,
+    )
+    db.commit()
+
+
+def test_messages_share_the_recipients_open_window(db_session):
+    start = datetime(2026, 3, 2, 9, 0)
+    _submit(db_session, "Jane", now=start)
+    _submit(db_session, "John", now=start + timedelta(minutes=10))
+    _submit(db_session, "Ramses", to_email="other@unc.edu", now=start)
+
+    digests = db_session.query(ContactDigest).order_by(ContactDigest.id).all()
+    assert [(d.to_email, len(d.messages)) for d in digests] == [
+        ("senator@unc.edu", 2),
+        ("other@unc.edu", 1),
+    ]
+    assert digests[0].closes_at == start + WINDOW
+
+
+def test_nothing_is_sent_before_the_window_closes(db_session):
+    start = datetime(2026, 3, 2, 9, 0)
+    _submit(db_session, "Jane", now=start)
+
+    assert flush_due_digests(db_session, start + WINDOW - timedelta(seconds=1)) == 0
+    assert db_session.query(EmailOutbox).count() == 0
+
+
+def test_closed_window_becomes_one_email(db_session):
+    start = datetime(2026, 3, 2, 9, 0)
+    for name in ("Jane", "John", "Ramses"):
+        _submit(db_session, name, now=start)
+
+    assert flush_due_digests(db_session, start + WINDOW) == 1
+
+    row = db_session.query(EmailOutbox).one()
+    assert row.to_email == "senator@unc.edu"
+    assert row.subject == "3 new messages via Senate Portal"
+    assert row.reply_to is None
+    for name in ("Jane", "John", "Ramses"):
+        assert f"Message from {name}" in row.body
+    assert "--- Message 3 of 3 ---" in row.body
+
+    digest = db_session.query(ContactDigest).one()
+    assert digest.status == "queued"
+    assert digest.outbox_id == row.id
+    assert flush_due_digests(db_session, start + 2 * WINDOW) == 0
+
+
+def test_single_message_digest_keeps_the_plain_format(db_session):
+    start = datetime(2026, 3, 2, 9, 0)
+    _submit(db_session, "Jane", now=start)
+
+    flush_due_digests(db_session, start + WINDOW)
+
+    row = db_session.query(EmailOutbox).one()
+    assert row.subject == "New Message via Senate Portal from Jane"
+    assert row.reply_to == "jane@unc.edu"
+    assert row.body.startswith("Name: Jane\nEmail: jane@unc.edu")
+
+
+def test_message_after_flush_opens_a_new_window(db_session):
+    start = datetime(2026, 3, 2, 9, 0)
+    _submit(db_session, "Jane", now=start)
+    flush_due_digests(db_session, start + WINDOW)
+
+    _submit(db_session, "John", now=start + WINDOW + timedelta(minutes=1))
+
+    digests = db_session.query(ContactDigest).order_by(ContactDigest.id).all()
+    assert [d.status for d in digests] == ["queued", "open"]
+    assert [m.sender_name for m in digests[1].messages] == ["John"]
+
+
+def test_digest_closed_while_racing_to_open_one_is_replaced(db_session, monkeypatch):
+    start = datetime(2026, 3, 2, 9, 0)
+    _submit(db_session, "Jane", now=start)
+    real_open_digest = contact_digest._open_digest
+    calls = []
+
+    def racing_open_digest(db, to_email):
+        calls.append(to_email)
+        if len(calls) == 1:
+            return None  # missed Jane's digest, so the insert below conflicts
+        if len(calls) == 2:
+            db.query(ContactDigest).update({"status": "queued"})  # a flush closes it
+        return real_open_digest(db, to_email)
+
+    monkeypatch.setattr(contact_digest, "_open_digest", racing_open_digest)
+    _submit(db_session, "John", now=start + timedelta(minutes=1))
+
+    digests = db_session.query(ContactDigest).order_by(ContactDigest.id).all()
+    assert [d.status for d in digests] == ["queued", "open"]
+    assert [m.sender_name for m in digests[1].messages] == ["John"]
+
+
+def test_outbox_worker_flushes_digests_before_sending(db_session):
+    delivered = []
+
+    class Connection:
+        def send_message(self, message):
+            delivered.append(message)
+
+        def quit(self):
+            pass
+
+    worker = OutboxWorker(
+        sessionmaker(bind=db_session.get_bind()),
+        SMTPPool(size=1, connect=Connection),
+        poll_seconds=0.05,
+        producers=[flush_due_digests],
+    )
+    past = datetime.now() - 2 * WINDOW
+    _submit(db_session, "Jane", now=past)
+    _submit(db_session, "John", now=past)
+
+    assert worker.run_once() == 1
+    assert [m["Subject"] for m in delivered] == ["2 new messages via Senate Portal"]
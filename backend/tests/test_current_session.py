@@ -0,0 +1,70 @@
+"""Tests for the cached current-session lookup."""
+
+from sqlalchemy import event, update
+
+from app.models import Leadership
+from app.utils.current_session import current_session
+
+
+def _leader(session_number: int, title: str = "Speaker") -> Leadership:
+    return Leadership(
+        title=title, first_name="Jane", last_name="Doe", session_number=session_number
+    )
+
+
+def _count_queries(db_session, fn):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_defaults_to_one_when_empty(db_session):
+    assert current_session(db_session, "senators") == 1
+
+
+def test_value_is_cached_between_calls(db_session):
+    db_session.add(_leader(3))
+    db_session.commit()
+
+    assert _count_queries(db_session, lambda: current_session(db_session, "leadership")) == (3, 1)
+    assert _count_queries(db_session, lambda: current_session(db_session, "leadership")) == (3, 0)
+
+
+def test_committed_insert_invalidates(db_session):
+    db_session.add(_leader(3))
+    db_session.commit()
+    assert current_session(db_session, "leadership") == 3
+
+    db_session.add(_leader(4))
+    db_session.flush()
+    assert current_session(db_session, "leadership") == 3  # not committed yet
+    db_session.commit()
+
+    assert current_session(db_session, "leadership") == 4
+
+
+def test_bulk_statement_invalidates_on_commit(db_session):
+    db_session.add(_leader(3))
+    db_session.commit()
+    assert current_session(db_session, "leadership") == 3
+
+    db_session.execute(update(Leadership).values(session_number=5))
+    db_session.commit()
+
+    assert current_session(db_session, "leadership") == 5
+
+
+def test_rosters_are_tracked_separately(db_session):
+    db_session.add(_leader(3))
+    db_session.commit()
+    assert current_session(db_session, "legislation") == 1
+    assert current_session(db_session, "leadership") == 3
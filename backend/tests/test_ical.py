@@ -0,0 +1,108 @@
+"""Tests for the iCalendar serializer in app/utils/ical.py."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.utils.ical import calendar_chunks, escape_text, event_lines, fold, timezone_lines
+
+
+def test_escape_text_escapes_separators_and_newlines():
+    assert escape_text("a,b;c\\d\ne") == r"a\,b\;c\\d\ne"
+
+
+def test_fold_keeps_lines_within_75_octets_without_splitting_characters():
+    line = "DESCRIPTION:" + "é" * 100
+    folded = fold(line)
+
+    pieces = folded.removesuffix("\r\n").split("\r\n ")
+    assert all(len(piece.encode("utf-8")) <= 75 for piece in pieces)
+    assert "".join(pieces) == line
+
+
+def test_recurring_events_use_the_calendar_timezone():
+    event = SimpleNamespace(
+        id=7,
+        title="Full Senate",
+        event_type="meeting",
+        location=None,
+        description=None,
+        start_datetime=datetime(2026, 9, 1, 23, 0, tzinfo=timezone.utc),
+        end_datetime=datetime(2026, 9, 2, 1, 0, tzinfo=timezone.utc),
+        recurrence_rule="FREQ=WEEKLY",
+    )
+    stamp = datetime(2026, 8, 1, tzinfo=timezone.utc)
+
+    lines = event_lines(event, domain="example.edu", stamp=stamp)
+
+    assert "DTSTART;TZID=America/New_York:20260901T190000" in lines
+    assert "RRULE:FREQ=WEEKLY" in lines
+    assert "UID:event-7@example.edu" in lines
+
+    event.recurrence_rule = None
+    assert "DTSTART:20260901T230000Z" in event_lines(event, domain="example.edu", stamp=stamp)
+
+
+def _components(feed: str) -> list[tuple[str, list[str]]]:
+    """Unfold the feed and return ``(name, property lines)`` for each component."""
+    lines = feed.replace("\r\n ", "").split("\r\n")
+    stack, found = [], []
+    for line in filter(None, lines):
+        if line.startswith("BEGIN:"):
+            stack.append((line.removeprefix("BEGIN:"), []))
+        elif line.startswith("END:"):
+            name, props = stack.pop()
+            assert name == line.removeprefix("END:")
+            found.append((name, props))
+        else:
+            stack[-1][1].append(line)
+    assert not stack
+    return found
+
+
+def test_feed_defines_every_tzid_it_uses():
+    event = SimpleNamespace(
+        id=7,
+        title="Full Senate",
+        event_type="meeting",
+        location=None,
+        description=None,
+        start_datetime=datetime(2026, 9, 1, 23, 0, tzinfo=timezone.utc),
+        end_datetime=datetime(2026, 9, 2, 1, 0, tzinfo=timezone.utc),
+        recurrence_rule="FREQ=WEEKLY",
+    )
+
+    components = _components("".join(calendar_chunks([event], domain="example.edu")))
+
+    used = {
+        prop.split("TZID=", 1)[1].split(":", 1)[0]
+        for name, props in components
+        if name == "VEVENT"
+        for prop in props
+        if "TZID=" in prop
+    }
+    defined = {
+        prop.removeprefix("TZID:")
+        for name, props in components
+        if name == "VTIMEZONE"
+        for prop in props
+        if prop.startswith("TZID:")
+    }
+    assert used == {"America/New_York"}
+    assert used <= defined
+    observances = {name: props for name, props in components if name in {"STANDARD", "DAYLIGHT"}}
+    assert "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU" in observances["DAYLIGHT"]
+    assert "TZOFFSETTO:-0500" in observances["STANDARD"]
+
+
+def test_timezone_rules_for_other_zones():
+    london = timezone_lines("Europe/London", 2026)
+    assert "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU" in london
+    assert "DTSTART:19701025T020000" in london
+
+    tokyo = timezone_lines("Asia/Tokyo", 2026)
+    assert "BEGIN:DAYLIGHT" not in tokyo
+    assert "TZOFFSETTO:+0900" in tokyo
+
+    # Friday before the last Sunday of March: no weekday rule, so listed per year.
+    jerusalem = timezone_lines("Asia/Jerusalem", 2026)
+    assert "RDATE:20270326T020000" in jerusalem
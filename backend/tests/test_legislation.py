@@ -2,6 +2,8 @@
 
 from datetime import date
 
+from sqlalchemy import event
+
 from app.models.Legislation import Legislation
 from app.models.LegislationAction import LegislationAction
 
@@ -279,6 +281,48 @@ def test_get_legislation_actions_ordered_by_display_order(integration_client, db
     assert actions[1]["description"] == "Second"
 
 
+def _detail_statements(client, db_session, legislation_id):
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"/api/legislation/{legislation_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return response.json(), statements
+
+
+def test_get_legislation_detail_is_cached_until_an_action_changes(integration_client, db_session):
+    leg = make_legislation()
+    leg.actions = [
+        LegislationAction(
+            action_date=date(2025, 1, 1),
+            description="Referred",
+            action_type="Referral",
+            display_order=1,
+        )
+    ]
+    db_session.add(leg)
+    db_session.commit()
+
+    _, statements = _detail_statements(integration_client, db_session, leg.id)
+    assert len(statements) == 2  # the bill, then its actions in one selectin query
+
+    data, statements = _detail_statements(integration_client, db_session, leg.id)
+    assert statements == []
+    assert [a["description"] for a in data["actions"]] == ["Referred"]
+
+    leg.actions[0].description = "Sent to Finance"
+    db_session.commit()
+
+    data, _ = _detail_statements(integration_client, db_session, leg.id)
+    assert [a["description"] for a in data["actions"]] == ["Sent to Finance"]
+
+
 def test_get_legislation_not_found(integration_client):
     resp = integration_client.get("/api/legislation/99999")
     assert resp.status_code == 404
@@ -337,3 +381,104 @@ def test_get_recent_legislation_ordered_most_recent_first(integration_client, db
     items = resp.json()
     assert items[0]["title"] == "Newer"
     assert items[1]["title"] == "Older"
+
+
+# ---------------------------------------------------------------------------
+# GET /api/legislation/facets
+# ---------------------------------------------------------------------------
+
+
+def _seed_facets(db_session):
+    passed = make_legislation(status="Passed", sponsor_name="Ann Lee")
+    passed.actions = [
+        LegislationAction(
+            action_date=date(2025, 1, d), description="x", action_type=t, display_order=i
+        )
+        for i, (d, t) in enumerate([(1, "Filing"), (4, "Referral"), (10, "Floor Vote")])
+    ]
+    failed = make_legislation(status="Failed", sponsor_name="Bo Park", bill_number="SB-002")
+    failed.actions = [
+        LegislationAction(
+            action_date=date(2025, 1, d), description="x", action_type=t, display_order=i
+        )
+        for i, (d, t) in enumerate([(1, "Filing"), (2, "Floor Vote")])
+    ]
+    db_session.add_all(
+        [
+            passed,
+            failed,
+            make_legislation(status="Passed", type="Resolution", bill_number="SR-001"),
+            make_legislation(session=2, status="Passed", bill_number="SB-100"),
+        ]
+    )
+    db_session.commit()
+
+
+def _counts(items):
+    return {item["value"]: item["count"] for item in items}
+
+
+def test_facets_count_each_dimension(integration_client, db_session):
+    _seed_facets(db_session)
+
+    data = integration_client.get("/api/legislation/facets?session=1").json()
+
+    assert data["total"] == 3
+    assert _counts(data["status"]) == {"Passed": 2, "Failed": 1}
+    assert _counts(data["type"]) == {"Bill": 2, "Resolution": 1}
+    assert _counts(data["sponsor"]) == {"Ann Lee": 1, "Bo Park": 1, "Jane Doe": 1}
+    assert data["session"] == [{"value": 2, "count": 1}, {"value": 1, "count": 3}]
+
+
+def test_facets_ignore_their_own_filter(integration_client, db_session):
+    _seed_facets(db_session)
+
+    data = integration_client.get("/api/legislation/facets?session=1&status=Passed").json()
+
+    assert data["total"] == 2
+    assert _counts(data["status"]) == {"Passed": 2, "Failed": 1}
+    assert _counts(data["type"]) == {"Bill": 1, "Resolution": 1}
+    assert _counts(data["session"]) == {1: 2, 2: 1}
+
+
+def test_facets_total_matches_list(integration_client, db_session):
+    _seed_facets(db_session)
+
+    query = "session=1&type=Bill&search=test"
+    facets = integration_client.get(f"/api/legislation/facets?{query}").json()
+    listing = integration_client.get(f"/api/legislation?{query}").json()
+    assert facets["total"] == listing["total"] == 2
+
+
+def test_facets_time_in_stage(integration_client, db_session):
+    _seed_facets(db_session)
+
+    stages = integration_client.get("/api/legislation/facets?session=1").json()["time_in_stage"]
+
+    assert stages == [
+        {"action_type": "Filing", "count": 2, "avg_days": 2.0, "min_days": 1, "max_days": 3},
+        {"action_type": "Referral", "count": 1, "avg_days": 6.0, "min_days": 6, "max_days": 6},
+    ]
+
+
+def test_facets_are_cached_until_legislation_changes(integration_client, db_session):
+    _seed_facets(db_session)
+    url = "/api/legislation/facets?session=1"
+    integration_client.get(url)
+
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        integration_client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == []
+
+    db_session.add(make_legislation(status="Failed", bill_number="SB-003"))
+    db_session.commit()
+    assert _counts(integration_client.get(url).json()["status"])["Failed"] == 2
@@ -0,0 +1,212 @@
+"""Tests for the versioned schema migrations in app/migrations.
+
+The interrupted-index test runs only against PostgreSQL (set TEST_DATABASE_URL).
+"""
+
+import os
+
+import pytest
+from sqlalchemy import Column, Integer, create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.migrations import (
+    Migration,
+    MigrationError,
+    applied_versions,
+    discover,
+    migrate,
+    pending,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _quiet(_message):
+    pass
+
+
+def _index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def _column_names(engine, table):
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def test_discovered_versions_are_unique_and_ordered():
+    versions = [migration.version for migration in discover()]
+
+    assert versions == sorted(set(versions))
+    assert versions[0] == 1
+
+
+def test_fresh_database_records_every_migration_once(engine):
+    applied = migrate(engine, log=_quiet)
+
+    assert [m.version for m in applied] == [m.version for m in discover()]
+    assert applied_versions(engine) == {m.version for m in discover()}
+    assert pending(engine) == []
+    assert migrate(engine, log=_quiet) == []
+
+
+def test_missing_indexes_are_created(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_legislation_session_introduced"))
+        conn.execute(text("DROP INDEX ix_senator_session_active_district"))
+
+    migrate(engine, log=_quiet)
+
+    assert "ix_legislation_session_introduced" in _index_names(engine, "legislation")
+    assert "ix_senator_session_active_district" in _index_names(engine, "senator")
+
+
+def test_missing_columns_are_added_with_defaults(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_leadership_session_order"))
+        conn.execute(text("ALTER TABLE leadership DROP COLUMN version"))
+        conn.execute(text("ALTER TABLE leadership DROP COLUMN display_order"))
+        conn.execute(
+            text(
+                "INSERT INTO leadership (title, first_name, last_name, session_number, is_active) "
+                "VALUES ('Speaker', 'Jane', 'Doe', 1, 1)"
+            )
+        )
+
+    migrate(engine, log=_quiet)
+
+    assert {"version", "display_order"} <= _column_names(engine, "leadership")
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT version, display_order FROM leadership")).one()
+    assert tuple(row) == (1, 0)
+
+
+def test_backfill_updates_in_batches(engine):
+    with engine.begin() as conn:
+        for i in range(7):
+            conn.execute(
+                text("INSERT INTO district (district_name) VALUES (:name)"), {"name": f"d{i}"}
+            )
+    batches = []
+
+    def upgrade(op):
+        batches.append(
+            op.backfill(
+                "district",
+                "district_name = upper(district_name)",
+                "district_name != upper(district_name)",
+                batch_size=3,
+            )
+        )
+
+    migrate(engine, [Migration(900, "upper_districts", upgrade, transactional=False)], log=_quiet)
+
+    assert batches == [7]
+    with engine.connect() as conn:
+        names = conn.execute(text("SELECT district_name FROM district")).scalars().all()
+    assert all(name == name.upper() for name in names)
+
+
+def test_booking_organization_keys_are_backfilled_without_losing_seats(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE finance_hearing_booking"))
+        conn.execute(
+            text(
+                "CREATE TABLE finance_hearing_booking (id INTEGER PRIMARY KEY, "
+                "hearing_date_id INTEGER NOT NULL, organization_name VARCHAR(255) NOT NULL, "
+                "contact_name VARCHAR(255) NOT NULL, contact_email VARCHAR(255) NOT NULL, "
+                "created_at DATETIME NOT NULL, CONSTRAINT uq_finance_hearing_booking_org "
+                "UNIQUE (hearing_date_id, organization_name))"
+            )
+        )
+        for name in ("ACM", "acm ", "Chess  Club"):
+            conn.execute(
+                text(
+                    "INSERT INTO finance_hearing_booking (hearing_date_id, organization_name, "
+                    "contact_name, contact_email, created_at) "
+                    "VALUES (1, :name, 'Pat', 'pat@unc.edu', '2026-01-01')"
+                ),
+                {"name": name},
+            )
+
+    migrate(engine, log=_quiet)
+
+    with engine.connect() as conn:
+        keys = conn.execute(
+            text("SELECT organization_key FROM finance_hearing_booking ORDER BY id")
+        ).scalars()
+        assert list(keys) == ["acm", "acm:2", "chess club"]
+    assert "uq_finance_hearing_booking_org_key" in _index_names(engine, "finance_hearing_booking")
+
+
+def test_failed_transactional_migration_is_rolled_back_and_not_recorded(engine):
+    def upgrade(op):
+        op.execute("INSERT INTO district (district_name) VALUES ('half done')")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        migrate(engine, [Migration(901, "broken", upgrade)], log=_quiet)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM district")).scalar() == 0
+    assert 901 not in applied_versions(engine)
+
+
+def test_not_null_column_without_default_is_rejected(engine):
+    def upgrade(op):
+        op.add_column("district", Column("required", Integer, nullable=False))
+
+    with pytest.raises(MigrationError):
+        migrate(engine, [Migration(902, "bad_column", upgrade)], log=_quiet)
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL"), reason="set TEST_DATABASE_URL to a PostgreSQL database"
+)
+def test_invalid_index_from_an_interrupted_build_is_rebuilt():
+    schema = "migration_indexes"
+    admin_engine = create_engine(os.environ["TEST_DATABASE_URL"])
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        os.environ["TEST_DATABASE_URL"], connect_args={"options": f"-csearch_path={schema}"}
+    )
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE item (id serial PRIMARY KEY, code int)"))
+            conn.execute(text("CREATE INDEX ix_item_code ON item (code)"))
+            # What a CONCURRENTLY build killed part-way leaves behind.
+            conn.execute(
+                text(
+                    "UPDATE pg_index SET indisvalid = false "
+                    "WHERE indexrelid = to_regclass('ix_item_code')"
+                )
+            )
+
+        def upgrade(op):
+            assert not op.index_is_valid("ix_item_code")
+            op.create_index("ix_item_code", "item", ["code"])
+
+        migrate(engine, [Migration(903, "rebuild", upgrade, transactional=False)], log=_quiet)
+
+        with engine.connect() as conn:
+            valid = conn.execute(
+                text(
+                    "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass('ix_item_code')"
+                )
+            ).scalar()
+        assert valid is True
+    finally:
+        engine.dispose()
+        with admin_engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        admin_engine.dispose()
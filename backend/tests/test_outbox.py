@@ -0,0 +1,191 @@
+"""Tests for the email outbox worker and the pooled SMTP sender."""
+
+import smtplib
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import EmailOutbox
+from app.utils.mailer import SMTPPool
+from app.utils.outbox import OutboxWorker, enqueue_email
+
+
+class FakeSMTP:
+    """Stands in for an authenticated ``smtplib.SMTP`` session."""
+
+    def __init__(self, server):
+        self.server = server
+        self.closed = False
+
+    def send_message(self, message):
+        if self.server.failures:
+            raise self.server.failures.pop(0)
+        self.server.delivered.append(message)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSMTPServer:
+    def __init__(self):
+        self.delivered = []
+        self.failures = []
+        self.sessions = []
+
+    def connect(self):
+        session = FakeSMTP(self)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def smtp():
+    return FakeSMTPServer()
+
+
+@pytest.fixture
+def worker(session_factory, smtp):
+    return OutboxWorker(
+        session_factory,
+        SMTPPool(size=1, connect=smtp.connect),
+        batch_size=10,
+        max_attempts=3,
+        retry_base=30,
+        poll_seconds=0.05,
+    )
+
+
+def _enqueue(session_factory, count=1, to_email="senator@unc.edu"):
+    with session_factory() as db:
+        for i in range(count):
+            enqueue_email(
+                db, to_email=to_email, subject=f"Message {i}", body="Hello", reply_to="a@unc.edu"
+            )
+        db.commit()
+
+
+def _rows(session_factory):
+    with session_factory() as db:
+        return db.query(EmailOutbox).order_by(EmailOutbox.id).all()
+
+
+def _make_due(session_factory):
+    with session_factory() as db:
+        for row in db.query(EmailOutbox):
+            row.next_attempt_at = datetime.now() - timedelta(seconds=1)
+        db.commit()
+
+
+def test_sends_pending_messages_over_one_reused_connection(worker, session_factory, smtp):
+    _enqueue(session_factory, count=3)
+
+    assert worker.run_once() == 3
+
+    assert [m["Subject"] for m in smtp.delivered] == ["Message 0", "Message 1", "Message 2"]
+    assert smtp.delivered[0]["Reply-To"] == "a@unc.edu"
+    assert worker.pool.connections_opened == 1
+    assert {row.status for row in _rows(session_factory)} == {"sent"}
+    assert worker.run_once() == 0
+
+
+def test_transient_failure_is_retried_with_backoff(worker, session_factory, smtp):
+    _enqueue(session_factory)
+    smtp.failures.append(smtplib.SMTPResponseException(451, b"try later"))
+
+    before = datetime.now()
+    worker.run_once()
+
+    [row] = _rows(session_factory)
+    assert row.status == "pending"
+    assert row.attempts == 1
+    assert "451" in row.last_error
+    assert row.next_attempt_at >= before + timedelta(seconds=30)
+    assert worker.run_once() == 0  # not due yet
+
+    _make_due(session_factory)
+    worker.run_once()
+    [row] = _rows(session_factory)
+    assert row.status == "sent"
+    assert row.attempts == 2
+
+
+def test_dead_lettered_after_max_attempts(worker, session_factory, smtp):
+    _enqueue(session_factory)
+    smtp.failures.extend(OSError("connection refused") for _ in range(3))
+
+    for _ in range(3):
+        _make_due(session_factory)
+        worker.run_once()
+
+    [row] = _rows(session_factory)
+    assert row.status == "dead"
+    assert row.attempts == 3
+    assert "connection refused" in row.last_error
+
+
+def test_rejected_recipient_is_dead_lettered_immediately(worker, session_factory, smtp):
+    _enqueue(session_factory)
+    smtp.failures.append(smtplib.SMTPRecipientsRefused({"x@unc.edu": (550, b"no such user")}))
+
+    worker.run_once()
+
+    [row] = _rows(session_factory)
+    assert row.status == "dead"
+    assert row.attempts == 1
+    assert worker.pool.connections_opened == 1  # the session survived the rejection
+
+
+def test_dropped_connection_is_replaced_and_send_retried(worker, session_factory, smtp):
+    _enqueue(session_factory)
+    smtp.failures.append(smtplib.SMTPServerDisconnected("gone"))
+
+    worker.run_once()
+
+    assert _rows(session_factory)[0].status == "sent"
+    assert worker.pool.connections_opened == 2
+    assert smtp.sessions[0].closed
+
+
+def test_idle_connections_are_not_reused(smtp):
+    from app.utils.mailer import build_message
+
+    pool = SMTPPool(size=1, idle_seconds=0, connect=smtp.connect)
+    pool.send(build_message(to_email="a@unc.edu", subject="1", body="x"))
+    time.sleep(0.01)
+    pool.send(build_message(to_email="a@unc.edu", subject="2", body="x"))
+
+    assert pool.connections_opened == 2
+    assert smtp.sessions[0].closed
+
+
+def test_background_thread_delivers_when_woken(worker, session_factory, smtp):
+    worker.start()
+    try:
+        _enqueue(session_factory)
+        worker.wake()
+        deadline = time.monotonic() + 5
+        while not smtp.delivered and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+
+    assert len(smtp.delivered) == 1
+    assert _rows(session_factory)[0].status == "sent"
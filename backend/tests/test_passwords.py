@@ -0,0 +1,97 @@
+"""Tests for password hashing, rehash-on-login and the hashing pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.utils import passwords
+from app.utils.passwords import (
+    HashingPool,
+    HashingPoolBusyError,
+    PBKDF2Hasher,
+    ScryptHasher,
+    needs_rehash,
+    verify_and_update,
+    verify_password,
+)
+
+FAST_PBKDF2 = PBKDF2Hasher(iterations=1_000)
+FAST_SCRYPT = ScryptHasher(n=2**10, r=8, p=1)
+
+
+@pytest.fixture
+def hashers(monkeypatch):
+    """Cheap parameters for both algorithms, with PBKDF2 as the default."""
+    monkeypatch.setitem(passwords.HASHERS, "pbkdf2_sha256", FAST_PBKDF2)
+    monkeypatch.setitem(passwords.HASHERS, "scrypt", FAST_SCRYPT)
+    monkeypatch.setattr(passwords, "PASSWORD_HASHER", "pbkdf2_sha256")
+
+
+@pytest.mark.parametrize("hasher", [FAST_PBKDF2, FAST_SCRYPT], ids=["pbkdf2", "scrypt"])
+def test_round_trip(hashers, hasher):
+    encoded = hasher.hash("TestPassword123!")
+
+    assert encoded.startswith(f"{hasher.algorithm}$")
+    assert verify_password("TestPassword123!", encoded)
+    assert not verify_password("WrongPassword123!", encoded)
+    assert hasher.hash("TestPassword123!") != encoded  # salted
+
+
+def test_malformed_or_unknown_hashes_do_not_verify(hashers):
+    assert not verify_password("x", "")
+    assert not verify_password("x", "bcrypt$12$abc$def")
+    assert not verify_password("x", "pbkdf2_sha256$notanumber$abc$def")
+    assert not verify_password("x", "scrypt$1024$8")
+
+
+def test_current_hash_is_kept(hashers):
+    encoded = FAST_PBKDF2.hash("TestPassword123!")
+
+    assert not needs_rehash(encoded)
+    assert verify_and_update("TestPassword123!", encoded) == (True, None)
+
+
+def test_outdated_parameters_are_rehashed(hashers):
+    encoded = PBKDF2Hasher(iterations=500).hash("TestPassword123!")
+
+    ok, new_hash = verify_and_update("TestPassword123!", encoded)
+
+    assert ok
+    assert new_hash.startswith("pbkdf2_sha256$1000$")
+    assert verify_password("TestPassword123!", new_hash)
+
+
+def test_switching_algorithm_rehashes_on_next_login(hashers, monkeypatch):
+    encoded = FAST_PBKDF2.hash("TestPassword123!")
+    monkeypatch.setattr(passwords, "PASSWORD_HASHER", "scrypt")
+
+    ok, new_hash = verify_and_update("TestPassword123!", encoded)
+
+    assert ok
+    assert new_hash.startswith("scrypt$1024$8$1$")
+    assert verify_and_update("WrongPassword123!", encoded) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_rejects_when_full(hashers, monkeypatch):
+    release = threading.Event()
+
+    def blocking_verify(password, password_hash):
+        release.wait(5)
+        return True, None
+
+    monkeypatch.setattr(passwords, "verify_and_update", blocking_verify)
+    pool = HashingPool(workers=1, max_pending=2)
+    try:
+        pending = [asyncio.create_task(pool.verify_and_update("x", "y")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingPoolBusyError):
+            await pool.verify_and_update("x", "y")
+
+        release.set()
+        assert await asyncio.gather(*pending) == [(True, None), (True, None)]
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,96 @@
+"""Tests for the RRULE subset in app/utils/recurrence.py."""
+
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.utils.recurrence import (
+    MAX_OCCURRENCES,
+    RecurrenceRule,
+    normalize,
+    occurrences,
+    series_end,
+)
+
+EASTERN = ZoneInfo("America/New_York")
+
+
+def test_parse_round_trips_to_canonical_text():
+    rule = RecurrenceRule.parse("rrule:freq=weekly;byday=th,tu;interval=2;until=20261215")
+
+    assert rule.by_day == (1, 3)
+    assert rule.until == date(2026, 12, 15)
+    assert str(rule) == "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;UNTIL=20261215"
+    assert normalize("  ") is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "FREQ=YEARLY",
+        "FREQ=WEEKLY;INTERVAL=0",
+        "FREQ=DAILY;BYDAY=MO",
+        "FREQ=WEEKLY;BYDAY=XX",
+        "FREQ=WEEKLY;COUNT=3;UNTIL=20261215",
+        "FREQ=WEEKLY;BYSETPOS=1",
+        "FREQ=DAILY;COUNT=10001",
+        "FREQ",
+    ],
+)
+def test_unsupported_rules_are_rejected(text):
+    with pytest.raises(ValueError):
+        RecurrenceRule.parse(text)
+
+
+def test_weekly_byday_occurrences_inside_window():
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=TU,TH")
+    first = datetime(2026, 9, 1, 19, 0)  # a Tuesday
+
+    starts = list(occurrences(rule, first, datetime(2026, 9, 8), datetime(2026, 9, 15)))
+
+    assert starts == [datetime(2026, 9, 8, 19, 0), datetime(2026, 9, 10, 19, 0)]
+
+
+def test_count_limits_the_series_from_its_first_occurrence():
+    rule = RecurrenceRule.parse("FREQ=DAILY;COUNT=3")
+    first = datetime(2026, 9, 1, 9, 0)
+
+    assert len(list(occurrences(rule, first))) == 3
+    assert list(occurrences(rule, first, datetime(2026, 9, 3))) == [datetime(2026, 9, 3, 9, 0)]
+    assert series_end(rule, first) == datetime(2026, 9, 3, 9, 0)
+
+
+def test_series_end_is_not_cut_short_by_the_occurrence_cap():
+    count = MAX_OCCURRENCES + 500
+    rule = RecurrenceRule.parse(f"FREQ=DAILY;COUNT={count}")
+    first = datetime(2026, 1, 1, 9, 0)
+
+    end = series_end(rule, first)
+
+    assert end == first + timedelta(days=count - 1)
+    late = list(occurrences(rule, first, datetime(2029, 1, 1), datetime(2030, 1, 1)))
+    assert late and late[-1] <= end
+
+
+def test_monthly_skips_months_without_that_day():
+    rule = RecurrenceRule.parse("FREQ=MONTHLY;COUNT=3")
+
+    starts = list(occurrences(rule, datetime(2026, 1, 31, 12, 0)))
+
+    assert [s.month for s in starts] == [1, 3, 5]
+
+
+def test_aware_series_keeps_local_time_across_daylight_saving():
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;UNTIL=20261110")
+    first = datetime(2026, 10, 27, 23, 0, tzinfo=timezone.utc)  # 7 pm EDT
+
+    starts = list(occurrences(rule, first))
+
+    assert [s.astimezone(EASTERN).hour for s in starts] == [19, 19, 19]
+    assert starts[-1].astimezone(timezone.utc).hour == 0  # 7 pm EST
+    assert series_end(rule, first).date() == date(2026, 11, 10)
+
+
+def test_open_ended_series_has_no_end():
+    assert series_end(RecurrenceRule.parse("FREQ=WEEKLY"), datetime(2026, 1, 1)) is None
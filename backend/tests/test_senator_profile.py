@@ -0,0 +1,158 @@
+"""Integration tests for GET /api/senators/{id}/profile."""
+
+from datetime import date
+
+from sqlalchemy import event
+
+from app.models import Committee, CommitteeMembership, District, Leadership, Legislation, Senator
+
+
+def _seed(db_session):
+    district = District(district_name="District 1")
+    finance = Committee(
+        name="Finance", description="Money", chair_name="X", chair_email="x@unc.edu"
+    )
+    rules = Committee(name="Rules", description="Rules", chair_name="Y", chair_email="y@unc.edu")
+    db_session.add_all([district, finance, rules])
+    db_session.flush()
+
+    def senator(session, email="jane@unc.edu"):
+        return Senator(
+            first_name="Jane",
+            last_name="Doe",
+            email=email,
+            district=district.id,
+            session_number=session,
+        )
+
+    old, current, other = (
+        senator(106, email="JANE@unc.edu"),
+        senator(107),
+        senator(107, "o@unc.edu"),
+    )
+    db_session.add_all([old, current, other])
+    db_session.flush()
+
+    db_session.add_all(
+        [
+            CommitteeMembership(senator_id=old.id, committee_id=rules.id, role="Member"),
+            CommitteeMembership(senator_id=current.id, committee_id=finance.id, role="Chair"),
+            CommitteeMembership(senator_id=other.id, committee_id=rules.id, role="Member"),
+            Leadership(
+                senator_id=old.id,
+                title="Speaker Pro Tempore",
+                first_name="Jane",
+                last_name="Doe",
+                session_number=106,
+                is_active=False,
+            ),
+        ]
+    )
+    for i, (sponsor, introduced) in enumerate(
+        [(old, date(2025, 2, 1)), (current, date(2026, 3, 1)), (current, date(2026, 4, 1))]
+    ):
+        db_session.add(
+            Legislation(
+                title=f"Bill {i}",
+                bill_number=f"SB-{i}",
+                session_number=sponsor.session_number,
+                sponsor_id=sponsor.id,
+                sponsor_name="Jane Doe",
+                summary="s",
+                full_text="f",
+                status="Introduced",
+                type="Bill",
+                date_introduced=introduced,
+                date_last_action=introduced,
+            )
+        )
+    db_session.add(
+        Legislation(
+            title="Someone else's bill",
+            bill_number="SB-9",
+            session_number=107,
+            sponsor_id=other.id,
+            sponsor_name="Jane Doe-Smith",
+            summary="s",
+            full_text="f",
+            status="Introduced",
+            type="Bill",
+            date_introduced=date(2026, 5, 1),
+            date_last_action=date(2026, 5, 1),
+        )
+    )
+    db_session.commit()
+    return current.id
+
+
+def test_profile_spans_sessions(integration_client, db_session):
+    senator_id = _seed(db_session)
+
+    data = integration_client.get(f"/api/senators/{senator_id}/profile").json()
+
+    assert data["senator"]["id"] == senator_id
+    assert [c["committee_name"] for c in data["senator"]["committees"]] == ["Finance"]
+    assert data["sessions"] == [107, 106]
+    assert [(h["session_number"], h["committee_name"]) for h in data["committee_history"]] == [
+        (107, "Finance"),
+        (106, "Rules"),
+    ]
+    assert [r["title"] for r in data["leadership_roles"]] == ["Speaker Pro Tempore"]
+    bills = data["sponsored_legislation"]
+    assert bills["total"] == 3
+    assert [b["title"] for b in bills["items"]] == ["Bill 2", "Bill 1", "Bill 0"]
+
+
+def test_sponsored_legislation_is_paginated(integration_client, db_session):
+    senator_id = _seed(db_session)
+
+    data = integration_client.get(f"/api/senators/{senator_id}/profile?page=2&limit=2").json()
+
+    bills = data["sponsored_legislation"]
+    assert (bills["total"], bills["page"], bills["limit"]) == (3, 2, 2)
+    assert [b["title"] for b in bills["items"]] == ["Bill 0"]
+
+
+def test_profile_query_count_is_bounded(integration_client, db_session):
+    senator_id = _seed(db_session)
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        integration_client.get(f"/api/senators/{senator_id}/profile")
+        first = len(statements)
+        integration_client.get(f"/api/senators/{senator_id}/profile")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert first <= 6
+    assert len(statements) == first  # the repeat request is served from the cache
+
+
+def test_etag_revalidation(integration_client, db_session):
+    senator_id = _seed(db_session)
+    url = f"/api/senators/{senator_id}/profile"
+
+    first = integration_client.get(url)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    not_modified = integration_client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    db_session.get(Senator, senator_id).last_name = "Roe"
+    db_session.commit()
+
+    changed = integration_client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["senator"]["last_name"] == "Roe"
+
+
+def test_unknown_senator_returns_404(integration_client):
+    assert integration_client.get("/api/senators/99999/profile").status_code == 404
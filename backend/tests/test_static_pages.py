@@ -55,8 +55,10 @@ def test_ensure_default_static_pages_does_not_overwrite_existing_page(db_session
     assert page.body == "<p>Custom content</p>"
 
 
-def test_ensure_default_static_pages_skips_without_editor(db_session):
+def test_ensure_default_static_pages_creates_pages_before_any_admin_exists(db_session):
     created = ensure_default_static_pages(db_session, slugs=["staffer-application"])
 
-    assert created == 0
-    assert db_session.query(StaticPageContent).count() == 0
+    page = db_session.query(StaticPageContent).one()
+    assert created == 1
+    assert page.page_slug == "staffer-application"
+    assert page.last_edited_by is None
@@ -0,0 +1,156 @@
+"""Contract tests shared by every upload storage backend."""
+
+import hashlib
+from datetime import datetime, timezone
+from io import BytesIO
+
+import pytest
+
+from app.utils.storage import LocalStorage, MemoryStorage, S3Storage, build_storage
+
+
+class _S3Error(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeS3Client:
+    """Just enough of the S3 API, in memory, to stand in for MinIO in tests."""
+
+    page_size = 2
+
+    def __init__(self):
+        self.objects = {}
+
+    def _get(self, Bucket, Key):
+        try:
+            return self.objects[(Bucket, Key)]
+        except KeyError:
+            raise _S3Error("404") from None
+
+    def put_object(self, Bucket, Key, Body, **extra):
+        self.objects[(Bucket, Key)] = {
+            "Body": bytes(Body),
+            "LastModified": datetime.now(timezone.utc),
+            "ETag": f'"{hashlib.md5(Body).hexdigest()}"',
+            **extra,
+        }
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        with open(Filename, "rb") as fh:
+            self.put_object(Bucket, Key, fh.read(), **(ExtraArgs or {}))
+
+    def head_object(self, Bucket, Key):
+        obj = self._get(Bucket, Key)
+        return {**obj, "ContentLength": len(obj["Body"])}
+
+    def get_object(self, Bucket, Key):
+        obj = self._get(Bucket, Key)
+        return {**obj, "Body": BytesIO(obj["Body"])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+    def list_objects_v2(self, Bucket, Prefix="", ContinuationToken=None):
+        keys = sorted(k for b, k in self.objects if b == Bucket and k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self.page_size]
+        contents = []
+        for key in page:
+            obj = self.objects[(Bucket, key)]
+            contents.append(
+                {
+                    "Key": key,
+                    "Size": len(obj["Body"]),
+                    "LastModified": obj["LastModified"],
+                    "ETag": obj["ETag"],
+                }
+            )
+        truncated = start + self.page_size < len(keys)
+        result = {"Contents": contents, "IsTruncated": truncated}
+        if truncated:
+            result["NextContinuationToken"] = str(start + self.page_size)
+        return result
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://s3.test/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+
+@pytest.fixture(params=["local", "memory", "s3"])
+def storage(request, tmp_path):
+    if request.param == "local":
+        return LocalStorage(tmp_path / "uploads")
+    if request.param == "memory":
+        return MemoryStorage()
+    return S3Storage("senate", prefix="uploads", client=FakeS3Client())
+
+
+def test_write_read_stat_delete(storage):
+    storage.write("ab/abc.jpg", b"image-bytes")
+
+    obj = storage.stat("ab/abc.jpg")
+    assert obj.key == "ab/abc.jpg"
+    assert obj.size == len(b"image-bytes")
+    assert obj.etag
+    assert storage.read("ab/abc.jpg") == b"image-bytes"
+    assert storage.exists("ab/abc.jpg")
+
+    storage.delete("ab/abc.jpg")
+    assert storage.stat("ab/abc.jpg") is None
+    with pytest.raises(FileNotFoundError):
+        storage.read("ab/abc.jpg")
+
+
+def test_write_file_consumes_source(storage, tmp_path):
+    source = tmp_path / "spooled.part"
+    source.write_bytes(b"%PDF-1.4\n")
+
+    storage.write_file("cd/cde.pdf", source)
+
+    assert storage.read("cd/cde.pdf") == b"%PDF-1.4\n"
+    assert not source.exists()
+
+
+def test_iter_objects_lists_everything_but_hidden_keys(storage):
+    for key in ("a.jpg", "ab/b.jpg", "ab/b_thumb.jpg", "cd/c.pdf", ".derivatives/x.webp"):
+        storage.write(key, b"x")
+
+    assert sorted(obj.key for obj in storage.iter_objects()) == [
+        "a.jpg",
+        "ab/b.jpg",
+        "ab/b_thumb.jpg",
+        "cd/c.pdf",
+    ]
+
+
+def test_s3_objects_carry_cache_headers_and_presigned_urls():
+    client = FakeS3Client()
+    storage = S3Storage("senate", client=client, presign_seconds=600)
+    sharded = "ab/ab" + "0" * 62 + ".jpg"
+
+    storage.write(sharded, b"x")
+    storage.write("legacy.pdf", b"y")
+
+    assert client.objects[("senate", sharded)]["CacheControl"].endswith("immutable")
+    assert client.objects[("senate", sharded)]["ContentType"] == "image/jpeg"
+    assert "immutable" not in client.objects[("senate", "legacy.pdf")]["CacheControl"]
+    assert storage.url("legacy.pdf") == "https://s3.test/senate/legacy.pdf?expires=600"
+
+
+def test_s3_public_base_url_skips_presigning():
+    storage = S3Storage(
+        "senate", prefix="uploads", client=FakeS3Client(), public_base_url="https://cdn.test/"
+    )
+    assert storage.url("ab/abc.jpg") == "https://cdn.test/uploads/ab/abc.jpg"
+
+
+def test_local_and_memory_have_no_direct_urls(tmp_path):
+    assert LocalStorage(tmp_path).url("a.jpg") is None
+    assert MemoryStorage().url("a.jpg") is None
+    assert LocalStorage(tmp_path).local_path("ab/a.jpg") == tmp_path / "ab" / "a.jpg"
+
+
+def test_build_storage_rejects_unknown_backend():
+    with pytest.raises(RuntimeError, match="Unknown UPLOAD_STORAGE"):
+        build_storage("ftp")
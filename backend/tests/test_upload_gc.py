@@ -0,0 +1,82 @@
+"""Tests for the unreferenced-upload garbage collector."""
+
+import os
+import time
+
+from app.models import Senator
+from app.models.cms import News, Staff
+from app.utils.storage import LocalStorage
+from app.utils.upload_gc import collect_garbage
+
+OLD = time.time() - 7 * 24 * 3600
+
+
+def _touch(root, relpath, mtime=OLD):
+    path = root / relpath
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * 10)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _seed(db_session):
+    db_session.add_all(
+        [
+            Senator(
+                first_name="A",
+                last_name="B",
+                email="a@example.com",
+                district=1,
+                session_number=1,
+                headshot_url="/api/uploads/aa/aaaa.jpg   ",
+            ),
+            Staff(
+                first_name="C",
+                last_name="D",
+                title="T",
+                email="c@example.com",
+                photo_url="https://senate.example.edu/api/uploads/legacy.png?w=320",
+            ),
+            News(
+                title="Post",
+                summary="s",
+                body='<p><img src="/api/uploads/cc/cccc_640w.webp"></p>',
+                author_id=None,
+                is_published=True,
+            ),
+        ]
+    )
+    db_session.flush()
+
+
+def test_finds_orphans_and_keeps_referenced_groups(db_session, tmp_path):
+    _seed(db_session)
+    kept = [
+        _touch(tmp_path, "aa/aaaa.jpg"),
+        _touch(tmp_path, "aa/aaaa_thumb.jpg"),
+        _touch(tmp_path, "aa/aaaa.json"),
+        _touch(tmp_path, "legacy.png"),
+        _touch(tmp_path, "legacy_thumb.png"),
+        _touch(tmp_path, "cc/cccc.jpg"),
+        _touch(tmp_path, "dd/dddd.jpg", mtime=time.time()),  # too new to collect
+        _touch(tmp_path, ".derivatives/ee/eeee.webp"),
+    ]
+    orphans = [_touch(tmp_path, "bb/bbbb.jpg"), _touch(tmp_path, "bb/bbbb_320w.webp")]
+
+    report = collect_garbage(db_session, LocalStorage(tmp_path), "/api/uploads")
+
+    assert sorted(report.orphans) == ["bb/bbbb.jpg", "bb/bbbb_320w.webp"]
+    assert report.orphan_bytes == 20
+    assert all(path.exists() for path in kept + orphans)
+
+
+def test_delete_removes_only_orphans(db_session, tmp_path):
+    _seed(db_session)
+    kept = _touch(tmp_path, "aa/aaaa.jpg")
+    orphan = _touch(tmp_path, "bb/bbbb.jpg")
+
+    report = collect_garbage(db_session, LocalStorage(tmp_path), "/api/uploads", delete=True)
+
+    assert report.deleted
+    assert kept.exists()
+    assert not orphan.exists()
@@ -161,7 +161,7 @@ export default function CalendarWidget({
               <div className="space-y-2 max-h-48 overflow-y-auto">
                 {selectedDateEvents.map((event) => (
                   <div
-                    key={event.id}
+                    key={`${event.id}-${event.start_datetime}`}
                     className="text-sm p-2 bg-blue-50 rounded border border-blue-200"
                   >
                     <p className="font-medium truncate">{event.title}</p>
@@ -246,7 +246,7 @@ export default function CalendarWidget({
                   <div className="space-y-1">
                     {eventsByDate[day]?.slice(0, 3).map((event) => (
                       <div
-                        key={event.id}
+                        key={`${event.id}-${event.start_datetime}`}
                         className="text-xs bg-blue-100 text-blue-800 p-1 rounded truncate hover:bg-blue-200"
                       >
                         {event.title}
@@ -281,7 +281,7 @@ export default function CalendarWidget({
           <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
             {selectedDateEvents.map((event) => (
               <Card
-                key={event.id}
+                key={`${event.id}-${event.start_datetime}`}
                 className="p-6 hover:shadow-lg transition-shadow"
               >
                 <h3 className="text-lg font-bold mb-2">{event.title}</h3>
@@ -3,6 +3,7 @@ import type {
   CalendarEvent,
   CarouselSlide,
   Committee,
+  FinanceHearingBooking,
   FinanceHearingConfig,
   FinanceHearingDate,
   Legislation,
@@ -458,6 +459,24 @@ export async function deleteFinanceHearingDate(id: number): Promise<void> {
   });
 }
 
+export async function getFinanceHearingBookings(
+  dateId: number,
+): Promise<FinanceHearingBooking[]> {
+  return request(`/admin/finance-hearings/dates/${dateId}/bookings`, {
+    method: "GET",
+  });
+}
+
+export async function cancelFinanceHearingBooking(
+  dateId: number,
+  bookingId: number,
+): Promise<void> {
+  return request<void>(
+    `/admin/finance-hearings/dates/${dateId}/bookings/${bookingId}`,
+    { method: "DELETE" },
+  );
+}
+
 // Committees
 export async function getAdminCommittees(): Promise<Committee[]> {
   return request("/admin/committees", {
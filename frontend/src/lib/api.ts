@@ -3,12 +3,18 @@ import type {
   CalendarEvent,
   CarouselSlide,
   Committee,
+  CommitteeRoster,
+  Directory,
   District,
+  FinanceHearingBooking,
   FinanceHearingConfig,
+  FinanceHearingDate,
   Leadership,
   Legislation,
+  LegislationFacets,
   News,
   Senator,
+  SenatorProfile,
   Staff,
   StaticPage,
 } from "@/types";
@@ -178,6 +184,15 @@ export async function getSenatorById(id: string | number): Promise<Senator> {
   return fetchAPI<Senator>(`/api/senators/${id}`);
 }
 
+export async function getSenatorProfile(
+  id: string | number,
+  page: number = 1,
+  limit: number = 20,
+): Promise<SenatorProfile> {
+  const query = createQueryString({ page, limit });
+  return fetchAPI<SenatorProfile>(`/api/senators/${id}/profile${query}`);
+}
+
 export async function getLeadership(session?: number): Promise<Leadership[]> {
   return fetchAPI<Leadership[]>(buildLeadershipEndpoint(session), undefined, 60);
 }
@@ -186,6 +201,14 @@ export async function getCommittees(): Promise<Committee[]> {
   return fetchAPI<Committee[]>("/api/committees/", undefined, 60);
 }
 
+export async function getCommitteeRoster(): Promise<CommitteeRoster> {
+  return fetchAPI<CommitteeRoster>("/api/committees/roster", undefined, 60);
+}
+
+export async function getDirectory(): Promise<Directory> {
+  return fetchAPI<Directory>("/api/directory", undefined, 60);
+}
+
 export async function getCommitteeById(
   id: string | number,
 ): Promise<Committee> {
@@ -207,6 +230,19 @@ export async function getLegislation(
   return fetchAPI<PaginatedResponse<Legislation>>(`/api/legislation${query}`);
 }
 
+export async function getLegislationFacets(
+  params: Omit<GetLegislationParams, "page" | "limit"> = {},
+): Promise<LegislationFacets> {
+  const query = createQueryString({
+    search: params.search,
+    status: params.status,
+    type: params.type,
+    session: params.session,
+    sponsor: params.sponsor,
+  });
+  return fetchAPI<LegislationFacets>(`/api/legislation/facets${query}`);
+}
+
 export async function getLegislationById(
   id: string | number,
 ): Promise<Legislation> {
@@ -240,6 +276,47 @@ export async function getFinanceHearings(): Promise<FinanceHearingConfig> {
   return fetchAPI<FinanceHearingConfig>("/api/finance-hearings", undefined, 60);
 }
 
+export async function getFinanceHearingDates(
+  page: number = 1,
+  limit: number = 20,
+  startDate?: string,
+  endDate?: string,
+  availableOnly?: boolean,
+): Promise<PaginatedResponse<FinanceHearingDate>> {
+  const query = createQueryString({
+    page,
+    limit,
+    start_date: startDate,
+    end_date: endDate,
+    available_only: availableOnly,
+  });
+  return fetchAPI<PaginatedResponse<FinanceHearingDate>>(
+    `/api/finance-hearings/dates${query}`,
+  );
+}
+
+export interface FinanceHearingBookingFormData {
+  organization_name: string;
+  contact_name: string;
+  contact_email: string;
+}
+
+export async function bookFinanceHearing(
+  dateId: number,
+  data: FinanceHearingBookingFormData,
+): Promise<FinanceHearingBooking> {
+  return fetchAPI<FinanceHearingBooking>(
+    `/api/finance-hearings/dates/${dateId}/bookings`,
+    {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify(data),
+    },
+  );
+}
+
 export async function getStaff(): Promise<Staff[]> {
   return fetchAPI<Staff[]>("/api/staff", undefined, 60);
 }
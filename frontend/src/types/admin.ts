@@ -119,6 +119,7 @@ export interface CreateFinanceHearingDate {
   hearing_time: string;
   location: string | null;
   description: string | null;
+  capacity?: number;
 }
 
 export interface UpdateFinanceHearingDate {
@@ -127,6 +128,7 @@ export interface UpdateFinanceHearingDate {
   location: string | null;
   description: string | null;
   is_full: boolean;
+  capacity?: number;
 }
 
 export interface CreateCommittee {
@@ -1,3 +1,5 @@
+import type { PaginatedResponse } from "./api";
+
 export interface Account {
   id: number;
   email: string;
@@ -25,6 +27,36 @@ export interface Senator {
   committees: CommitteeAssignment[];
 }
 
+export interface CommitteeHistoryEntry extends CommitteeAssignment {
+  session_number: number;
+}
+
+export interface LeadershipRole {
+  title: string;
+  session_number: number;
+  is_active: boolean;
+}
+
+export interface SponsoredLegislation {
+  id: number;
+  title: string;
+  short_title: string | null;
+  bill_number: string;
+  session_number: number;
+  status: string;
+  type: string;
+  date_introduced: string;
+  date_last_action: string;
+}
+
+export interface SenatorProfile {
+  senator: Senator;
+  sessions: number[];
+  committee_history: CommitteeHistoryEntry[];
+  leadership_roles: LeadershipRole[];
+  sponsored_legislation: PaginatedResponse<SponsoredLegislation>;
+}
+
 export interface Committee {
   id: number;
   name: string;
@@ -35,6 +67,29 @@ export interface Committee {
   is_active: boolean;
 }
 
+export interface CommitteeSeat {
+  senator_id: number;
+  role: string;
+}
+
+export interface CommitteeRoster {
+  committees: (Omit<Committee, "members"> & { members: CommitteeSeat[] })[];
+  senators: Record<number, Senator>;
+}
+
+export interface Directory extends CommitteeRoster {
+  current_senator_ids: number[];
+  districts: {
+    id: number;
+    district_name: string;
+    description: string | null;
+    senator_ids: number[];
+  }[];
+  leadership: Leadership[];
+  staff: Staff[];
+  carousel: CarouselSlide[];
+}
+
 export interface Leadership {
   id: number;
   title: string;
@@ -82,6 +137,28 @@ export interface Legislation {
   actions?: LegislationAction[];
 }
 
+export interface FacetCount<T = string> {
+  value: T;
+  count: number;
+}
+
+export interface StageDuration {
+  action_type: string;
+  count: number;
+  avg_days: number;
+  min_days: number;
+  max_days: number;
+}
+
+export interface LegislationFacets {
+  total: number;
+  status: FacetCount[];
+  type: FacetCount[];
+  sponsor: FacetCount[];
+  session: FacetCount<number>[];
+  time_in_stage: StageDuration[];
+}
+
 export interface CalendarEvent {
   id: number;
   title: string;
@@ -91,6 +168,7 @@ export interface CalendarEvent {
   location: string | null;
   event_type: string;
   is_published: boolean;
+  recurrence_rule?: string | null;
 }
 
 export interface CarouselSlide {
@@ -109,6 +187,18 @@ export interface FinanceHearingDate {
   location: string | null;
   description: string | null;
   is_full: boolean;
+  capacity: number;
+  booked_count: number;
+  seats_remaining: number;
+}
+
+export interface FinanceHearingBooking {
+  id: number;
+  hearing_date_id: number;
+  organization_name: string;
+  contact_name: string;
+  contact_email: string;
+  created_at: string;
 }
 
 export interface FinanceHearingConfig {